@@ -0,0 +1,21 @@
+"""
+Banc d'essai des recherches sur les trois structures (Liste, BST, Hachage)
+
+Point d'entrée en ligne de commande de partie_1/benchmark_recherche.py, où
+se trouvent la génération des requêtes et les mesures.
+
+Usage :
+    python benchmark_recherche.py --taille 5000 --sortie rapport_recherche.json
+    python benchmark_recherche.py --reference rapport_recherche.json
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+
+from partie_1.benchmark_recherche import main
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+"""
+Générateur de charge pour serveur_http.py
+
+Ouvre plusieurs connexions keep-alive vers le service local et y envoie des
+requêtes de recherche (et, en option, des ajouts), avec jusqu'à `profondeur`
+requêtes pipelinées en vol par connexion. Mesure le débit et la latence de
+chaque requête, de l'envoi à la réception complète de sa réponse.
+
+Usage :
+    python serveur_http.py --sans-sauvegarde &
+    python charge_http.py --requetes 20000 --connexions 8 --profondeur 8
+    python charge_http.py --mode booleen --taux-ajouts 0.05 --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import quote
+
+sys.path.append(os.path.dirname(__file__))
+
+from serveur_http import HOTE_DEFAUT, PORT_DEFAUT, TAILLE_ENTETES_MAX
+from partie_1.benchmark_tri import GRAINE_DEFAUT, percentile
+from partie_1.persistance import FICHIER_DONNEES
+
+
+TERMES_DEFAUT = ('roman', 'prince', 'mer', 'philosophie', 'la', 'temps', 'amour', 'guerre', 'nuit', 'ville')
+
+
+def generer_termes(fichier: Optional[str], nombre: int, graine: int = GRAINE_DEFAUT) -> List[str]:
+    """Fragments de titres tirés du fichier de données (termes fixes s'il n'existe pas)."""
+    if fichier and os.path.exists(fichier):
+        from partie_1.benchmark_recherche import generer_requetes
+        from partie_1.document import Document
+        from partie_1.persistance import lire_documents
+        documents = list(lire_documents(fichier, Document))
+        if documents:
+            return generer_requetes(documents, 'sous_chaine', nombre, graine)
+    rng = random.Random(graine)
+    return [rng.choice(TERMES_DEFAUT) for _ in range(nombre)]
+
+
+def requete_recherche(hote: str, terme: str, mode: str, limite: int) -> bytes:
+    return (f"GET /search?q={quote(terme)}&mode={mode}&limite={limite} HTTP/1.1\r\n"
+            f"Host: {hote}\r\n\r\n").encode('latin-1')
+
+
+def requete_ajout(hote: str, numero: int) -> bytes:
+    corps = json.dumps({'titre': f"Document de charge {numero}", 'auteur': "Générateur de Charge",
+                        'mots_cles': ['charge']}).encode('utf-8')
+    return (f"POST /documents HTTP/1.1\r\nHost: {hote}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(corps)}\r\n\r\n").encode('latin-1') + corps
+
+
+async def lire_reponse(reader: asyncio.StreamReader) -> int:
+    """Lit une réponse complète et retourne son code de statut."""
+    entetes = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+    statut = int(entetes[0].split(' ')[1])
+    longueur = 0
+    for ligne in entetes[1:]:
+        nom, _, valeur = ligne.partition(':')
+        if nom.strip().lower() == 'content-length':
+            longueur = int(valeur)
+    if longueur:
+        await reader.readexactly(longueur)
+    return statut
+
+
+async def executer_charge(hote: str, port: int, requetes: Sequence[bytes], connexions: int = 8,
+                          profondeur: int = 1) -> Dict[str, Any]:
+    """
+    Envoie toutes les requêtes sur `connexions` connexions keep-alive.
+
+    Args:
+        hote: Adresse du serveur
+        port: Port du serveur
+        requetes: Requêtes HTTP déjà formatées
+        connexions: Nombre de connexions simultanées
+        profondeur: Nombre maximal de requêtes pipelinées en vol par connexion
+
+    Returns:
+        {'requetes', 'erreurs', 'duree', 'debit', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}
+    """
+    a_envoyer = deque(requetes)
+    latences: List[float] = []
+    erreurs = 0
+
+    async def client():
+        nonlocal erreurs
+        reader, writer = await asyncio.open_connection(hote, port, limit=TAILLE_ENTETES_MAX)
+        en_vol = deque()
+        try:
+            while True:
+                while len(en_vol) < profondeur and a_envoyer:
+                    writer.write(a_envoyer.popleft())
+                    en_vol.append(time.perf_counter())
+                if not en_vol:
+                    return
+                await writer.drain()
+                statut = await lire_reponse(reader)
+                latences.append(time.perf_counter() - en_vol.popleft())
+                if statut >= 400:
+                    erreurs += 1
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    debut = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(max(1, connexions))))
+    duree = time.perf_counter() - debut
+
+    resultat = {'requetes': len(latences), 'erreurs': erreurs, 'connexions': connexions,
+                'profondeur': profondeur, 'duree': duree,
+                'debit': len(latences) / duree if duree > 0 else 0.0}
+    for p in (50, 95, 99):
+        resultat[f'p{p}_ms'] = percentile(latences, p) * 1000
+    resultat['max_ms'] = max(latences, default=0.0) * 1000
+    return resultat
+
+
+def formater_resultat(resultat: Dict[str, Any]) -> str:
+    return (f"{resultat['requetes']} requêtes en {resultat['duree']:.2f} s "
+            f"({resultat['connexions']} connexion(s), profondeur {resultat['profondeur']}) : "
+            f"{resultat['debit']:.0f} req/s, {resultat['erreurs']} erreur(s)\n"
+            f"Latence (ms) : p50 {resultat['p50_ms']:.3f}  p95 {resultat['p95_ms']:.3f}  "
+            f"p99 {resultat['p99_ms']:.3f}  max {resultat['max_ms']:.3f}")
+
+
+def main(arguments=None) -> int:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Générateur de charge pour le service HTTP de la bibliothèque")
+    parser.add_argument('--hote', default=HOTE_DEFAUT)
+    parser.add_argument('--port', type=int, default=PORT_DEFAUT)
+    parser.add_argument('--requetes', type=int, default=10000, help="Nombre total de requêtes")
+    parser.add_argument('--connexions', type=int, default=8)
+    parser.add_argument('--profondeur', type=int, default=1, help="Requêtes pipelinées en vol par connexion")
+    parser.add_argument('--mode', default='partout', help="Mode de recherche (voir cli.MODES_RECHERCHE)")
+    parser.add_argument('--limite', type=int, default=10, help="Documents renvoyés par recherche")
+    parser.add_argument('--taux-ajouts', type=float, default=0.0, help="Proportion de requêtes d'ajout (0 à 1)")
+    parser.add_argument('--donnees', default=FICHIER_DONNEES, help="Fichier dont les titres fournissent les termes")
+    parser.add_argument('--graine', type=int, default=GRAINE_DEFAUT)
+    parser.add_argument('--json', action='store_true', help="Affiche le résultat sur une ligne JSON")
+    args = parser.parse_args(arguments)
+
+    rng = random.Random(args.graine)
+    termes = generer_termes(args.donnees, args.requetes, args.graine)
+    requetes = [requete_ajout(args.hote, i) if rng.random() < args.taux_ajouts
+                else requete_recherche(args.hote, terme, args.mode, args.limite)
+                for i, terme in enumerate(termes)]
+
+    try:
+        resultat = asyncio.run(executer_charge(args.hote, args.port, requetes,
+                                               args.connexions, max(1, args.profondeur)))
+    except OSError as e:
+        print(f"[ERREUR] Connexion à {args.hote}:{args.port} impossible : {e}", file=sys.stderr)
+        return 2
+    print(json.dumps(resultat, ensure_ascii=False) if args.json else formater_resultat(resultat))
+    return 1 if resultat['erreurs'] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
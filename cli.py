@@ -0,0 +1,513 @@
+"""
+Interface en ligne de commande non interactive (traitements par lots)
+
+Chaque sous-commande charge le fichier de données dans un MoteurStockage,
+lit ses entrées sur l'entrée standard ou dans des fichiers ('-' : entrée
+standard) et écrit un objet JSON par ligne sur la sortie standard. Les
+messages d'information vont sur la sortie d'erreur : la sortie reste
+exploitable par un autre programme (jq, script de charge...).
+
+Sous-commandes :
+    search   un terme (ou une requête booléenne) par ligne
+    add      un document JSON par ligne : {"titre", "auteur", "mots_cles"}
+    delete   un titre exact (ou un identifiant avec --id) par ligne
+    sort     trie la liste avec l'algorithme choisi
+    import   ajoute (ou substitue avec --remplacer) le contenu de fichiers .json / .jsonl
+    export   écrit la collection en JSON Lines
+    bench    rejoue des requêtes et mesure débit et latences par mode
+    stats    statistiques de la collection et des index
+    batch    une commande JSON par ligne : {"op": "search", "terme": "..."}
+
+Les sous-commandes qui modifient la collection la sauvegardent à la fin,
+sauf avec --sans-sauvegarde.
+
+Exemples :
+    python cli.py search --mode auteur < auteurs.txt
+    python cli.py add nouveaux.jsonl
+    python cli.py --donnees bibliotheque_data_1000.json bench requetes.txt --modes partout titre
+    python cli.py export --ordre titre | head
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+sys.path.append(os.path.dirname(__file__))
+
+from partie_1.document import Document
+from partie_1.persistance import (
+    FICHIER_DONNEES, document_depuis_enregistrement, ecrire_documents, iterer_enregistrements, lire_documents
+)
+from partie_1.metriques import REGISTRE
+from stockage import MoteurStockage
+
+
+ALGORITHMES_TRI = ('insertion', 'selection', 'bulles', 'rapide', 'fusion', 'tas', 'comptage', 'vectorise')
+TAILLE_HACHAGE = 50
+
+
+def _rechercher_titre_exact(moteur: MoteurStockage, terme: str) -> List[Document]:
+    document = moteur.manager_bst.rechercher_par_titre(terme)
+    return [document] if document else []
+
+
+MODES_RECHERCHE: Dict[str, Callable[[MoteurStockage, str], List[Document]]] = {
+    'partout': lambda moteur, terme: moteur.rechercher_partout(terme),
+    'titre': lambda moteur, terme: moteur.manager_liste.rechercher(terme, 'titre_partiel'),
+    'titre_exact': _rechercher_titre_exact,
+    'auteur': lambda moteur, terme: moteur.manager_hash.rechercher_par_auteur(terme),
+    'mot_cle': lambda moteur, terme: moteur.manager_liste.rechercher_par_mots_cles(terme),
+    'avancee': lambda moteur, terme: moteur.manager_liste.rechercher_avancee(terme),
+    'booleen': lambda moteur, terme: moteur.manager_liste.rechercher_booleen(terme),
+}
+
+
+# ----------------------------------------------------------------------
+# Entrées / sorties
+# ----------------------------------------------------------------------
+
+def lire_lignes(fichiers: Iterable[str], entree: TextIO = None) -> Iterator[str]:
+    """
+    Lignes non vides des fichiers (l'entrée standard si aucun ou '-'),
+    sans les commentaires commençant par '#'.
+    """
+    entree = entree if entree is not None else sys.stdin
+    for fichier in list(fichiers) or ['-']:
+        flux = entree if fichier == '-' else open(fichier, 'r', encoding='utf-8')
+        try:
+            for ligne in flux:
+                ligne = ligne.strip()
+                if ligne and not ligne.startswith('#'):
+                    yield ligne
+        finally:
+            if flux is not entree:
+                flux.close()
+
+
+def ecrire(objet: Dict[str, Any], sortie: TextIO = None) -> None:
+    """Écrit un objet JSON sur une ligne."""
+    (sortie if sortie is not None else sys.stdout).write(json.dumps(objet, ensure_ascii=False) + '\n')
+
+
+def informer(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def charger_moteur(fichier: str) -> MoteurStockage:
+    """
+    Moteur rempli avec les documents du fichier (vide si le fichier n'existe pas).
+
+    Raises:
+        ValueError: Fichier illisible ou documents impossibles à indexer
+    """
+    moteur = MoteurStockage(taille_hachage=TAILLE_HACHAGE)
+    if os.path.exists(fichier):
+        try:
+            moteur.charger(lire_documents(fichier, Document))
+        except (OSError, ValueError):
+            raise
+        except Exception as e:
+            raise ValueError(f"Chargement de {fichier} impossible : {type(e).__name__}: {e}") from e
+        informer(f"[OK] {len(moteur)} documents chargés depuis {fichier}")
+    else:
+        informer(f"[INFO] Fichier {fichier} non trouvé : collection vide")
+    return moteur
+
+
+def sauvegarder_moteur(moteur: MoteurStockage, fichier: str) -> None:
+    nombre = ecrire_documents(moteur.documents(), fichier)
+    informer(f"[OK] {nombre} documents enregistrés dans {fichier}")
+
+
+# ----------------------------------------------------------------------
+# Opérations (une entrée -> un objet JSON)
+# ----------------------------------------------------------------------
+
+def rechercher(moteur: MoteurStockage, terme: str, mode: str = 'partout',
+               limite: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Exécute une recherche et décrit son résultat.
+
+    Args:
+        moteur: Moteur de stockage
+        terme: Terme ou requête booléenne
+        mode: Une des clés de MODES_RECHERCHE
+        limite: Nombre maximal de documents renvoyés (tous si None)
+
+    Returns:
+        {'requete', 'mode', 'total', 'ms', 'documents'}
+    """
+    if mode not in MODES_RECHERCHE:
+        raise ValueError(f"Mode de recherche '{mode}' inconnu (disponibles : {', '.join(MODES_RECHERCHE)})")
+    debut = time.perf_counter()
+    if mode == 'partout' and limite is not None:
+        # Seuls les documents renvoyés sont résolus (voir MoteurStockage.apercu_recherche)
+        total, renvoyes = moteur.apercu_recherche(terme, max(limite, 0))
+    else:
+        documents = MODES_RECHERCHE[mode](moteur, terme)
+        total, renvoyes = len(documents), documents if limite is None else documents[:max(limite, 0)]
+    duree = time.perf_counter() - debut
+    return {'requete': terme, 'mode': mode, 'total': total, 'ms': duree * 1000,
+            'documents': [doc.to_dict() for doc in renvoyes]}
+
+
+def ajouter(moteur: MoteurStockage, enregistrement: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ajoute un document décrit par un enregistrement JSON (un identifiant fourni est ignoré).
+
+    Returns:
+        {'ok', 'id', 'titre'}
+    """
+    document = document_depuis_enregistrement(enregistrement, Document)
+    document.id = None
+    moteur.ajouter(document)
+    return {'ok': True, 'id': document.id, 'titre': document.titre}
+
+
+def supprimer(moteur: MoteurStockage, cle, par_identifiant: bool = False, tous: bool = False) -> Dict[str, Any]:
+    """
+    Supprime par titre exact (le premier document, ou tous avec `tous`) ou par identifiant.
+
+    Returns:
+        {'ok', 'cle', 'supprimes'}
+    """
+    if par_identifiant:
+        try:
+            identifiant = int(cle)
+        except (TypeError, ValueError):
+            raise ValueError(f"Identifiant invalide : {cle!r}")
+        supprimes = 1 if moteur.supprimer(identifiant) else 0
+    else:
+        supprimes = len(moteur.supprimer_par_titre(str(cle), tous=tous))
+    return {'ok': bool(supprimes), 'cle': cle, 'supprimes': supprimes}
+
+
+def trier(moteur: MoteurStockage, algo: str = 'fusion') -> Dict[str, Any]:
+    """
+    Trie la liste par titre.
+
+    Returns:
+        {'ok', 'algo', 'documents', 'ms'}
+    """
+    debut = time.perf_counter()
+    moteur.manager_liste.trier(algo)
+    duree = time.perf_counter() - debut
+    return {'ok': True, 'algo': algo, 'documents': len(moteur), 'ms': duree * 1000}
+
+
+def statistiques(moteur: MoteurStockage, metriques: bool = False) -> Dict[str, Any]:
+    """Taille de la collection et des index, anomalies éventuelles et métriques de la session."""
+    documents = moteur.documents()
+    resultat = {
+        'documents': len(documents),
+        'auteurs': len({doc.auteur for doc in documents}),
+        'mots_cles': len({mot for doc in documents for mot in doc.mots_cles}),
+        'index': sorted(moteur.index),
+        'bst': {'taille': moteur.bst.size} if moteur.bst is not None else None,
+        'hachage': ({'buckets': moteur.hash_table.size,
+                     'buckets_utilises': sum(1 for bucket in moteur.hash_table.table if bucket.items)}
+                    if moteur.hash_table is not None else None),
+        'anomalies': moteur.verifier_coherence(),
+    }
+    if metriques:
+        resultat['metriques'] = REGISTRE.instantane()
+    return resultat
+
+
+def mesurer_recherches(moteur: MoteurStockage, requetes: List[str], mode: str,
+                       echauffement: int = 10, avec_cache: bool = False) -> Dict[str, Any]:
+    """
+    Rejoue les requêtes sur un mode et mesure chaque requête (voir benchmark_recherche).
+    Comme dans benchmark_recherche, le cache de résultats des gestionnaires est
+    désactivé pendant la mesure sauf si avec_cache est vrai : sinon les requêtes
+    répétées mesureraient le cache et non la recherche.
+
+    Returns:
+        {'mode', 'requetes', 'debit', 'resultats_moyens', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'moyenne_ms'}
+    """
+    from partie_1.benchmark_recherche import mesurer_requetes
+
+    operation = MODES_RECHERCHE[mode]
+    caches = [manager.cache for manager in (moteur.manager_liste, moteur.manager_bst, moteur.manager_hash)]
+    etats = [cache.actif for cache in caches]
+    for cache in caches:
+        cache.actif = avec_cache
+    try:
+        mesures = mesurer_requetes(lambda terme: operation(moteur, terme), requetes, echauffement)
+    finally:
+        for cache, actif in zip(caches, etats):
+            cache.actif = actif
+    resultat = {'mode': mode, 'requetes': mesures['requetes'], 'debit': mesures['debit'],
+                'resultats_moyens': mesures['resultats_moyens']}
+    for cle in ('p50', 'p95', 'p99', 'max', 'moyenne'):
+        resultat[f'{cle}_ms'] = mesures[cle] * 1000
+    return resultat
+
+
+OPERATIONS_LOT = ('search', 'add', 'delete', 'sort', 'stats')
+OPERATIONS_MODIFIANTES = ('add', 'delete', 'sort')
+
+
+_OBLIGATOIRE = object()
+
+
+def _parametre(commande: Dict[str, Any], nom: str, type_attendu: type, defaut=_OBLIGATOIRE):
+    """
+    Paramètre d'une commande de lot, de type vérifié (None vaut absence pour
+    un paramètre facultatif).
+
+    Raises:
+        ValueError: Paramètre du mauvais type
+        KeyError: Paramètre obligatoire manquant
+    """
+    valeur = commande.get(nom)
+    if valeur is None:
+        if defaut is _OBLIGATOIRE:
+            raise KeyError(nom)
+        return defaut
+    # bool est un sous-type d'int : true ne doit pas passer pour une limite
+    if not isinstance(valeur, type_attendu) or (isinstance(valeur, bool) and type_attendu is not bool):
+        raise ValueError(f"Paramètre '{nom}' invalide : {type_attendu.__name__} attendu, "
+                         f"{type(valeur).__name__} reçu")
+    return valeur
+
+
+def executer_commande(moteur: MoteurStockage, commande: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Exécute une commande de lot : {"op": "search", "terme", "mode", "limite"},
+    {"op": "add", "titre", "auteur", "mots_cles"}, {"op": "delete", "titre" | "id", "tous"},
+    {"op": "sort", "algo"} ou {"op": "stats", "metriques"}.
+
+    Raises:
+        ValueError: Opération inconnue ou paramètres invalides
+        KeyError: Paramètre obligatoire manquant
+    """
+    if not isinstance(commande, dict):
+        raise ValueError("Commande attendue sous forme d'objet JSON")
+    op = commande.get('op')
+    if op == 'search':
+        resultat = rechercher(moteur, _parametre(commande, 'terme', str), _parametre(commande, 'mode', str, 'partout'),
+                              _parametre(commande, 'limite', int, None))
+    elif op == 'add':
+        resultat = ajouter(moteur, commande)
+    elif op == 'delete':
+        if 'id' in commande:
+            resultat = supprimer(moteur, commande['id'], par_identifiant=True)
+        else:
+            resultat = supprimer(moteur, _parametre(commande, 'titre', str),
+                                 tous=_parametre(commande, 'tous', bool, False))
+    elif op == 'sort':
+        resultat = trier(moteur, _parametre(commande, 'algo', str, 'fusion'))
+    elif op == 'stats':
+        resultat = statistiques(moteur, commande.get('metriques', False))
+    else:
+        raise ValueError(f"Opération '{op}' inconnue (disponibles : {', '.join(OPERATIONS_LOT)})")
+    return {'op': op, **resultat}
+
+
+def traiter_lot(entrees: Iterable, operation: Callable[[Any], Optional[Dict[str, Any]]],
+                ecrire_resultats: bool = True) -> int:
+    """
+    Applique l'opération à chaque entrée et écrit son résultat (rien s'il vaut
+    None, ou avec ecrire_resultats faux). Une entrée invalide produit
+    {"ok": false, "ligne", "erreur"} sans interrompre le lot.
+
+    Returns:
+        Le nombre d'entrées en erreur
+    """
+    erreurs = 0
+    for ligne, entree in enumerate(entrees, 1):
+        try:
+            resultat = operation(entree)
+        except (ValueError, KeyError, TypeError) as e:
+            erreurs += 1
+            message = f"Paramètre manquant : {e}" if isinstance(e, KeyError) else str(e)
+            ecrire({'ok': False, 'ligne': ligne, 'erreur': message})
+            continue
+        if resultat is not None and ecrire_resultats:
+            ecrire(resultat)
+    return erreurs
+
+
+def _decoder(ligne: str):
+    try:
+        return json.loads(ligne)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON invalide : {e}")
+
+
+# ----------------------------------------------------------------------
+# Sous-commandes : (moteur, args) -> (nombre d'erreurs, collection modifiée)
+# ----------------------------------------------------------------------
+
+def commande_search(moteur, args):
+    erreurs = traiter_lot(lire_lignes(args.fichiers),
+                          lambda terme: rechercher(moteur, terme, args.mode, args.limite))
+    return erreurs, False
+
+
+def commande_add(moteur, args):
+    avant = len(moteur)
+    erreurs = traiter_lot(lire_lignes(args.fichiers), lambda ligne: ajouter(moteur, _decoder(ligne)))
+    return erreurs, len(moteur) != avant
+
+
+def commande_delete(moteur, args):
+    avant = len(moteur)
+    erreurs = traiter_lot(lire_lignes(args.fichiers),
+                          lambda cle: supprimer(moteur, cle, par_identifiant=args.id, tous=args.tous))
+    return erreurs, len(moteur) != avant
+
+
+def commande_sort(moteur, args):
+    ecrire(trier(moteur, args.algo))
+    return 0, True
+
+
+def commande_import(moteur, args):
+    if args.remplacer:
+        documents = [doc for fichier in args.fichiers for doc in lire_documents(fichier, Document)]
+        ecrire({'ok': True, 'fichiers': args.fichiers, 'documents': moteur.charger(documents)})
+        return 0, True
+
+    erreurs = 0
+    avant_import = len(moteur)
+    for fichier in args.fichiers:
+        avant = len(moteur)
+        # Seuls les enregistrements refusés et le bilan du fichier produisent une ligne
+        erreurs_fichier = traiter_lot(iterer_enregistrements(fichier),
+                                      lambda enregistrement: ajouter(moteur, enregistrement),
+                                      ecrire_resultats=False)
+        erreurs += erreurs_fichier
+        ecrire({'ok': not erreurs_fichier, 'fichier': fichier, 'ajoutes': len(moteur) - avant,
+                'erreurs': erreurs_fichier})
+    return erreurs, len(moteur) != avant_import
+
+
+def commande_export(moteur, args):
+    if args.ordre == 'titre':
+        documents = moteur.page(0, len(moteur), par_titre=True)
+    else:
+        documents = moteur.documents()
+    if args.sortie:
+        ecrire({'ok': True, 'fichier': args.sortie, 'documents': ecrire_documents(documents, args.sortie)})
+    else:
+        for document in documents:
+            ecrire(document.to_dict())
+    return 0, False
+
+
+def commande_bench(moteur, args):
+    if args.generer:
+        from partie_1.benchmark_recherche import generer_requetes
+        options = {'graine': args.graine} if args.graine is not None else {}
+        requetes = generer_requetes(moteur.documents(), 'sous_chaine', args.generer, **options)
+    else:
+        requetes = list(lire_lignes(args.fichiers))
+    for mode in args.modes:
+        ecrire(mesurer_recherches(moteur, requetes, mode, avec_cache=args.cache))
+    return 0, False
+
+
+def commande_stats(moteur, args):
+    ecrire(statistiques(moteur, args.metriques))
+    return 0, False
+
+
+def commande_batch(moteur, args):
+    modifie = False
+
+    def executer(ligne):
+        nonlocal modifie
+        resultat = executer_commande(moteur, _decoder(ligne))
+        modifie = modifie or (resultat['op'] in OPERATIONS_MODIFIANTES and resultat.get('ok', False))
+        return resultat
+
+    return traiter_lot(lire_lignes(args.fichiers), executer), modifie
+
+
+def construire_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Bibliothèque numérique : traitements par lots (sortie JSON Lines)")
+    parser.add_argument('--donnees', default=FICHIER_DONNEES,
+                        help=f"Fichier de documents .json ou .jsonl (défaut : {FICHIER_DONNEES})")
+    parser.add_argument('--sans-sauvegarde', action='store_true',
+                        help="N'enregistre pas les modifications dans le fichier de données")
+    sous_commandes = parser.add_subparsers(dest='commande', required=True)
+
+    def ajouter_sous_commande(nom, fonction, aide, entrees=None):
+        sous_parser = sous_commandes.add_parser(nom, help=aide, description=aide)
+        sous_parser.set_defaults(fonction=fonction)
+        if entrees:
+            sous_parser.add_argument('fichiers', nargs='*', help=f"{entrees} (défaut : entrée standard)")
+        return sous_parser
+
+    search = ajouter_sous_commande('search', commande_search, "Recherche chaque ligne lue",
+                                   "Fichiers de requêtes, une par ligne")
+    search.add_argument('--mode', choices=list(MODES_RECHERCHE), default='partout')
+    search.add_argument('--limite', type=int, help="Nombre maximal de documents renvoyés par requête")
+
+    ajouter_sous_commande('add', commande_add, "Ajoute les documents lus (un objet JSON par ligne)",
+                          "Fichiers JSON Lines de documents")
+
+    delete = ajouter_sous_commande('delete', commande_delete, "Supprime les documents par titre exact",
+                                   "Fichiers de titres, un par ligne")
+    delete.add_argument('--id', action='store_true', help="Les lignes sont des identifiants")
+    delete.add_argument('--tous', action='store_true', help="Supprime tous les documents portant le titre")
+
+    sort = ajouter_sous_commande('sort', commande_sort, "Trie la liste par titre")
+    sort.add_argument('--algo', choices=ALGORITHMES_TRI, default='fusion')
+
+    importer = ajouter_sous_commande('import', commande_import, "Importe des fichiers de documents")
+    importer.add_argument('fichiers', nargs='+', help="Fichiers .json (tableau) ou .jsonl")
+    importer.add_argument('--remplacer', action='store_true',
+                          help="Remplace la collection (identifiants conservés) au lieu d'ajouter")
+
+    export = ajouter_sous_commande('export', commande_export, "Exporte la collection")
+    export.add_argument('--ordre', choices=('liste', 'titre'), default='liste')
+    export.add_argument('--sortie', help="Fichier .json ou .jsonl (défaut : JSON Lines sur la sortie standard)")
+
+    bench = ajouter_sous_commande('bench', commande_bench, "Mesure débit et latences des recherches",
+                                  "Fichiers de requêtes, une par ligne")
+    bench.add_argument('--modes', nargs='+', choices=list(MODES_RECHERCHE), default=['partout'])
+    bench.add_argument('--generer', type=int, metavar='N',
+                       help="Génère N requêtes (fragments de titres) au lieu de les lire")
+    bench.add_argument('--graine', type=int, help="Graine des requêtes générées (défaut : celle des bancs d'essai)")
+    bench.add_argument('--cache', action='store_true',
+                       help="Laisse actif le cache de résultats des gestionnaires pendant la mesure")
+
+    stats = ajouter_sous_commande('stats', commande_stats, "Statistiques de la collection")
+    stats.add_argument('--metriques', action='store_true', help="Inclut les métriques de la session")
+
+    ajouter_sous_commande('batch', commande_batch, "Exécute une commande JSON par ligne",
+                          "Fichiers de commandes JSON Lines")
+    return parser
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """
+    Point d'entrée en ligne de commande.
+
+    Returns:
+        0 si toutes les entrées ont été traitées, 1 si certaines sont en erreur, 2 en cas d'échec global
+    """
+    args = construire_parser().parse_args(arguments)
+    try:
+        moteur = charger_moteur(args.donnees)
+        erreurs, modifie = args.fonction(moteur, args)
+        if modifie and not args.sans_sauvegarde:
+            sauvegarder_moteur(moteur, args.donnees)
+    except (OSError, ValueError) as e:
+        informer(f"[ERREUR] {e}")
+        return 2
+    finally:
+        sys.stdout.flush()
+    if erreurs:
+        informer(f"[ERREUR] {erreurs} entrée(s) en erreur")
+    return 1 if erreurs else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
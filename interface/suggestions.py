@@ -0,0 +1,115 @@
+"""
+Liste déroulante d'autocomplétion sous un champ de saisie Tkinter.
+
+Les suggestions viennent du moteur de stockage (tries de préfixes) : chaque
+frappe ne coûte qu'une descente dans le trie, la liste suit donc la saisie.
+"""
+
+import tkinter as tk
+
+
+NOMBRE_LIGNES = 8
+LIBELLES_CHAMPS = {'titre': 'titre', 'auteur': 'auteur', 'mot_cle': 'mot-clé'}
+
+
+class ChampSuggestions:
+    """
+    Attache une liste de suggestions à un ttk.Entry.
+
+    Flèches haut/bas pour parcourir, Entrée ou clic pour choisir, Échap pour fermer.
+
+    Args:
+        entry: Champ de saisie
+        fournisseur: Fonction (prefixe, champ, n) -> [Suggestion] (ex. moteur.suggerer)
+        champ: 'titre', 'auteur', 'mot_cle' (seul le dernier mot-clé après une virgule
+            est complété) ou None pour les trois
+        action: Fonction appelée après le choix d'une suggestion (ex. lancer la recherche)
+    """
+
+    def __init__(self, entry, fournisseur, champ=None, action=None):
+        self.entry = entry
+        self.fournisseur = fournisseur
+        self.champ = champ
+        self.action = action
+        self.suggestions = []
+        self.fenetre = None
+        self.liste = None
+
+        entry.bind('<KeyRelease>', self._saisie, add='+')
+        entry.bind('<Down>', lambda e: self._deplacer(1), add='+')
+        entry.bind('<Up>', lambda e: self._deplacer(-1), add='+')
+        entry.bind('<Return>', self._valider_clavier, add='+')
+        entry.bind('<Escape>', lambda e: self.masquer(), add='+')
+        entry.bind('<FocusOut>', lambda e: entry.after(150, self.masquer), add='+')
+
+    def _saisie(self, event):
+        if event.keysym in ('Up', 'Down', 'Return', 'Escape', 'Tab'):
+            return
+        prefixe = self._segment()[1]
+        self.suggestions = self.fournisseur(prefixe, self.champ, NOMBRE_LIGNES) if prefixe.strip() else []
+        if self.suggestions:
+            self._afficher()
+        else:
+            self.masquer()
+
+    def _segment(self):
+        """(début conservé, préfixe à compléter) : les mots-clés se saisissent séparés par des virgules."""
+        texte = self.entry.get()
+        if self.champ == 'mot_cle' and ',' in texte:
+            debut, prefixe = texte.rsplit(',', 1)
+            return debut + ', ', prefixe.strip()
+        return '', texte
+
+    def _afficher(self):
+        if self.fenetre is None:
+            self.fenetre = tk.Toplevel(self.entry)
+            self.fenetre.wm_overrideredirect(True)
+            self.liste = tk.Listbox(self.fenetre, activestyle='none', exportselection=False,
+                                    font=('Segoe UI', 9), relief='solid', borderwidth=1)
+            self.liste.pack(fill='both', expand=True)
+            self.liste.bind('<ButtonRelease-1>', lambda e: self._choisir(self.liste.nearest(e.y)))
+        self.liste.delete(0, 'end')
+        for suggestion in self.suggestions:
+            ligne = suggestion.texte
+            if self.champ is None:
+                ligne += f"   ({LIBELLES_CHAMPS[suggestion.champ]})"
+            self.liste.insert('end', ligne)
+        self.liste.configure(height=len(self.suggestions))
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self.fenetre.wm_geometry(f"{self.entry.winfo_width()}x{self.liste.winfo_reqheight()}+{x}+{y}")
+        self.fenetre.deiconify()
+        self.fenetre.lift()
+
+    def masquer(self):
+        if self.fenetre is not None:
+            self.fenetre.withdraw()
+        self.suggestions = []
+
+    def _deplacer(self, pas):
+        if not self.suggestions:
+            return
+        selection = self.liste.curselection()
+        index = (selection[0] + pas) if selection else (0 if pas > 0 else len(self.suggestions) - 1)
+        index = max(0, min(index, len(self.suggestions) - 1))
+        self.liste.selection_clear(0, 'end')
+        self.liste.selection_set(index)
+        self.liste.see(index)
+        return 'break'
+
+    def _valider_clavier(self, event):
+        if self.suggestions and self.liste.curselection():
+            self._choisir(self.liste.curselection()[0])
+            return 'break'
+        self.masquer()
+
+    def _choisir(self, index):
+        if not 0 <= index < len(self.suggestions):
+            return
+        texte = self._segment()[0] + self.suggestions[index].texte
+        self.entry.delete(0, 'end')
+        self.entry.insert(0, texte)
+        self.entry.icursor('end')
+        self.masquer()
+        if self.action is not None:
+            self.action()
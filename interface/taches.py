@@ -0,0 +1,213 @@
+"""
+Exécution des opérations longues de l'interface hors de la boucle Tk.
+
+Une tâche s'exécute dans un fil de travail et ne touche jamais aux widgets :
+elle publie son avancement par `tache.progression(fait, total, message)`, que
+la boucle Tk relève toutes les INTERVALLE_SONDAGE_MS millisecondes (after())
+avant d'appeler les fonctions de rappel dans le fil de l'interface.
+
+L'annulation est coopérative : `progression` lève TacheAnnulee lorsque la
+tâche a été annulée. L'interface, elle, est libérée dès le sondage suivant ;
+le résultat d'une tâche annulée est ignoré même si elle va à son terme.
+
+Exemple :
+    executeur = ExecuteurTaches(root)
+    executeur.lancer("Comparaison", comparer, resultat=afficher)
+"""
+
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+
+INTERVALLE_SONDAGE_MS = 50
+
+
+class TacheAnnulee(Exception):
+    """Levée au point de contrôle suivant l'annulation d'une tâche."""
+
+
+class Tache:
+    """
+    Opération exécutée dans un fil de travail.
+
+    Args:
+        nom: Libellé affiché pendant l'exécution
+    """
+
+    def __init__(self, nom: str):
+        self.nom = nom
+        self.resultat = None
+        self.erreur = None
+        self._annulee = threading.Event()
+        self._terminee = threading.Event()
+        self._avancement = queue.Queue()  # (fait, total, message), lus par la boucle Tk
+
+    @property
+    def annulee(self) -> bool:
+        return self._annulee.is_set()
+
+    @property
+    def terminee(self) -> bool:
+        return self._terminee.is_set()
+
+    def annuler(self) -> None:
+        self._annulee.set()
+
+    def progression(self, fait: int, total: int, message: str = "") -> None:
+        """
+        Publie l'avancement (appelée depuis le fil de travail) ; sert aussi de
+        point de contrôle de l'annulation.
+
+        Raises:
+            TacheAnnulee: La tâche a été annulée
+        """
+        if self.annulee:
+            raise TacheAnnulee(self.nom)
+        self._avancement.put((fait, total, message))
+
+    def _executer(self, fonction, args, kwargs) -> None:
+        try:
+            self.resultat = fonction(self, *args, **kwargs)
+        except TacheAnnulee:
+            pass
+        except Exception as e:
+            self.erreur = e
+        finally:
+            self._terminee.set()
+
+
+class ExecuteurTaches:
+    """
+    Lance des tâches en arrière-plan et rapatrie leurs événements dans la boucle Tk.
+
+    Args:
+        master: Fenêtre Tk dont la boucle exécute les fonctions de rappel
+        barre: BarreTaches à mettre à jour (optionnelle)
+    """
+
+    def __init__(self, master, barre=None):
+        self.master = master
+        self.barre = barre
+        self.en_cours = []
+
+    def lancer(self, nom: str, fonction, *args, progression=None, resultat=None,
+               erreur=None, annulation=None, annulable: bool = True, **kwargs) -> Tache:
+        """
+        Exécute `fonction(tache, *args, **kwargs)` dans un fil de travail.
+
+        Args:
+            nom: Libellé de la tâche
+            fonction: Opération ; reçoit la tâche en premier argument
+            progression: Rappel (fait, total, message) dans le fil Tk
+            resultat: Rappel (valeur) à la fin normale de la tâche
+            erreur: Rappel (exception) si la tâche a échoué
+            annulation: Rappel () dès que l'annulation est prise en compte
+            annulable: False pour désactiver le bouton d'annulation (chargement initial)
+
+        Returns:
+            La tâche lancée
+        """
+        tache = Tache(nom)
+        rappels = {'progression': progression, 'resultat': resultat,
+                   'erreur': erreur, 'annulation': annulation}
+        fil = threading.Thread(target=tache._executer, args=(fonction, args, kwargs),
+                               name=f"tache-{nom}", daemon=True)
+        self.en_cours.append(tache)
+        if self.barre is not None:
+            self.barre.afficher(tache, lambda: self.annuler(tache), annulable)
+        fil.start()
+        self.master.after(INTERVALLE_SONDAGE_MS, self._sonder, tache, rappels)
+        return tache
+
+    def occupe(self) -> bool:
+        return bool(self.en_cours)
+
+    def annuler(self, tache: Tache) -> None:
+        tache.annuler()
+
+    def annuler_tout(self) -> None:
+        for tache in self.en_cours:
+            tache.annuler()
+
+    def _sonder(self, tache: Tache, rappels: dict) -> None:
+        dernier = None
+        while True:
+            try:
+                dernier = tache._avancement.get_nowait()
+            except queue.Empty:
+                break
+
+        if tache.annulee:
+            self._terminer(tache)
+            if rappels['annulation']:
+                rappels['annulation']()
+            return
+
+        if dernier is not None:
+            if self.barre is not None:
+                self.barre.progresser(*dernier)
+            if rappels['progression']:
+                rappels['progression'](*dernier)
+
+        if not tache.terminee:
+            self.master.after(INTERVALLE_SONDAGE_MS, self._sonder, tache, rappels)
+            return
+
+        self._terminer(tache)
+        if tache.erreur is not None:
+            if rappels['erreur']:
+                rappels['erreur'](tache.erreur)
+        elif rappels['resultat']:
+            rappels['resultat'](tache.resultat)
+
+    def _terminer(self, tache: Tache) -> None:
+        if tache in self.en_cours:
+            self.en_cours.remove(tache)
+        if self.barre is not None and not self.en_cours:
+            self.barre.masquer()
+
+
+class BarreTaches(ttk.Frame):
+    """
+    Barre d'état : libellé, progression et bouton d'annulation de la tâche en cours.
+
+    Args:
+        parent: Conteneur
+        avant: Widget avant lequel la barre est placée (pour qu'elle garde sa place)
+    """
+
+    def __init__(self, parent, avant=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.avant = avant
+        self.message_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.message_var, font=('Segoe UI', 9)).pack(side='left', padx=(0, 10))
+        self.barre = ttk.Progressbar(self, mode='indeterminate', length=220)
+        self.barre.pack(side='left', fill='x', expand=True, padx=(0, 10))
+        self.bouton = ttk.Button(self, text="✖️ Annuler")
+        self.bouton.pack(side='right')
+        self._visible = False
+
+    def afficher(self, tache: Tache, annuler, annulable: bool = True) -> None:
+        self.message_var.set(f"⏳ {tache.nom}...")
+        self.bouton.configure(command=annuler, state='normal' if annulable else 'disabled')
+        self.barre.configure(mode='indeterminate', value=0)
+        self.barre.start(15)
+        if not self._visible:
+            options = {'before': self.avant} if self.avant is not None else {}
+            self.pack(side='bottom', fill='x', padx=15, pady=(0, 10), **options)
+            self._visible = True
+
+    def progresser(self, fait: int, total: int, message: str = "") -> None:
+        if total:
+            self.barre.stop()
+            self.barre.configure(mode='determinate', maximum=total, value=fait)
+        if message:
+            self.message_var.set(f"⏳ {message}")
+
+    def masquer(self) -> None:
+        self.barre.stop()
+        if self._visible:
+            self.pack_forget()
+            self._visible = False
@@ -1,4 +1,5 @@
 
+import functools
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
@@ -7,10 +8,11 @@ from tkinter import font
 from partie_1.document import Document
 from partie_1.compat import (
     trier_par_titre,
-    tri_fusion, tri_rapide, tri_selection, tri_bulles, tri_tas, tri_comptage,
+    tri_fusion, tri_rapide, tri_selection, tri_bulles, tri_tas, tri_comptage, tri_vectorise,
     comparer_tous_algorithmes_tri, comparer_tous_algorithmes_tri_gui
 )
-from partie_1.persistance import save_all_structures, load_all_structures, create_default_data
+from partie_1.tri_algorithms import top_k
+from partie_1.persistance import load_data, create_default_data
 from partie_1.suppression_avancee import (
     supprimer_document_complet, 
     supprimer_par_criteres, 
@@ -18,48 +20,85 @@ from partie_1.suppression_avancee import (
     vider_toutes_structures,
     obtenir_statistiques_suppression
 )
-try:
-    from partie_2.bst import BinarySearchTree
-    from partie_3 import HashTable
-except ImportError:
-    BinarySearchTree = None 
-    HashTable = None
-    pass
-
-
-def initialiser_structures_gui():
-    """Crée et initialise les TROIS structures (Liste, BST, Hachage) pour la GUI avec persistance."""
-    list_bib = [] 
-    bst_bib = BinarySearchTree() if BinarySearchTree else None
-    hash_bib = HashTable(size=50) if HashTable else None
+from stockage import MoteurStockage
+from interface.suggestions import ChampSuggestions
+from interface.taches import BarreTaches, ExecuteurTaches
+from interface.vue_virtuelle import VueVirtuelle
+
+
+TAILLE_PAGE_RESULTATS = 100
+DELAI_RECHERCHE_LIVE_MS = 200      # Pause de saisie avant de lancer la recherche en direct
+LONGUEUR_MIN_RECHERCHE_LIVE = 2
+LIGNES_PAR_TRANCHE = 20            # Lignes de résultats insérées par passage de la boucle Tk
+
+
+def initialiser_structures_gui(progression=None):
+    """
+    Crée le moteur de stockage (Liste, BST, Hachage, mots-clés) pour la GUI avec persistance.
     
-    list_bib = load_all_structures(Document, bst_bib, hash_bib)
+    Args:
+        progression: Fonction (fait, total, message) appelée pendant la construction des index
+    """
+    moteur = MoteurStockage(taille_hachage=50)
+    moteur.charger(load_data(Document), progression=progression)
     
-    if not list_bib:
-        list_bib = create_default_data(Document)
-        
-        for doc in list_bib:
-            if bst_bib:
-                bst_bib.insert(doc)
-            if hash_bib:
-                hash_bib.insert(doc)
+    if not len(moteur):
+        moteur.charger(create_default_data(Document), progression=progression)
+        moteur.sauvegarder()
             
-    return list_bib, bst_bib, hash_bib
+    return moteur
 
-def lancer_interface_graphique(structures):
-    """Point d'entrée pour lancer la fenêtre Tkinter."""
-    list_bib, bst_bib, hash_bib = structures
+def lancer_interface_graphique(moteur=None):
+    """
+    Point d'entrée pour lancer la fenêtre Tkinter. Sans moteur fourni, la
+    fenêtre s'ouvre aussitôt et les données sont chargées en arrière-plan.
+    """
     root = tk.Tk()
-    app = BibliothequeGUI(root, list_bib, bst_bib, hash_bib)
+    app = BibliothequeGUI(root, moteur)
     root.mainloop()
 
 
+def differer_pendant_chargement(methode):
+    """
+    Décorateur des recherches : pendant le chargement initial, l'appel est mis
+    en file (le dernier par action) et rejoué dès la publication des données.
+    Les champs de saisie sont lus au moment du rejeu.
+    """
+    @functools.wraps(methode)
+    def enveloppe(self, *args, **kwargs):
+        if self.chargement_en_cours:
+            self._appels_differes.pop(methode.__name__, None)
+            self._appels_differes[methode.__name__] = (methode, args, kwargs)
+            return None
+        return methode(self, *args, **kwargs)
+    return enveloppe
+
+
+def bloquer_pendant_chargement(methode):
+    """
+    Décorateur des actions qui modifient les données : elles sont refusées
+    pendant le chargement initial (leurs boutons sont d'ailleurs désactivés,
+    voir BibliothequeGUI._bouton_modification) plutôt que rejouées plus tard
+    avec des saisies qui auraient changé entre-temps.
+    """
+    @functools.wraps(methode)
+    def enveloppe(self, *args, **kwargs):
+        if self.chargement_en_cours:
+            messagebox.showinfo("Chargement", "La bibliothèque est en cours de chargement : réessayez dans un instant.")
+            return None
+        return methode(self, *args, **kwargs)
+    return enveloppe
+
+
 class BibliothequeGUI:
-    def __init__(self, master, list_bib, bst_bib, hash_bib):
+    def __init__(self, master, moteur=None):
         self.master = master
-        self.list_bib = list_bib
-        self.bst_bib = bst_bib
-        self.hash_bib = hash_bib
+        # Sans moteur, la fenêtre démarre sur un moteur vide ; le moteur chargé
+        # en arrière-plan le remplace d'un bloc (voir _publier_moteur)
+        self.chargement_en_cours = moteur is None
+        self.moteur = moteur if moteur is not None else MoteurStockage(taille_hachage=50)
+        self._appels_differes = {}
+        self._boutons_modification = []
         
         style = ttk.Style()
         style.theme_use('clam')
@@ -158,6 +197,10 @@ class BibliothequeGUI:
         self.notebook = ttk.Notebook(master)
         self.notebook.pack(pady=15, padx=15, expand=True, fill="both")
         
+        # Opérations longues (tris, comparaisons, tests) exécutées hors de la boucle Tk
+        self.barre_taches = BarreTaches(master, avant=self.notebook)
+        self.executeur = ExecuteurTaches(master, self.barre_taches)
+        
         padding = "25 20 25 20"
         self.frame_global = ttk.Frame(self.notebook, padding=padding)
         self.frame_p1 = ttk.Frame(self.notebook, padding="0 0 0 0")
@@ -182,6 +225,59 @@ class BibliothequeGUI:
 
         self.notebook.bind("<<NotebookTabChanged>>", self.update_affichage)
         self.update_affichage() 
+        
+        if self.chargement_en_cours:
+            self.executeur.lancer("Chargement de la bibliothèque",
+                                  lambda tache: initialiser_structures_gui(progression=tache.progression),
+                                  progression=self._progression_chargement,
+                                  resultat=self._publier_moteur,
+                                  erreur=self._echec_chargement,
+                                  annulable=False)
+
+    # Vues sur les index du moteur courant : les ajouts et suppressions passent par le moteur
+    @property
+    def list_bib(self):
+        return self.moteur.liste
+
+    @property
+    def bst_bib(self):
+        return self.moteur.bst
+
+    @property
+    def hash_bib(self):
+        return self.moteur.hash_table
+
+    def _progression_chargement(self, fait, total, message):
+        if self._appels_differes:
+            self.barre_taches.message_var.set(
+                f"⏳ {message} ({fait}/{total}) - {len(self._appels_differes)} action(s) en attente")
+
+    def _bouton_modification(self, parent, **options):
+        """Bouton d'une action qui modifie les données : désactivé jusqu'à la fin du chargement."""
+        bouton = ttk.Button(parent, **options)
+        if self.chargement_en_cours:
+            bouton.state(['disabled'])
+        self._boutons_modification.append(bouton)
+        return bouton
+
+    def _fin_chargement(self):
+        self.chargement_en_cours = False
+        for bouton in self._boutons_modification:
+            bouton.state(['!disabled'])
+
+    def _publier_moteur(self, moteur):
+        """Remplace le moteur vide par le moteur chargé, réactive les modifications puis rejoue les recherches mises en file."""
+        self.moteur = moteur
+        self._fin_chargement()
+        self.update_affichage()
+        appels, self._appels_differes = self._appels_differes, {}
+        for methode, args, kwargs in appels.values():
+            methode(self, *args, **kwargs)
+
+    def _echec_chargement(self, erreur):
+        self._fin_chargement()
+        self._appels_differes.clear()
+        messagebox.showerror("Erreur", f"Impossible de charger la bibliothèque : {erreur}")
 
     
     def setup_global_tab(self):
@@ -238,7 +334,7 @@ class BibliothequeGUI:
         button_frame = ttk.Frame(frame)
         button_frame.pack(fill='x', pady=(10, 0))
         
-        add_button = ttk.Button(button_frame, text="➕ Ajouter et Synchroniser", 
+        add_button = self._bouton_modification(button_frame, text="➕ Ajouter et Synchroniser", 
                                command=self.ajouter_global, style='Primary.TButton')
         add_button.pack(side='left')
         
@@ -247,6 +343,7 @@ class BibliothequeGUI:
                                      foreground=self.COLORS['text_secondary'])
         self.status_label.pack(side='left', padx=(20, 0))
 
+    @bloquer_pendant_chargement
     def ajouter_global(self):
         titre = self.titre_var.get().strip()
         auteur = self.auteur_var.get().strip()
@@ -256,16 +353,9 @@ class BibliothequeGUI:
             if not mots_cles:
                 mots_cles = ""
             
-            nouveau_doc = Document(titre, auteur, mots_cles)
+            self.moteur.ajouter_document(titre, auteur, mots_cles)
             
-            self.list_bib.append(nouveau_doc)
-            
-            if self.bst_bib:
-                 self.bst_bib.insert(nouveau_doc)
-            if self.hash_bib:
-                 self.hash_bib.insert(nouveau_doc)
-            
-            if save_all_structures(self.list_bib, self.bst_bib, self.hash_bib):
+            if self.moteur.sauvegarder():
                 self.status_label.configure(text=f"✅ '{titre}' ajouté et sauvegardé", 
                                           foreground=self.COLORS['success'])
             else:
@@ -285,6 +375,9 @@ class BibliothequeGUI:
     def setup_p1_tab(self):
         frame = self.frame_p1
         self.recherche_terme_var = tk.StringVar()
+        self.recherche_live_statut_var = tk.StringVar()
+        self._recherche_live_id = None
+        self._generation_recherche_live = 0
         
         canvas = tk.Canvas(frame, bg=self.COLORS['background'], highlightthickness=0)
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
@@ -338,7 +431,7 @@ class BibliothequeGUI:
                 font=('Segoe UI', 12, 'bold'),
                 foreground=self.COLORS['primary']).pack(pady=10)
         
-        ttk.Label(redirect_frame, text="• Visualisation en temps réel du tri\n• Affichage du temps d'exécution de chaque algorithme\n• Fonction de mélange aléatoire de la liste\n• 7 algorithmes de tri disponibles", 
+        ttk.Label(redirect_frame, text="• Visualisation en temps réel du tri\n• Affichage du temps d'exécution de chaque algorithme\n• Fonction de mélange aléatoire de la liste\n• 8 algorithmes de tri disponibles", 
                 font=('Segoe UI', 10),
                 foreground=self.COLORS['text_secondary'],
                 justify='left').pack(pady=5)
@@ -369,67 +462,111 @@ class BibliothequeGUI:
         entry = ttk.Entry(recherche_frame, textvariable=self.recherche_terme_var, 
                          style='Modern.TEntry')
         entry.pack(side="left", fill='x', expand=True, padx=(0, 10))
+        ChampSuggestions(entry, self._suggerer, action=self.rechercher_complete_list)
         ttk.Button(recherche_frame, text="🔍 Rechercher Tout", 
                   command=self.rechercher_complete_list, style='Primary.TButton').pack(side="left")
         
-        ttk.Label(recherche_card, text="📊 Performance: O(n) - Recherche séquentielle dans tous les champs", 
+        ttk.Label(recherche_card, textvariable=self.recherche_live_statut_var,
+                 font=('Segoe UI', 9),
+                 foreground=self.COLORS['text_secondary']).pack(anchor='w', pady=(8, 0))
+        self.liste_recherche_live = tk.Listbox(recherche_card, height=8, activestyle='none',
+                                               bg=self.COLORS['surface'],
+                                               fg=self.COLORS['text_primary'],
+                                               font=('Consolas', 9), bd=0, relief='flat')
+        self.liste_recherche_live.pack(fill='x', pady=(5, 0))
+        self.liste_recherche_live.bind('<Double-Button-1>', self._ouvrir_resultat_live)
+        self._resultats_live = []
+        self.recherche_terme_var.trace_add('write', self._planifier_recherche_live)
+        
+        ttk.Label(recherche_card, text="📊 Performance: résultats en direct pendant la saisie (index des trigrammes et du vocabulaire)", 
                  font=('Segoe UI', 9),
                  foreground=self.COLORS['text_secondary']).pack(pady=(8, 0))
 
 
+    def _suggerer(self, prefixe, champ, n):
+        return self.moteur.suggerer(prefixe, champ, n)
+
+    def _lancer_tache(self, nom, fonction, *args, **rappels):
+        """Lance une opération longue en arrière-plan ; une seule à la fois."""
+        if self.executeur.occupe():
+            messagebox.showwarning("Opération en cours",
+                                   "Une opération est déjà en cours. Attendez sa fin ou annulez-la.")
+            return None
+        rappels.setdefault('erreur', self._erreur_tache)
+        return self.executeur.lancer(nom, fonction, *args, **rappels)
+
+    def _erreur_tache(self, erreur):
+        messagebox.showerror("Erreur", f"Erreur pendant l'opération : {erreur}")
+
+    @bloquer_pendant_chargement
+    def _trier_en_arriere_plan(self, nom, fonction, terminer):
+        """
+        Trie une copie de la liste dans un fil de travail puis applique le nouvel
+        ordre dans la boucle Tk : la liste reste intacte si le tri est annulé.
+        
+        Args:
+            nom: Nom de l'algorithme
+            fonction: Fonction de tri (en place ou renvoyant la liste triée)
+            terminer: Appelée avec la durée du tri (secondes) une fois la liste mise à jour
+        """
+        documents = list(self.list_bib)
+
+        def trier(tache):
+            import time
+            debut = time.perf_counter()
+            resultat = fonction(documents)
+            return (resultat if resultat is not None else documents), time.perf_counter() - debut
+
+        def appliquer(valeur):
+            resultat, temps = valeur
+            try:
+                self.moteur.reordonner(resultat)
+            except ValueError:
+                messagebox.showwarning("Triage", "La liste a été modifiée pendant le tri : résultat ignoré.")
+                return
+            terminer(temps)
+            self.update_affichage()
+
+        self._lancer_tache(f"{nom} de {len(documents)} documents", trier, resultat=appliquer)
+
     def trier_list(self):
-        trier_par_titre(self.list_bib) 
-        messagebox.showinfo("Triage", "La liste a été triée par Tri par Insertion.")
-        self.update_affichage()
+        self._trier_en_arriere_plan("Tri par Insertion", trier_par_titre, lambda temps:
+            messagebox.showinfo("Triage", "La liste a été triée par Tri par Insertion."))
 
     def trier_insertion(self):
-        trier_par_titre(self.list_bib) 
-        messagebox.showinfo("Triage", "La liste a été triée par Tri par Insertion (O(n²)).")
-        self.update_affichage()
+        self._trier_en_arriere_plan("Tri par Insertion", trier_par_titre, lambda temps:
+            messagebox.showinfo("Triage", "La liste a été triée par Tri par Insertion (O(n²))."))
 
     def trier_selection(self):
-        tri_selection(self.list_bib)
-        messagebox.showinfo("Triage", "La liste a été triée par Tri par Sélection (O(n²)).")
-        self.update_affichage()
+        self._trier_en_arriere_plan("Tri par Sélection", tri_selection, lambda temps:
+            messagebox.showinfo("Triage", "La liste a été triée par Tri par Sélection (O(n²))."))
 
     def trier_bulles(self):
-        tri_bulles(self.list_bib)
-        messagebox.showinfo("Triage", "La liste a été triée par Tri à Bulles (O(n²)).")
-        self.update_affichage()
+        self._trier_en_arriere_plan("Tri à Bulles", tri_bulles, lambda temps:
+            messagebox.showinfo("Triage", "La liste a été triée par Tri à Bulles (O(n²))."))
 
     def trier_rapide(self):
-        resultat = tri_rapide(self.list_bib)
-        self.list_bib.clear()
-        self.list_bib.extend(resultat)
-        messagebox.showinfo("Triage", "La liste a été triée par Tri Rapide (O(n log n)).")
-        self.update_affichage()
+        self._trier_en_arriere_plan("Tri Rapide", tri_rapide, lambda temps:
+            messagebox.showinfo("Triage", "La liste a été triée par Tri Rapide (O(n log n))."))
 
     def trier_fusion(self):
-        resultat = tri_fusion(self.list_bib)
-        self.list_bib.clear()
-        self.list_bib.extend(resultat)
-        messagebox.showinfo("Triage", "La liste a été triée par Tri Fusion (O(n log n)).")
-        self.update_affichage()
+        self._trier_en_arriere_plan("Tri Fusion", tri_fusion, lambda temps:
+            messagebox.showinfo("Triage", "La liste a été triée par Tri Fusion (O(n log n))."))
 
     def trier_tas(self):
-        tri_tas(self.list_bib)
-        messagebox.showinfo("Triage", "La liste a été triée par Tri par Tas (O(n log n)).")
-        self.update_affichage()
+        self._trier_en_arriere_plan("Tri par Tas", tri_tas, lambda temps:
+            messagebox.showinfo("Triage", "La liste a été triée par Tri par Tas (O(n log n))."))
 
     def trier_comptage(self):
-        tri_comptage(self.list_bib)
-        messagebox.showinfo("Triage", "La liste a été triée par Tri par Comptage (O(n + k)).")
-        self.update_affichage()
+        self._trier_en_arriere_plan("Tri par Comptage", tri_comptage, lambda temps:
+            messagebox.showinfo("Triage", "La liste a été triée par Tri par Comptage (O(n + k))."))
 
     def comparer_algorithmes(self):
-        """Lance la comparaison de tous les algorithmes de tri et affiche les résultats dans une fenêtre contextuelle."""
-        try:
-            resultats = comparer_tous_algorithmes_tri_gui(Document)
-            
-            self.afficher_comparaison_resultats(resultats)
-            
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors de la comparaison: {str(e)}")
+        """Lance la comparaison de tous les algorithmes de tri en arrière-plan et affiche les résultats dans une fenêtre contextuelle."""
+        self._lancer_tache("Comparaison des algorithmes de tri",
+                           lambda tache: comparer_tous_algorithmes_tri_gui(Document, progression=tache.progression),
+                           resultat=self.afficher_comparaison_resultats,
+                           erreur=lambda e: messagebox.showerror("Erreur", f"Erreur lors de la comparaison: {str(e)}"))
 
     def afficher_comparaison_resultats(self, resultats):
         """Affiche les résultats de comparaison dans une fenêtre contextuelle."""
@@ -587,86 +724,48 @@ class BibliothequeGUI:
         fenetre_resultats.focus_set()
 
     
+    @bloquer_pendant_chargement
     def melanger_liste(self):
-        """Mélange aléatoirement la liste"""
+        """
+        Mélange aléatoirement la liste : une copie est mélangée puis appliquée
+        par le moteur (verrou d'écriture, invalidation du cache des recherches).
+        """
         import random
-        random.shuffle(self.list_bib)
+        copie = list(self.list_bib)
+        random.shuffle(copie)
+        self.moteur.reordonner(copie)
         self.temps_execution_var.set("🔀 Liste mélangée aléatoirement !")
         self.update_affichage()
     
+    def _trier_affichage(self, nom, fonction):
+        """Tri en arrière-plan avec mesure de temps PRÉCISE (sans GUI)"""
+        def terminer(temps):
+            self.temps_execution_var.set(f"⏱️ {nom}: {temps:.6f} secondes ({len(self.list_bib)} docs)")
+        self._trier_en_arriere_plan(nom, fonction, terminer)
+
     def trier_insertion_affichage(self):
-        """Tri par insertion avec mesure de temps PRÉCISE (sans GUI)"""
-        import time
-        start_time = time.perf_counter()
-        trier_par_titre(self.list_bib)
-        end_time = time.perf_counter()
-        temps = end_time - start_time
-        self.temps_execution_var.set(f"⏱️ Tri Insertion: {temps:.6f} secondes ({len(self.list_bib)} docs)")
-        self.update_affichage()
+        self._trier_affichage("Tri Insertion", trier_par_titre)
     
     def trier_selection_affichage(self):
-        """Tri par sélection avec mesure de temps PRÉCISE (sans GUI)"""
-        import time
-        start_time = time.perf_counter()
-        tri_selection(self.list_bib)
-        end_time = time.perf_counter()
-        temps = end_time - start_time
-        self.temps_execution_var.set(f"⏱️ Tri Sélection: {temps:.6f} secondes ({len(self.list_bib)} docs)")
-        self.update_affichage()
+        self._trier_affichage("Tri Sélection", tri_selection)
     
     def trier_bulles_affichage(self):
-        """Tri à bulles avec mesure de temps PRÉCISE (sans GUI)"""
-        import time
-        start_time = time.perf_counter()
-        tri_bulles(self.list_bib)
-        end_time = time.perf_counter()
-        temps = end_time - start_time
-        self.temps_execution_var.set(f"⏱️ Tri à Bulles: {temps:.6f} secondes ({len(self.list_bib)} docs)")
-        self.update_affichage()
+        self._trier_affichage("Tri à Bulles", tri_bulles)
     
     def trier_rapide_affichage(self):
-        """Tri rapide avec mesure de temps PRÉCISE (sans GUI)"""
-        import time
-        start_time = time.perf_counter()
-        resultat = tri_rapide(self.list_bib)
-        self.list_bib.clear()
-        self.list_bib.extend(resultat)
-        end_time = time.perf_counter()
-        temps = end_time - start_time
-        self.temps_execution_var.set(f"⏱️ Tri Rapide: {temps:.6f} secondes ({len(self.list_bib)} docs)")
-        self.update_affichage()
+        self._trier_affichage("Tri Rapide", tri_rapide)
     
     def trier_fusion_affichage(self):
-        """Tri fusion avec mesure de temps PRÉCISE (sans GUI)"""
-        import time
-        start_time = time.perf_counter()
-        resultat = tri_fusion(self.list_bib)
-        self.list_bib.clear()
-        self.list_bib.extend(resultat)
-        end_time = time.perf_counter()
-        temps = end_time - start_time
-        self.temps_execution_var.set(f"⏱️ Tri Fusion: {temps:.6f} secondes ({len(self.list_bib)} docs)")
-        self.update_affichage()
+        self._trier_affichage("Tri Fusion", tri_fusion)
     
     def trier_tas_affichage(self):
-        """Tri tas avec mesure de temps PRÉCISE (sans GUI)"""
-        import time
-        start_time = time.perf_counter()
-        tri_tas(self.list_bib)
-        end_time = time.perf_counter()
-        temps = end_time - start_time
-        self.temps_execution_var.set(f"⏱️ Tri Tas: {temps:.6f} secondes ({len(self.list_bib)} docs)")
-        self.update_affichage()
+        self._trier_affichage("Tri Tas", tri_tas)
     
     def trier_comptage_affichage(self):
-        """Tri comptage avec mesure de temps PRÉCISE (sans GUI)"""
-        import time
-        start_time = time.perf_counter()
-        tri_comptage(self.list_bib)
-        end_time = time.perf_counter()
-        temps = end_time - start_time
-        self.temps_execution_var.set(f"⏱️ Tri Comptage: {temps:.6f} secondes ({len(self.list_bib)} docs)")
-        self.update_affichage()
+        self._trier_affichage("Tri Comptage", tri_comptage)
+    
+    def trier_vectorise_affichage(self):
+        self._trier_affichage("Tri Vectorisé", tri_vectorise)
     
     def executer_tests_unitaires(self):
         """Exécute les tests unitaires et affiche les résultats dans une fenêtre"""
@@ -713,30 +812,49 @@ class BibliothequeGUI:
         result_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=result_text.yview)
         
-        result_window.update()
-        
         tests = TestsTriAlgorithmes()
-        resultats = tests.executer_tous_les_tests()
         
-        rapport = tests.generer_rapport_texte(resultats)
-        result_text.insert('1.0', rapport)
-        result_text.config(state='disabled')
+        def afficher_progression(fait, total, nom_algo):
+            if result_window.winfo_exists():
+                progress_label.config(text=f"⏳ {nom_algo} testé ({fait}/{total})...")
         
-        total_tests = sum(len(tests_algo) for tests_algo in resultats.values())
-        tests_reussis = sum(1 for tests_algo in resultats.values() 
-                           for test in tests_algo.values() if test['valide'])
+        def afficher_rapport(resultats):
+            if not result_window.winfo_exists():
+                return
+            rapport = tests.generer_rapport_texte(resultats)
+            result_text.insert('1.0', rapport)
+            result_text.config(state='disabled')
+            
+            total_tests = sum(len(tests_algo) for tests_algo in resultats.values())
+            tests_reussis = sum(1 for tests_algo in resultats.values() 
+                               for test in tests_algo.values() if test['valide'])
+            
+            if tests_reussis == total_tests:
+                progress_label.config(text=f"✅ Tous les tests ont réussi ! ({tests_reussis}/{total_tests})",
+                                     foreground=self.COLORS['success'])
+            else:
+                progress_label.config(text=f"⚠️ {total_tests - tests_reussis} test(s) échoué(s) ({tests_reussis}/{total_tests})",
+                                     foreground=self.COLORS['danger'])
         
-        if tests_reussis == total_tests:
-            progress_label.config(text=f"✅ Tous les tests ont réussi ! ({tests_reussis}/{total_tests})",
-                                 foreground=self.COLORS['success'])
-        else:
-            progress_label.config(text=f"⚠️ {total_tests - tests_reussis} test(s) échoué(s) ({tests_reussis}/{total_tests})",
-                                 foreground=self.COLORS['danger'])
+        def annuler():
+            if result_window.winfo_exists():
+                progress_label.config(text="✖️ Tests annulés", foreground=self.COLORS['danger'])
         
         ttk.Button(main_frame, text="Fermer", 
                   command=result_window.destroy,
                   style='Primary.TButton').pack(pady=10)
+        
+        tache = self._lancer_tache("Tests unitaires des algorithmes de tri",
+                                   lambda tache: tests.executer_tous_les_tests(progression=tache.progression),
+                                   progression=afficher_progression, resultat=afficher_rapport,
+                                   annulation=annuler)
+        if tache is None:
+            result_window.destroy()
+            return
+        # Fermer la fenêtre annule les tests restants
+        result_window.bind('<Destroy>', lambda e: tache.annuler() if e.widget is result_window else None)
 
+    @differer_pendant_chargement
     def rechercher_complete_list(self):
         """Recherche complète dans tous les champs (titre, auteur, mots-clés)."""
         terme = self.recherche_terme_var.get().strip()
@@ -748,7 +866,7 @@ class BibliothequeGUI:
         resultats = []
         champs_trouves = []
         
-        for doc in self.list_bib:
+        for doc in self.moteur.rechercher_partout(terme):
             trouve = False
             champs = []
             
@@ -826,6 +944,7 @@ class BibliothequeGUI:
         
         search_entry = ttk.Entry(search_input_frame, textvariable=self.recherche_bst_var)
         search_entry.pack(side="left", fill='x', expand=True, padx=(0, 10))
+        ChampSuggestions(search_entry, self._suggerer, 'titre', self.rechercher_bst)
         ttk.Button(search_input_frame, text="Rechercher Titre", command=self.rechercher_bst, style='Primary.TButton').pack(side="left")
         
         ttk.Label(search_frame, text="Recherche rapide basée sur la structure arborescente.", 
@@ -839,6 +958,7 @@ class BibliothequeGUI:
         
         auteur_entry = ttk.Entry(auteur_input_frame, textvariable=self.recherche_bst_auteur_var)
         auteur_entry.pack(side="left", fill='x', expand=True, padx=(0, 10))
+        ChampSuggestions(auteur_entry, self._suggerer, 'auteur', self.rechercher_auteur_bst)
         ttk.Button(auteur_input_frame, text="Rechercher Auteur", command=self.rechercher_auteur_bst, style='Primary.TButton').pack(side="left")
         
         ttk.Label(auteur_frame, text="Recherche par auteur dans le BST.", 
@@ -852,6 +972,7 @@ class BibliothequeGUI:
         
         mots_cles_entry = ttk.Entry(mots_cles_input_frame, textvariable=self.recherche_bst_mots_cles_var)
         mots_cles_entry.pack(side="left", fill='x', expand=True, padx=(0, 10))
+        ChampSuggestions(mots_cles_entry, self._suggerer, 'mot_cle', self.rechercher_mots_cles_bst)
         ttk.Button(mots_cles_input_frame, text="Rechercher Mots-clés", command=self.rechercher_mots_cles_bst, style='Primary.TButton').pack(side="left")
         
         ttk.Label(mots_cles_frame, text="Recherche par mots-clés dans le BST.", 
@@ -892,7 +1013,7 @@ class BibliothequeGUI:
         ttk.Label(mots_cles_row, text="Mots-clés:", width=15).pack(side="left")
         ttk.Entry(mots_cles_row, textvariable=self.ajout_bst_mots_cles_var).pack(side="left", fill='x', expand=True, padx=5)
         
-        ttk.Button(ajout_frame, text="Ajouter au BST", command=self.ajouter_bst, style='Primary.TButton').pack(pady=10)
+        self._bouton_modification(ajout_frame, text="Ajouter au BST", command=self.ajouter_bst, style='Primary.TButton').pack(pady=10)
         
         ttk.Label(ajout_frame, text="Ajoute le document dans le BST tout en maintenant l'ordre trié.", 
                  foreground=self.COLORS['text_secondary'], font=('Segoe UI', 9)).pack()
@@ -918,11 +1039,57 @@ class BibliothequeGUI:
         
         delete_entry = ttk.Entry(delete_input_frame, textvariable=self.suppression_bst_var)
         delete_entry.pack(side="left", fill='x', expand=True, padx=(0, 10))
-        ttk.Button(delete_input_frame, text="Supprimer par Titre", command=self.supprimer_bst, style='Primary.TButton').pack(side="left")
+        self._bouton_modification(delete_input_frame, text="Supprimer par Titre", command=self.supprimer_bst, style='Primary.TButton').pack(side="left")
         
         ttk.Label(delete_frame, text="Maintient l'intégrité du BST après la suppression (O(log n)).", 
                  foreground=self.COLORS['text_secondary'], font=('Segoe UI', 9)).pack(pady=(8, 0))
 
+    def _planifier_recherche_live(self, *args):
+        """Relance le délai à chaque frappe : seule la dernière saisie après une pause est recherchée."""
+        if self._recherche_live_id is not None:
+            self.master.after_cancel(self._recherche_live_id)
+        self._generation_recherche_live += 1  # Interrompt l'affichage d'une recherche dépassée
+        self._recherche_live_id = self.master.after(DELAI_RECHERCHE_LIVE_MS, self._recherche_live)
+
+    @differer_pendant_chargement
+    def _recherche_live(self):
+        """Recherche en direct : seule la première page de résultats est résolue puis affichée par tranches."""
+        import time
+        self._recherche_live_id = None
+        generation = self._generation_recherche_live
+        terme = self.recherche_terme_var.get().strip()
+        self.liste_recherche_live.delete(0, tk.END)
+        self._resultats_live = []
+        if len(terme) < LONGUEUR_MIN_RECHERCHE_LIVE:
+            self.recherche_live_statut_var.set("")
+            return
+
+        debut = time.perf_counter()
+        total, premiers = self.moteur.apercu_recherche(terme, TAILLE_PAGE_RESULTATS)
+        duree_ms = (time.perf_counter() - debut) * 1000
+        statut = f"⚡ {total} résultat(s) en {duree_ms:.1f} ms"
+        if total > len(premiers):
+            statut += f" ({len(premiers)} premiers affichés)"
+        self.recherche_live_statut_var.set(statut)
+        self._resultats_live = premiers
+        self._afficher_tranche_live(0, generation)
+
+    def _afficher_tranche_live(self, debut, generation):
+        if generation != self._generation_recherche_live:
+            return  # Une saisie plus récente a remplacé cette recherche
+        fin = debut + LIGNES_PAR_TRANCHE
+        for doc in self._resultats_live[debut:fin]:
+            self.liste_recherche_live.insert(tk.END, str(doc))
+        if fin < len(self._resultats_live):
+            self.master.after(1, self._afficher_tranche_live, fin, generation)
+
+    def _ouvrir_resultat_live(self, event=None):
+        selection = self.liste_recherche_live.curselection()
+        if selection and selection[0] < len(self._resultats_live):
+            doc = self._resultats_live[selection[0]]
+            self.afficher_resultats_temp([doc], f"Document '{doc.titre}'")
+
+    @differer_pendant_chargement
     def rechercher_bst(self):
         terme = self.recherche_bst_var.get().strip()
         if not terme: return
@@ -932,6 +1099,7 @@ class BibliothequeGUI:
         self.afficher_resultats_temp([resultat] if resultat else [], 
                                     f"Résultat P2 (BST O(log n)) pour '{terme}'")
 
+    @differer_pendant_chargement
     def rechercher_auteur_bst(self):
         auteur = self.recherche_bst_auteur_var.get().strip()
         if not auteur: return
@@ -939,6 +1107,7 @@ class BibliothequeGUI:
         resultats = self.bst_bib.search_by_author(auteur)
         self.afficher_resultats_temp(resultats, f"Résultats P2 (BST Auteur) pour '{auteur}'")
 
+    @differer_pendant_chargement
     def rechercher_mots_cles_bst(self):
         mot_cle = self.recherche_bst_mots_cles_var.get().strip()
         if not mot_cle: return
@@ -946,6 +1115,7 @@ class BibliothequeGUI:
         resultats = self.bst_bib.search_by_keywords(mot_cle)
         self.afficher_resultats_temp(resultats, f"Résultats P2 (BST Mots-clés) pour '{mot_cle}'")
 
+    @differer_pendant_chargement
     def rechercher_avancee_bst(self):
         terme = self.recherche_bst_avancee_var.get().strip()
         if not terme: return
@@ -953,8 +1123,9 @@ class BibliothequeGUI:
         resultats = self.bst_bib.search_advanced(terme)
         self.afficher_resultats_temp(resultats, f"Résultats P2 (BST Avancée) pour '{terme}'")
 
+    @bloquer_pendant_chargement
     def ajouter_bst(self):
-        """Ajoute un document uniquement dans le BST """
+        """Ajoute un document depuis l'onglet BST (le moteur l'indexe dans toutes les structures)"""
         titre = self.ajout_bst_titre_var.get().strip()
         auteur = self.ajout_bst_auteur_var.get().strip()
         mots_cles = self.ajout_bst_mots_cles_var.get().strip()
@@ -964,26 +1135,10 @@ class BibliothequeGUI:
             return
         
         try:
-            from partie_1.document import Document
-            nouveau_doc = Document(titre, auteur, mots_cles)
+            self.moteur.ajouter_document(titre, auteur, mots_cles)
             
-            self.bst_bib.insert(nouveau_doc)
-            
-            try:
-                import json
-                import os
-                bst_file = 'bibliotheque_data_bst.json'
-                documents_data = []
-                for doc in self.bst_bib.in_order_traversal():
-                    documents_data.append({
-                        'titre': doc.titre,
-                        'auteur': doc.auteur,
-                        'mots_cles': doc.mots_cles
-                    })
-                with open(bst_file, 'w', encoding='utf-8') as f:
-                    json.dump(documents_data, f, indent=4, ensure_ascii=False)
-            except Exception as e:
-                print(f"Erreur lors de la sauvegarde du BST: {e}")
+            if not self.moteur.sauvegarder():
+                print("Erreur lors de la sauvegarde des documents")
             
             self.ajout_bst_titre_var.set("")
             self.ajout_bst_auteur_var.set("")
@@ -991,140 +1146,142 @@ class BibliothequeGUI:
             
             self.update_affichage()
             
-            messagebox.showinfo("Succès", f"Document '{titre}' ajouté au BST avec succès !\n\nTaille du BST: {self.bst_bib.size} documents\n\nNote: Ajouté uniquement dans le BST, pas dans les autres structures.")
+            messagebox.showinfo("Succès", f"Document '{titre}' ajouté au BST avec succès !\n\nTaille du BST: {self.bst_bib.size} documents\n\nNote: Le document est aussi indexé dans la liste et la table de hachage.")
             
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors de l'ajout : {str(e)}")
     
+    @differer_pendant_chargement
     def comparer_performances_bst_liste(self):
-        """Compare les performances de recherche entre BST et Liste"""
+        """Compare les performances de recherche entre BST et Liste (mesures en arrière-plan)"""
         if not self.bst_bib or not self.list_bib:
             messagebox.showwarning("Structures vides", "BST ou Liste vide. Ajoutez des documents d'abord.")
             return
         
-        try:
+        import random
+        documents = list(self.list_bib)
+        nb_tests = min(100, len(documents))
+        titres_test = random.sample([doc.titre for doc in documents], nb_tests)
+        
+        def mesurer(tache):
             import time
-            import random
-            
-            result_window = tk.Toplevel(self.master)
-            result_window.title("Comparaison des Performances : BST vs Liste")
-            result_window.geometry("700x600")
-            result_window.configure(bg=self.COLORS['background'])
-            
-            main_frame = ttk.Frame(result_window, padding="20")
-            main_frame.pack(fill="both", expand=True)
-            
-            ttk.Label(main_frame, text="Comparaison des Performances de Recherche", 
-                     font=('Segoe UI', 14, 'bold')).pack(pady=(0, 10))
-            
-            ttk.Label(main_frame, text="Recherche par titre : Liste O(n) vs BST O(log n)", 
-                     font=('Segoe UI', 10), 
-                     foreground=self.COLORS['text_secondary']).pack(pady=(0, 20))
-            
-            text_frame = ttk.Frame(main_frame)
-            text_frame.pack(fill="both", expand=True)
-            
-            scrollbar = ttk.Scrollbar(text_frame)
-            scrollbar.pack(side="right", fill="y")
-            
-            result_text = tk.Text(text_frame, wrap="word", 
-                                 yscrollcommand=scrollbar.set,
-                                 bg=self.COLORS['background'],
-                                 fg=self.COLORS['text_primary'],
-                                 font=('Consolas', 10),
-                                 padx=10, pady=10)
-            result_text.pack(side="left", fill="both", expand=True)
-            scrollbar.config(command=result_text.yview)
-            
-            result_text.insert('end', "🔄 Test en cours...\n\n")
-            result_window.update()
-            
-            nb_tests = min(100, len(self.list_bib))
-            titres_test = random.sample([doc.titre for doc in self.list_bib], nb_tests)
-            
-            result_text.insert('end', f"{'='*60}\n")
-            result_text.insert('end', f"Nombre de documents dans la collection : {len(self.list_bib)}\n")
-            result_text.insert('end', f"Nombre de recherches à effectuer : {nb_tests}\n")
-            result_text.insert('end', f"{'='*60}\n\n")
-            
-            result_text.insert('end', "📊 Test 1 : Recherche Séquentielle (Liste)\n")
-            result_text.insert('end', "-" * 60 + "\n")
             start_liste = time.time()
-            for titre in titres_test:
-                for doc in self.list_bib:
+            for i, titre in enumerate(titres_test, 1):
+                for doc in documents:
                     if doc.titre.lower() == titre.lower():
                         break
-            end_liste = time.time()
-            temps_liste = end_liste - start_liste
-            temps_moyen_liste = temps_liste / nb_tests
-            
-            result_text.insert('end', f"Algorithme        : Recherche Séquentielle\n")
-            result_text.insert('end', f"Complexité        : O(n)\n")
-            result_text.insert('end', f"Temps total       : {temps_liste:.6f} secondes\n")
-            result_text.insert('end', f"Temps moyen/recherche : {temps_moyen_liste:.8f} secondes\n\n")
-            result_window.update()
+                if i % 10 == 0:
+                    tache.progression(i, 2 * nb_tests, "Recherche séquentielle (Liste)")
+            temps_liste = time.time() - start_liste
             
-            result_text.insert('end', "🌳 Test 2 : Recherche BST (Arbre Binaire)\n")
-            result_text.insert('end', "-" * 60 + "\n")
             start_bst = time.time()
             for titre in titres_test:
                 self.bst_bib.search(titre)
-            end_bst = time.time()
-            temps_bst = end_bst - start_bst
-            temps_moyen_bst = temps_bst / nb_tests
-            
-            result_text.insert('end', f"Algorithme        : Recherche BST\n")
-            result_text.insert('end', f"Complexité        : O(log n)\n")
-            result_text.insert('end', f"Temps total       : {temps_bst:.6f} secondes\n")
-            result_text.insert('end', f"Temps moyen/recherche : {temps_moyen_bst:.8f} secondes\n\n")
-            result_window.update()
-            
-            gain = temps_liste / temps_bst if temps_bst > 0 else 0
-            result_text.insert('end', f"{'='*60}\n")
-            result_text.insert('end', "🏆 RÉSULTAT DE LA COMPARAISON\n")
-            result_text.insert('end', f"{'='*60}\n\n")
-            
-            if gain > 1:
-                result_text.insert('end', f"✅ Le BST est {gain:.2f}x plus rapide que la liste !\n\n")
-            elif gain < 1:
-                result_text.insert('end', f"⚠️ La liste est {1/gain:.2f}x plus rapide (collection très petite)\n\n")
-            else:
-                result_text.insert('end', f"Les performances sont similaires\n\n")
-            
-            result_text.insert('end', f"Différence de temps : {abs(temps_liste - temps_bst):.6f} secondes\n")
-            result_text.insert('end', f"Gain relatif      : {((temps_liste - temps_bst) / temps_liste * 100):.2f}%\n\n")
-            
-            result_text.insert('end', f"{'='*60}\n")
-            result_text.insert('end', "💡 ANALYSE\n")
-            result_text.insert('end', f"{'='*60}\n\n")
-            
-            result_text.insert('end', f"Pour {len(self.list_bib)} documents :\n")
-            result_text.insert('end', f"  • Liste : parcourt en moyenne {len(self.list_bib)//2} éléments\n")
-            
-            import math
-            hauteur_theorique = math.ceil(math.log2(len(self.list_bib))) if len(self.list_bib) > 0 else 0
-            result_text.insert('end', f"  • BST : parcourt environ {hauteur_theorique} niveaux\n\n")
-            
-            if len(self.list_bib) < 50:
-                result_text.insert('end', "ℹ️ Note : Pour les petites collections (< 50), la différence\n")
-                result_text.insert('end', "   est minime. Le BST montre ses avantages avec plus de données.\n")
-            else:
-                result_text.insert('end', "✨ Le BST démontre clairement son avantage en termes de\n")
-                result_text.insert('end', "   performance pour les grandes collections !\n")
-            
-            result_text.config(state='disabled')
-            
-            ttk.Button(main_frame, text="Fermer", 
-                      command=result_window.destroy).pack(pady=10)
-            
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors de la comparaison : {str(e)}")
+            temps_bst = time.time() - start_bst
+            tache.progression(2 * nb_tests, 2 * nb_tests, "Recherche BST")
+            return temps_liste, temps_bst
+        
+        self._lancer_tache("Comparaison BST / Liste", mesurer,
+                           resultat=lambda temps: self._afficher_comparaison_bst_liste(len(documents), nb_tests, *temps),
+                           erreur=lambda e: messagebox.showerror("Erreur", f"Erreur lors de la comparaison : {str(e)}"))
     
+    def _afficher_comparaison_bst_liste(self, nb_documents, nb_tests, temps_liste, temps_bst):
+        result_window = tk.Toplevel(self.master)
+        result_window.title("Comparaison des Performances : BST vs Liste")
+        result_window.geometry("700x600")
+        result_window.configure(bg=self.COLORS['background'])
+        
+        main_frame = ttk.Frame(result_window, padding="20")
+        main_frame.pack(fill="both", expand=True)
+        
+        ttk.Label(main_frame, text="Comparaison des Performances de Recherche", 
+                 font=('Segoe UI', 14, 'bold')).pack(pady=(0, 10))
+        
+        ttk.Label(main_frame, text="Recherche par titre : Liste O(n) vs BST O(log n)", 
+                 font=('Segoe UI', 10), 
+                 foreground=self.COLORS['text_secondary']).pack(pady=(0, 20))
+        
+        text_frame = ttk.Frame(main_frame)
+        text_frame.pack(fill="both", expand=True)
+        
+        scrollbar = ttk.Scrollbar(text_frame)
+        scrollbar.pack(side="right", fill="y")
+        
+        result_text = tk.Text(text_frame, wrap="word", 
+                             yscrollcommand=scrollbar.set,
+                             bg=self.COLORS['background'],
+                             fg=self.COLORS['text_primary'],
+                             font=('Consolas', 10),
+                             padx=10, pady=10)
+        result_text.pack(side="left", fill="both", expand=True)
+        scrollbar.config(command=result_text.yview)
+        
+        temps_moyen_liste = temps_liste / nb_tests
+        temps_moyen_bst = temps_bst / nb_tests
+        
+        result_text.insert('end', f"{'='*60}\n")
+        result_text.insert('end', f"Nombre de documents dans la collection : {nb_documents}\n")
+        result_text.insert('end', f"Nombre de recherches à effectuer : {nb_tests}\n")
+        result_text.insert('end', f"{'='*60}\n\n")
+        
+        result_text.insert('end', "📊 Test 1 : Recherche Séquentielle (Liste)\n")
+        result_text.insert('end', "-" * 60 + "\n")
+        result_text.insert('end', f"Algorithme        : Recherche Séquentielle\n")
+        result_text.insert('end', f"Complexité        : O(n)\n")
+        result_text.insert('end', f"Temps total       : {temps_liste:.6f} secondes\n")
+        result_text.insert('end', f"Temps moyen/recherche : {temps_moyen_liste:.8f} secondes\n\n")
+        
+        result_text.insert('end', "🌳 Test 2 : Recherche BST (Arbre Binaire)\n")
+        result_text.insert('end', "-" * 60 + "\n")
+        result_text.insert('end', f"Algorithme        : Recherche BST\n")
+        result_text.insert('end', f"Complexité        : O(log n)\n")
+        result_text.insert('end', f"Temps total       : {temps_bst:.6f} secondes\n")
+        result_text.insert('end', f"Temps moyen/recherche : {temps_moyen_bst:.8f} secondes\n\n")
+        
+        gain = temps_liste / temps_bst if temps_bst > 0 else 0
+        result_text.insert('end', f"{'='*60}\n")
+        result_text.insert('end', "🏆 RÉSULTAT DE LA COMPARAISON\n")
+        result_text.insert('end', f"{'='*60}\n\n")
+        
+        if gain > 1:
+            result_text.insert('end', f"✅ Le BST est {gain:.2f}x plus rapide que la liste !\n\n")
+        elif gain < 1:
+            result_text.insert('end', f"⚠️ La liste est {1/gain:.2f}x plus rapide (collection très petite)\n\n")
+        else:
+            result_text.insert('end', f"Les performances sont similaires\n\n")
+        
+        result_text.insert('end', f"Différence de temps : {abs(temps_liste - temps_bst):.6f} secondes\n")
+        result_text.insert('end', f"Gain relatif      : {((temps_liste - temps_bst) / temps_liste * 100):.2f}%\n\n")
+        
+        result_text.insert('end', f"{'='*60}\n")
+        result_text.insert('end', "💡 ANALYSE\n")
+        result_text.insert('end', f"{'='*60}\n\n")
+        
+        result_text.insert('end', f"Pour {nb_documents} documents :\n")
+        result_text.insert('end', f"  • Liste : parcourt en moyenne {nb_documents//2} éléments\n")
+        
+        import math
+        hauteur_theorique = math.ceil(math.log2(nb_documents)) if nb_documents > 0 else 0
+        result_text.insert('end', f"  • BST : parcourt environ {hauteur_theorique} niveaux\n\n")
+        
+        if nb_documents < 50:
+            result_text.insert('end', "ℹ️ Note : Pour les petites collections (< 50), la différence\n")
+            result_text.insert('end', "   est minime. Le BST montre ses avantages avec plus de données.\n")
+        else:
+            result_text.insert('end', "✨ Le BST démontre clairement son avantage en termes de\n")
+            result_text.insert('end', "   performance pour les grandes collections !\n")
+        
+        result_text.config(state='disabled')
+        
+        ttk.Button(main_frame, text="Fermer", 
+                  command=result_window.destroy).pack(pady=10)
+    
+    @bloquer_pendant_chargement
     def supprimer_bst(self):
         titre = self.suppression_bst_var.get().strip()
         if not titre: return
         
-        resultat = supprimer_document_complet(titre, self.list_bib, self.bst_bib, self.hash_bib)
+        resultat = supprimer_document_complet(titre, moteur=self.moteur)
         
         if resultat['succes']:
             message = f"Document '{titre}' supprimé avec succès !\n\n"
@@ -1171,21 +1328,27 @@ class BibliothequeGUI:
         auteur_frame = ttk.LabelFrame(frame, text="Recherche par Auteur (O(1))", padding="15 10")
         auteur_frame.pack(pady=15, fill="x")
         
-        ttk.Entry(auteur_frame, textvariable=self.recherche_hash_auteur_var, width=40).pack(side="left", padx=10)
+        auteur_entry = ttk.Entry(auteur_frame, textvariable=self.recherche_hash_auteur_var, width=40)
+        auteur_entry.pack(side="left", padx=10)
+        ChampSuggestions(auteur_entry, self._suggerer, 'auteur', self.rechercher_auteur_hash)
         ttk.Button(auteur_frame, text="Rechercher Auteur", command=self.rechercher_auteur_hash, style='Primary.TButton').pack(side="left")
         ttk.Label(auteur_frame, text="Trouve tous les documents d'un auteur en calculant directement l'index.", foreground="gray").pack(pady=5)
 
         titre_frame = ttk.LabelFrame(frame, text="Recherche par Titre (O(n))", padding="15 10")
         titre_frame.pack(pady=15, fill="x")
         
-        ttk.Entry(titre_frame, textvariable=self.recherche_hash_titre_var, width=40).pack(side="left", padx=10)
+        titre_entry = ttk.Entry(titre_frame, textvariable=self.recherche_hash_titre_var, width=40)
+        titre_entry.pack(side="left", padx=10)
+        ChampSuggestions(titre_entry, self._suggerer, 'titre', self.rechercher_titre_hash)
         ttk.Button(titre_frame, text="Rechercher Titre", command=self.rechercher_titre_hash, style='Primary.TButton').pack(side="left")
         ttk.Label(titre_frame, text="Recherche par titre dans la table de hachage.", foreground="gray").pack(pady=5)
 
         mots_cles_frame = ttk.LabelFrame(frame, text="Recherche par Mots-clés (O(n))", padding="15 10")
         mots_cles_frame.pack(pady=15, fill="x")
         
-        ttk.Entry(mots_cles_frame, textvariable=self.recherche_hash_mots_cles_var, width=40).pack(side="left", padx=10)
+        mots_cles_entry = ttk.Entry(mots_cles_frame, textvariable=self.recherche_hash_mots_cles_var, width=40)
+        mots_cles_entry.pack(side="left", padx=10)
+        ChampSuggestions(mots_cles_entry, self._suggerer, 'mot_cle', self.rechercher_mots_cles_hash)
         ttk.Button(mots_cles_frame, text="Rechercher Mots-clés", command=self.rechercher_mots_cles_hash, style='Primary.TButton').pack(side="left")
         ttk.Label(mots_cles_frame, text="Recherche par mots-clés dans la table de hachage.", foreground="gray").pack(pady=5)
 
@@ -1196,6 +1359,7 @@ class BibliothequeGUI:
         ttk.Button(avancee_frame, text="Rechercher Avancée", command=self.rechercher_avancee_hash, style='Primary.TButton').pack(side="left")
         ttk.Label(avancee_frame, text="Recherche dans tous les champs de la table de hachage.", foreground="gray").pack(pady=5)
 
+    @differer_pendant_chargement
     def rechercher_auteur_hash(self):
         auteur = self.recherche_hash_auteur_var.get().strip()
         if not auteur: return
@@ -1203,6 +1367,7 @@ class BibliothequeGUI:
         resultats = self.hash_bib.search_by_author(auteur)
         self.afficher_resultats_temp(resultats, f"Résultats P3 (Hachage Auteur O(1)) pour '{auteur}'")
 
+    @differer_pendant_chargement
     def rechercher_titre_hash(self):
         titre = self.recherche_hash_titre_var.get().strip()
         if not titre: return
@@ -1210,6 +1375,7 @@ class BibliothequeGUI:
         resultats = self.hash_bib.search_by_title(titre)
         self.afficher_resultats_temp(resultats, f"Résultats P3 (Hachage Titre O(n)) pour '{titre}'")
 
+    @differer_pendant_chargement
     def rechercher_mots_cles_hash(self):
         mot_cle = self.recherche_hash_mots_cles_var.get().strip()
         if not mot_cle: return
@@ -1217,6 +1383,7 @@ class BibliothequeGUI:
         resultats = self.hash_bib.search_by_keywords(mot_cle)
         self.afficher_resultats_temp(resultats, f"Résultats P3 (Hachage Mots-clés O(n)) pour '{mot_cle}'")
 
+    @differer_pendant_chargement
     def rechercher_avancee_hash(self):
         terme = self.recherche_hash_avancee_var.get().strip()
         if not terme: return
@@ -1254,7 +1421,7 @@ class BibliothequeGUI:
         
         ttk.Entry(titre_frame, textvariable=self.suppression_titre_var, 
                  style='Modern.TEntry', width=40).pack(side="left", padx=(0, 10))
-        ttk.Button(titre_frame, text="🗑️ Supprimer par Titre", 
+        self._bouton_modification(titre_frame, text="🗑️ Supprimer par Titre", 
                   command=self.supprimer_par_titre_avance, style='Primary.TButton').pack(side="left")
         
         ttk.Label(titre_card, text="Supprime le document avec le titre exact spécifié", 
@@ -1269,7 +1436,7 @@ class BibliothequeGUI:
         
         ttk.Entry(auteur_frame, textvariable=self.suppression_auteur_var, 
                  style='Modern.TEntry', width=40).pack(side="left", padx=(0, 10))
-        ttk.Button(auteur_frame, text="🗑️ Supprimer par Auteur", 
+        self._bouton_modification(auteur_frame, text="🗑️ Supprimer par Auteur", 
                   command=self.supprimer_par_auteur_avance, style='Primary.TButton').pack(side="left")
         
         ttk.Label(auteur_card, text="Supprime tous les documents de l'auteur spécifié", 
@@ -1284,7 +1451,7 @@ class BibliothequeGUI:
         
         ttk.Entry(mots_cles_frame, textvariable=self.suppression_mots_cles_var, 
                  style='Modern.TEntry', width=40).pack(side="left", padx=(0, 10))
-        ttk.Button(mots_cles_frame, text="🗑️ Supprimer par Mots-clés", 
+        self._bouton_modification(mots_cles_frame, text="🗑️ Supprimer par Mots-clés", 
                   command=self.supprimer_par_mots_cles_avance, style='Primary.TButton').pack(side="left")
         
         ttk.Label(mots_cles_card, text="Supprime tous les documents contenant le mot-clé spécifié", 
@@ -1294,13 +1461,14 @@ class BibliothequeGUI:
         massive_card = ttk.LabelFrame(frame, text="⚠️ Suppression Massive", padding="15 10")
         massive_card.pack(pady=15, fill="x")
         
-        ttk.Button(massive_card, text="🗑️ SUPPRIMER TOUS LES DOCUMENTS", 
+        self._bouton_modification(massive_card, text="🗑️ SUPPRIMER TOUS LES DOCUMENTS", 
                   command=self.supprimer_tous_documents, style='Secondary.TButton').pack(pady=10)
         
         ttk.Label(massive_card, text="⚠️ ATTENTION: Cette action supprimera TOUS les documents de la bibliothèque !", 
                  font=('Segoe UI', 9),
                  foreground=self.COLORS['danger']).pack()
     
+    @bloquer_pendant_chargement
     def supprimer_par_titre_avance(self):
         """Supprime un document par titre exact."""
         titre = self.suppression_titre_var.get().strip()
@@ -1308,7 +1476,7 @@ class BibliothequeGUI:
             messagebox.showwarning("Attention", "Veuillez entrer un titre.")
             return
         
-        resultat = supprimer_document_complet(titre, self.list_bib, self.bst_bib, self.hash_bib)
+        resultat = supprimer_document_complet(titre, moteur=self.moteur)
         
         if resultat['succes']:
             message = f"✅ Document '{titre}' supprimé avec succès !\n\n"
@@ -1327,6 +1495,7 @@ class BibliothequeGUI:
         
         self.suppression_titre_var.set("")
     
+    @bloquer_pendant_chargement
     def supprimer_par_auteur_avance(self):
         """Supprime tous les documents d'un auteur."""
         auteur = self.suppression_auteur_var.get().strip()
@@ -1334,7 +1503,7 @@ class BibliothequeGUI:
             messagebox.showwarning("Attention", "Veuillez entrer un nom d'auteur.")
             return
         
-        resultat = supprimer_par_criteres('auteur', auteur, self.list_bib, self.bst_bib, self.hash_bib)
+        resultat = supprimer_par_criteres('auteur', auteur, moteur=self.moteur)
         
         if resultat['succes']:
             message = f"✅ {len(resultat['documents_supprimes'])} document(s) supprimé(s) pour l'auteur '{auteur}'\n\n"
@@ -1348,6 +1517,7 @@ class BibliothequeGUI:
         
         self.suppression_auteur_var.set("")
     
+    @bloquer_pendant_chargement
     def supprimer_par_mots_cles_avance(self):
         """Supprime tous les documents contenant un mot-clé."""
         mot_cle = self.suppression_mots_cles_var.get().strip()
@@ -1355,7 +1525,7 @@ class BibliothequeGUI:
             messagebox.showwarning("Attention", "Veuillez entrer un mot-clé.")
             return
         
-        resultat = supprimer_par_criteres('mots_cles', mot_cle, self.list_bib, self.bst_bib, self.hash_bib)
+        resultat = supprimer_par_criteres('mots_cles', mot_cle, moteur=self.moteur)
         
         if resultat['succes']:
             message = f"✅ {len(resultat['documents_supprimes'])} document(s) supprimé(s) pour le mot-clé '{mot_cle}'\n\n"
@@ -1369,6 +1539,7 @@ class BibliothequeGUI:
         
         self.suppression_mots_cles_var.set("")
     
+    @bloquer_pendant_chargement
     def supprimer_tous_documents(self):
         """Supprime tous les documents avec confirmation."""
         if not self.list_bib:
@@ -1383,8 +1554,7 @@ class BibliothequeGUI:
         )
         
         if confirmation:
-            for doc in self.list_bib[:]:
-                supprimer_document_complet(doc.titre, self.list_bib, self.bst_bib, self.hash_bib)
+            vider_toutes_structures(moteur=self.moteur)
             
             messagebox.showinfo("Suppression terminée", "🗑️ Tous les documents ont été supprimés.")
             self.update_affichage()
@@ -1437,7 +1607,7 @@ class BibliothequeGUI:
         
         ttk.Label(melange_frame, text="🎲 Mélange aléatoire:", 
                  font=('Segoe UI', 10, 'bold')).pack(side='left', padx=(0, 10))
-        ttk.Button(melange_frame, text="🔀 Mélanger la liste", 
+        self._bouton_modification(melange_frame, text="🔀 Mélanger la liste", 
                   command=self.melanger_liste, 
                   style='Warning.TButton').pack(side='left')
         ttk.Label(melange_frame, text="Permet de mélanger aléatoirement la liste pour tester les algorithmes", 
@@ -1456,36 +1626,39 @@ class BibliothequeGUI:
         ttk.Label(tri_buttons_frame, text="Algorithmes O(n²):", 
                  font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, columnspan=3, sticky='w', pady=(0, 5))
         
-        ttk.Button(tri_buttons_frame, text="🔄 Tri Insertion", 
+        self._bouton_modification(tri_buttons_frame, text="🔄 Tri Insertion", 
                   command=self.trier_insertion_affichage, style='Secondary.TButton').grid(row=1, column=0, padx=(0, 5), pady=2, sticky='ew')
         
-        ttk.Button(tri_buttons_frame, text="🔍 Tri Sélection", 
+        self._bouton_modification(tri_buttons_frame, text="🔍 Tri Sélection", 
                   command=self.trier_selection_affichage, style='Secondary.TButton').grid(row=1, column=1, padx=5, pady=2, sticky='ew')
         
-        ttk.Button(tri_buttons_frame, text="🫧 Tri Bulles", 
+        self._bouton_modification(tri_buttons_frame, text="🫧 Tri Bulles", 
                   command=self.trier_bulles_affichage, style='Secondary.TButton').grid(row=1, column=2, padx=(5, 0), pady=2, sticky='ew')
         
         ttk.Label(tri_buttons_frame, text="Algorithmes O(n log n):", 
                  font=('Segoe UI', 10, 'bold')).grid(row=2, column=0, columnspan=3, sticky='w', pady=(15, 5))
         
-        ttk.Button(tri_buttons_frame, text="⚡ Tri Rapide", 
+        self._bouton_modification(tri_buttons_frame, text="⚡ Tri Rapide", 
                   command=self.trier_rapide_affichage, style='Primary.TButton').grid(row=3, column=0, padx=(0, 5), pady=2, sticky='ew')
         
-        ttk.Button(tri_buttons_frame, text="🔀 Tri Fusion", 
+        self._bouton_modification(tri_buttons_frame, text="🔀 Tri Fusion", 
                   command=self.trier_fusion_affichage, style='Primary.TButton').grid(row=3, column=1, padx=5, pady=2, sticky='ew')
         
-        ttk.Button(tri_buttons_frame, text="📚 Tri Tas", 
+        self._bouton_modification(tri_buttons_frame, text="📚 Tri Tas", 
                   command=self.trier_tas_affichage, style='Primary.TButton').grid(row=3, column=2, padx=(5, 0), pady=2, sticky='ew')
         
         ttk.Label(tri_buttons_frame, text="Algorithmes Spéciaux:", 
                  font=('Segoe UI', 10, 'bold')).grid(row=4, column=0, columnspan=3, sticky='w', pady=(15, 5))
         
-        ttk.Button(tri_buttons_frame, text="📊 Tri Comptage", 
+        self._bouton_modification(tri_buttons_frame, text="📊 Tri Comptage", 
                   command=self.trier_comptage_affichage, style='Secondary.TButton').grid(row=5, column=0, padx=(0, 5), pady=2, sticky='ew')
         
         ttk.Button(tri_buttons_frame, text="📈 Comparer Tous", 
                   command=self.comparer_algorithmes, style='Primary.TButton').grid(row=5, column=1, padx=5, pady=2, sticky='ew')
         
+        self._bouton_modification(tri_buttons_frame, text="🚀 Tri Vectorisé", 
+                  command=self.trier_vectorise_affichage, style='Secondary.TButton').grid(row=5, column=2, padx=(5, 0), pady=2, sticky='ew')
+        
         for i in range(3):
             tri_buttons_frame.columnconfigure(i, weight=1, uniform="buttons")
         
@@ -1507,7 +1680,7 @@ class BibliothequeGUI:
                   command=self.executer_tests_unitaires, 
                   style='Primary.TButton').pack(side='left', padx=(0, 10))
         
-        ttk.Label(tests_button_frame, text="42 tests (7 algorithmes × 6 scénarios)", 
+        ttk.Label(tests_button_frame, text="48 tests (8 algorithmes × 6 scénarios)", 
                  font=('Segoe UI', 9),
                  foreground=self.COLORS['text_secondary']).pack(side='left')
         
@@ -1515,44 +1688,30 @@ class BibliothequeGUI:
                                   style='Card.TLabelframe', padding="15 10")
         list_card.pack(pady=(0, 15), fill="both", expand=True)
         
-        self.text_list = tk.Text(list_card, height=12, wrap='word', 
-                                bg=self.COLORS['surface'],
-                                fg=self.COLORS['text_primary'],
-                                font=('Consolas', 9),
-                                bd=0, relief='flat')
-        self.text_list.pack(padx=10, pady=10, fill="both", expand=True)
+        # Vues virtualisées : seules les lignes visibles sont lues et affichées
+        self.vue_liste = VueVirtuelle(list_card, lambda: len(self.list_bib),
+                                      lambda debut, taille: self.moteur.page(debut, taille),
+                                      message_vide="La liste est vide.")
+        self.vue_liste.pack(padx=10, pady=10, fill="both", expand=True)
         
         bst_card = ttk.LabelFrame(content_frame, text="🌳 BST (P2) - Ordre In-order (Automatiquement Trié)", 
                                  style='Card.TLabelframe', padding="15 10")
         bst_card.pack(pady=(0, 0), fill="both", expand=True)
         
-        self.text_bst = tk.Text(bst_card, height=12, wrap='word', 
-                               bg=self.COLORS['surface'],
-                               fg=self.COLORS['text_primary'],
-                               font=('Consolas', 9),
-                               bd=0, relief='flat')
-        self.text_bst.pack(padx=10, pady=10, fill="both", expand=True)
-        
-    def update_affichage(self, event=None):
-        """Met à jour les zones d'affichage de la LISTE et du BST."""
-        
-        self.text_list.delete('1.0', tk.END)
-        if self.list_bib:
-            for i, doc in enumerate(self.list_bib):
-                self.text_list.insert(tk.END, f"[{i+1}] {doc}\n")
-        else:
-            self.text_list.insert(tk.END, "La liste est vide.")
-
-        self.text_bst.delete('1.0', tk.END)
         if self.bst_bib:
-            documents_tries = self.bst_bib.in_order_traversal()
-            if documents_tries:
-                for i, doc in enumerate(documents_tries):
-                    self.text_bst.insert(tk.END, f"[{i+1}] {doc}\n")
-            else:
-                 self.text_bst.insert(tk.END, "Le BST est vide.")
+            self.vue_bst = VueVirtuelle(bst_card, lambda: self.bst_bib.size,
+                                        lambda debut, taille: self.bst_bib.in_order_page(debut, taille),
+                                        message_vide="Le BST est vide.")
+            self.vue_bst.pack(padx=10, pady=10, fill="both", expand=True)
         else:
-            self.text_bst.insert(tk.END, "Le module BST est non fonctionnel.")
+            self.vue_bst = None
+            ttk.Label(bst_card, text="Le module BST est non fonctionnel.").pack(padx=10, pady=10)
+        
+    def update_affichage(self, event=None):
+        """Met à jour les vues de la LISTE et du BST : O(lignes visibles), quelle que soit la taille."""
+        self.vue_liste.rafraichir()
+        if self.vue_bst is not None:
+            self.vue_bst.rafraichir()
 
 
     def afficher_resultats_temp(self, documents, titre, message_detail=None):
@@ -1594,9 +1753,13 @@ class BibliothequeGUI:
                 texte_affichage.insert(tk.END, message_detail + "\n\n")
                 texte_affichage.insert(tk.END, "=" * 50 + "\n\n")
             
+            premiers = top_k(documents, TAILLE_PAGE_RESULTATS)
             texte_affichage.insert(tk.END, f"✅ {len(documents)} résultat(s) trouvé(s):\n\n")
-            for i, doc in enumerate(documents, 1):
+            for i, doc in enumerate(premiers, 1):
                 texte_affichage.insert(tk.END, f"{i}. {doc}\n\n")
+            
+            if len(documents) > len(premiers):
+                texte_affichage.insert(tk.END, f"... et {len(documents) - len(premiers)} autre(s) résultat(s) non affiché(s).\n")
         
         button_frame = ttk.Frame(fenetre_resultat)
         button_frame.pack(fill='x', padx=20, pady=(0, 20))
@@ -0,0 +1,93 @@
+"""
+Affichage virtualisé de grandes collections de documents.
+
+VueVirtuelle ne crée qu'autant de lignes de Treeview que de lignes visibles ;
+la barre de défilement déplace une fenêtre sur la collection et seule la page
+visible est demandée à la source (liste ou BST). Ouvrir ou faire défiler la
+vue coûte donc O(lignes visibles), quel que soit le nombre de documents.
+"""
+
+from tkinter import ttk
+
+
+LIGNES_VISIBLES = 12
+COLONNES = (
+    ('rang', '#', 60),
+    ('titre', 'Titre', 260),
+    ('auteur', 'Auteur', 160),
+    ('mots_cles', 'Mots-clés', 220),
+)
+
+
+class VueVirtuelle(ttk.Frame):
+    """
+    Treeview de hauteur fixe alimenté page par page.
+
+    Args:
+        parent: Conteneur
+        compter: Fonction () -> nombre total de documents
+        page: Fonction (debut, taille) -> documents de rang debut à debut + taille - 1
+        message_vide: Texte affiché quand la collection est vide
+        lignes: Nombre de lignes visibles
+    """
+
+    def __init__(self, parent, compter, page, message_vide="Aucun document.",
+                 lignes=LIGNES_VISIBLES, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.compter = compter
+        self.page = page
+        self.message_vide = message_vide
+        self.lignes = lignes
+        self.debut = 0
+        self.total = 0
+
+        self.arbre = ttk.Treeview(self, columns=[nom for nom, _, _ in COLONNES],
+                                  show='headings', height=lignes, selectmode='browse')
+        for nom, libelle, largeur in COLONNES:
+            self.arbre.heading(nom, text=libelle)
+            self.arbre.column(nom, width=largeur, stretch=nom != 'rang', anchor='w')
+        self.defilement = ttk.Scrollbar(self, orient='vertical', command=self._defiler)
+        self.arbre.pack(side='left', fill='both', expand=True)
+        self.defilement.pack(side='right', fill='y')
+
+        for i in range(lignes):
+            self.arbre.insert('', 'end', iid=str(i), values=())
+        self.arbre.bind('<MouseWheel>', lambda e: self._deplacer(-1 if e.delta > 0 else 1, 'units'))
+        self.arbre.bind('<Button-4>', lambda e: self._deplacer(-1, 'units'))
+        self.arbre.bind('<Button-5>', lambda e: self._deplacer(1, 'units'))
+        self.arbre.bind('<Prior>', lambda e: self._deplacer(-1, 'pages'))
+        self.arbre.bind('<Next>', lambda e: self._deplacer(1, 'pages'))
+
+    def rafraichir(self):
+        """Relit le nombre de documents et la page visible (après un ajout, une suppression ou un tri)."""
+        self.total = self.compter()
+        self._afficher(self.debut)
+
+    def _afficher(self, debut):
+        self.debut = max(0, min(debut, self.total - self.lignes))
+        documents = self.page(self.debut, self.lignes) if self.total else []
+        for i in range(self.lignes):
+            if i < len(documents):
+                doc = documents[i]
+                valeurs = (self.debut + i + 1, doc.titre, doc.auteur, ", ".join(doc.mots_cles))
+            elif i == 0 and not self.total:
+                valeurs = ('', self.message_vide, '', '')
+            else:
+                valeurs = ()
+            self.arbre.item(str(i), values=valeurs)
+        if self.total:
+            self.defilement.set(self.debut / self.total, (self.debut + len(documents)) / self.total)
+        else:
+            self.defilement.set(0, 1)
+
+    def _deplacer(self, nombre, unite):
+        pas = self.lignes if unite == 'pages' else 1
+        self._afficher(self.debut + int(nombre) * pas)
+        return 'break'
+
+    def _defiler(self, action, valeur, unite=None):
+        """Commande de la barre de défilement : 'moveto' fraction ou 'scroll' n units|pages."""
+        if action == 'moveto':
+            self._afficher(int(float(valeur) * self.total))
+        elif action == 'scroll':
+            self._deplacer(valeur, unite)
@@ -9,12 +9,6 @@ import os
 
 sys.path.append(os.path.dirname(__file__))
 
-try:
-    from interface.ui import lancer_interface_graphique, initialiser_structures_gui
-except ImportError as e:
-    print(f"Erreur: Impossible de charger l'interface graphique. {e}")
-    sys.exit(1)
-
 
 def lancer_mode_terminal():
     """Lance le mode terminal"""
@@ -22,6 +16,17 @@ def lancer_mode_terminal():
     terminal_main()
 
 
+def lancer_mode_graphique():
+    """Lance l'interface graphique (Tkinter n'est importé qu'à ce moment)"""
+    try:
+        from interface.ui import lancer_interface_graphique
+    except ImportError as e:
+        print(f"Erreur: Impossible de charger l'interface graphique. {e}")
+        sys.exit(1)
+    # La fenêtre s'ouvre tout de suite ; les données sont chargées en arrière-plan
+    lancer_interface_graphique()
+
+
 def menu_lancement():
     """Affiche le menu de sélection du mode d'exécution"""
     print("\n" + "=" * 60)
@@ -40,8 +45,7 @@ def menu_lancement():
         lancer_mode_terminal()
     elif choix == '2':
         print("\n🚀 Lancement de l'Interface Graphique...\n")
-        structures = initialiser_structures_gui()
-        lancer_interface_graphique(structures)
+        lancer_mode_graphique()
     elif choix == '0':
         print("\n👋 Au revoir ! Programme terminé.\n")
     else:
@@ -22,53 +22,56 @@ except ImportError:
 
 sys.path.append(os.path.dirname(__file__))
 
-from partie_1 import Document, BibliothequeManager, Bibliotheque
-from partie_1.persistance import save_all_structures, load_all_structures, create_default_data
-from partie_2 import BinarySearchTree, BSTManager
-from partie_3 import HashTable, HashTableManager
+from partie_1 import Document
+from partie_1.persistance import load_data, create_default_data
+from partie_1.metriques import REGISTRE
+from stockage import MoteurStockage
 
 
 class MenuTerminal:
     """Classe principale pour l'interface terminal"""
     
     def __init__(self):
-        """Initialise le menu terminal avec les structures de données"""
-        self.liste_documents = []
-        self.bst = BinarySearchTree()
-        self.hash_table = HashTable(size=50)
+        """Initialise le menu terminal avec le moteur de stockage et ses index"""
+        self.moteur = MoteurStockage(taille_hachage=50)
         
-        self.manager_liste = BibliothequeManager(Bibliotheque())
-        self.manager_bst = BSTManager()
-        self.manager_hash = HashTableManager()
+        self.bst = self.moteur.bst
+        self.hash_table = self.moteur.hash_table
+        self.index_mots_cles = self.moteur.index_mots_cles
+        
+        self.manager_liste = self.moteur.manager_liste
+        self.manager_bst = self.moteur.manager_bst
+        self.manager_hash = self.moteur.manager_hash
         
         self.charger_donnees()
     
+    @property
+    def liste_documents(self):
+        """Documents du moteur, dans l'ordre de la liste"""
+        return self.moteur.documents()
+    
     def charger_donnees(self):
         """Charge les données depuis les fichiers JSON"""
         print(f"{BLEU}Chargement des données...{RESET}")
         
-        self.liste_documents = load_all_structures(Document, self.bst, self.hash_table)
+        try:
+            self.moteur.charger(load_data(Document))
+        except Exception as e:
+            # Le fichier n'est pas écrasé par les données par défaut : la session démarre vide
+            print(f"{ROUGE}Erreur lors du chargement des données: {e}{RESET}\n")
+            return
         
-        if not self.liste_documents:
+        if not len(self.moteur):
             print(f"{JAUNE}Aucune donnée trouvée. Création de données par défaut...{RESET}")
-            self.liste_documents = create_default_data(Document)
-            
-            for doc in self.liste_documents:
-                self.bst.insert(doc)
-                self.hash_table.insert(doc)
-            
+            self.moteur.charger(create_default_data(Document))
             self.sauvegarder_donnees()
         
-        for doc in self.liste_documents:
-            self.manager_liste.bibliotheque.add_document(doc)
-        
-        print(f"{VERT}✓ {len(self.liste_documents)} documents chargés{RESET}\n")
+        print(f"{VERT}✓ {len(self.moteur)} documents chargés{RESET}\n")
     
     def sauvegarder_donnees(self):
         """Sauvegarde les données dans les fichiers JSON"""
         try:
-            save_all_structures(self.liste_documents)
-            return True
+            return self.moteur.sauvegarder()
         except Exception as e:
             print(f"{ROUGE}Erreur lors de la sauvegarde: {e}{RESET}")
             return False
@@ -93,6 +96,7 @@ class MenuTerminal:
         print(f"{BOLD}{BLEU}║{RESET}  {VERT}6.{RESET} 📊 Comparaison des performances                       {BOLD}{BLEU}║{RESET}")
         print(f"{BOLD}{BLEU}║{RESET}  {VERT}7.{RESET} 🧪 Tests des algorithmes de tri                       {BOLD}{BLEU}║{RESET}")
         print(f"{BOLD}{BLEU}║{RESET}  {VERT}8.{RESET} 📈 Statistiques                                       {BOLD}{BLEU}║{RESET}")
+        print(f"{BOLD}{BLEU}║{RESET}  {VERT}9.{RESET} ⏱️  Métriques des opérations                           {BOLD}{BLEU}║{RESET}")
         print(f"{BOLD}{BLEU}║{RESET}  {ROUGE}0.{RESET} 🚪 Quitter                                            {BOLD}{BLEU}║{RESET}")
         print(f"{BOLD}{BLEU}║{RESET}                                                               {BOLD}{BLEU}║{RESET}")
         print(f"{BOLD}{BLEU}╚═══════════════════════════════════════════════════════════════╝{RESET}\n")
@@ -115,7 +119,7 @@ class MenuTerminal:
     
     def ajouter_document(self):
         """Ajoute un nouveau document"""
-        print(f"\n{BOLD}{BLEU}{'AJOUT D\'UN NOUVEAU DOCUMENT':^70}{RESET}")
+        print(f"\n{BOLD}{BLEU}{'AJOUT D’UN NOUVEAU DOCUMENT':^70}{RESET}")
         print("=" * 70 + "\n")
         
         titre = input(f"{VERT}Titre:{RESET} ").strip()
@@ -126,15 +130,11 @@ class MenuTerminal:
         auteur = input(f"{VERT}Auteur:{RESET} ").strip()
         if not auteur:
             print(f"{ROUGE}L'auteur ne peut pas être vide.{RESET}")
-        return
+            return
 
         mots_cles = input(f"{VERT}Mots-clés (séparés par des virgules):{RESET} ").strip()
         
-        nouveau_doc = Document(titre, auteur, mots_cles)
-        self.liste_documents.append(nouveau_doc)
-        self.bst.insert(nouveau_doc)
-        self.hash_table.insert(nouveau_doc)
-        self.manager_liste.bibliotheque.add_document(nouveau_doc)
+        self.moteur.ajouter_document(titre, auteur, mots_cles)
         
         if self.sauvegarder_donnees():
             print(f"\n{VERT}✓ Document '{titre}' ajouté avec succès !{RESET}")
@@ -149,6 +149,8 @@ class MenuTerminal:
         print(f"{VERT}2.{RESET} Recherche par titre (BST - O(log n))")
         print(f"{VERT}3.{RESET} Recherche par auteur (Hash - O(1))")
         print(f"{VERT}4.{RESET} Recherche avancée (tous champs)")
+        print(f"{VERT}5.{RESET} Recherche multi-critères (planificateur)")
+        print(f"{VERT}6.{RESET} Recherche booléenne (AND / OR / NOT)")
         print(f"{ROUGE}0.{RESET} Retour")
         print("=" * 70)
         
@@ -162,13 +164,17 @@ class MenuTerminal:
             self._recherche_auteur_hash()
         elif choix == "4":
             self._recherche_avancee()
+        elif choix == "5":
+            self._recherche_multi_criteres()
+        elif choix == "6":
+            self._recherche_booleenne()
     
     def _recherche_titre_liste(self):
         """Recherche par titre dans la liste"""
         terme = input(f"\n{VERT}Titre à rechercher:{RESET} ").strip()
         
         start = time.perf_counter()
-        resultats = [doc for doc in self.liste_documents if terme.lower() in doc.titre.lower()]
+        resultats = self.manager_liste.rechercher(terme, 'titre_partiel')
         end = time.perf_counter()
         
         self._afficher_resultats_recherche(resultats, f"Recherche Liste (O(n)) - {(end-start)*1000:.3f} ms")
@@ -178,7 +184,7 @@ class MenuTerminal:
         terme = input(f"\n{VERT}Titre exact à rechercher:{RESET} ").strip()
         
         start = time.perf_counter()
-        resultat = self.bst.search(terme)
+        resultat = self.manager_bst.rechercher_par_titre(terme)
         end = time.perf_counter()
         
         resultats = [resultat] if resultat else []
@@ -189,7 +195,7 @@ class MenuTerminal:
         auteur = input(f"\n{VERT}Auteur à rechercher:{RESET} ").strip()
         
         start = time.perf_counter()
-        resultats = self.hash_table.search_by_author(auteur)
+        resultats = self.manager_hash.rechercher_par_auteur(auteur)
         end = time.perf_counter()
         
         self._afficher_resultats_recherche(resultats, f"Recherche Hash (O(1)) - {(end-start)*1000:.3f} ms")
@@ -204,6 +210,39 @@ class MenuTerminal:
         
         self._afficher_resultats_recherche(resultats, f"Recherche Avancée - {(end-start)*1000:.3f} ms")
     
+    def _recherche_multi_criteres(self):
+        """Recherche sur plusieurs critères exacts, planifiée selon les index disponibles"""
+        print(f"\n{JAUNE}Laissez vide les critères à ignorer.{RESET}")
+        titre = input(f"{VERT}Titre exact:{RESET} ").strip()
+        auteur = input(f"{VERT}Auteur exact:{RESET} ").strip()
+        mot_cle = input(f"{VERT}Mot-clé:{RESET} ").strip()
+        
+        planificateur = self.moteur.planificateur()
+        plan = planificateur.planifier(planificateur.predicats(titre, auteur, mot_cle))
+        
+        start = time.perf_counter()
+        resultats = planificateur.executer(plan)
+        end = time.perf_counter()
+        
+        print(f"\n{plan.explain()}")
+        self._afficher_resultats_recherche(resultats, f"Recherche multi-critères - {(end-start)*1000:.3f} ms")
+    
+    def _recherche_booleenne(self):
+        """Recherche par requête booléenne sur les bitmaps du moteur"""
+        print(f"\n{JAUNE}Exemple : keyword:philosophie AND NOT auteur:camus{RESET}")
+        print(f"{JAUNE}Champs : keyword, auteur, titre — opérateurs : AND, OR, NOT, parenthèses{RESET}")
+        requete = input(f"{VERT}Requête:{RESET} ").strip()
+        
+        start = time.perf_counter()
+        try:
+            resultats = self.manager_liste.rechercher_booleen(requete)
+        except ValueError as e:
+            print(f"{ROUGE}{e}{RESET}")
+            return
+        end = time.perf_counter()
+        
+        self._afficher_resultats_recherche(resultats, f"Recherche booléenne - {(end-start)*1000:.3f} ms")
+    
     def _afficher_resultats_recherche(self, resultats, titre):
         """Affiche les résultats d'une recherche"""
         print(f"\n{BOLD}{BLEU}{'='*70}{RESET}")
@@ -228,6 +267,9 @@ class MenuTerminal:
         print(f"{VERT}4.{RESET} Tri Rapide - O(n log n)")
         print(f"{VERT}5.{RESET} Tri Fusion - O(n log n)")
         print(f"{VERT}6.{RESET} Tri Tas - O(n log n)")
+        etat = "activé" if self.manager_liste.bibliotheque.keep_sorted else "désactivé"
+        print(f"{VERT}7.{RESET} Tri continu à chaque ajout - O(log n) + O(n) ({etat})")
+        print(f"{VERT}8.{RESET} Tri Vectorisé (NumPy) - O(n log n)")
         print(f"{ROUGE}0.{RESET} Retour")
         print("=" * 70)
         
@@ -235,6 +277,10 @@ class MenuTerminal:
         
         if choix == "0":
             return
+        
+        if choix == "7":
+            self._basculer_tri_continu()
+            return
 
         algorithmes = {
             "1": ("Tri par Insertion", "insertion"),
@@ -242,7 +288,8 @@ class MenuTerminal:
             "3": ("Tri à Bulles", "bulles"),
             "4": ("Tri Rapide", "rapide"),
             "5": ("Tri Fusion", "fusion"),
-            "6": ("Tri Tas", "tas")
+            "6": ("Tri Tas", "tas"),
+            "8": ("Tri Vectorisé", "vectorise")
         }
         
         if choix in algorithmes:
@@ -257,31 +304,31 @@ class MenuTerminal:
         self.manager_liste.trier(algo)
         end = time.perf_counter()
         
-        self.liste_documents = list(self.manager_liste.bibliotheque)
-        
         print(f"{VERT}✓ Tri terminé en {(end-start)*1000:.3f} ms{RESET}")
         
         if self.sauvegarder_donnees():
             print(f"{VERT}✓ Liste sauvegardée{RESET}")
     
+    def _basculer_tri_continu(self):
+        """Active ou désactive le maintien trié de la liste"""
+        actif = not self.manager_liste.bibliotheque.keep_sorted
+        self.manager_liste.activer_tri_continu(actif)
+        
+        if actif:
+            print(f"{VERT}✓ Tri continu activé : chaque ajout est inséré à sa place{RESET}")
+            if self.sauvegarder_donnees():
+                print(f"{VERT}✓ Liste sauvegardée{RESET}")
+        else:
+            print(f"{JAUNE}Tri continu désactivé{RESET}")
+    
     def supprimer_document(self):
         """Supprime un document"""
         titre = input(f"\n{VERT}Titre du document à supprimer:{RESET} ").strip()
         
-        doc_a_supprimer = None
-        for doc in self.liste_documents:
-            if doc.titre.lower() == titre.lower():
-                doc_a_supprimer = doc
-                break
-        
-        if not doc_a_supprimer:
+        if not self.moteur.supprimer_par_titre(titre, tous=False):
             print(f"{ROUGE}Document non trouvé.{RESET}")
             return
         
-        self.liste_documents.remove(doc_a_supprimer)
-        self.bst.delete(doc_a_supprimer.titre)
-        self.manager_liste.bibliotheque.remove_document(doc_a_supprimer.titre)
-        
         if self.sauvegarder_donnees():
             print(f"{VERT}✓ Document '{titre}' supprimé avec succès !{RESET}")
     
@@ -294,39 +341,32 @@ class MenuTerminal:
             print(f"{JAUNE}Pas assez de documents pour une comparaison significative.{RESET}")
             return
         
-        import random
-        titres_test = random.sample([doc.titre for doc in self.liste_documents], 
-                                    min(20, len(self.liste_documents)))
+        from partie_1.benchmark_recherche import executer_benchmark_recherche
         
-        temps_liste = 0
-        temps_bst = 0
-        temps_hash = 0
+        rapport = executer_benchmark_recherche(self.liste_documents, nombre_requetes=100,
+                                               bst=self.bst, hash_table=self.hash_table)
+        resultats = rapport['resultats']
+        complexites = {'liste': 'O(n)', 'bst': 'O(log n)', 'hachage': 'O(1)'}
         
-        for titre in titres_test:
-            start = time.perf_counter()
-            [doc for doc in self.liste_documents if doc.titre == titre]
-            temps_liste += time.perf_counter() - start
-            
-            start = time.perf_counter()
-            self.bst.search(titre)
-            temps_bst += time.perf_counter() - start
-        
-        for doc in random.sample(self.liste_documents, min(20, len(self.liste_documents))):
-            start = time.perf_counter()
-            self.hash_table.search_by_author(doc.auteur)
-            temps_hash += time.perf_counter() - start
-        
-        print(f"{VERT}Recherche dans Liste (O(n)):{RESET}      {temps_liste*1000:.3f} ms")
-        print(f"{VERT}Recherche dans BST (O(log n)):{RESET}    {temps_bst*1000:.3f} ms")
-        print(f"{VERT}Recherche dans Hash (O(1)):{RESET}       {temps_hash*1000:.3f} ms")
-        
-        if temps_liste > 0 and temps_bst > 0:
-            gain = temps_liste / temps_bst
-            print(f"\n{BLEU}→ BST est {gain:.1f}x plus rapide que la Liste{RESET}")
-        
-        if temps_liste > 0 and temps_hash > 0:
-            gain = temps_liste / temps_hash
-            print(f"{BLEU}→ Hash est {gain:.1f}x plus rapide que la Liste{RESET}")
+        print(f"{'Structure':<18} {'Requête':<12} {'Débit (req/s)':>14} {'p50 (µs)':>10} {'p99 (µs)':>10}")
+        print("-" * 70)
+        for structure, types in resultats.items():
+            libelle = f"{structure} ({complexites[structure]})"
+            for type_requete, mesure in types.items():
+                print(f"{VERT}{libelle:<18}{RESET} {type_requete:<12} {mesure['debit']:>14.0f} "
+                      f"{mesure['p50'] * 1e6:>10.1f} {mesure['p99'] * 1e6:>10.1f}")
+            print("-" * 70)
+        
+        p50_liste = resultats['liste']['exact']['p50']
+        p50_bst = resultats['bst']['exact']['p50']
+        p50_hash = resultats['hachage']['auteur_zipf']['p50']
+        p50_liste_auteur = resultats['liste']['auteur_zipf']['p50']
+        
+        if p50_liste > 0 and p50_bst > 0:
+            print(f"\n{BLEU}→ BST est {p50_liste / p50_bst:.1f}x plus rapide que la Liste (titre exact){RESET}")
+        
+        if p50_liste_auteur > 0 and p50_hash > 0:
+            print(f"{BLEU}→ Hash est {p50_liste_auteur / p50_hash:.1f}x plus rapide que la Liste (auteur){RESET}")
     
     def tester_algorithmes_tri(self):
         """Teste tous les algorithmes de tri"""
@@ -369,6 +409,43 @@ class MenuTerminal:
         print(f"  - Taille: {self.hash_table.size}")
         print(f"  - Buckets utilisés: {sum(1 for bucket in self.hash_table.table if bucket.items)}")
     
+    def afficher_metriques(self):
+        """Affiche et exporte les métriques (latences, compteurs) de la session"""
+        print(f"\n{BOLD}{BLEU}{'MÉTRIQUES DES OPÉRATIONS':^70}{RESET}")
+        print("=" * 70 + "\n")
+        print(REGISTRE.exporter_texte())
+
+        print(f"\n{BOLD}Cache des recherches:{RESET}")
+        for nom, manager in (("Liste", self.manager_liste), ("BST", self.manager_bst),
+                             ("Hash", self.manager_hash)):
+            stats = manager.statistiques_cache()
+            print(f"  {nom:<6} {stats['succes']:>6} succès / {stats['echecs']:>6} échecs "
+                  f"({stats['taux_succes']:.0%}), {stats['perimes']} invalidé(s), "
+                  f"{stats['entrees']}/{stats['capacite']} entrées")
+
+        print(f"\n{VERT}1.{RESET} Exporter en JSON")
+        print(f"{VERT}2.{RESET} Exporter en texte")
+        print(f"{VERT}3.{RESET} Réinitialiser les métriques")
+        print(f"{ROUGE}0.{RESET} Retour")
+        
+        choix = input(f"\n{BLEU}Votre choix:{RESET} ").strip()
+        
+        if choix in ("1", "2"):
+            extension = "json" if choix == "1" else "txt"
+            fichier = input(f"{VERT}Fichier [metriques.{extension}]:{RESET} ").strip() or f"metriques.{extension}"
+            try:
+                if choix == "1":
+                    REGISTRE.exporter_json(fichier)
+                else:
+                    with open(fichier, 'w', encoding='utf-8') as f:
+                        f.write(REGISTRE.exporter_texte() + "\n")
+                print(f"{VERT}✓ Métriques exportées dans {fichier}{RESET}")
+            except OSError as e:
+                print(f"{ROUGE}Erreur lors de l'export: {e}{RESET}")
+        elif choix == "3":
+            REGISTRE.reinitialiser()
+            print(f"{VERT}✓ Métriques réinitialisées{RESET}")
+    
     def executer(self):
         """Boucle principale du menu"""
         self.afficher_banniere()
@@ -393,6 +470,8 @@ class MenuTerminal:
                 self.tester_algorithmes_tri()
             elif choix == "8":
                 self.afficher_statistiques()
+            elif choix == "9":
+                self.afficher_metriques()
             elif choix == "0":
                 print(f"\n{VERT}Merci d'avoir utilisé la Bibliothèque Numérique !{RESET}")
                 print(f"{BLEU}Au revoir !{RESET}\n")
@@ -1,45 +1,39 @@
 
-from .document import Document
+# Exports différés (PEP 562, voir partie_1/exports_differes.py)
+from .exports_differes import exports_differes
 
-from .bibliotheque import Bibliotheque
-from .gestionnaire_poo import BibliothequeManager
-from .tri_algorithms import (
-    TriAlgorithm, TriInsertion, TriSelection, TriBulles,
-    TriRapide, TriFusion, TriTas, TriComptage
-)
-from .search_algorithms import (
-    SearchAlgorithm, SearchByTitle, SearchByAuthor,
-    SearchByKeywords, SearchAdvanced
-)
+_SOUS_MODULES = {
+    'document': ('Document',),
+    'bibliotheque': ('Bibliotheque',),
+    'gestionnaire_poo': ('BibliothequeManager',),
+    'tri_algorithms': (
+        'TriAlgorithm', 'TriInsertion', 'TriSelection', 'TriBulles', 'TriRapide', 'TriFusion',
+        'TriTas', 'TriComptage', 'TriVectorise', 'top_k'
+    ),
+    'search_algorithms': (
+        'SearchAlgorithm', 'SearchByTitle', 'SearchByAuthor', 'SearchByKeywords', 'SearchAdvanced'
+    ),
+    'profilage': ('Profileur', 'formater_rapport_profil'),
+    'metriques': ('REGISTRE', 'RegistreMetriques'),
+    'cache': ('CacheResultats',),
+    'bitmap': ('Bitmap',),
+    'recherche_booleenne': ('IndexBooleen',),
+    'compat': (
+        'trier_par_titre', 'rechercher_par_titre', 'rechercher_par_auteur',
+        'rechercher_par_mots_cles', 'rechercher_avancee', 'ajouter_document',
+        'afficher_bibliotheque', 'tri_fusion', 'tri_rapide', 'tri_selection', 'tri_bulles',
+        'tri_tas', 'tri_comptage', 'tri_vectorise', 'comparer_temps_execution',
+        'comparer_tous_algorithmes_tri', 'comparer_tous_algorithmes_tri_gui'
+    ),
+    'persistance': (
+        'save_data', 'load_data', 'save_all_structures', 'load_all_structures',
+        'create_default_data', 'iterer_enregistrements', 'lire_documents', 'ecrire_documents',
+        'tri_externe'
+    ),
+    'suppression_avancee': (
+        'supprimer_document_complet', 'supprimer_par_criteres', 'supprimer_documents_multiples',
+        'vider_toutes_structures', 'obtenir_statistiques_suppression'
+    ),
+}
 
-from .compat import (
-    trier_par_titre, 
-    rechercher_par_titre, 
-    rechercher_par_auteur,
-    rechercher_par_mots_cles,
-    rechercher_avancee,
-    ajouter_document, 
-    afficher_bibliotheque,
-    tri_fusion,
-    tri_rapide,
-    tri_selection,
-    tri_bulles,
-    tri_tas,
-    tri_comptage,
-    comparer_temps_execution,
-    comparer_tous_algorithmes_tri,
-    comparer_tous_algorithmes_tri_gui
-)
-
-from .persistance import (
-    save_data, load_data, save_all_structures, 
-    load_all_structures, create_default_data
-)
-
-from .suppression_avancee import (
-    supprimer_document_complet, 
-    supprimer_par_criteres, 
-    supprimer_documents_multiples,
-    vider_toutes_structures,
-    obtenir_statistiques_suppression
-)
\ No newline at end of file
+__all__, __getattr__, __dir__ = exports_differes(__name__, _SOUS_MODULES, globals())
@@ -0,0 +1,345 @@
+"""
+Banc d'essai des recherches sur les trois structures (Liste, BST, Hachage)
+
+Rejoue une charge de requêtes reproductible (graine fixe) sur chaque structure
+et mesure, par type de requête, le débit et les percentiles de latence.
+Le rapport JSON peut être comparé d'une version à l'autre.
+
+Types de requêtes (même sémantique sur chaque structure, qui doivent donc
+trouver le même nombre de documents ; un écart fait échouer le banc) :
+    exact        titre exact présent dans la collection (tous les documents de ce titre)
+    prefixe      début de titre
+    sous_chaine  fragment recherché dans tous les champs
+    absent       majoritairement des titres inexistants (90 % d'échecs)
+    auteur_zipf  auteur exact tiré selon une loi de Zipf (quelques auteurs très demandés)
+
+Usage :
+    python -m partie_1.benchmark_recherche --taille 5000 --sortie rapport_recherche.json
+    python -m partie_1.benchmark_recherche --reference rapport_recherche.json
+"""
+
+import argparse
+import platform
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .bibliotheque import Bibliotheque
+from .benchmark_tri import GRAINE_DEFAUT, percentile, sauvegarder_rapport, charger_rapport
+from .document import Document
+from .generateur import generer_documents_realistes
+from .gestionnaire_poo import BibliothequeManager
+from .persistance import iterer_enregistrements
+
+try:
+    from ..partie_2 import BinarySearchTree, BSTManager
+    from ..partie_3 import HashTable, HashTableManager
+except ImportError:
+    from partie_2 import BinarySearchTree, BSTManager
+    from partie_3 import HashTable, HashTableManager
+
+
+TYPES_REQUETES = ('exact', 'prefixe', 'sous_chaine', 'absent', 'auteur_zipf')
+STRUCTURES = ('liste', 'bst', 'hachage')
+TAUX_ECHEC_ABSENT = 0.9
+EXPOSANT_ZIPF = 1.1
+
+
+def generer_requetes(documents: List[Document], type_requete: str, nombre: int,
+                     graine: int = GRAINE_DEFAUT) -> List[str]:
+    """
+    Génère une charge de requêtes reproductible pour un type donné.
+
+    Args:
+        documents: Collection sur laquelle porteront les requêtes
+        type_requete: Un des TYPES_REQUETES
+        nombre: Nombre de requêtes
+        graine: Graine du générateur
+
+    Returns:
+        Liste des termes de recherche
+    """
+    rng = random.Random(f"{type_requete}-{nombre}-{graine}")
+    if not documents:
+        return []
+
+    if type_requete == 'exact':
+        return [rng.choice(documents).titre for _ in range(nombre)]
+
+    if type_requete == 'prefixe':
+        return [rng.choice(documents).titre[:rng.randint(2, 6)] for _ in range(nombre)]
+
+    if type_requete == 'sous_chaine':
+        requetes = []
+        for _ in range(nombre):
+            mots = rng.choice(documents).titre.split()
+            mot = rng.choice(mots)
+            debut = rng.randint(0, max(0, len(mot) - 3))
+            requetes.append(mot[debut:debut + 4])
+        return requetes
+
+    if type_requete == 'absent':
+        return [rng.choice(documents).titre if rng.random() >= TAUX_ECHEC_ABSENT
+                else f"Titre inexistant {rng.randint(0, 10 ** 9)}"
+                for _ in range(nombre)]
+
+    if type_requete == 'auteur_zipf':
+        auteurs = sorted({doc.auteur for doc in documents})
+        rng.shuffle(auteurs)
+        poids = [1 / (rang ** EXPOSANT_ZIPF) for rang in range(1, len(auteurs) + 1)]
+        return rng.choices(auteurs, weights=poids, k=nombre)
+
+    raise ValueError(f"Type de requête '{type_requete}' inconnu (disponibles : {', '.join(TYPES_REQUETES)})")
+
+
+def construire_backends(documents: List[Document], bst: Optional[BinarySearchTree] = None,
+                        hash_table: Optional[HashTable] = None,
+                        avec_cache: bool = False) -> Dict[str, Dict[str, Callable]]:
+    """
+    Associe à chaque structure l'opération utilisée pour chaque type de requête.
+
+    Pour un même type, toutes les structures calculent le même résultat : les
+    recherches plus larges d'un gestionnaire (sous-chaîne du titre ou de
+    l'auteur) sont filtrées à la sémantique du type.
+
+    Les structures existantes peuvent être passées pour mesurer les données réelles ;
+    sinon elles sont construites à partir des documents. Le cache de résultats
+    des gestionnaires est désactivé sauf si avec_cache est vrai.
+
+    Returns:
+        {structure: {type_requete: fonction(terme)}}
+    """
+    if bst is None:
+        bst = BinarySearchTree()
+        for doc in documents:
+            bst.insert(doc)
+    if hash_table is None:
+        hash_table = HashTable(size=max(50, len(documents) // 20))
+        for doc in documents:
+            hash_table.insert(doc)
+
+    manager_liste = BibliothequeManager(Bibliotheque(documents))
+    manager_bst = BSTManager(bst)
+    manager_hash = HashTableManager(hash_table=hash_table)
+    for manager in (manager_liste, manager_bst, manager_hash):
+        manager.cache.actif = avec_cache
+
+    def titres_egaux(recherche):
+        return lambda terme: [doc for doc in recherche(terme) if doc.titre.lower() == terme.lower()]
+
+    def auteurs_egaux(recherche):
+        return lambda terme: [doc for doc in recherche(terme) if doc.auteur.lower() == terme.lower()]
+
+    def titres_commencant(recherche):
+        return lambda terme: [doc for doc in recherche(terme) if doc.titre.lower().startswith(terme.lower())]
+
+    return {
+        'liste': {
+            'exact': manager_liste.rechercher_par_titre,
+            'prefixe': titres_commencant(lambda terme: manager_liste.rechercher(terme, 'titre_partiel')),
+            'sous_chaine': manager_liste.rechercher_avancee,
+            'absent': manager_liste.rechercher_par_titre,
+            'auteur_zipf': auteurs_egaux(manager_liste.rechercher_par_auteur)
+        },
+        'bst': {
+            'exact': manager_bst.rechercher_tous_par_titre,
+            'prefixe': manager_bst.rechercher_par_prefixe,
+            'sous_chaine': manager_bst.rechercher_avancee,
+            'absent': manager_bst.rechercher_tous_par_titre,
+            'auteur_zipf': auteurs_egaux(manager_bst.rechercher_par_auteur)
+        },
+        # La table est indexée par auteur : les recherches par titre parcourent tous les buckets
+        'hachage': {
+            'exact': titres_egaux(manager_hash.rechercher_par_titre),
+            'prefixe': titres_commencant(manager_hash.rechercher_par_titre),
+            'sous_chaine': manager_hash.rechercher_avancee,
+            'absent': titres_egaux(manager_hash.rechercher_par_titre),
+            'auteur_zipf': auteurs_egaux(manager_hash.rechercher_par_auteur)
+        }
+    }
+
+
+def mesurer_requetes(operation: Callable, requetes: Sequence[str], echauffement: int = 10) -> Dict[str, Any]:
+    """
+    Rejoue une charge de requêtes et mesure chaque requête individuellement.
+
+    Returns:
+        Débit (requêtes/s) et latences p50, p95, p99, max, moyenne en secondes
+    """
+    for terme in requetes[:echauffement]:
+        operation(terme)
+
+    latences = []
+    resultats = 0
+    debut_total = time.perf_counter()
+    for terme in requetes:
+        debut = time.perf_counter()
+        trouve = operation(terme)
+        latences.append(time.perf_counter() - debut)
+        if isinstance(trouve, list):
+            resultats += len(trouve)
+        elif trouve is not None:
+            resultats += 1
+    duree = time.perf_counter() - debut_total
+
+    if not latences:
+        return {'requetes': 0, 'debit': 0.0, 'resultats': 0, 'resultats_moyens': 0.0,
+                'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0, 'moyenne': 0.0}
+
+    return {
+        'requetes': len(latences),
+        'debit': len(latences) / duree if duree > 0 else float('inf'),
+        'resultats': resultats,
+        'resultats_moyens': resultats / len(latences),
+        'p50': percentile(latences, 50),
+        'p95': percentile(latences, 95),
+        'p99': percentile(latences, 99),
+        'max': max(latences),
+        'moyenne': statistics.mean(latences)
+    }
+
+
+def executer_benchmark_recherche(documents: Optional[List[Document]] = None, taille: int = 5000,
+                                 nombre_requetes: int = 500, types: Sequence[str] = TYPES_REQUETES,
+                                 graine: int = GRAINE_DEFAUT, bst: Optional[BinarySearchTree] = None,
+                                 hash_table: Optional[HashTable] = None,
+                                 avec_cache: bool = False,
+                                 structures: Sequence[str] = STRUCTURES) -> Dict[str, Any]:
+    """
+    Exécute la charge complète sur chaque structure.
+
+    Args:
+        documents: Collection à utiliser (par défaut, générée avec la graine par partie_1.generateur)
+        taille: Taille de la collection générée si documents est None
+        nombre_requetes: Nombre de requêtes par type
+        types: Types de requêtes à rejouer
+        graine: Graine des générateurs
+        bst: BST existant à mesurer (optionnel)
+        hash_table: Table de hachage existante à mesurer (optionnel)
+        avec_cache: Mesure les gestionnaires avec leur cache de résultats actif
+        structures: Structures à mesurer (parmi STRUCTURES)
+
+    Returns:
+        Rapport sérialisable en JSON : {structure: {type_requete: mesures}}
+
+    Raises:
+        RuntimeError: Les structures ne trouvent pas le même nombre de documents pour un type
+    """
+    if documents is None:
+        documents = generer_documents_realistes(taille, graine)
+
+    backends = construire_backends(documents, bst, hash_table, avec_cache)
+    charges = {type_requete: generer_requetes(documents, type_requete, nombre_requetes, graine)
+               for type_requete in types}
+
+    rapport = {
+        'version': 1,
+        'parametres': {
+            'graine': graine,
+            'taille': len(documents),
+            'nombre_requetes': nombre_requetes,
+            'types': list(types),
+            'structures': list(structures),
+            'avec_cache': avec_cache
+        },
+        'environnement': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine()
+        },
+        'resultats': {}
+    }
+
+    for structure in structures:
+        rapport['resultats'][structure] = {
+            type_requete: mesurer_requetes(backends[structure][type_requete], charges[type_requete])
+            for type_requete in types
+        }
+
+    for type_requete in types:
+        trouves = {structure: rapport['resultats'][structure][type_requete]['resultats']
+                   for structure in structures}
+        if len(set(trouves.values())) > 1:
+            raise RuntimeError(f"Résultats différents pour '{type_requete}' selon la structure : {trouves}")
+
+    return rapport
+
+
+def comparer_rapports_recherche(reference: Dict[str, Any], actuel: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compare deux rapports : ratio des p50 et p99 et du débit pour chaque structure et type.
+    """
+    differences = []
+    for structure, types in actuel['resultats'].items():
+        for type_requete, mesure in types.items():
+            ref = reference.get('resultats', {}).get(structure, {}).get(type_requete)
+            if not ref:
+                continue
+            differences.append({
+                'structure': structure,
+                'type': type_requete,
+                'ratio_p50': mesure['p50'] / ref['p50'] if ref['p50'] > 0 else None,
+                'ratio_p99': mesure['p99'] / ref['p99'] if ref['p99'] > 0 else None,
+                'ratio_debit': mesure['debit'] / ref['debit'] if ref['debit'] > 0 else None
+            })
+    return differences
+
+
+def formater_rapport_recherche(rapport: Dict[str, Any]) -> str:
+    """Retourne un tableau texte lisible du rapport."""
+    lignes = []
+    lignes.append("=" * 88)
+    lignes.append(f"{'Structure':<10} {'Requête':<12} {'Débit (req/s)':>14} {'p50 (µs)':>10} "
+                  f"{'p95 (µs)':>10} {'p99 (µs)':>10} {'Résultats moy.':>15}")
+    lignes.append("=" * 88)
+
+    for structure, types in rapport['resultats'].items():
+        for type_requete, mesure in types.items():
+            lignes.append(f"{structure:<10} {type_requete:<12} {mesure['debit']:>14.0f} "
+                          f"{mesure['p50'] * 1e6:>10.1f} {mesure['p95'] * 1e6:>10.1f} "
+                          f"{mesure['p99'] * 1e6:>10.1f} {mesure['resultats_moyens']:>15.1f}")
+        lignes.append("-" * 88)
+
+    return "\n".join(lignes)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Banc d'essai des recherches Liste / BST / Hachage")
+    parser.add_argument('--taille', type=int, default=5000, help="Taille de la collection générée")
+    parser.add_argument('--donnees', help="Fichier de documents (.json ou .jsonl) à utiliser à la place")
+    parser.add_argument('--requetes', type=int, default=500, help="Nombre de requêtes par type")
+    parser.add_argument('--types', nargs='+', choices=TYPES_REQUETES, default=list(TYPES_REQUETES))
+    parser.add_argument('--graine', type=int, default=GRAINE_DEFAUT)
+    parser.add_argument('--sortie', help="Fichier JSON où enregistrer le rapport")
+    parser.add_argument('--reference', help="Rapport JSON de référence à comparer")
+    parser.add_argument('--cache', action='store_true',
+                        help="Active le cache de résultats des gestionnaires pendant la mesure")
+    args = parser.parse_args(arguments)
+
+    documents = None
+    if args.donnees:
+        documents = [Document(e['titre'], e['auteur'], e['mots_cles'])
+                     for e in iterer_enregistrements(args.donnees)]
+
+    rapport = executer_benchmark_recherche(documents, args.taille, args.requetes,
+                                           args.types, args.graine, avec_cache=args.cache)
+    print(formater_rapport_recherche(rapport))
+
+    if args.sortie:
+        sauvegarder_rapport(rapport, args.sortie)
+        print(f"\n[OK] Rapport enregistré dans {args.sortie}")
+
+    if args.reference:
+        print(f"\nComparaison avec {args.reference} :")
+        for diff in comparer_rapports_recherche(charger_rapport(args.reference), rapport):
+            if diff['ratio_p50'] is not None:
+                print(f"  {diff['structure']:<10} {diff['type']:<12} p50 x{diff['ratio_p50']:.2f}  "
+                      f"débit x{diff['ratio_debit']:.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,386 @@
+"""
+Banc d'essai reproductible des algorithmes de tri.
+
+Les jeux de données sont générés à partir d'une graine fixe, chaque mesure est
+répétée après un échauffement et le rapport (médiane, p95, pic mémoire,
+exposant de complexité ajusté) peut être sauvegardé en JSON pour être comparé
+d'une version à l'autre.
+
+Usage :
+    python -m partie_1.benchmark_tri --sortie rapport_tri.json
+    python -m partie_1.benchmark_tri --reference rapport_tri.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import string
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .document import Document
+from .tri_algorithms import (
+    TriAlgorithm, TriInsertion, TriSelection, TriBulles,
+    TriRapide, TriFusion, TriTas, TriComptage, TriVectorise
+)
+
+
+GRAINE_DEFAUT = 42
+TAILLES_DEFAUT = (100, 200, 400, 800)
+SCENARIOS = ('aleatoire', 'trie', 'inverse', 'doublons', 'titres_francais')
+
+PREPOSITIONS = ["Du", "Avec", "Une", "Aux", "Vers", "Le", "Par", "La", "Dans", "Au",
+                "Sur", "Chez", "L'", "Sans", "Pour", "Un", "Sous", "Les", "Des"]
+NOMS = ["Secret", "Récit", "Mystère", "Été", "Ombre", "Énigme", "Océan", "Hasard",
+        "Mythe", "Instant", "Pierre", "Reine", "Enfant", "Guerre", "Aube", "Futur",
+        "Jardin", "Femme", "Temple", "Paix", "Tristesse", "Jour", "Orage", "Magicien",
+        "Passé", "Vie", "Héros", "Homme", "Automne", "Nuit", "Prince", "Histoire",
+        "Amour", "Trésor", "Palais", "Pont", "Peur", "Tour", "Route", "Voyage",
+        "Tempête", "Mort", "Moment", "Rivière", "Lune", "Soleil", "Destin", "Temps",
+        "Roman", "Présent", "Printemps", "Montagne", "Désespoir", "Quête", "Conte",
+        "Siècle", "Espoir", "Lumière", "Rêve", "Cauchemar", "Ciel", "Étoile", "Neige"]
+ADJECTIFS = ["Caché", "Étrange", "Irréel", "Imparfait", "Mortel", "Fini", "Large",
+             "Invisible", "Incomplet", "Dernier", "Étroit", "Bon", "Maudit", "Vrai",
+             "Révélé", "Perdu", "Unique", "Sombre", "Éternel", "Oublié"]
+AUTEURS = ["Victor Hugo", "Émile Zola", "Albert Camus", "George Sand", "Marcel Proust",
+           "Honoré de Balzac", "Amélie Nothomb", "Jules Verne", "Colette", "Stendhal"]
+MOTS_CLES = ["roman", "poésie", "théâtre", "histoire", "philosophie", "aventure",
+             "drame", "mystère", "amour", "société"]
+
+
+def titre_francais(rng: random.Random) -> str:
+    """
+    Génère un titre réaliste sur le modèle des fichiers fournis
+    ("Ombre", "Récit de Lune", "Temple et Paix", "Vers Invisible Enfant").
+    """
+    forme = rng.random()
+    if forme < 0.09:
+        return rng.choice(NOMS)
+    if forme < 0.55:
+        return f"{rng.choice(NOMS)} {rng.choice(['de', 'et'])} {rng.choice(NOMS)}"
+    return f"{rng.choice(PREPOSITIONS)} {rng.choice(ADJECTIFS + NOMS)} {rng.choice(NOMS + ADJECTIFS)}"
+
+
+def generer_documents(scenario: str, taille: int, graine: int = GRAINE_DEFAUT,
+                      document_classe=Document) -> List[Document]:
+    """
+    Génère un jeu de documents reproductible.
+
+    Args:
+        scenario: 'aleatoire', 'trie', 'inverse', 'doublons' ou 'titres_francais'
+        taille: Nombre de documents
+        graine: Graine du générateur pseudo-aléatoire
+        document_classe: Classe utilisée pour construire les documents
+
+    Returns:
+        Liste de documents (toujours identique pour une même graine)
+    """
+    rng = random.Random(f"{scenario}-{taille}-{graine}")
+
+    if scenario in ('aleatoire', 'trie', 'inverse'):
+        titres = [''.join(rng.choices(string.ascii_lowercase, k=12)) for _ in range(taille)]
+        if scenario == 'trie':
+            titres.sort()
+        elif scenario == 'inverse':
+            titres.sort(reverse=True)
+    elif scenario == 'doublons':
+        reservoir = [titre_francais(rng) for _ in range(max(1, taille // 20))]
+        titres = [rng.choice(reservoir) for _ in range(taille)]
+    elif scenario == 'titres_francais':
+        titres = [titre_francais(rng) for _ in range(taille)]
+    else:
+        raise ValueError(f"Scénario '{scenario}' inconnu (disponibles : {', '.join(SCENARIOS)})")
+
+    return [document_classe(titre, AUTEURS[i % len(AUTEURS)], MOTS_CLES[i % len(MOTS_CLES)])
+            for i, titre in enumerate(titres)]
+
+
+def algorithmes_par_defaut() -> Dict[str, TriAlgorithm]:
+    """Retourne les algorithmes mesurés par défaut, indexés comme dans BibliothequeManager."""
+    return {
+        'insertion': TriInsertion(),
+        'selection': TriSelection(),
+        'bulles': TriBulles(),
+        'rapide': TriRapide(),
+        'fusion': TriFusion(),
+        'tas': TriTas(),
+        'comptage': TriComptage(),
+        'vectorise': TriVectorise()
+    }
+
+
+def percentile(valeurs: Sequence[float], p: float) -> float:
+    """Percentile p (0-100) par interpolation linéaire entre les rangs."""
+    if not valeurs:
+        return 0.0
+    ordonnees = sorted(valeurs)
+    rang = (len(ordonnees) - 1) * p / 100
+    bas = math.floor(rang)
+    haut = math.ceil(rang)
+    return ordonnees[bas] + (ordonnees[haut] - ordonnees[bas]) * (rang - bas)
+
+
+def mesurer_tri(algorithme: TriAlgorithm, documents: List, repetitions: int = 5,
+                echauffement: int = 1, mesurer_memoire: bool = True) -> Dict[str, Any]:
+    """
+    Mesure un algorithme de tri sur des copies du même jeu de données.
+
+    Seule la liste est copiée (les tris ne modifient pas les documents eux-mêmes),
+    ce qui évite le coût d'un deepcopy dans la mesure. Le pic mémoire est mesuré
+    lors d'une exécution séparée pour ne pas fausser les temps, avec le nombre
+    de blocs alloués pendant le tri et encore vivants à sa fin (différence de
+    deux instantanés tracemalloc : tracemalloc ne compte pas les allocations
+    temporaires, que le pic couvre).
+
+    Args:
+        algorithme: L'algorithme à mesurer
+        documents: Jeu de données (non modifié)
+        repetitions: Nombre d'exécutions mesurées
+        echauffement: Nombre d'exécutions préalables non mesurées
+        mesurer_memoire: Mesure aussi le pic mémoire et les blocs alloués avec tracemalloc
+
+    Returns:
+        Dictionnaire avec mediane, p95, min, max, moyenne, echantillons,
+        memoire_pic et blocs_alloues
+    """
+    for _ in range(echauffement):
+        algorithme.sort(list(documents))
+
+    echantillons = []
+    for _ in range(max(1, repetitions)):
+        copie = list(documents)
+        debut = time.perf_counter()
+        algorithme.sort(copie)
+        echantillons.append(time.perf_counter() - debut)
+
+    memoire_pic = blocs_alloues = None
+    if mesurer_memoire:
+        copie = list(documents)
+        deja_actif = tracemalloc.is_tracing()
+        if not deja_actif:
+            tracemalloc.start()
+        filtres = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        avant = tracemalloc.take_snapshot().filter_traces(filtres)
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        algorithme.sort(copie)
+        memoire_pic = tracemalloc.get_traced_memory()[1] - base
+        apres = tracemalloc.take_snapshot().filter_traces(filtres)
+        blocs_alloues = sum(stat.count_diff for stat in apres.compare_to(avant, 'filename'))
+        if not deja_actif:
+            tracemalloc.stop()
+
+    return {
+        'mediane': statistics.median(echantillons),
+        'p95': percentile(echantillons, 95),
+        'min': min(echantillons),
+        'max': max(echantillons),
+        'moyenne': statistics.mean(echantillons),
+        'echantillons': echantillons,
+        'memoire_pic': memoire_pic,
+        'blocs_alloues': blocs_alloues
+    }
+
+
+def ajuster_exposant(tailles: Sequence[int], temps: Sequence[float]) -> Optional[float]:
+    """
+    Ajuste t = c * n^k par moindres carrés en échelle log-log et retourne k.
+    Un exposant proche de 1 indique O(n) (ou O(n log n)), proche de 2 indique O(n²).
+    """
+    points = [(math.log(n), math.log(t)) for n, t in zip(tailles, temps) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+
+    moyenne_x = statistics.mean(x for x, _ in points)
+    moyenne_y = statistics.mean(y for _, y in points)
+    variance = sum((x - moyenne_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    covariance = sum((x - moyenne_x) * (y - moyenne_y) for x, y in points)
+    return covariance / variance
+
+
+def executer_benchmark_tri(algorithmes: Optional[Dict[str, TriAlgorithm]] = None,
+                           tailles: Sequence[int] = TAILLES_DEFAUT,
+                           scenarios: Sequence[str] = SCENARIOS,
+                           repetitions: int = 5, echauffement: int = 1,
+                           graine: int = GRAINE_DEFAUT, mesurer_memoire: bool = True,
+                           progression: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """
+    Exécute le banc d'essai complet et retourne un rapport sérialisable en JSON.
+
+    Args:
+        algorithmes: Algorithmes à mesurer (par défaut, tous)
+        tailles: Tailles de jeux de données
+        scenarios: Scénarios de données à générer
+        repetitions: Nombre d'exécutions mesurées par point
+        echauffement: Nombre d'exécutions d'échauffement par point
+        graine: Graine des générateurs
+        mesurer_memoire: Mesure aussi le pic mémoire
+        progression: Fonction appelée avec un message avant chaque mesure
+
+    Returns:
+        Rapport : paramètres, environnement et résultats par algorithme et scénario
+    """
+    if algorithmes is None:
+        algorithmes = algorithmes_par_defaut()
+
+    rapport = {
+        'version': 1,
+        'parametres': {
+            'graine': graine,
+            'tailles': list(tailles),
+            'scenarios': list(scenarios),
+            'repetitions': repetitions,
+            'echauffement': echauffement
+        },
+        'environnement': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine()
+        },
+        'resultats': {}
+    }
+
+    jeux = {(scenario, taille): generer_documents(scenario, taille, graine)
+            for scenario in scenarios for taille in tailles}
+
+    for nom, algorithme in algorithmes.items():
+        resultats_algo = {}
+        for scenario in scenarios:
+            points = {}
+            for taille in tailles:
+                if progression:
+                    progression(f"{nom} / {scenario} / {taille}")
+                try:
+                    mesure = mesurer_tri(algorithme, jeux[(scenario, taille)],
+                                         repetitions, echauffement, mesurer_memoire)
+                except RecursionError:
+                    mesure = {'erreur': 'RecursionError'}
+                points[str(taille)] = mesure
+
+            valides = [(int(n), m['mediane']) for n, m in points.items() if 'mediane' in m]
+            resultats_algo[scenario] = {
+                'complexite': algorithme.complexity,
+                'tailles': points,
+                'exposant': ajuster_exposant([n for n, _ in valides], [t for _, t in valides])
+            }
+        rapport['resultats'][nom] = resultats_algo
+
+    return rapport
+
+
+def sauvegarder_rapport(rapport: Dict[str, Any], fichier: str) -> None:
+    """Sauvegarde un rapport au format JSON (trié pour faciliter les diffs)."""
+    with open(fichier, 'w', encoding='utf-8') as f:
+        json.dump(rapport, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+
+def charger_rapport(fichier: str) -> Dict[str, Any]:
+    """Charge un rapport JSON précédemment sauvegardé."""
+    with open(fichier, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def comparer_rapports(reference: Dict[str, Any], actuel: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compare deux rapports point par point.
+
+    Returns:
+        Liste de différences : algorithme, scénario, taille, médianes et ratio actuel/référence,
+        plus l'évolution de l'exposant ajusté
+    """
+    differences = []
+    for nom, scenarios in actuel['resultats'].items():
+        for scenario, donnees in scenarios.items():
+            ref = reference.get('resultats', {}).get(nom, {}).get(scenario)
+            if ref is None:
+                continue
+            for taille, mesure in donnees['tailles'].items():
+                mesure_ref = ref['tailles'].get(taille, {})
+                if 'mediane' not in mesure or 'mediane' not in mesure_ref:
+                    continue
+                ratio = mesure['mediane'] / mesure_ref['mediane'] if mesure_ref['mediane'] > 0 else None
+                differences.append({
+                    'algorithme': nom,
+                    'scenario': scenario,
+                    'taille': int(taille),
+                    'reference': mesure_ref['mediane'],
+                    'actuel': mesure['mediane'],
+                    'ratio': ratio,
+                    'exposant_reference': ref.get('exposant'),
+                    'exposant_actuel': donnees.get('exposant')
+                })
+    return differences
+
+
+def formater_rapport(rapport: Dict[str, Any]) -> str:
+    """Retourne un tableau texte lisible du rapport."""
+    lignes = []
+    lignes.append("=" * 96)
+    lignes.append(f"{'Algorithme':<12} {'Scénario':<16} {'Taille':>7} {'Médiane (ms)':>13} "
+                  f"{'p95 (ms)':>10} {'Pic mém. (Ko)':>14} {'Exposant':>9}")
+    lignes.append("=" * 96)
+
+    for nom, scenarios in rapport['resultats'].items():
+        for scenario, donnees in scenarios.items():
+            exposant = donnees['exposant']
+            for taille, mesure in donnees['tailles'].items():
+                if 'erreur' in mesure:
+                    lignes.append(f"{nom:<12} {scenario:<16} {taille:>7} {mesure['erreur']:>13}")
+                    continue
+                memoire = f"{mesure['memoire_pic'] / 1024:.1f}" if mesure['memoire_pic'] is not None else "-"
+                texte_exposant = f"{exposant:.2f}" if exposant is not None else "-"
+                lignes.append(f"{nom:<12} {scenario:<16} {taille:>7} {mesure['mediane'] * 1000:>13.4f} "
+                              f"{mesure['p95'] * 1000:>10.4f} {memoire:>14} {texte_exposant:>9}")
+        lignes.append("-" * 96)
+
+    return "\n".join(lignes)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Banc d'essai reproductible des algorithmes de tri")
+    parser.add_argument('--algorithmes', nargs='+', help="Algorithmes à mesurer (défaut : tous)")
+    parser.add_argument('--tailles', nargs='+', type=int, default=list(TAILLES_DEFAUT))
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--echauffement', type=int, default=1)
+    parser.add_argument('--graine', type=int, default=GRAINE_DEFAUT)
+    parser.add_argument('--sans-memoire', action='store_true', help="Ne pas mesurer le pic mémoire")
+    parser.add_argument('--sortie', help="Fichier JSON où enregistrer le rapport")
+    parser.add_argument('--reference', help="Rapport JSON de référence à comparer")
+    args = parser.parse_args(arguments)
+
+    algorithmes = algorithmes_par_defaut()
+    if args.algorithmes:
+        inconnus = set(args.algorithmes) - set(algorithmes)
+        if inconnus:
+            parser.error(f"Algorithme(s) inconnu(s) : {', '.join(sorted(inconnus))}")
+        algorithmes = {nom: algorithmes[nom] for nom in args.algorithmes}
+
+    rapport = executer_benchmark_tri(algorithmes, args.tailles, args.scenarios,
+                                     args.repetitions, args.echauffement, args.graine,
+                                     mesurer_memoire=not args.sans_memoire)
+    print(formater_rapport(rapport))
+
+    if args.sortie:
+        sauvegarder_rapport(rapport, args.sortie)
+        print(f"\n[OK] Rapport enregistré dans {args.sortie}")
+
+    if args.reference:
+        print(f"\nComparaison avec {args.reference} :")
+        for diff in comparer_rapports(charger_rapport(args.reference), rapport):
+            if diff['ratio'] is not None:
+                print(f"  {diff['algorithme']:<12} {diff['scenario']:<16} {diff['taille']:>7} "
+                      f"x{diff['ratio']:.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
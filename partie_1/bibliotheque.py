@@ -1,6 +1,14 @@
 
+from bisect import bisect_left, bisect_right
 from typing import List, Optional
+from .concurrence import VerrouLectureEcriture, en_ecriture, en_lecture
 from .document import Document
+from .identifiants import cle_document
+
+
+def _cle_tri(document: Document) -> str:
+    """Clé de tri utilisée par tous les algorithmes : le titre en minuscules."""
+    return document.titre.lower()
 
 
 class Bibliotheque:
@@ -9,16 +17,48 @@ class Bibliotheque:
     Fournit des méthodes pour ajouter, supprimer, trier et rechercher des documents.
     """
     
-    def __init__(self, documents: Optional[List[Document]] = None):
+    def __init__(self, documents: Optional[List[Document]] = None, keep_sorted: bool = False):
         """
         Initialise une nouvelle bibliothèque.
         
         Args:
             documents: Liste optionnelle de documents initiaux
+            keep_sorted: Maintient la liste triée par titre à chaque ajout
         """
         self._documents = documents if documents is not None else []
+        self._cles = None
+        self.generation = 0  # Incrémentée à chaque modification (invalidation du cache de recherche)
+        self.verrou = VerrouLectureEcriture()  # Recherches en parallèle, une seule modification à la fois
+        if keep_sorted:
+            self.set_keep_sorted(True)
     
     @property
+    def keep_sorted(self) -> bool:
+        """Indique si la bibliothèque est maintenue triée en continu."""
+        return self._cles is not None
+    
+    @en_ecriture
+    def set_keep_sorted(self, actif: bool) -> None:
+        """
+        Active ou désactive le maintien permanent de l'ordre par titre.
+        
+        À l'activation, la liste est triée une seule fois (tri stable) et un
+        tableau de clés est mis en cache. Les ajouts insèrent ensuite chaque
+        document à sa position par recherche dichotomique : O(log n) pour la
+        recherche plus O(n) pour le décalage, au lieu d'un re-tri complet.
+        
+        Args:
+            actif: True pour activer le mode trié, False pour le désactiver
+        """
+        if actif:
+            self._documents.sort(key=_cle_tri)
+            self._cles = [_cle_tri(doc) for doc in self._documents]
+            self.generation += 1
+        else:
+            self._cles = None
+    
+    @property
+    @en_lecture
     def documents(self) -> List[Document]:
         """Retourne la liste des documents (lecture seule)."""
         return self._documents.copy()
@@ -32,6 +72,7 @@ class Bibliotheque:
         """Vérifie si la bibliothèque est vide."""
         return len(self._documents) == 0
     
+    @en_ecriture
     def add_document(self, document: Document) -> None:
         """
         Ajoute un document à la bibliothèque.
@@ -39,8 +80,17 @@ class Bibliotheque:
         Args:
             document: Le document à ajouter
         """
-        self._documents.append(document)
+        self.generation += 1
+        if self._cles is None:
+            self._documents.append(document)
+            return
+        
+        cle = _cle_tri(document)
+        position = bisect_right(self._cles, cle)
+        self._cles.insert(position, cle)
+        self._documents.insert(position, document)
     
+    @en_ecriture
     def remove_document(self, titre: str) -> bool:
         """
         Supprime un document par son titre.
@@ -51,12 +101,45 @@ class Bibliotheque:
         Returns:
             True si le document a été supprimé, False sinon
         """
+        if self._cles is not None:
+            position = self._position_titre(titre)
+            if position is None:
+                return False
+            self._cles.pop(position)
+            self._documents.pop(position)
+            self.generation += 1
+            return True
+        
         for i, doc in enumerate(self._documents):
             if doc.titre.lower() == titre.lower():
                 self._documents.pop(i)
+                self.generation += 1
                 return True
         return False
     
+    @en_ecriture
+    def remove(self, document: Document) -> bool:
+        """
+        Supprime ce document précis (comparé par identifiant), même si d'autres
+        documents portent le même titre.
+        
+        Args:
+            document: Le document à supprimer
+            
+        Returns:
+            True si le document a été supprimé, False sinon
+        """
+        cle = cle_document(document)
+        for i, doc in enumerate(self._documents):
+            if cle_document(doc) == cle:
+                self._documents.pop(i)
+                if self._cles is not None:
+                    self._cles.pop(i)
+                self.generation += 1
+                return True
+        return False
+    
+    @en_lecture
     def get_document_by_title(self, titre: str) -> Optional[Document]:
         """
         Récupère un document par son titre.
@@ -67,15 +150,40 @@ class Bibliotheque:
         Returns:
             Le document trouvé ou None
         """
+        if self._cles is not None:
+            position = self._position_titre(titre)
+            return self._documents[position] if position is not None else None
+        
         for doc in self._documents:
             if doc.titre.lower() == titre.lower():
                 return doc
         return None
     
+    def _position_titre(self, titre: str) -> Optional[int]:
+        """
+        Recherche dichotomique d'un titre dans le tableau de clés (mode trié).
+        
+        Args:
+            titre: Le titre à rechercher
+            
+        Returns:
+            L'index du premier document portant ce titre, ou None
+        """
+        cle = titre.lower()
+        position = bisect_left(self._cles, cle)
+        if position < len(self._cles) and self._cles[position] == cle:
+            return position
+        return None
+    
+    @en_ecriture
     def clear(self) -> None:
         """Vide la bibliothèque de tous ses documents."""
         self._documents.clear()
+        if self._cles is not None:
+            self._cles.clear()
+        self.generation += 1
     
+    @en_ecriture
     def sort(self, algorithm) -> None:
         """
         Trie la bibliothèque en utilisant l'algorithme spécifié.
@@ -84,7 +192,11 @@ class Bibliotheque:
             algorithm: Instance d'une classe qui hérite de TriAlgorithm
         """
         algorithm.sort(self._documents)
+        if self._cles is not None:
+            self._cles = [_cle_tri(doc) for doc in self._documents]
+        self.generation += 1
     
+    @en_lecture
     def search(self, algorithm, terme: str) -> List[Document]:
         """
         Recherche des documents en utilisant l'algorithme spécifié.
@@ -102,14 +214,17 @@ class Bibliotheque:
         """Retourne le nombre de documents."""
         return len(self._documents)
     
+    @en_lecture
     def __iter__(self):
-        """Permet d'itérer sur les documents."""
-        return iter(self._documents)
+        """Permet d'itérer sur les documents (sur une copie : une modification concurrente n'affecte pas l'itération)."""
+        return iter(self._documents.copy())
     
+    @en_lecture
     def __getitem__(self, index: int) -> Document:
         """Permet d'accéder aux documents par index."""
         return self._documents[index]
     
+    @en_lecture
     def __str__(self) -> str:
         """Représentation textuelle de la bibliothèque."""
         if self.is_empty():
@@ -0,0 +1,277 @@
+"""
+Bitmaps compressés d'identifiants (organisation de type « roaring »).
+
+Un identifiant x est rangé dans le conteneur de clé x >> 16, sous la forme de
+ses 16 bits de poids faible. Un conteneur peu rempli (au plus 4096 valeurs)
+est un tableau trié array('H') : 2 octets par valeur. Au-delà, c'est une
+carte de bits de 8 Ko (bytearray de 65536 bits), modifiable sur place. Le
+résultat d'une opération reste une carte de bits tant qu'il n'est pas très
+creux : le reconvertir en tableau coûterait plus que l'opération elle-même.
+
+Les opérations ET / OU / SAUF se font conteneur par conteneur : deux cartes
+de bits sont converties en entiers Python et combinées par les opérateurs
+binaires (calcul en C sur 8 Ko), un tableau est filtré sur une carte de bits,
+deux tableaux passent par des ensembles. Sur un million d'identifiants denses
+(16 conteneurs), une intersection coûte moins d'une milliseconde.
+
+Exemple :
+    a = Bitmap([1, 2, 3, 70000])
+    b = Bitmap([2, 3, 4])
+    list(a & b)   # [2, 3]
+    list(a - b)   # [1, 70000]
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, Union
+
+
+BITS_CONTENEUR = 16
+TAILLE_CONTENEUR = 1 << BITS_CONTENEUR
+OCTETS_CARTE = TAILLE_CONTENEUR // 8
+SEUIL_TABLEAU = 4096  # Au-delà, un tableau (2 octets/valeur) dépasse la carte de bits (8 Ko)
+SEUIL_CONVERSION = 512  # Cardinal sous lequel le résultat d'une opération redevient un tableau
+
+Conteneur = Union[array, bytearray]
+
+# Positions des bits à 1 de chaque octet, pour énumérer une carte de bits
+_BITS_OCTET = tuple(tuple(i for i in range(8) if octet >> i & 1) for octet in range(256))
+_OCTET_NON_NUL = re.compile(b'[^\x00]')
+
+
+def _vers_entier(conteneur: Conteneur) -> int:
+    """Conteneur sous forme d'entier dont le bit i vaut 1 si la valeur i est présente."""
+    if isinstance(conteneur, bytearray):
+        return int.from_bytes(conteneur, 'little')
+    carte = bytearray(OCTETS_CARTE)
+    for valeur in conteneur:
+        carte[valeur >> 3] |= 1 << (valeur & 7)
+    return int.from_bytes(carte, 'little')
+
+
+def _positions(carte: bytes) -> Iterator[int]:
+    """Valeurs présentes dans une carte de bits, par ordre croissant (octets nuls sautés en C)."""
+    for trouve in _OCTET_NON_NUL.finditer(carte):
+        base = trouve.start() << 3
+        for bit in _BITS_OCTET[trouve.group()[0]]:
+            yield base + bit
+
+
+def _depuis_entier(entier: int) -> Conteneur:
+    """
+    Conteneur issu d'une opération (None s'il est vide). Énumérer les bits se
+    fait en Python : seuls les résultats très creux redeviennent des tableaux.
+    """
+    cardinal = entier.bit_count()
+    if cardinal == 0:
+        return None
+    carte = entier.to_bytes(OCTETS_CARTE, 'little')
+    if cardinal <= SEUIL_CONVERSION:
+        return array('H', _positions(carte))
+    return bytearray(carte)
+
+
+def _depuis_valeurs(valeurs) -> Conteneur:
+    """Conteneur le plus compact pour des valeurs triées sans doublon (None si vide)."""
+    if not valeurs:
+        return None
+    if len(valeurs) <= SEUIL_TABLEAU:
+        return array('H', valeurs)
+    carte = bytearray(OCTETS_CARTE)
+    for valeur in valeurs:
+        carte[valeur >> 3] |= 1 << (valeur & 7)
+    return carte
+
+
+def _cardinal(conteneur: Conteneur) -> int:
+    if isinstance(conteneur, bytearray):
+        return int.from_bytes(conteneur, 'little').bit_count()
+    return len(conteneur)
+
+
+def _contient(conteneur: Conteneur, valeur: int) -> bool:
+    if isinstance(conteneur, bytearray):
+        return bool(conteneur[valeur >> 3] >> (valeur & 7) & 1)
+    i = bisect_left(conteneur, valeur)
+    return i < len(conteneur) and conteneur[i] == valeur
+
+
+def _et(a: Conteneur, b: Conteneur) -> Conteneur:
+    if isinstance(a, array) and isinstance(b, array):
+        return _depuis_valeurs(sorted(set(a).intersection(b)))
+    if isinstance(a, array) or isinstance(b, array):
+        tableau, carte = (a, b) if isinstance(a, array) else (b, a)
+        return _depuis_valeurs([v for v in tableau if carte[v >> 3] >> (v & 7) & 1])
+    return _depuis_entier(_vers_entier(a) & _vers_entier(b))
+
+
+def _ou(a: Conteneur, b: Conteneur) -> Conteneur:
+    if isinstance(a, array) and isinstance(b, array) and len(a) + len(b) <= SEUIL_TABLEAU:
+        return array('H', sorted(set(a).union(b)))
+    return _depuis_entier(_vers_entier(a) | _vers_entier(b))
+
+
+def _sauf(a: Conteneur, b: Conteneur) -> Conteneur:
+    if isinstance(a, array):
+        if isinstance(b, array):
+            return _depuis_valeurs(sorted(set(a).difference(b)))
+        return _depuis_valeurs([v for v in a if not b[v >> 3] >> (v & 7) & 1])
+    return _depuis_entier(_vers_entier(a) & ~_vers_entier(b))
+
+
+class Bitmap:
+    """
+    Ensemble d'entiers positifs compressé par conteneurs de 65536 valeurs.
+
+    Supporte `&` (ET), `|` (OU), `-` (SAUF), l'appartenance, la taille et
+    l'itération par ordre croissant.
+    """
+
+    __slots__ = ('_conteneurs',)
+
+    def __init__(self, valeurs: Iterable[int] = ()):
+        self._conteneurs: Dict[int, Conteneur] = {}
+        for valeur in valeurs:
+            self.add(valeur)
+
+    @classmethod
+    def _depuis_conteneurs(cls, conteneurs: Dict[int, Conteneur]) -> 'Bitmap':
+        bitmap = cls()
+        bitmap._conteneurs = conteneurs
+        return bitmap
+
+    def add(self, valeur: int) -> None:
+        """Ajoute une valeur. Complexité: O(1) en fin de tableau ou dans une carte de bits."""
+        if valeur < 0:
+            raise ValueError("Un bitmap ne contient que des entiers positifs")
+        cle, bas = valeur >> BITS_CONTENEUR, valeur & (TAILLE_CONTENEUR - 1)
+        conteneur = self._conteneurs.get(cle)
+        if conteneur is None:
+            self._conteneurs[cle] = array('H', (bas,))
+        elif isinstance(conteneur, bytearray):
+            conteneur[bas >> 3] |= 1 << (bas & 7)
+        elif not conteneur or conteneur[-1] < bas:
+            conteneur.append(bas)
+        elif not _contient(conteneur, bas):
+            conteneur.insert(bisect_left(conteneur, bas), bas)
+        else:
+            return
+        if isinstance(conteneur, array) and len(conteneur) > SEUIL_TABLEAU:
+            self._conteneurs[cle] = _depuis_valeurs(list(conteneur))
+
+    def discard(self, valeur: int) -> None:
+        """Retire une valeur si elle est présente."""
+        cle, bas = valeur >> BITS_CONTENEUR, valeur & (TAILLE_CONTENEUR - 1)
+        conteneur = self._conteneurs.get(cle)
+        if conteneur is None:
+            return
+        if isinstance(conteneur, bytearray):
+            conteneur[bas >> 3] &= ~(1 << (bas & 7)) & 0xFF
+            if not any(conteneur):
+                del self._conteneurs[cle]
+            return
+        if _contient(conteneur, bas):
+            conteneur.remove(bas)
+            if not conteneur:
+                del self._conteneurs[cle]
+
+    def clear(self) -> None:
+        self._conteneurs.clear()
+
+    def copy(self) -> 'Bitmap':
+        return Bitmap._depuis_conteneurs({cle: conteneur[:] for cle, conteneur in self._conteneurs.items()})
+
+    def __contains__(self, valeur: int) -> bool:
+        conteneur = self._conteneurs.get(valeur >> BITS_CONTENEUR)
+        return conteneur is not None and _contient(conteneur, valeur & (TAILLE_CONTENEUR - 1))
+
+    def __len__(self) -> int:
+        return sum(_cardinal(conteneur) for conteneur in self._conteneurs.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._conteneurs)
+
+    def __iter__(self) -> Iterator[int]:
+        for cle in sorted(self._conteneurs):
+            base = cle << BITS_CONTENEUR
+            conteneur = self._conteneurs[cle]
+            valeurs = _positions(conteneur) if isinstance(conteneur, bytearray) else conteneur
+            for valeur in valeurs:
+                yield base + valeur
+
+    def __and__(self, autre: 'Bitmap') -> 'Bitmap':
+        if len(self._conteneurs) > len(autre._conteneurs):
+            self, autre = autre, self
+        conteneurs = {}
+        for cle, conteneur in self._conteneurs.items():
+            if cle in autre._conteneurs:
+                resultat = _et(conteneur, autre._conteneurs[cle])
+                if resultat is not None:
+                    conteneurs[cle] = resultat
+        return Bitmap._depuis_conteneurs(conteneurs)
+
+    def __or__(self, autre: 'Bitmap') -> 'Bitmap':
+        conteneurs = {cle: conteneur[:] for cle, conteneur in self._conteneurs.items()}
+        for cle, conteneur in autre._conteneurs.items():
+            conteneurs[cle] = _ou(conteneurs[cle], conteneur) if cle in conteneurs else conteneur[:]
+        return Bitmap._depuis_conteneurs(conteneurs)
+
+    def __sub__(self, autre: 'Bitmap') -> 'Bitmap':
+        conteneurs = {}
+        for cle, conteneur in self._conteneurs.items():
+            if cle in autre._conteneurs:
+                resultat = _sauf(conteneur, autre._conteneurs[cle])
+                if resultat is not None:
+                    conteneurs[cle] = resultat
+            else:
+                conteneurs[cle] = conteneur[:]
+        return Bitmap._depuis_conteneurs(conteneurs)
+
+    @classmethod
+    def union(cls, *bitmaps: 'Bitmap') -> 'Bitmap':
+        """
+        Union de plusieurs bitmaps en une passe : chaque conteneur n'est
+        combiné qu'une fois, là où une suite de `|` recopierait le résultat
+        partiel à chaque opération.
+        """
+        groupes: Dict[int, list] = {}
+        for bitmap in bitmaps:
+            for cle, conteneur in bitmap._conteneurs.items():
+                groupes.setdefault(cle, []).append(conteneur)
+        conteneurs = {}
+        for cle, groupe in groupes.items():
+            if len(groupe) == 1:
+                conteneurs[cle] = groupe[0][:]
+                continue
+            entier = 0
+            for conteneur in groupe:
+                entier |= _vers_entier(conteneur)
+            conteneurs[cle] = _depuis_entier(entier)
+        return cls._depuis_conteneurs(conteneurs)
+
+    @classmethod
+    def depuis_tries(cls, valeurs: Iterable[int]) -> 'Bitmap':
+        """Bitmap de valeurs déjà triées et sans doublon, construit conteneur par conteneur."""
+        conteneurs = {}
+        cle_courante, valeurs_conteneur = None, []
+        for valeur in valeurs:
+            cle = valeur >> BITS_CONTENEUR
+            if cle != cle_courante:
+                if valeurs_conteneur:
+                    conteneurs[cle_courante] = _depuis_valeurs(valeurs_conteneur)
+                cle_courante, valeurs_conteneur = cle, []
+            valeurs_conteneur.append(valeur & (TAILLE_CONTENEUR - 1))
+        if valeurs_conteneur:
+            conteneurs[cle_courante] = _depuis_valeurs(valeurs_conteneur)
+        return cls._depuis_conteneurs(conteneurs)
+
+    def __eq__(self, autre) -> bool:
+        return isinstance(autre, Bitmap) and list(self) == list(autre)
+
+    def octets(self) -> int:
+        """Mémoire occupée par les conteneurs (en octets, hors objets Python)."""
+        return sum(len(c) if isinstance(c, bytearray) else 2 * len(c) for c in self._conteneurs.values())
+
+    def __repr__(self) -> str:
+        return f"Bitmap(taille={len(self)}, conteneurs={len(self._conteneurs)})"
@@ -0,0 +1,131 @@
+"""
+Cache des résultats de recherche (LRU avec durée de vie optionnelle).
+
+Les entrées sont indexées par (structure, algorithme, terme normalisé) et
+mémorisent la génération de la structure au moment du calcul. Bibliotheque,
+BinarySearchTree et HashTable incrémentent leur compteur `generation` à chaque
+insertion, suppression ou vidage : une entrée calculée sur une génération
+antérieure n'est jamais servie.
+
+Exemple :
+    cache = CacheResultats(capacite=256, duree_vie=60)
+    resultats = cache.obtenir_ou_calculer('bst', 'auteur', terme, bst.generation,
+                                          lambda: bst.search_by_author(terme))
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+CAPACITE_DEFAUT = 256
+
+
+def normaliser_terme(terme: str) -> str:
+    """
+    Toutes les recherches étant insensibles à la casse, 'Hugo' et 'hugo'
+    partagent une entrée. Les espaces sont conservés : ils participent aux
+    recherches par sous-chaîne.
+    """
+    return terme.lower()
+
+
+class CacheResultats:
+    """
+    Cache LRU des résultats de recherche avec invalidation par génération.
+
+    Args:
+        capacite: Nombre maximal d'entrées conservées
+        duree_vie: Durée de vie d'une entrée en secondes (None : illimitée)
+    """
+
+    def __init__(self, capacite: int = CAPACITE_DEFAUT, duree_vie: Optional[float] = None):
+        if capacite < 1:
+            raise ValueError("La capacité du cache doit être au moins 1")
+        self.capacite = capacite
+        self.duree_vie = duree_vie
+        self.actif = True  # False : chaque appel recalcule (mesures de performance brutes)
+        self._entrees = OrderedDict()
+        self._verrou = threading.Lock()
+        self.succes = 0
+        self.echecs = 0
+        self.perimes = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def obtenir_ou_calculer(self, structure: str, algorithme: str, terme: str,
+                            generation: int, calcul: Callable[[], Any]) -> Any:
+        """
+        Retourne le résultat en cache, ou le calcule et le mémorise.
+
+        Args:
+            structure: Nom de la structure interrogée ('liste', 'bst', 'hachage')
+            algorithme: Nom de l'algorithme de recherche
+            terme: Terme recherché (normalisé pour la clé)
+            generation: Génération courante de la structure
+            calcul: Fonction sans argument calculant le résultat
+
+        Returns:
+            Le résultat (une copie si c'est une liste, pour protéger l'entrée)
+        """
+        if not self.actif:
+            return calcul()
+
+        cle = (structure, algorithme, normaliser_terme(terme))
+        maintenant = time.monotonic()
+
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None:
+                generation_entree, instant, valeur = entree
+                if generation_entree != generation:
+                    self.perimes += 1
+                    del self._entrees[cle]
+                elif self.duree_vie is not None and maintenant - instant > self.duree_vie:
+                    self.expirations += 1
+                    del self._entrees[cle]
+                else:
+                    self.succes += 1
+                    self._entrees.move_to_end(cle)
+                    return list(valeur) if isinstance(valeur, list) else valeur
+            self.echecs += 1
+
+        valeur = calcul()
+
+        with self._verrou:
+            self._entrees[cle] = (generation, maintenant, valeur)
+            self._entrees.move_to_end(cle)
+            while len(self._entrees) > self.capacite:
+                self._entrees.popitem(last=False)
+                self.evictions += 1
+
+        return list(valeur) if isinstance(valeur, list) else valeur
+
+    def vider(self) -> None:
+        """Supprime toutes les entrées (les statistiques sont conservées)."""
+        with self._verrou:
+            self._entrees.clear()
+
+    def statistiques(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques du cache.
+
+        Returns:
+            Dictionnaire avec entrees, capacite, succes, echecs, taux_succes,
+            perimes (génération dépassée), expirations (durée de vie) et evictions (LRU)
+        """
+        demandes = self.succes + self.echecs
+        return {
+            'entrees': len(self._entrees),
+            'capacite': self.capacite,
+            'succes': self.succes,
+            'echecs': self.echecs,
+            'taux_succes': self.succes / demandes if demandes else 0.0,
+            'perimes': self.perimes,
+            'expirations': self.expirations,
+            'evictions': self.evictions
+        }
+
+    def __len__(self) -> int:
+        return len(self._entrees)
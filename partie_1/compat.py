@@ -5,7 +5,7 @@ from .bibliotheque import Bibliotheque
 from .gestionnaire_poo import BibliothequeManager
 from .tri_algorithms import (
     TriInsertion, TriSelection, TriBulles,
-    TriRapide, TriFusion, TriTas, TriComptage
+    TriRapide, TriFusion, TriTas, TriComptage, TriVectorise
 )
 from .search_algorithms import SearchByTitle, SearchByAuthor, SearchByKeywords, SearchAdvanced
 
@@ -65,6 +65,12 @@ def tri_comptage(bibliotheque: List[Document]) -> None:
     tri.sort(bibliotheque)
 
 
+def tri_vectorise(bibliotheque: List[Document]) -> None:
+    """Tri vectorisé NumPy, avec repli sans NumPy (wrapper POO)."""
+    tri = TriVectorise()
+    tri.sort(bibliotheque)
+
+
 def rechercher_par_titre(bibliotheque: List[Document]) -> None:
     """
     Recherche par titre (ancienne API, wrapper POO).
@@ -177,9 +183,8 @@ def afficher_bibliotheque(bibliotheque: List[Document]) -> None:
 
 
 def comparer_temps_execution(Document_Classe, tri_insertion_func, tri_fusion_func):
-    """Compare les temps d'exécution (wrapper POO)."""
-    import time
-    import random
+    """Compare les temps d'exécution (wrapper POO, données reproductibles)."""
+    from .benchmark_tri import generer_documents, mesurer_tri
     
     tailles = [10, 50, 100, 500, 1000]
     print("\n" + "=" * 70)
@@ -187,21 +192,10 @@ def comparer_temps_execution(Document_Classe, tri_insertion_func, tri_fusion_fun
     print("=" * 70)
     
     for taille in tailles:
-        docs = [Document_Classe(f"Document {random.randint(1000, 9999)}", f"Auteur {i % 10}", f"tag{i % 5}") for i in range(taille)]
-        random.shuffle(docs)
+        docs = generer_documents('aleatoire', taille, document_classe=Document_Classe)
         
-        from copy import deepcopy
-        docs_copy = deepcopy(docs)
-        start = time.perf_counter()
-        tri_insertion = TriInsertion()
-        tri_insertion.sort(docs_copy)
-        temps_insertion = time.perf_counter() - start
-        
-        docs_copy = deepcopy(docs)
-        start = time.perf_counter()
-        tri_fusion = TriFusion()
-        tri_fusion.sort(docs_copy)
-        temps_fusion = time.perf_counter() - start
+        temps_insertion = mesurer_tri(TriInsertion(), docs, repetitions=3, mesurer_memoire=False)['mediane']
+        temps_fusion = mesurer_tri(TriFusion(), docs, repetitions=3, mesurer_memoire=False)['mediane']
         
         print(f"\nTaille: {taille} documents")
         print(f"  Tri Insertion (O(n²)): {temps_insertion:.6f}s")
@@ -217,8 +211,8 @@ def comparer_tous_algorithmes_tri(Document_Classe):
     return manager.comparer_algorithmes_tri([10, 50, 100])
 
 
-def comparer_tous_algorithmes_tri_gui(Document_Classe):
+def comparer_tous_algorithmes_tri_gui(Document_Classe, progression=None):
     """Compare tous les algorithmes pour l'interface (wrapper POO)."""
     manager = BibliothequeManager()
-    return manager.comparer_algorithmes_tri([10, 50, 100])
+    return manager.comparer_algorithmes_tri([10, 50, 100], progression=progression)
 
@@ -0,0 +1,139 @@
+"""
+Contrôle de concurrence lecteurs / rédacteur des structures partagées.
+
+Bibliotheque, BinarySearchTree, HashTable et MoteurStockage possèdent chacun
+un VerrouLectureEcriture (`self.verrou`) : leurs méthodes de recherche et de
+parcours le prennent en lecture, leurs modifications en écriture. Plusieurs
+fils (interface, tâche de fond, serveur) peuvent ainsi chercher en même temps
+pendant qu'un seul modifie, sans qu'un parcours ne voie une structure à moitié
+modifiée.
+
+Exemple :
+    with moteur.lecture():         # plusieurs recherches sur un état cohérent
+        titres = moteur.manager_bst.rechercher_par_prefixe("le")
+        auteurs = moteur.manager_hash.rechercher_par_auteur("camus")
+"""
+
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+
+class VerrouLectureEcriture:
+    """
+    Verrou partagé en lecture, exclusif en écriture.
+
+    Un rédacteur en attente passe avant les nouveaux lecteurs (pas de famine
+    des écritures). Le verrou est réentrant : un fil peut reprendre une lecture
+    ou une écriture qu'il détient déjà, et lire pendant qu'il écrit. En
+    revanche, demander l'écriture en tenant la lecture bloquerait le fil
+    (il attendrait sa propre lecture) : c'est refusé par une RuntimeError.
+    """
+
+    def __init__(self):
+        self._etat = threading.Lock()  # Protège les champs ci-dessous
+        self._condition = threading.Condition(self._etat)
+        self._lecteurs = {}  # identifiant du fil -> niveau d'imbrication des lectures
+        self._ecrivain = None
+        self._niveau_ecriture = 0
+        self._ecrivains_en_attente = 0
+
+    def acquerir_lecture(self) -> None:
+        moi = threading.get_ident()
+        with self._etat:
+            if moi in self._lecteurs or self._ecrivain == moi:
+                self._lecteurs[moi] = self._lecteurs.get(moi, 0) + 1
+                return
+            while self._ecrivain is not None or self._ecrivains_en_attente:
+                self._condition.wait()
+            self._lecteurs[moi] = 1
+
+    def liberer_lecture(self) -> None:
+        moi = threading.get_ident()
+        with self._etat:
+            niveau = self._lecteurs.get(moi)
+            if niveau is None:
+                raise RuntimeError("Lecture libérée par un fil qui ne la détient pas")
+            if niveau > 1:
+                self._lecteurs[moi] = niveau - 1
+                return
+            del self._lecteurs[moi]
+            if not self._lecteurs and self._ecrivains_en_attente:
+                self._condition.notify_all()
+
+    def acquerir_ecriture(self) -> None:
+        moi = threading.get_ident()
+        with self._etat:
+            if self._ecrivain == moi:
+                self._niveau_ecriture += 1
+                return
+            if moi in self._lecteurs:
+                raise RuntimeError("Écriture demandée pendant une lecture du même fil (interblocage)")
+            self._ecrivains_en_attente += 1
+            try:
+                while self._ecrivain is not None or self._lecteurs:
+                    self._condition.wait()
+            finally:
+                self._ecrivains_en_attente -= 1
+            self._ecrivain = moi
+            self._niveau_ecriture = 1
+
+    def liberer_ecriture(self) -> None:
+        with self._etat:
+            if self._ecrivain != threading.get_ident():
+                raise RuntimeError("Écriture libérée par un fil qui ne la détient pas")
+            self._niveau_ecriture -= 1
+            if not self._niveau_ecriture:
+                self._ecrivain = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def lecture(self):
+        self.acquerir_lecture()
+        try:
+            yield
+        finally:
+            self.liberer_lecture()
+
+    @contextmanager
+    def ecriture(self):
+        self.acquerir_ecriture()
+        try:
+            yield
+        finally:
+            self.liberer_ecriture()
+
+    @property
+    def lecteurs(self) -> int:
+        """Nombre de fils qui lisent en ce moment."""
+        return len(self._lecteurs)
+
+    @property
+    def ecriture_en_cours(self) -> bool:
+        return self._ecrivain is not None
+
+
+def en_lecture(methode):
+    """Décorateur : exécute la méthode sous `self.verrou` en lecture."""
+    @wraps(methode)
+    def enveloppe(self, *args, **kwargs):
+        verrou = self.verrou
+        verrou.acquerir_lecture()
+        try:
+            return methode(self, *args, **kwargs)
+        finally:
+            verrou.liberer_lecture()
+    return enveloppe
+
+
+def en_ecriture(methode):
+    """Décorateur : exécute la méthode sous `self.verrou` en écriture."""
+    @wraps(methode)
+    def enveloppe(self, *args, **kwargs):
+        verrou = self.verrou
+        verrou.acquerir_ecriture()
+        try:
+            return methode(self, *args, **kwargs)
+        finally:
+            verrou.liberer_ecriture()
+    return enveloppe
@@ -3,8 +3,12 @@ class Document:
     """
     Structure de données représentant un document dans la bibliothèque
     avec ses attributs (titre, auteur, mots_cles).
+    
+    L'identifiant `id` est un entier stable attribué par le moteur de stockage
+    à l'ajout du document (None tant que le document n'est pas stocké).
     """
-    def __init__(self, titre, auteur, mots_cles):
+    def __init__(self, titre, auteur, mots_cles, id=None):
+        self.id = id
         self.titre = titre
         self.auteur = auteur
         if isinstance(mots_cles, str):
@@ -21,8 +25,11 @@ class Document:
     
     def to_dict(self):
         """Convertit l'objet Document en dictionnaire pour la sérialisation JSON."""
-        return {
+        donnees = {
             'titre': self.titre,
             'auteur': self.auteur,
             'mots_cles': self.mots_cles
-        }
\ No newline at end of file
+        }
+        if self.id is not None:
+            donnees = {'id': self.id, **donnees}
+        return donnees
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Exports différés des paquets (PEP 562).
+
+Chaque `__init__` déclare la table {sous-module: noms exportés} et obtient
+`__all__`, `__getattr__` et `__dir__` de exports_differes : un nom n'est
+importé qu'au premier accès, si bien qu'importer le paquet ne charge que les
+sous-modules réellement utilisés.
+
+Exemple :
+    _SOUS_MODULES = {'document': ('Document',)}
+    __all__, __getattr__, __dir__ = exports_differes(__name__, _SOUS_MODULES, globals())
+"""
+
+from importlib import import_module
+from typing import Callable, Dict, List, Sequence, Tuple
+
+
+def exports_differes(paquet: str, sous_modules: Dict[str, Sequence[str]],
+                     espace: dict) -> Tuple[List[str], Callable, Callable]:
+    """
+    Construit les attributs d'export différé d'un paquet.
+
+    Args:
+        paquet: Nom du paquet (`__name__` de son `__init__`)
+        sous_modules: Noms exportés par sous-module
+        espace: Espace de noms du paquet (`globals()`), complété à chaque import
+
+    Returns:
+        (__all__, __getattr__, __dir__)
+    """
+    origines = {nom: module for module, noms in sous_modules.items() for nom in noms}
+
+    def __getattr__(nom):
+        module = origines.get(nom)
+        if module is None:
+            raise AttributeError(f"module {paquet!r} has no attribute {nom!r}")
+        valeur = getattr(import_module(f".{module}", paquet), nom)
+        espace[nom] = valeur  # Les accès suivants ne passent plus par __getattr__
+        return valeur
+
+    def __dir__():
+        return sorted(set(espace) | set(origines))
+
+    return list(origines), __getattr__, __dir__
@@ -0,0 +1,289 @@
+"""
+Générateur de grandes bibliothèques synthétiques pour les tests de charge.
+
+Les distributions reproduisent celles des fichiers bibliotheque_data*.json
+fournis : formes de titres ("Ombre", "Récit de Lune", "Vers Invisible Enfant")
+et vocabulaire de chaque position, proportion de titres accentués, nombre de
+mots-clés par document. La popularité des auteurs suit une loi de Zipf et celle
+des mots-clés une loi de puissance ; le taux de titres en double est réglable.
+
+Les documents sont produits un par un et écrits en flux : la mémoire utilisée
+ne dépend pas du nombre de documents (10 000 à 10 000 000).
+
+Usage :
+    python -m partie_1.generateur 1000000 --sortie bibliotheque_1M.jsonl
+    python -m partie_1.generateur 50000 --sortie test.json --doublons 0.05
+"""
+
+import argparse
+import bisect
+import math
+import os
+import random
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from .document import Document
+from .persistance import iterer_enregistrements, _ecrire_enregistrements
+from .benchmark_tri import GRAINE_DEFAUT, NOMS, ADJECTIFS, PREPOSITIONS, AUTEURS, MOTS_CLES
+
+
+DOSSIER_PROJET = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FICHIERS_MODELES = ('bibliotheque_data_1000.json', 'bibliotheque_data_500.json')
+CONNECTEURS = ('de', 'et')
+EXPOSANT_AUTEURS = 1.0
+EXPOSANT_MOTS_CLES = 1.2
+
+
+class ProfilBibliotheque:
+    """
+    Distributions observées dans une bibliothèque existante.
+
+    Une forme de titre est une suite d'emplacements, chacun avec son vocabulaire
+    (par exemple [noms, {'de', 'et'}, noms] pour "Récit de Lune").
+    """
+
+    def __init__(self, formes: Dict[str, List[List[str]]], poids_formes: Dict[str, int],
+                 auteurs: List[str], mots_cles: List[str], nombres_mots_cles: Dict[int, int]):
+        self.formes = formes
+        self.poids_formes = poids_formes
+        self.auteurs = auteurs
+        self.mots_cles = mots_cles
+        self.nombres_mots_cles = nombres_mots_cles
+
+    @classmethod
+    def depuis_fichiers(cls, fichiers: Sequence[str] = FICHIERS_MODELES) -> 'ProfilBibliotheque':
+        """
+        Construit le profil à partir des fichiers fournis (lus en flux).
+        Si aucun fichier n'est disponible, utilise le vocabulaire de benchmark_tri.
+        """
+        formes = {}
+        poids_formes = Counter()
+        auteurs = set()
+        mots_cles = set()
+        nombres_mots_cles = Counter()
+
+        for fichier in fichiers:
+            chemin = fichier if os.path.isabs(fichier) else os.path.join(DOSSIER_PROJET, fichier)
+            if not os.path.exists(chemin):
+                continue
+            for enregistrement in iterer_enregistrements(chemin):
+                mots = enregistrement['titre'].split()
+                if not mots:
+                    continue
+                nom_forme = cls._nom_forme(mots)
+                emplacements = formes.setdefault(nom_forme, [set() for _ in mots])
+                for emplacement, mot in zip(emplacements, mots):
+                    emplacement.add(mot)
+                poids_formes[nom_forme] += 1
+
+                auteurs.add(enregistrement['auteur'])
+                valeurs = enregistrement['mots_cles']
+                if isinstance(valeurs, str):
+                    valeurs = valeurs.split(',')
+                valeurs = [mot.strip().lower() for mot in valeurs if mot.strip()]
+                mots_cles.update(valeurs)
+                nombres_mots_cles[len(valeurs)] += 1
+
+        if not poids_formes:
+            return cls.par_defaut()
+
+        return cls({nom: [sorted(emplacement) for emplacement in emplacements]
+                    for nom, emplacements in formes.items()},
+                   dict(poids_formes), sorted(auteurs), sorted(mots_cles), dict(nombres_mots_cles))
+
+    @classmethod
+    def par_defaut(cls) -> 'ProfilBibliotheque':
+        """Profil construit à partir du vocabulaire de benchmark_tri."""
+        return cls(
+            {'1': [NOMS],
+             '3-liaison': [NOMS, list(CONNECTEURS), NOMS],
+             '3': [PREPOSITIONS, ADJECTIFS + NOMS, NOMS + ADJECTIFS]},
+            {'1': 9, '3-liaison': 46, '3': 45},
+            list(AUTEURS), list(MOTS_CLES), {2: 1, 3: 1, 4: 1, 5: 1}
+        )
+
+    @staticmethod
+    def _nom_forme(mots: List[str]) -> str:
+        if len(mots) == 3 and mots[1] in CONNECTEURS:
+            return '3-liaison'
+        return str(len(mots))
+
+
+def _cumuls_puissance(taille: int, exposant: float) -> List[float]:
+    """Poids cumulés d'une loi de puissance 1 / rang^exposant."""
+    cumuls = []
+    total = 0.0
+    for rang in range(1, taille + 1):
+        total += 1.0 / (rang ** exposant)
+        cumuls.append(total)
+    return cumuls
+
+
+def _cumuls_liste(poids: Sequence[float]) -> Iterator[float]:
+    total = 0
+    for valeur in poids:
+        total += valeur
+        yield total
+
+
+def _tirer(rng: random.Random, valeurs: Sequence, cumuls: Sequence[float]):
+    """Tire une valeur selon des poids cumulés (recherche dichotomique)."""
+    return valeurs[bisect.bisect_right(cumuls, rng.random() * cumuls[-1])]
+
+
+class _EspaceTitres:
+    """
+    Énumère sans répétition les titres d'une forme, sans les garder en mémoire.
+
+    Le k-ième titre est obtenu par une permutation affine k -> (a*k + b) mod N
+    de l'espace des N combinaisons, décodée en un mot par emplacement. Au-delà
+    de N titres, un numéro de tome garantit l'unicité ("Récit de Lune, tome 2").
+    """
+
+    def __init__(self, emplacements: List[List[str]], rng: random.Random):
+        self.emplacements = emplacements
+        self.taille = math.prod(len(emplacement) for emplacement in emplacements)
+        self.a = max(1, int(self.taille * 0.6180339887)) | 1
+        while math.gcd(self.a, self.taille) != 1:
+            self.a += 2
+        self.b = rng.randrange(self.taille)
+        self.emis = 0
+
+    def titre(self, rang: int) -> str:
+        tome, position = divmod(rang, self.taille)
+        code = (self.a * position + self.b) % self.taille
+        mots = []
+        for emplacement in reversed(self.emplacements):
+            code, indice = divmod(code, len(emplacement))
+            mots.append(emplacement[indice])
+        titre = ' '.join(reversed(mots))
+        return f"{titre}, tome {tome + 1}" if tome else titre
+
+    def suivant(self) -> str:
+        self.emis += 1
+        return self.titre(self.emis - 1)
+
+
+def iterer_documents(taille: int, graine: int = GRAINE_DEFAUT, taux_doublons: float = 0.0,
+                     exposant_auteurs: float = EXPOSANT_AUTEURS,
+                     exposant_mots_cles: float = EXPOSANT_MOTS_CLES,
+                     profil: Optional[ProfilBibliotheque] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Génère en flux des enregistrements de documents (même format que save_data).
+
+    Args:
+        taille: Nombre de documents
+        graine: Graine du générateur (même graine => même bibliothèque)
+        taux_doublons: Proportion de documents reprenant le titre d'un document précédent
+        exposant_auteurs: Exposant de la loi de Zipf sur la popularité des auteurs
+        exposant_mots_cles: Exposant de la loi de puissance sur la fréquence des mots-clés
+        profil: Distributions à reproduire (par défaut, celles des fichiers fournis)
+
+    Yields:
+        Dictionnaires {'titre', 'auteur', 'mots_cles'}
+    """
+    if not 0.0 <= taux_doublons <= 1.0:
+        raise ValueError("Le taux de doublons doit être compris entre 0 et 1")
+
+    if profil is None:
+        profil = ProfilBibliotheque.depuis_fichiers()
+    rng = random.Random(f"generateur-{graine}")
+
+    noms_formes = sorted(profil.formes)
+    cumuls_formes = list(_cumuls_liste([profil.poids_formes[nom] for nom in noms_formes]))
+    espaces = {nom: _EspaceTitres(profil.formes[nom], rng) for nom in noms_formes}
+
+    # Le rang de popularité est attribué au hasard : l'auteur le plus lu change avec la graine
+    auteurs = list(profil.auteurs)
+    rng.shuffle(auteurs)
+    cumuls_auteurs = _cumuls_puissance(len(auteurs), exposant_auteurs)
+
+    mots_cles = list(profil.mots_cles)
+    rng.shuffle(mots_cles)
+    cumuls_mots_cles = _cumuls_puissance(len(mots_cles), exposant_mots_cles)
+
+    nombres = sorted(n for n in profil.nombres_mots_cles if n <= len(mots_cles))
+    cumuls_nombres = list(_cumuls_liste([profil.nombres_mots_cles[n] for n in nombres]))
+
+    for _ in range(taille):
+        espace = espaces[_tirer(rng, noms_formes, cumuls_formes)]
+        if espace.emis and rng.random() < taux_doublons:
+            titre = espace.titre(rng.randrange(espace.emis))
+        else:
+            titre = espace.suivant()
+
+        choisis = []
+        nombre = _tirer(rng, nombres, cumuls_nombres) if nombres else 0
+        while len(choisis) < nombre:
+            mot = _tirer(rng, mots_cles, cumuls_mots_cles)
+            if mot not in choisis:
+                choisis.append(mot)
+
+        yield {
+            'titre': titre,
+            'auteur': _tirer(rng, auteurs, cumuls_auteurs),
+            'mots_cles': choisis
+        }
+
+
+def generer_documents_realistes(taille: int, graine: int = GRAINE_DEFAUT, taux_doublons: float = 0.0,
+                                document_classe=Document, **options) -> List[Document]:
+    """
+    Génère une bibliothèque en mémoire, prête à être chargée dans une structure.
+
+    Returns:
+        Liste de documents (toujours identique pour une même graine)
+    """
+    return [document_classe(enregistrement['titre'], enregistrement['auteur'],
+                            enregistrement['mots_cles'])
+            for enregistrement in iterer_documents(taille, graine, taux_doublons, **options)]
+
+
+def generer_fichier(taille: int, fichier: str, graine: int = GRAINE_DEFAUT,
+                    taux_doublons: float = 0.0, **options) -> int:
+    """
+    Écrit une bibliothèque synthétique directement sur disque, sans la garder en mémoire.
+
+    Args:
+        taille: Nombre de documents
+        fichier: Fichier de sortie (.jsonl pour JSON Lines, sinon tableau JSON comme save_data)
+        graine: Graine du générateur
+        taux_doublons: Proportion de titres en double
+
+    Returns:
+        Nombre de documents écrits (0 en cas d'erreur)
+    """
+    try:
+        nombre = _ecrire_enregistrements(
+            iterer_documents(taille, graine, taux_doublons, **options), fichier)
+        print(f"\n[OK] Génération réussie : {nombre} documents écrits dans {fichier}")
+        return nombre
+    except Exception as e:
+        print(f"\n[ERREUR] Erreur lors de la génération : {e}")
+        return 0
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Génère une grande bibliothèque synthétique")
+    parser.add_argument('taille', type=int, help="Nombre de documents")
+    parser.add_argument('--sortie', required=True, help="Fichier de sortie (.json ou .jsonl)")
+    parser.add_argument('--graine', type=int, default=GRAINE_DEFAUT)
+    parser.add_argument('--doublons', type=float, default=0.0, help="Proportion de titres en double (0 à 1)")
+    parser.add_argument('--exposant-auteurs', type=float, default=EXPOSANT_AUTEURS)
+    parser.add_argument('--exposant-mots-cles', type=float, default=EXPOSANT_MOTS_CLES)
+    args = parser.parse_args(arguments)
+
+    debut = time.perf_counter()
+    nombre = generer_fichier(args.taille, args.sortie, args.graine, args.doublons,
+                             exposant_auteurs=args.exposant_auteurs,
+                             exposant_mots_cles=args.exposant_mots_cles)
+    if nombre:
+        print(f"Durée : {time.perf_counter() - debut:.1f} s")
+    return 0 if nombre == args.taille else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
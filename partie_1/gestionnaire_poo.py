@@ -1,16 +1,19 @@
 
-from typing import List, Dict, Any
+from contextlib import nullcontext
+from typing import List, Dict, Any, Callable, Optional
 import time
-from copy import deepcopy
 
 from .bibliotheque import Bibliotheque
 from .document import Document
 from .tri_algorithms import (
     TriAlgorithm, TriInsertion, TriSelection, TriBulles,
-    TriRapide, TriFusion, TriTas, TriComptage
+    TriRapide, TriFusion, TriTas, TriComptage, TriVectorise, top_k
 )
+from .cache import CacheResultats
+from .metriques import REGISTRE
+from .recherche_booleenne import IndexBooleen
 from .search_algorithms import (
-    SearchAlgorithm, SearchByTitle, SearchByAuthor,
+    SearchAlgorithm, SearchByTitle, SearchByTitlePartial, SearchByAuthor,
     SearchByKeywords, SearchAdvanced
 )
 
@@ -21,14 +24,22 @@ class BibliothequeManager:
     Centralise les opérations de tri, recherche et gestion.
     """
     
-    def __init__(self, bibliotheque: Bibliotheque = None):
+    def __init__(self, bibliotheque: Bibliotheque = None, cache: Optional[CacheResultats] = None,
+                 moteur=None):
         """
         Initialise le gestionnaire.
         
         Args:
             bibliotheque: Instance de Bibliotheque (optionnel)
+            cache: Cache des résultats de recherche (par défaut, un cache dédié)
+            moteur: MoteurStockage dont la bibliothèque est un index ; les ajouts
+                et suppressions passent alors par lui
         """
-        self.bibliotheque = bibliotheque if bibliotheque else Bibliotheque()
+        self.bibliotheque = bibliotheque if bibliotheque is not None else Bibliotheque()
+        self.moteur = moteur
+        self.cache = cache if cache is not None else CacheResultats()
+        self._index_booleen = None
+        self._generation_index_booleen = None
         
         self.tri_algorithms = {
             'insertion': TriInsertion(),
@@ -37,11 +48,13 @@ class BibliothequeManager:
             'rapide': TriRapide(),
             'fusion': TriFusion(),
             'tas': TriTas(),
-            'comptage': TriComptage()
+            'comptage': TriComptage(),
+            'vectorise': TriVectorise()
         }
         
         self.search_algorithms = {
             'titre': SearchByTitle(),
+            'titre_partiel': SearchByTitlePartial(),
             'auteur': SearchByAuthor(),
             'mots_cles': SearchByKeywords(),
             'avancee': SearchAdvanced()
@@ -61,7 +74,10 @@ class BibliothequeManager:
             Le document créé
         """
         doc = Document(titre, auteur, mots_cles)
-        self.bibliotheque.add_document(doc)
+        if self.moteur is not None:
+            self.moteur.ajouter(doc)
+        else:
+            self.bibliotheque.add_document(doc)
         return doc
     
     def supprimer_document(self, titre: str) -> bool:
@@ -74,11 +90,16 @@ class BibliothequeManager:
         Returns:
             True si supprimé, False sinon
         """
+        if self.moteur is not None:
+            return bool(self.moteur.supprimer_par_titre(titre, tous=False))
         return self.bibliotheque.remove_document(titre)
     
     def vider_bibliotheque(self) -> None:
         """Vide complètement la bibliothèque."""
-        self.bibliotheque.clear()
+        if self.moteur is not None:
+            self.moteur.vider()
+        else:
+            self.bibliotheque.clear()
     
     
     def trier(self, algorithm_name: str = 'insertion') -> None:
@@ -89,10 +110,39 @@ class BibliothequeManager:
             algorithm_name: Nom de l'algorithme ('insertion', 'fusion', etc.)
         """
         algorithm = self.tri_algorithms.get(algorithm_name)
-        if algorithm:
-            self.bibliotheque.sort(algorithm)
-        else:
+        if not algorithm:
             raise ValueError(f"Algorithme de tri '{algorithm_name}' non disponible")
+        
+        if self.bibliotheque.keep_sorted:
+            return
+        self.bibliotheque.sort(algorithm)
+    
+    def activer_tri_continu(self, actif: bool = True) -> None:
+        """
+        Active ou désactive le maintien permanent de l'ordre par titre.
+        
+        Une fois activé, chaque ajout est inséré à sa place par recherche
+        dichotomique : plus besoin de relancer un tri complet après un ajout.
+        
+        Args:
+            actif: True pour activer, False pour désactiver
+        """
+        self.bibliotheque.set_keep_sorted(actif)
+    
+    def top_k(self, k: int, key: Optional[Callable] = None) -> List[Document]:
+        """
+        Retourne les k premiers documents dans l'ordre sans trier la collection.
+        
+        Args:
+            k: Nombre de documents souhaités (ex. taille d'une page d'affichage)
+            key: Fonction de clé (par défaut, le titre en minuscules)
+            
+        Returns:
+            Les k premiers documents, triés
+        """
+        if key is None and self.bibliotheque.keep_sorted:
+            return self.bibliotheque[:max(k, 0)]
+        return top_k(self.bibliotheque, k, key)
     
     def trier_avec_mesure(self, algorithm_name: str = 'insertion') -> Dict[str, Any]:
         """
@@ -119,25 +169,35 @@ class BibliothequeManager:
             'nombre_documents': self.bibliotheque.size
         }
     
-    def comparer_algorithmes_tri(self, tailles: List[int] = None) -> List[Dict[str, Any]]:
+    def comparer_algorithmes_tri(self, tailles: List[int] = None, graine: Optional[int] = None,
+                                 repetitions: int = 3, progression=None) -> List[Dict[str, Any]]:
         """
         Compare les performances de tous les algorithmes de tri.
+        Les données sont générées avec une graine fixe et le temps retenu est
+        la médiane de plusieurs exécutions (voir benchmark_tri).
         
         Args:
             tailles: Liste des tailles à tester
+            graine: Graine du générateur de données (par défaut, GRAINE_DEFAUT)
+            repetitions: Nombre d'exécutions mesurées par algorithme
+            progression: Fonction (fait, total, message) appelée après chaque mesure
             
         Returns:
             Liste de dictionnaires avec les résultats
         """
+        from .benchmark_tri import GRAINE_DEFAUT, generer_documents, mesurer_tri
+        
+        if graine is None:
+            graine = GRAINE_DEFAUT
         if tailles is None:
             tailles = [10, 50, 100, 500, 1000]
         
         resultats = []
+        total = len(tailles) * len(self.tri_algorithms)
+        fait = 0
         
         for taille in tailles:
-            import random
-            test_docs = [Document(f"Document {random.randint(1000, 9999)}", f"Auteur {i % 10}", f"tag{i % 5}") for i in range(taille)]
-            random.shuffle(test_docs)
+            test_docs = generer_documents('aleatoire', taille, graine)
             
             taille_resultats = {
                 'taille': taille,
@@ -145,17 +205,16 @@ class BibliothequeManager:
             }
             
             for nom, algorithm in self.tri_algorithms.items():
-                docs_copy = deepcopy(test_docs)
-                
-                start_time = time.perf_counter()
-                algorithm.sort(docs_copy)
-                end_time = time.perf_counter()
+                mesure = mesurer_tri(algorithm, test_docs, repetitions, mesurer_memoire=False)
                 
                 taille_resultats['algorithmes'].append({
                     'nom': nom.capitalize(),
                     'complexite': algorithm.complexity,
-                    'temps': end_time - start_time
+                    'temps': mesure['mediane']
                 })
+                fait += 1
+                if progression is not None:
+                    progression(fait, total, f"{nom.capitalize()} sur {taille} documents")
             
             resultats.append(taille_resultats)
         
@@ -165,6 +224,7 @@ class BibliothequeManager:
     def rechercher(self, terme: str, algorithm_name: str = 'avancee') -> List[Document]:
         """
         Recherche des documents avec l'algorithme spécifié.
+        Les résultats sont mis en cache jusqu'à la prochaine modification de la bibliothèque.
         
         Args:
             terme: Terme de recherche
@@ -175,10 +235,33 @@ class BibliothequeManager:
         """
         algorithm = self.search_algorithms.get(algorithm_name)
         if algorithm:
-            return self.bibliotheque.search(algorithm, terme)
+            with REGISTRE.chronometrer(f"liste.rechercher.{algorithm_name}"):
+                return self.cache.obtenir_ou_calculer(
+                    'liste', algorithm_name, terme, self.bibliotheque.generation,
+                    lambda: self.bibliotheque.search(algorithm, terme))
         else:
             raise ValueError(f"Algorithme de recherche '{algorithm_name}' non disponible")
     
+    def statistiques_cache(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache de recherche (succès, échecs, taux...)."""
+        return self.cache.statistiques()
+    
+    def rechercher_top_k(self, terme: str, k: int, algorithm_name: str = 'avancee',
+                         key: Optional[Callable] = None) -> List[Document]:
+        """
+        Recherche puis retourne uniquement les k premiers résultats dans l'ordre.
+        
+        Args:
+            terme: Terme de recherche
+            k: Nombre de résultats souhaités
+            algorithm_name: Nom de l'algorithme de recherche
+            key: Fonction de clé (par défaut, le titre en minuscules)
+            
+        Returns:
+            Les k premiers résultats, triés
+        """
+        return top_k(self.rechercher(terme, algorithm_name), k, key)
+    
     def rechercher_par_titre(self, titre: str) -> List[Document]:
         """Recherche par titre exact."""
         return self.rechercher(titre, 'titre')
@@ -195,6 +278,46 @@ class BibliothequeManager:
         """Recherche avancée dans tous les champs."""
         return self.rechercher(terme, 'avancee')
     
+    def index_booleen(self) -> IndexBooleen:
+        """
+        Index bitmap des recherches booléennes : celui du moteur s'il en
+        maintient un, sinon un index construit à partir de la bibliothèque et
+        reconstruit après chaque modification de celle-ci.
+        """
+        if self.moteur is not None and self.moteur.structure('booleen') is not None:
+            return self.moteur.structure('booleen')
+        if self._generation_index_booleen != self.bibliotheque.generation:
+            self._index_booleen = IndexBooleen(self.bibliotheque)
+            # Un index reconstruit repartirait de la génération 0 et pourrait retomber
+            # sur une génération déjà en cache : il reprend celle de la bibliothèque
+            self._index_booleen.generation = self.bibliotheque.generation
+            self._generation_index_booleen = self.bibliotheque.generation
+        return self._index_booleen
+    
+    def rechercher_booleen(self, requete: str) -> List[Document]:
+        """
+        Recherche par requête booléenne sur des bitmaps d'identifiants.
+        
+        Exemple : "keyword:philosophie AND NOT auteur:camus". Champs : keyword,
+        auteur, titre ; opérateurs AND, OR, NOT et parenthèses (voir
+        partie_1/recherche_booleenne.py).
+        
+        Args:
+            requete: La requête
+            
+        Returns:
+            Liste des documents trouvés, par ordre d'identifiant
+            
+        Raises:
+            ValueError: Requête mal formée
+        """
+        # L'index booléen du moteur est modifié sous son verrou : on le lit en lecture
+        lecture = self.moteur.lecture() if self.moteur is not None else nullcontext()
+        with lecture, REGISTRE.chronometrer("liste.rechercher.booleen"):
+            index = self.index_booleen()
+            return self.cache.obtenir_ou_calculer('liste', 'booleen', requete, index.generation,
+                                                  lambda: index.search(requete))
+    
     
     def afficher_bibliotheque(self) -> str:
         """
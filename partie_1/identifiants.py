@@ -0,0 +1,118 @@
+"""
+Identifiants de documents et listes d'identifiants triées.
+
+Chaque document reçoit un identifiant entier stable lorsqu'il entre dans le
+moteur de stockage ; l'identifiant est sauvegardé avec le document. Les index
+qui renvoient des ensembles de documents (index inversé des mots-clés,
+planificateur) manipulent des tableaux d'entiers triés et sans doublon
+(array('q')) : intersection, union et différence se font alors par fusion ou
+recherche dichotomique, sans construire d'ensembles d'objets.
+
+Exemple :
+    a = tableau_trie([7, 2, 5])
+    b = tableau_trie([5, 9, 7])
+    intersection_triee(a, b)   # array('q', [5, 7])
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+
+# En dessous de ce rapport de tailles, l'intersection passe par des ensembles
+RATIO_DICHOTOMIE = 16
+
+
+def cle_document(document) -> int:
+    """
+    Clé entière d'un document : son identifiant stable, ou à défaut son
+    identité (documents construits hors du moteur, sans identifiant).
+    """
+    identifiant = getattr(document, 'id', None)
+    return identifiant if identifiant is not None else id(document)
+
+
+def tableau_trie(cles: Iterable[int]) -> array:
+    """Tableau trié et sans doublon des clés."""
+    return array('q', sorted(set(cles)))
+
+
+def contient_trie(tableau: array, cle: int) -> bool:
+    """Recherche dichotomique d'une clé. Complexité: O(log n)."""
+    i = bisect_left(tableau, cle)
+    return i < len(tableau) and tableau[i] == cle
+
+
+def inserer_trie(tableau: array, cle: int) -> bool:
+    """
+    Insère une clé à sa place. Les identifiants étant attribués dans l'ordre
+    croissant, l'insertion se fait le plus souvent en fin de tableau, en O(1).
+
+    Returns:
+        False si la clé était déjà présente
+    """
+    if not tableau or tableau[-1] < cle:
+        tableau.append(cle)
+        return True
+    i = bisect_left(tableau, cle)
+    if i < len(tableau) and tableau[i] == cle:
+        return False
+    tableau.insert(i, cle)
+    return True
+
+
+def retirer_trie(tableau: array, cle: int) -> bool:
+    """Retire une clé ; retourne False si elle était absente."""
+    i = bisect_left(tableau, cle)
+    if i < len(tableau) and tableau[i] == cle:
+        del tableau[i]
+        return True
+    return False
+
+
+def intersection_triee(a: array, b: array) -> array:
+    """
+    Intersection de deux tableaux triés. Si l'un est bien plus petit, chacune
+    de ses clés est cherchée par dichotomie dans l'autre, à partir de la
+    position de la précédente : O(k log n) sans parcourir le grand tableau.
+    Sinon l'intersection d'ensembles (en C) est plus rapide qu'une fusion
+    écrite en Python.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if len(a) * RATIO_DICHOTOMIE >= len(b):
+        return array('q', sorted(set(a).intersection(b)))
+    resultat = array('q')
+    debut = 0
+    fin = len(b)
+    for cle in a:
+        debut = bisect_left(b, cle, debut)
+        if debut == fin:
+            break
+        if b[debut] == cle:
+            resultat.append(cle)
+    return resultat
+
+
+def union_triee(*tableaux: array) -> array:
+    """Union de tableaux triés par fusion k-voies (heapq.merge)."""
+    if len(tableaux) == 1:
+        return array('q', tableaux[0])
+    resultat = array('q')
+    for cle in heapq.merge(*tableaux):
+        if not resultat or resultat[-1] != cle:
+            resultat.append(cle)
+    return resultat
+
+
+def difference_triee(a: array, b: array) -> array:
+    """Clés de `a` absentes de `b`."""
+    resultat = array('q')
+    debut = 0
+    fin = len(b)
+    for cle in a:
+        debut = bisect_left(b, cle, debut)
+        if debut == fin or b[debut] != cle:
+            resultat.append(cle)
+    return resultat
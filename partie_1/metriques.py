@@ -0,0 +1,275 @@
+"""
+Registre de métriques en mémoire : compteurs, jauges et histogrammes de latence.
+
+Les histogrammes suivent le principe des histogrammes HDR : les valeurs (en
+nanosecondes) sont rangées dans des classes dont la largeur double à chaque
+puissance de deux, chacune découpée en sous-classes linéaires. La précision
+relative reste constante (environ 1,6 %) quelle que soit l'échelle, pour une
+mémoire bornée et un enregistrement en temps constant.
+
+Les gestionnaires, la persistance et les fonctions de suppression enregistrent
+leurs opérations dans le registre global REGISTRE :
+
+    from partie_1.metriques import REGISTRE
+    print(REGISTRE.exporter_texte())
+    REGISTRE.exporter_json('metriques.json')
+"""
+
+import functools
+import json
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+BITS_PRECISION = 7  # 64 sous-classes par puissance de deux
+
+
+class Compteur:
+    """Valeur entière qui ne fait qu'augmenter."""
+
+    def __init__(self):
+        self.valeur = 0
+        self._verrou = threading.Lock()
+
+    def incrementer(self, n: int = 1) -> None:
+        with self._verrou:
+            self.valeur += n
+
+    def reinitialiser(self) -> None:
+        self.valeur = 0
+
+    def instantane(self) -> Dict[str, Any]:
+        return {'type': 'compteur', 'valeur': self.valeur}
+
+
+class Jauge:
+    """Valeur instantanée (nombre de documents, taille d'un fichier...)."""
+
+    def __init__(self):
+        self.valeur = 0
+
+    def definir(self, valeur: float) -> None:
+        self.valeur = valeur
+
+    def reinitialiser(self) -> None:
+        self.valeur = 0
+
+    def instantane(self) -> Dict[str, Any]:
+        return {'type': 'jauge', 'valeur': self.valeur}
+
+
+class Histogramme:
+    """
+    Histogramme de latences à précision relative constante.
+
+    Les durées sont enregistrées en secondes et stockées en nanosecondes.
+    L'enregistrement ne prend pas de verrou pour rester sous la microseconde :
+    deux enregistrements strictement simultanés peuvent, rarement, n'en compter qu'un.
+    """
+
+    def __init__(self, bits_precision: int = BITS_PRECISION):
+        self.bits_precision = bits_precision
+        self.reinitialiser()
+
+    def reinitialiser(self) -> None:
+        self.classes = {}
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+
+    @property
+    def nombre(self) -> int:
+        return sum(self.classes.values())
+
+    def _indice(self, valeur: int) -> int:
+        decalage = valeur.bit_length() - self.bits_precision
+        if decalage <= 0:
+            return valeur
+        return (decalage << self.bits_precision) + (valeur >> decalage)
+
+    def _bornes(self, indice: int):
+        """Bornes [inf, sup) des valeurs rangées dans une classe."""
+        if indice < (1 << self.bits_precision):
+            return indice, indice + 1
+        decalage = indice >> self.bits_precision
+        mantisse = indice & ((1 << self.bits_precision) - 1)
+        return mantisse << decalage, (mantisse + 1) << decalage
+
+    def enregistrer(self, duree: float) -> None:
+        """Ajoute une durée (en secondes)."""
+        self.enregistrer_ns(max(0, int(duree * 1e9)))
+
+    def enregistrer_ns(self, valeur: int) -> None:
+        """Ajoute une durée en nanosecondes (chemin rapide des chronomètres)."""
+        decalage = valeur.bit_length() - self.bits_precision
+        indice = (decalage << self.bits_precision) + (valeur >> decalage) if decalage > 0 else valeur
+        classes = self.classes
+        classes[indice] = classes.get(indice, 0) + 1
+        self.total += valeur
+        if self.maximum is None or valeur > self.maximum:
+            self.maximum = valeur
+        if self.minimum is None or valeur < self.minimum:
+            self.minimum = valeur
+
+    def percentile(self, p: float) -> float:
+        """
+        Valeur (en secondes) sous laquelle se trouvent p % des enregistrements.
+        Retourne la borne haute de la classe, sans dépasser le maximum observé.
+        """
+        classes = dict(self.classes)
+        nombre = sum(classes.values())
+        if not nombre:
+            return 0.0
+        rang = max(1, math.ceil(p / 100 * nombre))
+        cumul = 0
+        for indice in sorted(classes):
+            cumul += classes[indice]
+            if cumul >= rang:
+                return min(self._bornes(indice)[1] - 1, self.maximum) / 1e9
+        return self.maximum / 1e9
+
+    def instantane(self) -> Dict[str, Any]:
+        nombre = self.nombre
+        moyenne = self.total / nombre / 1e9 if nombre else 0.0
+        return {
+            'type': 'histogramme',
+            'nombre': nombre,
+            'moyenne': moyenne,
+            'min': (self.minimum or 0) / 1e9,
+            'max': (self.maximum or 0) / 1e9,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'p999': self.percentile(99.9)
+        }
+
+
+class RegistreMetriques:
+    """Ensemble nommé de compteurs, jauges et histogrammes."""
+
+    def __init__(self):
+        self.metriques = {}
+        self.actif = True
+        self._verrou = threading.Lock()
+
+    def _obtenir(self, nom: str, classe):
+        metrique = self.metriques.get(nom)
+        if metrique is None:
+            with self._verrou:
+                metrique = self.metriques.setdefault(nom, classe())
+        if not isinstance(metrique, classe):
+            raise TypeError(f"La métrique '{nom}' existe déjà avec un autre type")
+        return metrique
+
+    def compteur(self, nom: str) -> Compteur:
+        return self._obtenir(nom, Compteur)
+
+    def jauge(self, nom: str) -> Jauge:
+        return self._obtenir(nom, Jauge)
+
+    def histogramme(self, nom: str) -> Histogramme:
+        return self._obtenir(nom, Histogramme)
+
+    def chronometrer(self, nom: str) -> 'Chronometre':
+        """
+        Gestionnaire de contexte enregistrant la durée dans l'histogramme `nom`
+        (dont le nombre d'enregistrements est le nombre d'appels) et les
+        exceptions dans le compteur `nom.erreurs`.
+        """
+        return Chronometre(self, nom)
+
+    def reinitialiser(self) -> None:
+        """Remet toutes les métriques à zéro (les références existantes restent valides)."""
+        for metrique in list(self.metriques.values()):
+            metrique.reinitialiser()
+
+    def instantane(self) -> Dict[str, Dict[str, Any]]:
+        """Valeurs courantes de toutes les métriques, triées par nom."""
+        return {nom: self.metriques[nom].instantane() for nom in sorted(self.metriques)}
+
+    def exporter_texte(self) -> str:
+        """Retourne un tableau texte lisible de toutes les métriques."""
+        lignes = []
+        histogrammes = []
+        for nom, valeurs in self.instantane().items():
+            if valeurs['type'] == 'histogramme':
+                histogrammes.append((nom, valeurs))
+            else:
+                lignes.append(f"{nom:<45} {valeurs['valeur']:>12}")
+
+        if histogrammes:
+            lignes.append("")
+            lignes.append(f"{'Opération':<45} {'Appels':>8} {'p50 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}")
+            lignes.append("-" * 87)
+            for nom, valeurs in histogrammes:
+                lignes.append(f"{nom:<45} {valeurs['nombre']:>8} {valeurs['p50'] * 1000:>10.3f} "
+                              f"{valeurs['p99'] * 1000:>10.3f} {valeurs['max'] * 1000:>10.3f}")
+
+        return "\n".join(lignes) if lignes else "Aucune métrique enregistrée."
+
+    def exporter_json(self, fichier: Optional[str] = None) -> str:
+        """
+        Exporte un instantané au format JSON.
+
+        Args:
+            fichier: Fichier où écrire l'instantané (optionnel)
+
+        Returns:
+            Le texte JSON
+        """
+        texte = json.dumps({'horodatage': time.time(), 'metriques': self.instantane()},
+                           indent=4, ensure_ascii=False)
+        if fichier:
+            with open(fichier, 'w', encoding='utf-8') as f:
+                f.write(texte)
+        return texte
+
+
+class Chronometre:
+    """Mesure la durée d'un bloc et l'enregistre dans un registre."""
+
+    __slots__ = ('registre', 'nom', 'debut')
+
+    def __init__(self, registre: RegistreMetriques, nom: str):
+        self.registre = registre
+        self.nom = nom
+        self.debut = 0
+
+    def __enter__(self) -> 'Chronometre':
+        self.debut = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, type_exc, valeur_exc, trace) -> bool:
+        if self.registre.actif:
+            self.registre.histogramme(self.nom).enregistrer_ns(time.perf_counter_ns() - self.debut)
+            if type_exc is not None:
+                self.registre.compteur(f"{self.nom}.erreurs").incrementer()
+        return False
+
+
+REGISTRE = RegistreMetriques()
+
+
+def mesure(nom: str, registre: Optional[RegistreMetriques] = None) -> Callable:
+    """
+    Décorateur : chronomètre chaque appel de la fonction dans le registre
+    (par défaut, le registre global REGISTRE).
+    """
+    def decorateur(fonction):
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            cible = registre or REGISTRE
+            if not cible.actif:
+                return fonction(*args, **kwargs)
+            debut = time.perf_counter_ns()
+            try:
+                return fonction(*args, **kwargs)
+            except Exception:
+                cible.compteur(f"{nom}.erreurs").incrementer()
+                raise
+            finally:
+                cible.histogramme(nom).enregistrer_ns(time.perf_counter_ns() - debut)
+        return enveloppe
+    return decorateur
@@ -1,10 +1,17 @@
 
 import json
 import os
+import heapq
+import tempfile
 from copy import deepcopy
 
+from .metriques import REGISTRE, mesure
+
 FICHIER_DONNEES = 'bibliotheque_data.json'
+TAILLE_RUN_DEFAUT = 100000
+TAILLE_LECTURE = 1 << 16
 
+@mesure('persistance.save_data')
 def save_data(bibliotheque_list: list):
     """
     Sauvegarde la liste des documents au format JSON.
@@ -16,12 +23,14 @@ def save_data(bibliotheque_list: list):
         with open(FICHIER_DONNEES, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=4, ensure_ascii=False)
         
+        REGISTRE.jauge('persistance.documents').definir(len(data))
         print(f"\n[OK] Sauvegarde réussie : {len(data)} documents enregistrés dans {FICHIER_DONNEES}")
         return True
     except Exception as e:
         print(f"\n[ERREUR] Erreur lors de la sauvegarde des données : {e}")
         return False
 
+@mesure('persistance.load_data')
 def load_data(Document_Classe):
     """
     Charge les documents depuis le fichier JSON et les retourne sous forme de liste d'objets Document.
@@ -44,10 +53,12 @@ def load_data(Document_Classe):
             doc = Document_Classe(
                 titre=item['titre'],
                 auteur=item['auteur'],
-                mots_cles=mots_cles_str
+                mots_cles=mots_cles_str,
+                id=item.get('id')
             )
             bibliotheque_list.append(doc)
         
+        REGISTRE.jauge('persistance.documents').definir(len(bibliotheque_list))
         print(f"\n[OK] Chargement réussi : {len(bibliotheque_list)} documents chargés depuis {FICHIER_DONNEES}")
         return bibliotheque_list
         
@@ -58,6 +69,7 @@ def load_data(Document_Classe):
         print(f"\n[ERREUR] Erreur lors du chargement des données : {e}")
         return []
 
+@mesure('persistance.save_all_structures')
 def save_all_structures(list_bib, bst_bib=None, hash_bib=None):
     """
     Sauvegarde toutes les structures de données (liste, BST, Hash) en utilisant la liste comme source principale.
@@ -76,6 +88,7 @@ def save_all_structures(list_bib, bst_bib=None, hash_bib=None):
         print(f"[ERREUR] Erreur lors de la sauvegarde des structures : {e}")
         return False
 
+@mesure('persistance.load_all_structures')
 def load_all_structures(Document_Classe, bst_bib=None, hash_bib=None):
     """
     Charge les données depuis le fichier et les synchronise avec toutes les structures.
@@ -84,15 +97,13 @@ def load_all_structures(Document_Classe, bst_bib=None, hash_bib=None):
         list_bib = load_data(Document_Classe)
         
         if bst_bib is not None:
-            bst_bib.root = None
-            bst_bib.size = 0
+            bst_bib.clear()
             for doc in list_bib:
                 bst_bib.insert(doc)
             print(f"[OK] BST synchronisé avec {len(list_bib)} documents")
         
         if hash_bib is not None:
-            from partie_3.hashing import Bucket
-            hash_bib.table = [Bucket() for _ in range(hash_bib.size)]
+            hash_bib.clear()
             for doc in list_bib:
                 hash_bib.insert(doc)
             print(f"[OK] Table de hachage synchronisée avec {len(list_bib)} documents")
@@ -118,4 +129,177 @@ def create_default_data(Document_Classe):
     
     save_data(docs)
     print("[OK] Données par défaut créées et sauvegardées.")
-    return docs
\ No newline at end of file
+    return docs
+
+
+def iterer_enregistrements(fichier=FICHIER_DONNEES):
+    """
+    Lit en flux les enregistrements d'un fichier JSON (tableau) ou JSON Lines.
+    Le fichier est lu par blocs : la mémoire utilisée ne dépend pas de sa taille.
+    """
+    decodeur = json.JSONDecoder()
+    with open(fichier, 'r', encoding='utf-8') as f:
+        tampon = ''
+        position = 0
+        fin_fichier = False
+        
+        while True:
+            while position < len(tampon) and tampon[position] in ' \t\r\n,[':
+                position += 1
+            
+            if position < len(tampon) and tampon[position] == ']':
+                return
+            
+            if position >= len(tampon):
+                if fin_fichier:
+                    return
+                tampon = tampon[position:] + f.read(TAILLE_LECTURE)
+                position = 0
+                fin_fichier = len(tampon) < TAILLE_LECTURE
+                continue
+            
+            try:
+                enregistrement, position = decodeur.raw_decode(tampon, position)
+            except json.JSONDecodeError:
+                if fin_fichier:
+                    raise
+                bloc = f.read(TAILLE_LECTURE)
+                fin_fichier = not bloc
+                tampon = tampon[position:] + bloc
+                position = 0
+                continue
+            
+            yield enregistrement
+
+
+def _ecrire_enregistrements(enregistrements, fichier):
+    """
+    Écrit des enregistrements en flux : JSON Lines si le fichier se termine par
+    .jsonl, sinon un tableau JSON au même format que save_data().
+    """
+    nombre = 0
+    json_lines = fichier.endswith('.jsonl')
+    
+    with open(fichier, 'w', encoding='utf-8') as f:
+        if not json_lines:
+            f.write('[')
+        
+        for enregistrement in enregistrements:
+            if json_lines:
+                f.write(json.dumps(enregistrement, ensure_ascii=False) + '\n')
+            else:
+                texte = json.dumps(enregistrement, indent=4, ensure_ascii=False)
+                f.write(',\n' if nombre else '\n')
+                f.write('\n'.join('    ' + ligne for ligne in texte.splitlines()))
+            nombre += 1
+        
+        if not json_lines:
+            f.write('\n]' if nombre else ']')
+    
+    return nombre
+
+
+def document_depuis_enregistrement(enregistrement, Document_Classe):
+    """
+    Construit un document à partir d'un enregistrement JSON (mots-clés en liste
+    ou en chaîne séparée par des virgules, identifiant facultatif).
+
+    Raises:
+        ValueError: Titre ou auteur manquant
+    """
+    if not isinstance(enregistrement, dict):
+        raise ValueError("Enregistrement attendu sous forme d'objet JSON")
+    titre = str(enregistrement.get('titre', '')).strip()
+    auteur = str(enregistrement.get('auteur', '')).strip()
+    if not titre or not auteur:
+        raise ValueError("Le titre et l'auteur sont obligatoires")
+    mots_cles = enregistrement.get('mots_cles', '')
+    if isinstance(mots_cles, list):
+        mots_cles = ','.join(mots_cles)
+    return Document_Classe(titre=titre, auteur=auteur, mots_cles=mots_cles, id=enregistrement.get('id'))
+
+
+def lire_documents(fichier, Document_Classe):
+    """
+    Lit en flux les documents d'un fichier JSON (tableau) ou JSON Lines,
+    sans rien afficher (contrairement à load_data).
+    """
+    for enregistrement in iterer_enregistrements(fichier):
+        yield document_depuis_enregistrement(enregistrement, Document_Classe)
+
+
+def ecrire_documents(documents, fichier):
+    """
+    Écrit des documents dans un fichier quelconque : JSON Lines si son nom se
+    termine par .jsonl, sinon tableau JSON au format de save_data(). Le fichier
+    n'est remplacé qu'une fois entièrement écrit.
+
+    Returns:
+        Le nombre de documents écrits
+    """
+    fichier_temporaire = fichier + '.tmp'
+    nombre = _ecrire_enregistrements((doc.to_dict() for doc in documents), fichier_temporaire)
+    os.replace(fichier_temporaire, fichier)
+    REGISTRE.jauge('persistance.documents').definir(nombre)
+    return nombre
+
+
+@mesure('persistance.tri_externe')
+def tri_externe(fichier_entree=FICHIER_DONNEES, fichier_sortie=None, cle='titre', taille_run=TAILLE_RUN_DEFAUT):
+    """
+    Trie un fichier de données plus grand que la mémoire disponible (tri fusion externe).
+    
+    Les enregistrements sont lus en flux et découpés en runs de `taille_run`
+    éléments, chacun trié en mémoire puis écrit dans un fichier temporaire.
+    Les runs sont ensuite fusionnés (fusion k-voies avec heapq.merge) directement
+    dans le fichier de sortie. `taille_run` fixe donc le budget mémoire.
+    Le tri est stable et utilise la même clé que les TriAlgorithm (minuscules).
+    """
+    if fichier_sortie is None:
+        fichier_sortie = fichier_entree
+    
+    def cle_tri(enregistrement):
+        return str(enregistrement.get(cle, '')).lower()
+    
+    try:
+        with tempfile.TemporaryDirectory(prefix='tri_externe_') as dossier:
+            runs = []
+            
+            def vider_run(run):
+                run.sort(key=cle_tri)
+                chemin = os.path.join(dossier, f'run_{len(runs):05d}.jsonl')
+                _ecrire_enregistrements(run, chemin)
+                runs.append(chemin)
+            
+            run = []
+            for enregistrement in iterer_enregistrements(fichier_entree):
+                run.append(enregistrement)
+                if len(run) >= taille_run:
+                    vider_run(run)
+                    run = []
+            if run or not runs:
+                vider_run(run)
+            
+            flux = [iterer_enregistrements(chemin) for chemin in runs]
+            fichier_temporaire = fichier_sortie + '.tmp'
+            remplace = False
+            try:
+                nombre = _ecrire_enregistrements(heapq.merge(*flux, key=cle_tri), fichier_temporaire)
+                os.replace(fichier_temporaire, fichier_sortie)
+                remplace = True
+            finally:
+                for flux_run in flux:
+                    flux_run.close()
+                # Une fusion interrompue ne laisse pas de fichier partiel à côté de la sortie
+                if not remplace and os.path.exists(fichier_temporaire):
+                    os.remove(fichier_temporaire)
+        
+        print(f"\n[OK] Tri externe réussi : {nombre} documents triés par {cle} ({len(runs)} run(s)) dans {fichier_sortie}")
+        return nombre
+        
+    except json.JSONDecodeError:
+        print(f"\n[ERREUR] Erreur de format JSON dans {fichier_entree}. Fichier corrompu.")
+        return 0
+    except Exception as e:
+        print(f"\n[ERREUR] Erreur lors du tri externe : {e}")
+        return 0
@@ -0,0 +1,268 @@
+"""
+Instrumentation des algorithmes de tri et de recherche.
+
+Un Profileur compte les opérations élémentaires pendant une exécution
+(comparaisons, écritures dans la liste, nœuds visités, buckets sondés) et peut
+y attacher à la demande une session cProfile et/ou tracemalloc. Les méthodes
+profile() de TriAlgorithm, SearchAlgorithm, BSTSearchAlgorithm et
+HashSearchAlgorithm l'utilisent.
+
+Les comparaisons sont comptées au travers de documents mandataires
+(DocumentInstrumente) dont les champs texte signalent chaque comparaison :
+les algorithmes eux-mêmes ne sont pas modifiés. Le BST et la table de hachage
+exposent un attribut `compteurs` (None par défaut) que le profileur renseigne
+le temps d'une recherche.
+
+Exemple :
+    rapport = TriRapide().profile(documents, memoire=True)
+    print(formater_rapport_profil(rapport))
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+
+LIGNES_PROFIL = 15
+
+
+class ChaineComptee(str):
+    """Chaîne dont chaque comparaison incrémente compteurs['comparaisons']."""
+
+    def __new__(cls, valeur, compteurs: Counter):
+        chaine = super().__new__(cls, valeur)
+        chaine.compteurs = compteurs
+        return chaine
+
+    def lower(self):
+        return ChaineComptee(str.lower(self), self.compteurs)
+
+    def _comparer(self):
+        self.compteurs['comparaisons'] += 1
+
+    def __eq__(self, autre):
+        self._comparer()
+        return str.__eq__(self, autre)
+
+    def __ne__(self, autre):
+        self._comparer()
+        return str.__ne__(self, autre)
+
+    def __lt__(self, autre):
+        self._comparer()
+        return str.__lt__(self, autre)
+
+    def __le__(self, autre):
+        self._comparer()
+        return str.__le__(self, autre)
+
+    def __gt__(self, autre):
+        self._comparer()
+        return str.__gt__(self, autre)
+
+    def __ge__(self, autre):
+        self._comparer()
+        return str.__ge__(self, autre)
+
+    def __contains__(self, sous_chaine):
+        self._comparer()
+        return str.__contains__(self, sous_chaine)
+
+    def startswith(self, *args):
+        self._comparer()
+        return str.startswith(self, *args)
+
+    __hash__ = str.__hash__
+
+
+class DocumentInstrumente:
+    """Mandataire d'un document dont les champs texte comptent les comparaisons."""
+
+    __slots__ = ('document', 'titre', 'auteur', 'mots_cles')
+
+    def __init__(self, document, compteurs: Counter):
+        self.document = document
+        self.titre = ChaineComptee(document.titre, compteurs)
+        self.auteur = ChaineComptee(document.auteur, compteurs)
+        self.mots_cles = [ChaineComptee(mot, compteurs) for mot in document.mots_cles]
+
+    def __getattr__(self, nom):
+        return getattr(self.document, nom)
+
+
+class ListeInstrumentee(list):
+    """Liste qui compte les écritures d'éléments (un échange compte pour deux)."""
+
+    def __init__(self, elements, compteurs: Counter):
+        super().__init__(elements)
+        self.compteurs = compteurs
+
+    def __setitem__(self, index, valeur):
+        if isinstance(index, slice):
+            valeur = list(valeur)
+            self.compteurs['ecritures'] += len(valeur)
+        else:
+            self.compteurs['ecritures'] += 1
+        super().__setitem__(index, valeur)
+
+    def append(self, valeur):
+        self.compteurs['ecritures'] += 1
+        super().append(valeur)
+
+    def extend(self, valeurs):
+        valeurs = list(valeurs)
+        self.compteurs['ecritures'] += len(valeurs)
+        super().extend(valeurs)
+
+    def insert(self, index, valeur):
+        self.compteurs['ecritures'] += 1
+        super().insert(index, valeur)
+
+
+def instrumenter_documents(documents: List, compteurs: Counter) -> ListeInstrumentee:
+    """Enveloppe une liste de documents pour compter comparaisons et écritures."""
+    return ListeInstrumentee((DocumentInstrumente(doc, compteurs) for doc in documents), compteurs)
+
+
+def desinstrumenter(element):
+    """Retourne le document d'origine (ou une liste de documents) derrière les mandataires."""
+    if isinstance(element, DocumentInstrumente):
+        return element.document
+    if isinstance(element, list):
+        return [desinstrumenter(doc) for doc in element]
+    return element
+
+
+class Profileur:
+    """
+    Session de profilage : compteurs, durée et, à la demande, cProfile et tracemalloc.
+
+    S'utilise comme gestionnaire de contexte :
+
+        with Profileur(cprofile=True) as profileur:
+            bst.compteurs = profileur.compteurs
+            bst.search("Dune")
+        print(profileur.rapport())
+    """
+
+    def __init__(self, cprofile: bool = False, memoire: bool = False, lignes_profil: int = LIGNES_PROFIL):
+        self.cprofile = cprofile
+        self.memoire = memoire
+        self.lignes_profil = lignes_profil
+        self.compteurs = Counter()
+        self.duree = 0.0
+        self.memoire_pic = None
+        self.allocations_nettes = None
+        self._profil = None
+        self._tracemalloc_deja_actif = False
+        self._base_memoire = 0
+        self._base_blocs = 0
+        self._debut = 0.0
+
+    def __enter__(self) -> 'Profileur':
+        if self.memoire:
+            self._tracemalloc_deja_actif = tracemalloc.is_tracing()
+            if not self._tracemalloc_deja_actif:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._base_memoire = tracemalloc.get_traced_memory()[0]
+            self._base_blocs = sys.getallocatedblocks()
+        if self.cprofile:
+            self._profil = cProfile.Profile()
+            self._profil.enable()
+        self._debut = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.duree = time.perf_counter() - self._debut
+        if self._profil is not None:
+            self._profil.disable()
+        if self.memoire:
+            self.allocations_nettes = sys.getallocatedblocks() - self._base_blocs
+            self.memoire_pic = tracemalloc.get_traced_memory()[1] - self._base_memoire
+            if not self._tracemalloc_deja_actif:
+                tracemalloc.stop()
+        return False
+
+    def profil_texte(self) -> Optional[str]:
+        """Fonctions les plus coûteuses (temps cumulé) de la session cProfile."""
+        if self._profil is None:
+            return None
+        flux = io.StringIO()
+        pstats.Stats(self._profil, stream=flux).sort_stats('cumulative').print_stats(self.lignes_profil)
+        return flux.getvalue()
+
+    def rapport(self, **informations) -> Dict[str, Any]:
+        """
+        Résumé sérialisable de la session.
+
+        Args:
+            informations: Champs ajoutés tels quels (algorithme, terme, ...)
+
+        Returns:
+            Dictionnaire avec duree, compteurs, memoire_pic, allocations_nettes et profil
+        """
+        rapport = dict(informations)
+        rapport.update({
+            'duree': self.duree,
+            'compteurs': dict(self.compteurs),
+            'memoire_pic': self.memoire_pic,
+            'allocations_nettes': self.allocations_nettes,
+            'profil': self.profil_texte()
+        })
+        return rapport
+
+
+def profiler_structure(structure, recherche, terme: str, cprofile: bool = False,
+                       memoire: bool = False, **informations) -> Dict[str, Any]:
+    """
+    Profile une recherche sur une structure exposant un attribut `compteurs`
+    (BinarySearchTree, HashTable).
+
+    Args:
+        structure: La structure interrogée
+        recherche: Fonction (structure, terme) -> résultat(s)
+        terme: Terme recherché
+
+    Returns:
+        Rapport du profileur, avec le nombre de résultats
+    """
+    precedents = getattr(structure, 'compteurs', None)
+    with Profileur(cprofile, memoire) as profileur:
+        structure.compteurs = profileur.compteurs
+        try:
+            resultat = recherche(structure, terme)
+        finally:
+            structure.compteurs = precedents
+
+    if isinstance(resultat, list):
+        nombre = len(resultat)
+    else:
+        nombre = 0 if resultat is None else 1
+    return profileur.rapport(terme=terme, nombre_resultats=nombre, **informations)
+
+
+def formater_rapport_profil(rapport: Dict[str, Any]) -> str:
+    """Retourne une présentation texte d'un rapport de profilage."""
+    lignes = []
+    titre = rapport.get('algorithme', 'Profilage')
+    lignes.append("=" * 60)
+    lignes.append(f"{titre} ({rapport.get('complexite', 'O(?)')})")
+    lignes.append("=" * 60)
+    lignes.append(f"Durée : {rapport['duree'] * 1000:.3f} ms")
+    if 'nombre_resultats' in rapport:
+        lignes.append(f"Résultats : {rapport['nombre_resultats']}")
+    for nom, valeur in sorted(rapport['compteurs'].items()):
+        lignes.append(f"  {nom:<20} {valeur:>12}")
+    if rapport['memoire_pic'] is not None:
+        lignes.append(f"Pic mémoire : {rapport['memoire_pic']} octets")
+        lignes.append(f"Blocs alloués (net) : {rapport['allocations_nettes']}")
+    if rapport['profil']:
+        lignes.append("")
+        lignes.append(rapport['profil'])
+    return "\n".join(lignes)
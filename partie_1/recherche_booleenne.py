@@ -0,0 +1,304 @@
+"""
+Recherche booléenne sur des bitmaps d'identifiants.
+
+IndexBooleen associe un Bitmap d'identifiants à chaque mot-clé, à chaque mot
+des noms d'auteurs et à chaque trigramme des titres. Une requête combine des
+termes avec AND, OR, NOT et des parenthèses ; deux termes juxtaposés sont
+reliés par AND :
+
+    keyword:philosophie AND NOT auteur:camus
+    (titre:prince OR titre:"vieil homme") keyword:roman
+
+Champs :
+    keyword / mot_cle : mot-clé exact
+    auteur / author   : mot(s) du nom de l'auteur
+    titre / title     : sous-chaîne du titre (filtrée par trigrammes)
+    sans champ        : l'un des trois
+
+Chaque terme donne un Bitmap exact et la requête est évaluée par opérations
+ET / OU / SAUF sur les bitmaps ; seuls les documents du résultat final sont
+résolus.
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+from .bitmap import Bitmap
+from .identifiants import cle_document
+
+
+CHAMPS = {
+    'keyword': 'mot_cle', 'mot_cle': 'mot_cle', 'mots_cles': 'mot_cle',
+    'auteur': 'auteur', 'author': 'auteur',
+    'titre': 'titre', 'title': 'titre'
+}
+OPERATEURS = ('AND', 'OR', 'NOT')
+TAILLE_NGRAMME = 3
+
+_MOTS = re.compile(r"\w+")
+_JETONS = re.compile(r'''
+    \s*(?:
+        (?P<ouvrante>\() | (?P<fermante>\)) |
+        (?:(?P<champ>[^\W\d]\w*):)?(?:"(?P<guillemets>[^"]*)"|(?P<mot>[^\s()"]+))
+    )''', re.VERBOSE)
+
+
+def mots(texte: str) -> List[str]:
+    """Mots d'un texte, en minuscules."""
+    return _MOTS.findall(texte.lower())
+
+
+def ngrammes(texte: str, taille: int = TAILLE_NGRAMME) -> set:
+    """Sous-chaînes de `taille` caractères d'un texte en minuscules."""
+    texte = texte.lower()
+    return {texte[i:i + taille] for i in range(len(texte) - taille + 1)}
+
+
+def analyser_requete(requete: str):
+    """
+    Convertit une requête en arbre : ('terme', champ, valeur), ('NOT', a),
+    ('AND', a, b) ou ('OR', a, b). Le champ vaut None pour un terme sans champ.
+
+    Raises:
+        ValueError: Requête mal formée ou champ inconnu
+    """
+    jetons = []
+    position = 0
+    requete = requete.rstrip()
+    while position < len(requete):
+        trouve = _JETONS.match(requete, position)
+        if trouve is None or trouve.end() == position:
+            raise ValueError(f"Requête invalide près de « {requete[position:].strip()} »")
+        position = trouve.end()
+        if trouve.group('ouvrante'):
+            jetons.append(('(',))
+        elif trouve.group('fermante'):
+            jetons.append((')',))
+        else:
+            champ = trouve.group('champ')
+            guillemets = trouve.group('guillemets')
+            valeur = guillemets if guillemets is not None else trouve.group('mot')
+            if champ is None and guillemets is None and valeur.upper() in OPERATEURS:
+                jetons.append((valeur.upper(),))
+                continue
+            if champ is not None:
+                if champ.lower() not in CHAMPS:
+                    raise ValueError(f"Champ '{champ}' inconnu (disponibles : {', '.join(CHAMPS)})")
+                champ = CHAMPS[champ.lower()]
+            jetons.append(('terme', champ, valeur.strip().lower()))
+
+    if not jetons:
+        raise ValueError("Requête vide")
+    arbre, suivant = _analyser_ou(jetons, 0)
+    if suivant < len(jetons):
+        raise ValueError(f"Jeton inattendu : {jetons[suivant][0]}")
+    return arbre
+
+
+def _analyser_ou(jetons, i):
+    gauche, i = _analyser_et(jetons, i)
+    while i < len(jetons) and jetons[i][0] == 'OR':
+        droite, i = _analyser_et(jetons, i + 1)
+        gauche = ('OR', gauche, droite)
+    return gauche, i
+
+
+def _analyser_et(jetons, i):
+    gauche, i = _analyser_non(jetons, i)
+    while i < len(jetons) and jetons[i][0] not in ('OR', ')'):
+        if jetons[i][0] == 'AND':
+            i += 1
+        droite, i = _analyser_non(jetons, i)
+        gauche = ('AND', gauche, droite)
+    return gauche, i
+
+
+def _analyser_non(jetons, i):
+    if i < len(jetons) and jetons[i][0] == 'NOT':
+        operande, i = _analyser_non(jetons, i + 1)
+        return ('NOT', operande), i
+    return _analyser_primaire(jetons, i)
+
+
+def _analyser_primaire(jetons, i):
+    if i >= len(jetons):
+        raise ValueError("Requête incomplète : terme attendu")
+    jeton = jetons[i]
+    if jeton[0] == '(':
+        arbre, i = _analyser_ou(jetons, i + 1)
+        if i >= len(jetons) or jetons[i][0] != ')':
+            raise ValueError("Parenthèse fermante manquante")
+        return arbre, i + 1
+    if jeton[0] == 'terme':
+        return jeton, i + 1
+    raise ValueError(f"Jeton inattendu : {jeton[0]}")
+
+
+class IndexBooleen:
+    """
+    Postings en bitmaps des mots-clés, des mots d'auteurs et des trigrammes
+    de titres, et évaluation des requêtes booléennes.
+    """
+
+    def __init__(self, documents: Iterable = ()):
+        self.mots_cles: Dict[str, Bitmap] = {}
+        self.auteurs: Dict[str, Bitmap] = {}
+        self.trigrammes: Dict[str, Bitmap] = {}
+        self.tous = Bitmap()
+        self.documents: Dict[int, object] = {}  # identifiant -> document
+        self.generation = 0  # Incrémentée à chaque modification (invalidation du cache de recherche)
+        for document in documents:
+            self.insert(document)
+
+    @staticmethod
+    def _cles_postings(document) -> Iterable[Tuple[str, str]]:
+        for mot in set(mot.lower() for mot in document.mots_cles):
+            yield 'mots_cles', mot
+        for mot in set(mots(document.auteur)):
+            yield 'auteurs', mot
+        for trigramme in ngrammes(document.titre):
+            yield 'trigrammes', trigramme
+
+    def insert(self, document) -> None:
+        """
+        Indexe un document (sans effet si ce même document est déjà indexé).
+
+        Raises:
+            ValueError: Un autre document est déjà indexé sous le même identifiant
+        """
+        cle = cle_document(document)
+        existant = self.documents.get(cle)
+        if existant is document:
+            return
+        if existant is not None:
+            raise ValueError(f"L'identifiant {cle} de '{document.titre}' est déjà attribué "
+                             f"à '{existant.titre}'")
+        self.documents[cle] = document
+        self.tous.add(cle)
+        for table, terme in self._cles_postings(document):
+            postings = getattr(self, table)
+            if terme not in postings:
+                postings[terme] = Bitmap()
+            postings[terme].add(cle)
+        self.generation += 1
+
+    def delete(self, document) -> bool:
+        """
+        Retire un document (comparé par identifiant).
+
+        Returns:
+            True si le document était indexé
+        """
+        cle = cle_document(document)
+        document = self.documents.pop(cle, None)
+        if document is None:
+            return False
+        self.tous.discard(cle)
+        for table, terme in self._cles_postings(document):
+            postings = getattr(self, table)
+            bitmap = postings.get(terme)
+            if bitmap is not None:
+                bitmap.discard(cle)
+                if not bitmap:
+                    del postings[terme]
+        self.generation += 1
+        return True
+
+    def clear(self) -> None:
+        """Vide l'index."""
+        for postings in (self.mots_cles, self.auteurs, self.trigrammes):
+            postings.clear()
+        self.tous.clear()
+        self.documents.clear()
+        self.generation += 1
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def _bitmap_titre(self, valeur: str) -> Bitmap:
+        """Titres contenant la valeur : intersection des trigrammes puis vérification."""
+        trigrammes = ngrammes(valeur)
+        if trigrammes:
+            bitmaps = sorted((self.trigrammes.get(t, Bitmap()) for t in trigrammes), key=len)
+            candidats = bitmaps[0]
+            for bitmap in bitmaps[1:]:
+                if not candidats:
+                    break
+                candidats = candidats & bitmap
+        else:
+            # Valeur trop courte pour les trigrammes : parcours direct des titres
+            return Bitmap.depuis_tries(sorted(cle for cle, document in self.documents.items()
+                                              if valeur in document.titre.lower()))
+        if len(trigrammes) == 1 and len(valeur) == TAILLE_NGRAMME:
+            return candidats
+        return Bitmap.depuis_tries(cle for cle in candidats if valeur in self.documents[cle].titre.lower())
+
+    def bitmap(self, champ: str, valeur: str) -> Bitmap:
+        """Bitmap des documents satisfaisant un terme (champ None : un des trois champs)."""
+        valeur = valeur.lower()
+        if champ is None:
+            return self.bitmap('mot_cle', valeur) | self.bitmap('auteur', valeur) | self.bitmap('titre', valeur)
+        if champ == 'mot_cle':
+            return self.mots_cles.get(valeur, Bitmap())
+        if champ == 'auteur':
+            resultat = None
+            for mot in mots(valeur):
+                bitmap = self.auteurs.get(mot, Bitmap())
+                resultat = bitmap if resultat is None else resultat & bitmap
+            return resultat if resultat is not None else Bitmap()
+        return self._bitmap_titre(valeur)
+
+    def bitmap_contient(self, valeur: str) -> Bitmap:
+        """
+        Documents dont le titre, l'auteur ou un mot-clé contient la valeur
+        (sous-chaîne, comme la recherche complète de la liste) : trigrammes
+        pour les titres, parcours du vocabulaire pour les auteurs et mots-clés.
+        """
+        valeur = valeur.lower()
+        if not valeur:
+            return self.tous
+        mots_cles = [bitmap for mot, bitmap in self.mots_cles.items() if valeur in mot]
+        return Bitmap.union(self._bitmap_titre(valeur), self._bitmap_auteur_contient(valeur), *mots_cles)
+
+    def _bitmap_auteur_contient(self, valeur: str) -> Bitmap:
+        """Auteurs contenant la valeur : chaque mot de la valeur est dans un mot du nom."""
+        candidats = None
+        for morceau in mots(valeur):
+            bitmap = Bitmap.union(*(postings for mot, postings in self.auteurs.items() if morceau in mot))
+            candidats = bitmap if candidats is None else candidats & bitmap
+            if not candidats:
+                return candidats
+        if candidats is None:
+            candidats = self.tous
+        if _MOTS.fullmatch(valeur):
+            return candidats
+        return Bitmap.depuis_tries(cle for cle in candidats if valeur in self.documents[cle].auteur.lower())
+
+    def search_contains(self, terme: str) -> List:
+        """Documents dont le titre, l'auteur ou un mot-clé contient le terme, par ordre d'identifiant."""
+        return [self.documents[cle] for cle in self.bitmap_contient(terme.strip())]
+
+    def evaluer(self, arbre) -> Bitmap:
+        """Évalue un arbre de requête ; `a AND NOT b` est calculé comme a SAUF b."""
+        operation = arbre[0]
+        if operation == 'terme':
+            return self.bitmap(arbre[1], arbre[2])
+        if operation == 'NOT':
+            return self.tous - self.evaluer(arbre[1])
+        if operation == 'OR':
+            return self.evaluer(arbre[1]) | self.evaluer(arbre[2])
+        gauche, droite = arbre[1], arbre[2]
+        if droite[0] == 'NOT':
+            return self.evaluer(gauche) - self.evaluer(droite[1])
+        if gauche[0] == 'NOT':
+            return self.evaluer(droite) - self.evaluer(gauche[1])
+        return self.evaluer(gauche) & self.evaluer(droite)
+
+    def search(self, requete: str) -> List:
+        """
+        Documents satisfaisant la requête, par ordre d'identifiant.
+
+        Raises:
+            ValueError: Requête mal formée
+        """
+        return [self.documents[cle] for cle in self.evaluer(analyser_requete(requete))]
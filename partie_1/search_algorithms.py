@@ -1,6 +1,6 @@
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List
 
 
 class SearchAlgorithm(ABC):
@@ -24,6 +24,29 @@ class SearchAlgorithm(ABC):
         """
         pass
     
+    def profile(self, documents: List, terme: str, cprofile: bool = False, memoire: bool = False) -> Dict[str, Any]:
+        """
+        Recherche en comptant les comparaisons, avec cProfile/tracemalloc à la demande.
+        
+        Args:
+            documents: Liste de documents à rechercher
+            terme: Terme de recherche
+            cprofile: Attache une session cProfile
+            memoire: Mesure le pic mémoire et les blocs alloués avec tracemalloc
+            
+        Returns:
+            Rapport de profilage (voir partie_1.profilage)
+        """
+        from .profilage import Profileur, instrumenter_documents
+        
+        profileur = Profileur(cprofile, memoire)
+        liste = instrumenter_documents(documents, profileur.compteurs)
+        with profileur:
+            resultats = self.search(liste, terme)
+        profileur.compteurs['documents_examines'] = len(documents)
+        return profileur.rapport(algorithme=self.name, complexite=self.complexity,
+                                 terme=terme, nombre_resultats=len(resultats))
+    
     def __str__(self) -> str:
         return f"{self.name} ({self.complexity})"
 
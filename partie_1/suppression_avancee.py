@@ -1,7 +1,26 @@
 
 from partie_1.persistance import save_all_structures
+from partie_1.metriques import mesure
 
-def supprimer_document_complet(titre, list_bib, bst_bib=None, hash_bib=None):
+LIBELLES_INDEX = {
+    'liste': 'Liste principale',
+    'bst': 'BST',
+    'hachage': 'Table de hachage',
+    'mots_cles': 'Index des mots-clés',
+    'booleen': 'Index booléen (bitmaps)',
+    'suggestions': 'Index des suggestions'
+}
+
+
+def _sauvegarder_moteur(moteur, resultat):
+    try:
+        if moteur.sauvegarder():
+            resultat['sauvegarde'] = True
+    except Exception as e:
+        resultat['erreurs'].append(f'Sauvegarde: {str(e)}')
+
+@mesure('suppression.supprimer_document_complet')
+def supprimer_document_complet(titre, list_bib=None, bst_bib=None, hash_bib=None, moteur=None):
     """
     Supprime un document par titre exact de toutes les structures disponibles.
     
@@ -10,6 +29,7 @@ def supprimer_document_complet(titre, list_bib, bst_bib=None, hash_bib=None):
         list_bib (list): Liste principale des documents
         bst_bib (BinarySearchTree, optional): Arbre BST
         hash_bib (HashTable, optional): Table de hachage
+        moteur (MoteurStockage, optional): Moteur de stockage ; remplace les trois structures
     
     Returns:
         dict: Résultat de la suppression avec détails
@@ -22,6 +42,19 @@ def supprimer_document_complet(titre, list_bib, bst_bib=None, hash_bib=None):
         'sauvegarde': False
     }
     
+    if moteur is not None:
+        try:
+            libelles = [LIBELLES_INDEX.get(nom, nom) for nom in moteur.index]
+            if moteur.supprimer_par_titre(titre):
+                resultat['supprime_de'] = libelles
+                resultat['succes'] = True
+                _sauvegarder_moteur(moteur, resultat)
+            else:
+                resultat['non_trouve_dans'] = libelles
+        except Exception as e:
+            resultat['erreurs'].append(f'Moteur: {str(e)}')
+        return resultat
+    
     try:
         documents_avant = len(list_bib)
         list_bib[:] = [doc for doc in list_bib if doc.titre != titre]
@@ -41,14 +74,7 @@ def supprimer_document_complet(titre, list_bib, bst_bib=None, hash_bib=None):
         
         if hash_bib:
             try:
-                supprime_hash = False
-                for bucket in hash_bib.table:
-                    if bucket.items:
-                        bucket.items[:] = [doc for doc in bucket.items if doc.titre != titre]
-                        if len(bucket.items) < len([doc for doc in bucket.items if doc.titre == titre]):
-                            supprime_hash = True
-                
-                if supprime_hash:
+                if hash_bib.delete(titre):
                     resultat['supprime_de'].append('Table de hachage')
                     resultat['succes'] = True
                 else:
@@ -69,7 +95,8 @@ def supprimer_document_complet(titre, list_bib, bst_bib=None, hash_bib=None):
         resultat['erreurs'].append(f'Général: {str(e)}')
         return resultat
 
-def supprimer_par_criteres(critere, valeur, list_bib, bst_bib=None, hash_bib=None):
+@mesure('suppression.supprimer_par_criteres')
+def supprimer_par_criteres(critere, valeur, list_bib=None, bst_bib=None, hash_bib=None, moteur=None):
     """
     Supprime tous les documents correspondant à un critère spécifique.
     
@@ -79,6 +106,7 @@ def supprimer_par_criteres(critere, valeur, list_bib, bst_bib=None, hash_bib=Non
         list_bib (list): Liste principale des documents
         bst_bib (BinarySearchTree, optional): Arbre BST
         hash_bib (HashTable, optional): Table de hachage
+        moteur (MoteurStockage, optional): Moteur de stockage ; remplace les trois structures
     
     Returns:
         dict: Résultat de la suppression avec détails
@@ -93,7 +121,7 @@ def supprimer_par_criteres(critere, valeur, list_bib, bst_bib=None, hash_bib=Non
     try:
         documents_a_supprimer = []
         
-        for doc in list_bib:
+        for doc in (moteur.documents() if moteur is not None else list_bib):
             correspondance = False
             
             if critere == 'auteur' and valeur.lower() in doc.auteur.lower():
@@ -109,13 +137,23 @@ def supprimer_par_criteres(critere, valeur, list_bib, bst_bib=None, hash_bib=Non
             if correspondance:
                 documents_a_supprimer.append(doc)
         
-        for doc in documents_a_supprimer:
-            supprimer_document_complet(doc.titre, list_bib, bst_bib, hash_bib)
-            resultat['documents_supprimes'].append(doc)
+        if moteur is not None:
+            with moteur.transaction():
+                for doc in documents_a_supprimer:
+                    moteur.supprimer_document(doc)
+            resultat['documents_supprimes'] = documents_a_supprimer
+        else:
+            for doc in documents_a_supprimer:
+                supprimer_document_complet(doc.titre, list_bib, bst_bib, hash_bib)
+                resultat['documents_supprimes'].append(doc)
         
         if documents_a_supprimer:
             resultat['succes'] = True
             
+            if moteur is not None:
+                _sauvegarder_moteur(moteur, resultat)
+                return resultat
+            
             try:
                 if save_all_structures(list_bib, bst_bib, hash_bib):
                     resultat['sauvegarde'] = True
@@ -128,7 +166,8 @@ def supprimer_par_criteres(critere, valeur, list_bib, bst_bib=None, hash_bib=Non
         resultat['erreurs'].append(f'Général: {str(e)}')
         return resultat
 
-def supprimer_documents_multiples(titres, list_bib, bst_bib=None, hash_bib=None):
+@mesure('suppression.supprimer_documents_multiples')
+def supprimer_documents_multiples(titres, list_bib=None, bst_bib=None, hash_bib=None, moteur=None):
     """
     Supprime plusieurs documents par leurs titres.
     
@@ -137,6 +176,7 @@ def supprimer_documents_multiples(titres, list_bib, bst_bib=None, hash_bib=None)
         list_bib (list): Liste principale des documents
         bst_bib (BinarySearchTree, optional): Arbre BST
         hash_bib (HashTable, optional): Table de hachage
+        moteur (MoteurStockage, optional): Moteur de stockage ; remplace les trois structures
     
     Returns:
         dict: Résultat de la suppression avec détails
@@ -151,7 +191,7 @@ def supprimer_documents_multiples(titres, list_bib, bst_bib=None, hash_bib=None)
     
     try:
         for titre in titres:
-            doc_resultat = supprimer_document_complet(titre, list_bib, bst_bib, hash_bib)
+            doc_resultat = supprimer_document_complet(titre, list_bib, bst_bib, hash_bib, moteur)
             if doc_resultat['succes']:
                 resultat['supprimes'].append(titre)
                 resultat['succes'] = True
@@ -162,6 +202,9 @@ def supprimer_documents_multiples(titres, list_bib, bst_bib=None, hash_bib=None)
                 resultat['erreurs'].extend(doc_resultat['erreurs'])
         
         if resultat['succes']:
+            if moteur is not None:
+                _sauvegarder_moteur(moteur, resultat)
+                return resultat
             try:
                 if save_all_structures(list_bib, bst_bib, hash_bib):
                     resultat['sauvegarde'] = True
@@ -174,7 +217,8 @@ def supprimer_documents_multiples(titres, list_bib, bst_bib=None, hash_bib=None)
         resultat['erreurs'].append(f'Général: {str(e)}')
         return resultat
 
-def vider_toutes_structures(list_bib, bst_bib=None, hash_bib=None):
+@mesure('suppression.vider_toutes_structures')
+def vider_toutes_structures(list_bib=None, bst_bib=None, hash_bib=None, moteur=None):
     """
     Supprime tous les documents de toutes les structures.
     
@@ -182,31 +226,39 @@ def vider_toutes_structures(list_bib, bst_bib=None, hash_bib=None):
         list_bib (list): Liste principale des documents
         bst_bib (BinarySearchTree, optional): Arbre BST
         hash_bib (HashTable, optional): Table de hachage
+        moteur (MoteurStockage, optional): Moteur de stockage ; remplace les trois structures
     
     Returns:
         dict: Résultat de la suppression avec détails
     """
     resultat = {
         'succes': False,
-        'documents_supprimes': len(list_bib),
+        'documents_supprimes': len(moteur) if moteur is not None else len(list_bib),
         'erreurs': [],
         'sauvegarde': False
     }
     
+    if moteur is not None:
+        try:
+            moteur.vider()
+            resultat['succes'] = True
+            _sauvegarder_moteur(moteur, resultat)
+        except Exception as e:
+            resultat['erreurs'].append(f'Moteur: {str(e)}')
+        return resultat
+    
     try:
         list_bib.clear()
         
         if bst_bib:
             try:
-                bst_bib.root = None
-                bst_bib.size = 0
+                bst_bib.clear()
             except Exception as e:
                 resultat['erreurs'].append(f'BST: {str(e)}')
         
         if hash_bib:
             try:
-                for bucket in hash_bib.table:
-                    bucket.items.clear()
+                hash_bib.clear()
             except Exception as e:
                 resultat['erreurs'].append(f'Hash: {str(e)}')
         
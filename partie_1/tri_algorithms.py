@@ -1,9 +1,30 @@
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Callable, Dict, List, Optional
+import heapq
+import importlib.util
 import time
 
 
+_NUMPY_NON_CHARGE = object()
+_numpy = _NUMPY_NON_CHARGE
+
+
+def numpy_module():
+    """
+    NumPy, importé au premier tri vectorisé plutôt qu'au chargement du module :
+    son import coûte plus que tout le reste du démarrage. None s'il est absent.
+    """
+    global _numpy
+    if _numpy is _NUMPY_NON_CHARGE:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
 class TriAlgorithm(ABC):
     """Classe abstraite pour les algorithmes de tri."""
     
@@ -31,11 +52,32 @@ class TriAlgorithm(ABC):
         Returns:
             Temps d'exécution en secondes
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.sort(documents)
-        end_time = time.time()
+        end_time = time.perf_counter()
         return end_time - start_time
     
+    def profile(self, documents: List, cprofile: bool = False, memoire: bool = False) -> Dict[str, Any]:
+        """
+        Trie en comptant comparaisons et écritures, avec cProfile/tracemalloc à la demande.
+        
+        Args:
+            documents: Liste de documents à trier (triée en place)
+            cprofile: Attache une session cProfile
+            memoire: Mesure le pic mémoire et les blocs alloués avec tracemalloc
+            
+        Returns:
+            Rapport de profilage (voir partie_1.profilage)
+        """
+        from .profilage import Profileur, instrumenter_documents, desinstrumenter
+        
+        profileur = Profileur(cprofile, memoire)
+        liste = instrumenter_documents(documents, profileur.compteurs)
+        with profileur:
+            self.sort(liste)
+        documents[:] = desinstrumenter(liste)
+        return profileur.rapport(algorithme=self.name, complexite=self.complexity, taille=len(documents))
+    
     def __str__(self) -> str:
         return f"{self.name} ({self.complexity})"
 
@@ -125,24 +167,52 @@ class TriRapide(TriAlgorithm):
         self._quick_sort(documents, 0, len(documents) - 1)
     
     def _quick_sort(self, documents: List, bas: int, haut: int) -> None:
-        """Fonction récursive pour le tri rapide."""
-        if bas < haut:
-            pi = self._partition(documents, bas, haut)
-            self._quick_sort(documents, bas, pi - 1)
-            self._quick_sort(documents, pi + 1, haut)
+        """
+        Tri rapide : appel récursif sur la plus petite partie, boucle sur la
+        plus grande, ce qui borne la profondeur de récursion à O(log n).
+        """
+        while bas < haut:
+            milieu = self._partition(documents, bas, haut)
+            if milieu - bas < haut - milieu:
+                self._quick_sort(documents, bas, milieu)
+                bas = milieu + 1
+            else:
+                self._quick_sort(documents, milieu + 1, haut)
+                haut = milieu
+    
+    def _choisir_pivot(self, documents: List, bas: int, haut: int) -> str:
+        """
+        Médiane du premier, du milieu et du dernier titre : une liste déjà
+        triée ou inversée est coupée en deux moitiés au lieu de tomber dans
+        le pire cas quadratique.
+        """
+        milieu = (bas + haut) // 2
+        candidats = sorted((documents[bas].titre.lower(), documents[milieu].titre.lower(),
+                            documents[haut].titre.lower()))
+        return candidats[1]
     
     def _partition(self, documents: List, bas: int, haut: int) -> int:
-        """Partitionne la liste."""
-        pivot = documents[haut].titre.lower()
-        i = bas - 1
+        """
+        Partitionne la liste (schéma de Hoare) : les deux curseurs s'arrêtent
+        sur les titres égaux au pivot, si bien que les doublons sont répartis
+        des deux côtés au lieu de s'accumuler d'un seul.
         
-        for j in range(bas, haut):
-            if documents[j].titre.lower() <= pivot:
-                i += 1
-                documents[i], documents[j] = documents[j], documents[i]
+        Returns:
+            L'indice j tel que documents[bas..j] <= pivot <= documents[j+1..haut]
+        """
+        pivot = self._choisir_pivot(documents, bas, haut)
+        i, j = bas - 1, haut + 1
         
-        documents[i + 1], documents[haut] = documents[haut], documents[i + 1]
-        return i + 1
+        while True:
+            i += 1
+            while documents[i].titre.lower() < pivot:
+                i += 1
+            j -= 1
+            while documents[j].titre.lower() > pivot:
+                j -= 1
+            if i >= j:
+                return j
+            documents[i], documents[j] = documents[j], documents[i]
 
 
 class TriFusion(TriAlgorithm):
@@ -265,3 +335,51 @@ class TriComptage(TriAlgorithm):
             bucket.sort(key=lambda d: d.titre.lower())
             documents.extend(bucket)
 
+
+class TriVectorise(TriAlgorithm):
+    """
+    Tri vectorisé avec NumPy : argsort stable sur un tableau de titres.
+    Complexité : O(n log n), exécuté en code natif.
+    Sans NumPy, se replie sur le tri natif de Python (Timsort, stable lui aussi).
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.complexity = "O(n log n)"
+        self.numpy_disponible = importlib.util.find_spec('numpy') is not None
+    
+    def sort(self, documents: List) -> None:
+        """Trie la liste en permutant les documents selon l'argsort des titres."""
+        if len(documents) < 2:
+            return
+        
+        np = numpy_module()
+        if np is None:
+            documents.sort(key=lambda doc: doc.titre.lower())
+            return
+        
+        cles = np.array([doc.titre.lower() for doc in documents])
+        ordre = np.argsort(cles, kind='stable')
+        documents[:] = [documents[i] for i in ordre.tolist()]
+
+
+def top_k(documents: List, k: int, key: Optional[Callable] = None) -> List:
+    """
+    Retourne les k premiers documents dans l'ordre, sans trier toute la liste.
+    
+    Utilise un tas borné à k éléments : O(n log k) au lieu de O(n log n).
+    Les égalités conservent l'ordre d'origine (résultat stable).
+    
+    Args:
+        documents: Liste de documents (non modifiée)
+        k: Nombre de documents à retourner
+        key: Fonction de clé (par défaut, le titre en minuscules)
+        
+    Returns:
+        Liste des k premiers documents, triés
+    """
+    if k <= 0:
+        return []
+    if key is None:
+        key = lambda doc: doc.titre.lower()
+    return heapq.nsmallest(k, documents, key=key)
@@ -1,61 +1,26 @@
 
-from .bst import (
-    Node,
-    BinarySearchTree,
-    comparer_recherche_performance
-)
+# Exports différés (PEP 562, voir partie_1/exports_differes.py)
+try:
+    from ..partie_1.exports_differes import exports_differes
+except ImportError:
+    from partie_1.exports_differes import exports_differes
 
-from .bst_manager import BSTManager
+_SOUS_MODULES = {
+    'bst': ('Node', 'BinarySearchTree', 'comparer_recherche_performance'),
+    'bst_persistant': ('PersistentNode', 'PersistentBinarySearchTree', 'BSTSnapshot'),
+    'bst_manager': ('BSTManager',),
+    'trie': ('TriePrefixes', 'IndexSuggestions', 'Suggestion'),
+    'search_algorithms_bst': (
+        'BSTSearchAlgorithm', 'SearchByTitleBST', 'SearchByAuthorBST', 'SearchByKeywordsBST',
+        'SearchAdvancedBST', 'SearchMultipleCriteriaBST', 'comparer_recherche_bst_vs_liste'
+    ),
+    'compat': (
+        'rechercher_par_titre_bst', 'rechercher_par_auteur_bst', 'rechercher_par_mots_cles_bst',
+        'recherche_avancee_bst', 'ajouter_document_bst', 'supprimer_document_bst_func',
+        'supprimer_document_bst_interactif', 'afficher_bst_in_order', 'obtenir_documents_tries_bst',
+        'get_statistiques_bst'
+    ),
+    'bst_suppression': ('supprimer_document_bst',),
+}
 
-from .search_algorithms_bst import (
-    BSTSearchAlgorithm,
-    SearchByTitleBST,
-    SearchByAuthorBST,
-    SearchByKeywordsBST,
-    SearchAdvancedBST,
-    SearchMultipleCriteriaBST,
-    comparer_recherche_bst_vs_liste
-)
-
-from .compat import (
-    rechercher_par_titre_bst,
-    rechercher_par_auteur_bst,
-    rechercher_par_mots_cles_bst,
-    recherche_avancee_bst,
-    ajouter_document_bst,
-    supprimer_document_bst_func,
-    supprimer_document_bst_interactif,
-    afficher_bst_in_order,
-    obtenir_documents_tries_bst,
-    get_statistiques_bst
-)
-
-from .bst_suppression import supprimer_document_bst
-
-__all__ = [
-    'Node',
-    'BinarySearchTree',
-    'BSTManager',
-    
-    'BSTSearchAlgorithm',
-    'SearchByTitleBST',
-    'SearchByAuthorBST',
-    'SearchByKeywordsBST',
-    'SearchAdvancedBST',
-    'SearchMultipleCriteriaBST',
-    
-    'comparer_recherche_performance',
-    'comparer_recherche_bst_vs_liste',
-    
-    'rechercher_par_titre_bst',
-    'rechercher_par_auteur_bst',
-    'rechercher_par_mots_cles_bst',
-    'recherche_avancee_bst',
-    'ajouter_document_bst',
-    'supprimer_document_bst',
-    'supprimer_document_bst_func',
-    'supprimer_document_bst_interactif',
-    'afficher_bst_in_order',
-    'obtenir_documents_tries_bst',
-    'get_statistiques_bst',
-]
\ No newline at end of file
+__all__, __getattr__, __dir__ = exports_differes(__name__, _SOUS_MODULES, globals())
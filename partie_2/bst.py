@@ -1,5 +1,4 @@
 
-import time
 import random
 from copy import deepcopy
 
@@ -15,22 +14,41 @@ except ImportError:
             return f"Titre: '{self.titre}' | Auteur: {self.auteur}"
 
 
+try:
+    from ..partie_1.identifiants import cle_document
+    from ..partie_1.concurrence import VerrouLectureEcriture, en_ecriture, en_lecture
+except ImportError:
+    from partie_1.identifiants import cle_document
+    from partie_1.concurrence import VerrouLectureEcriture, en_ecriture, en_lecture
+
+
 class Node:
     """Représente un nœud dans l'Arbre Binaire de Recherche."""
     def __init__(self, document):
         self.document = document
         self.left = None
         self.right = None
+        self.taille = 1  # Nombre de nœuds du sous-arbre (accès par rang)
+
+
+def _taille(node):
+    return node.taille if node is not None else 0
+
 
 class BinarySearchTree:
     """Implémentation du BST pour stocker des documents triés par titre."""
     def __init__(self):
         self.root = None
         self.size = 0
+        self.compteurs = None  # Counter renseigné par partie_1.profilage pendant un profilage
+        self.generation = 0  # Incrémentée à chaque modification (invalidation du cache de recherche)
+        self.verrou = VerrouLectureEcriture()  # Recherches en parallèle, une seule modification à la fois
 
 
+    @en_ecriture
     def insert(self, document):
         """Insère un nouveau document dans l'arbre."""
+        self.generation += 1
         if self.root is None:
             self.root = Node(document)
             self.size += 1
@@ -38,6 +56,9 @@ class BinarySearchTree:
             self.root = self._insert_recursif(self.root, document)
 
     def _insert_recursif(self, current_node, document):
+        if self.compteurs is not None:
+            self.compteurs['visites_noeuds'] += 1
+        current_node.taille += 1  # L'insertion réussit toujours (doublons à droite)
         titre_cle = document.titre.lower()
         current_cle = current_node.document.titre.lower()
 
@@ -57,6 +78,7 @@ class BinarySearchTree:
         return current_node
             
 
+    @en_lecture
     def search(self, titre):
         """Recherche un document par titre dans le BST."""
         titre_cle = titre.lower()
@@ -66,6 +88,8 @@ class BinarySearchTree:
         """Méthode de recherche récursive. Complexité : O(log n) en moyenne."""
         if current_node is None:
             return None
+        if self.compteurs is not None:
+            self.compteurs['visites_noeuds'] += 1
 
         current_cle = current_node.document.titre.lower()
 
@@ -76,6 +100,56 @@ class BinarySearchTree:
         else:
             return self._search_recursif(current_node.right, titre_cle)
 
+    @en_lecture
+    def search_all(self, titre):
+        """
+        Recherche tous les documents portant exactement ce titre (doublons compris).
+        Les titres égaux étant rangés à droite, la descente continue à droite
+        après chaque correspondance. Complexité : O(h + k).
+        """
+        titre_cle = titre.lower()
+        resultats = []
+        current_node = self.root
+        while current_node is not None:
+            if self.compteurs is not None:
+                self.compteurs['visites_noeuds'] += 1
+            current_cle = current_node.document.titre.lower()
+            if titre_cle < current_cle:
+                current_node = current_node.left
+            else:
+                if titre_cle == current_cle:
+                    resultats.append(current_node.document)
+                current_node = current_node.right
+        return resultats
+
+    @en_lecture
+    def search_prefix(self, prefixe):
+        """Recherche les documents dont le titre commence par un préfixe, dans l'ordre."""
+        resultats = []
+        self._search_prefix_recursif(self.root, prefixe.lower(), resultats)
+        return resultats
+
+    def _search_prefix_recursif(self, current_node, prefixe, resultats):
+        """
+        Parcours limité à l'intervalle des titres ayant ce préfixe.
+        Complexité : O(h + k), h étant la hauteur et k le nombre de résultats.
+        """
+        if current_node is None:
+            return
+        if self.compteurs is not None:
+            self.compteurs['visites_noeuds'] += 1
+
+        current_cle = current_node.document.titre.lower()
+        correspond = current_cle.startswith(prefixe)
+
+        if current_cle > prefixe:
+            self._search_prefix_recursif(current_node.left, prefixe, resultats)
+        if correspond:
+            resultats.append(current_node.document)
+        if correspond or current_cle < prefixe:
+            self._search_prefix_recursif(current_node.right, prefixe, resultats)
+
+    @en_lecture
     def search_by_author(self, auteur):
         """Recherche tous les documents d'un auteur dans le BST."""
         resultats = []
@@ -86,6 +160,8 @@ class BinarySearchTree:
         """Recherche récursive par auteur. Complexité : O(n) car on doit parcourir tout l'arbre."""
         if current_node is None:
             return
+        if self.compteurs is not None:
+            self.compteurs['visites_noeuds'] += 1
 
         if auteur_cle in current_node.document.auteur.lower():
             resultats.append(current_node.document)
@@ -93,6 +169,7 @@ class BinarySearchTree:
         self._search_by_author_recursif(current_node.left, auteur_cle, resultats)
         self._search_by_author_recursif(current_node.right, auteur_cle, resultats)
 
+    @en_lecture
     def search_by_keywords(self, mot_cle):
         """Recherche tous les documents contenant un mot-clé dans le BST."""
         resultats = []
@@ -103,6 +180,8 @@ class BinarySearchTree:
         """Recherche récursive par mots-clés. Complexité : O(n) car on doit parcourir tout l'arbre."""
         if current_node is None:
             return
+        if self.compteurs is not None:
+            self.compteurs['visites_noeuds'] += 1
 
         for mot in current_node.document.mots_cles:
             if mot_cle in mot.lower():
@@ -112,6 +191,7 @@ class BinarySearchTree:
         self._search_by_keywords_recursif(current_node.left, mot_cle, resultats)
         self._search_by_keywords_recursif(current_node.right, mot_cle, resultats)
 
+    @en_lecture
     def search_advanced(self, terme):
         """Recherche avancée dans tous les champs (titre, auteur, mots-clés)."""
         resultats = []
@@ -122,6 +202,8 @@ class BinarySearchTree:
         """Recherche avancée récursive. Complexité : O(n) car on doit parcourir tout l'arbre."""
         if current_node is None:
             return
+        if self.compteurs is not None:
+            self.compteurs['visites_noeuds'] += 1
 
         document = current_node.document
         
@@ -139,6 +221,7 @@ class BinarySearchTree:
         self._search_advanced_recursif(current_node.right, terme, resultats)
 
 
+    @en_lecture
     def in_order_traversal(self):
         """Effectue un parcours in-order et retourne la liste des documents triés."""
         resultats = []
@@ -148,11 +231,56 @@ class BinarySearchTree:
     def _in_order_recursif(self, node, resultats):
         """Méthode de parcours récursive : Gauche -> Racine -> Droite."""
         if node:
+            if self.compteurs is not None:
+                self.compteurs['visites_noeuds'] += 1
             self._in_order_recursif(node.left, resultats)
             resultats.append(node.document)
             self._in_order_recursif(node.right, resultats)
             
 
+    @en_lecture
+    def in_order_page(self, debut, taille):
+        """
+        Documents de rang `debut` à `debut + taille - 1` dans l'ordre in-order,
+        sans parcourir ceux qui précèdent : la descente vers le rang de départ
+        s'appuie sur la taille des sous-arbres. Complexité: O(h + taille).
+        """
+        resultats = []
+        debut = max(0, debut)
+        if taille <= 0 or debut >= self.size:
+            return resultats
+
+        pile = []
+        node = self.root
+        rang = debut
+        while node is not None:
+            gauche = _taille(node.left)
+            if rang < gauche:
+                pile.append(node)
+                node = node.left
+            elif rang == gauche:
+                pile.append(node)
+                break
+            else:
+                rang -= gauche + 1
+                node = node.right
+
+        while pile and len(resultats) < taille:
+            node = pile.pop()
+            resultats.append(node.document)
+            node = node.right
+            while node is not None:
+                pile.append(node)
+                node = node.left
+        return resultats
+
+    @en_lecture
+    def select(self, rang):
+        """Document de rang donné dans l'ordre in-order (None hors limites). Complexité: O(h)."""
+        page = self.in_order_page(rang, 1)
+        return page[0] if page and rang >= 0 else None
+
+    @en_ecriture
     def delete(self, titre):
         """Supprime un document par titre de l'arbre."""
         titre_cle = titre.lower()
@@ -161,19 +289,45 @@ class BinarySearchTree:
         self.root = self._delete_recursif(self.root, titre_cle)
         
         if self.size < original_size:
+            self.generation += 1
             return True
         return False
 
-    def _delete_recursif(self, node, titre_cle):
+    @en_ecriture
+    def delete_document(self, document):
+        """
+        Supprime ce document précis de l'arbre (comparé par identifiant), même
+        si d'autres documents portent le même titre.
+        """
+        original_size = self.size
+        self.root = self._delete_recursif(self.root, document.titre.lower(), document)
+        if self.size < original_size:
+            self.generation += 1
+            return True
+        return False
+
+    @en_ecriture
+    def clear(self):
+        """Vide l'arbre."""
+        self.root = None
+        self.size = 0
+        self.generation += 1
+
+    def _delete_recursif(self, node, titre_cle, document=None):
         if node is None:
             return node
+        if self.compteurs is not None:
+            self.compteurs['visites_noeuds'] += 1
 
         current_cle = node.document.titre.lower()
 
         if titre_cle < current_cle:
-            node.left = self._delete_recursif(node.left, titre_cle)
+            node.left = self._delete_recursif(node.left, titre_cle, document)
         elif titre_cle > current_cle:
-            node.right = self._delete_recursif(node.right, titre_cle)
+            node.right = self._delete_recursif(node.right, titre_cle, document)
+        elif document is not None and cle_document(node.document) != cle_document(document):
+            # Doublon de titre : les titres égaux sont rangés à droite
+            node.right = self._delete_recursif(node.right, titre_cle, document)
         else:
             
             if node.left is None:
@@ -187,8 +341,9 @@ class BinarySearchTree:
             
             node.document = temp.document
             
-            node.right = self._delete_recursif(node.right, temp.document.titre.lower())
+            node.right = self._delete_recursif(node.right, temp.document.titre.lower(), temp.document)
             
+        node.taille = 1 + _taille(node.left) + _taille(node.right)
         return node
 
     def _trouver_min_node(self, node):
@@ -212,8 +367,14 @@ def recherche_sequentielle(bibliotheque_list, titre_cle):
 
 def comparer_recherche_performance(Document_Classe, list_size=10000):
     """
-    Compare le temps de recherche séquentielle (list) vs. BST.
+    Compare le temps de recherche séquentielle (list) vs. BST, mesuré par
+    le banc d'essai commun (partie_1.benchmark_recherche) sur 100 titres exacts.
     """
+    try:
+        from ..partie_1.benchmark_recherche import executer_benchmark_recherche
+    except ImportError:
+        from partie_1.benchmark_recherche import executer_benchmark_recherche
+
     print("\n" + "="*70)
     print("        COMPARAISON DES PERFORMANCES DE RECHERCHE")
     print(f"        Taille de l'échantillon : {list_size} documents")
@@ -223,24 +384,10 @@ def comparer_recherche_performance(Document_Classe, list_size=10000):
     random.shuffle(titres_uniques)
     donnees = [Document_Classe(titre, "Auteur", "") for titre in titres_uniques]
 
-    bibliotheque_list = donnees
-    bst = BinarySearchTree()
-    for doc in donnees:
-        bst.insert(doc)
-
-    titres_a_chercher = random.sample(titres_uniques, 100) 
-    
-    start_time_seq = time.time()
-    for titre in titres_a_chercher:
-        recherche_sequentielle(bibliotheque_list, titre)
-    end_time_seq = time.time()
-    temps_sequentiel = (end_time_seq - start_time_seq) / len(titres_a_chercher)
-    
-    start_time_bst = time.time()
-    for titre in titres_a_chercher:
-        bst.search(titre)
-    end_time_bst = time.time()
-    temps_bst = (end_time_bst - start_time_bst) / len(titres_a_chercher)
+    rapport = executer_benchmark_recherche(donnees, nombre_requetes=100, types=('exact',),
+                                           structures=('liste', 'bst'))
+    temps_sequentiel = rapport['resultats']['liste']['exact']['moyenne']
+    temps_bst = rapport['resultats']['bst']['exact']['moyenne']
     
     print(f"| {'Algorithme':<30} | {'Complexité (Moyenne)':<25} | {'Temps Moyen par Recherche (s)':<15} |")
     print("-" * 70)
@@ -249,4 +396,4 @@ def comparer_recherche_performance(Document_Classe, list_size=10000):
     print("-" * 70)
 
     gain = (temps_sequentiel / temps_bst) if temps_bst > 0 else float('inf')
-    print(f"\nConclusion : Le BST est environ {gain:.2f} fois plus rapide que la recherche séquentielle.")
\ No newline at end of file
+    print(f"\nConclusion : Le BST est environ {gain:.2f} fois plus rapide que la recherche séquentielle.")
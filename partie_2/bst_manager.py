@@ -5,8 +5,12 @@ import time
 
 try:
     from ..partie_1.document import Document
+    from ..partie_1.cache import CacheResultats
+    from ..partie_1.metriques import mesure
 except ImportError:
     from partie_1.document import Document
+    from partie_1.cache import CacheResultats
+    from partie_1.metriques import mesure
 
 
 class BSTManager:
@@ -15,14 +19,28 @@ class BSTManager:
     Simplifie l'utilisation du BST et fournit une interface cohérente.
     """
     
-    def __init__(self, bst: Optional[BinarySearchTree] = None):
+    def __init__(self, bst: Optional[BinarySearchTree] = None, cache: Optional[CacheResultats] = None,
+                 moteur=None):
         """
         Initialise le gestionnaire avec un BST existant ou en crée un nouveau.
         
         Args:
             bst: Un BST existant (optionnel)
+            cache: Cache des résultats de recherche (par défaut, un cache dédié)
+            moteur: MoteurStockage dont le BST est un index ; les modifications passent alors par lui
         """
         self.bst = bst if bst is not None else BinarySearchTree()
+        self.moteur = moteur
+        self.cache = cache if cache is not None else CacheResultats()
+    
+    def _rechercher(self, algorithme: str, terme: str, recherche):
+        """Sert la recherche depuis le cache tant que le BST n'a pas été modifié."""
+        return self.cache.obtenir_ou_calculer('bst', algorithme, terme, self.bst.generation,
+                                              lambda: recherche(terme))
+    
+    def statistiques_cache(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache de recherche (succès, échecs, taux...)."""
+        return self.cache.statistiques()
     
     
     def ajouter_document(self, titre: str, auteur: str, mots_cles: str) -> bool:
@@ -39,7 +57,10 @@ class BSTManager:
         """
         try:
             document = Document(titre, auteur, mots_cles)
-            self.bst.insert(document)
+            if self.moteur is not None:
+                self.moteur.ajouter(document)
+            else:
+                self.bst.insert(document)
             return True
         except Exception as e:
             print(f"❌ Erreur lors de l'ajout : {e}")
@@ -55,8 +76,11 @@ class BSTManager:
         Returns:
             True si la suppression a réussi
         """
+        if self.moteur is not None:
+            return bool(self.moteur.supprimer_par_titre(titre, tous=False))
         return self.bst.delete(titre)
     
+    @mesure('bst.rechercher_par_titre')
     def rechercher_par_titre(self, titre: str) -> Optional[Document]:
         """
         Recherche un document par son titre exact.
@@ -67,8 +91,36 @@ class BSTManager:
         Returns:
             Le document trouvé ou None
         """
-        return self.bst.search(titre)
+        return self._rechercher('titre', titre, self.bst.search)
+    
+    @mesure('bst.rechercher_tous_par_titre')
+    def rechercher_tous_par_titre(self, titre: str) -> List[Document]:
+        """
+        Recherche tous les documents portant exactement ce titre (doublons compris).
+        
+        Args:
+            titre: Le titre à rechercher
+            
+        Returns:
+            Liste des documents trouvés
+        """
+        return self._rechercher('titre_tous', titre, self.bst.search_all)
+    
+    @mesure('bst.rechercher_par_prefixe')
+    def rechercher_par_prefixe(self, prefixe: str) -> List[Document]:
+        """
+        Recherche les documents dont le titre commence par un préfixe.
+        Exploite l'ordre du BST : seule la zone concernée est parcourue.
+        
+        Args:
+            prefixe: Le début du titre
+            
+        Returns:
+            Liste des documents trouvés, triés par titre
+        """
+        return self._rechercher('prefixe', prefixe, self.bst.search_prefix)
     
+    @mesure('bst.rechercher_par_auteur')
     def rechercher_par_auteur(self, auteur: str) -> List[Document]:
         """
         Recherche tous les documents d'un auteur.
@@ -79,8 +131,9 @@ class BSTManager:
         Returns:
             Liste des documents trouvés
         """
-        return self.bst.search_by_author(auteur)
+        return self._rechercher('auteur', auteur, self.bst.search_by_author)
     
+    @mesure('bst.rechercher_par_mots_cles')
     def rechercher_par_mots_cles(self, mot_cle: str) -> List[Document]:
         """
         Recherche tous les documents contenant un mot-clé.
@@ -91,8 +144,9 @@ class BSTManager:
         Returns:
             Liste des documents trouvés
         """
-        return self.bst.search_by_keywords(mot_cle)
+        return self._rechercher('mots_cles', mot_cle, self.bst.search_by_keywords)
     
+    @mesure('bst.rechercher_avancee')
     def rechercher_avancee(self, terme: str) -> List[Document]:
         """
         Recherche avancée dans tous les champs.
@@ -103,7 +157,7 @@ class BSTManager:
         Returns:
             Liste des documents trouvés
         """
-        return self.bst.search_advanced(terme)
+        return self._rechercher('avancee', terme, self.bst.search_advanced)
     
     
     def obtenir_documents_tries(self) -> List[Document]:
@@ -182,8 +236,10 @@ class BSTManager:
     
     def vider(self) -> None:
         """Vide complètement le BST."""
-        self.bst.root = None
-        self.bst.size = 0
+        if self.moteur is not None:
+            self.moteur.vider()
+        else:
+            self.bst.clear()
     
     def est_vide(self) -> bool:
         """
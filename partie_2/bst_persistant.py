@@ -0,0 +1,395 @@
+"""
+Arbre binaire de recherche persistant (copie de chemin).
+
+Les nœuds ne sont jamais modifiés après leur création : une insertion ou une
+suppression recopie seulement les nœuds du chemin racine -> point modifié et
+partage tous les autres sous-arbres avec la version précédente. Chaque
+modification produit donc une nouvelle racine pour O(h) nœuds de mémoire
+(O(log n) sur un arbre équilibré), et toute version antérieure reste intacte.
+
+Conséquences :
+- snapshot() est O(1) : l'instantané fige la racine courante ; on peut le
+  parcourir sans aucun verrou pendant que d'autres fils modifient l'arbre ;
+- les lectures de l'arbre lui-même ne prennent pas de verrou non plus : elles
+  lisent la version courante (une seule affectation d'attribut, atomique) ;
+- undo() rétablit la version précédente en O(1) (annulation d'une suppression
+  par exemple), dans la limite de `profondeur_historique` versions.
+
+L'ordre est celui de BinarySearchTree (titre en minuscules, titres égaux à
+droite) et l'interface est la même : l'arbre peut remplacer l'index BST du
+moteur :
+    moteur.retirer_index('bst')
+    moteur.ajouter_index(IndexBST(PersistentBinarySearchTree()))
+"""
+
+from collections import deque
+
+try:
+    from ..partie_1.identifiants import cle_document
+    from ..partie_1.concurrence import VerrouLectureEcriture, en_ecriture
+except ImportError:
+    from partie_1.identifiants import cle_document
+    from partie_1.concurrence import VerrouLectureEcriture, en_ecriture
+
+
+class PersistentNode:
+    """Nœud immuable : ses champs ne changent plus après le constructeur."""
+
+    __slots__ = ('document', 'left', 'right', 'taille')
+
+    def __init__(self, document, left=None, right=None):
+        self.document = document
+        self.left = left
+        self.right = right
+        self.taille = 1 + _taille(left) + _taille(right)
+
+
+def _taille(node):
+    return node.taille if node is not None else 0
+
+
+def _recopier_chemin(chemin, sous_arbre):
+    """
+    Reconstruit les nœuds du chemin (du bas vers le haut) au-dessus du nouveau
+    sous-arbre ; les frères non traversés sont partagés tels quels.
+
+    Args:
+        chemin: Liste de (nœud, True si la descente est passée à gauche)
+        sous_arbre: Nouveau sous-arbre qui remplace le bas du chemin
+
+    Returns:
+        La nouvelle racine
+    """
+    for node, gauche in reversed(chemin):
+        if gauche:
+            sous_arbre = PersistentNode(node.document, sous_arbre, node.right)
+        else:
+            sous_arbre = PersistentNode(node.document, node.left, sous_arbre)
+    return sous_arbre
+
+
+class BSTSnapshot:
+    """
+    Version figée de l'arbre. Rien ne la modifie : ses lectures ne prennent
+    aucun verrou et restent cohérentes quoi que fassent les rédacteurs.
+    """
+
+    __slots__ = ('root', 'size', 'generation', 'compteurs')
+
+    def __init__(self, root=None, size=0, generation=0, compteurs=None):
+        self.root = root
+        self.size = size
+        self.generation = generation
+        self.compteurs = compteurs  # Counter renseigné par partie_1.profilage pendant un profilage
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Parcours in-order paresseux (pile explicite, sans récursion)."""
+        pile = []
+        node = self.root
+        while pile or node is not None:
+            while node is not None:
+                pile.append(node)
+                node = node.left
+            node = pile.pop()
+            yield node.document
+            node = node.right
+
+    def _prefixe(self):
+        """Parcours préfixe (racine, gauche, droite), l'ordre des recherches O(n) de BinarySearchTree."""
+        pile = [self.root] if self.root is not None else []
+        compteurs = self.compteurs
+        while pile:
+            node = pile.pop()
+            if compteurs is not None:
+                compteurs['visites_noeuds'] += 1
+            yield node.document
+            if node.right is not None:
+                pile.append(node.right)
+            if node.left is not None:
+                pile.append(node.left)
+
+    def search(self, titre):
+        """Recherche un document par titre. Complexité : O(h)."""
+        titre_cle = titre.lower()
+        node = self.root
+        while node is not None:
+            if self.compteurs is not None:
+                self.compteurs['visites_noeuds'] += 1
+            current_cle = node.document.titre.lower()
+            if titre_cle == current_cle:
+                return node.document
+            node = node.left if titre_cle < current_cle else node.right
+        return None
+
+    def search_all(self, titre):
+        """Tous les documents portant exactement ce titre (doublons compris). Complexité : O(h + k)."""
+        titre_cle = titre.lower()
+        resultats = []
+        node = self.root
+        while node is not None:
+            if self.compteurs is not None:
+                self.compteurs['visites_noeuds'] += 1
+            current_cle = node.document.titre.lower()
+            if titre_cle < current_cle:
+                node = node.left
+            else:
+                if titre_cle == current_cle:
+                    resultats.append(node.document)
+                node = node.right
+        return resultats
+
+    def search_prefix(self, prefixe):
+        """
+        Documents dont le titre commence par un préfixe, dans l'ordre : parcours
+        in-order (pile explicite) limité à l'intervalle des titres ayant ce
+        préfixe. Complexité : O(h + k).
+        """
+        prefixe = prefixe.lower()
+        resultats = []
+        pile = []
+        node = self.root
+        while pile or node is not None:
+            while node is not None:
+                if self.compteurs is not None:
+                    self.compteurs['visites_noeuds'] += 1
+                current_cle = node.document.titre.lower()
+                pile.append((node, current_cle))
+                node = node.left if current_cle > prefixe else None
+            node, current_cle = pile.pop()
+            correspond = current_cle.startswith(prefixe)
+            if correspond:
+                resultats.append(node.document)
+            node = node.right if correspond or current_cle < prefixe else None
+        return resultats
+
+    def search_by_author(self, auteur):
+        """Documents dont l'auteur contient le terme. Complexité : O(n)."""
+        auteur_cle = auteur.lower()
+        return [doc for doc in self._prefixe() if auteur_cle in doc.auteur.lower()]
+
+    def search_by_keywords(self, mot_cle):
+        """Documents dont un mot-clé contient le terme. Complexité : O(n)."""
+        mot_cle = mot_cle.lower()
+        return [doc for doc in self._prefixe() if any(mot_cle in mot.lower() for mot in doc.mots_cles)]
+
+    def search_advanced(self, terme):
+        """Recherche dans le titre, l'auteur et les mots-clés. Complexité : O(n)."""
+        terme = terme.lower()
+        return [doc for doc in self._prefixe()
+                if terme in doc.titre.lower() or terme in doc.auteur.lower()
+                or any(terme in mot.lower() for mot in doc.mots_cles)]
+
+    def in_order_traversal(self):
+        """Liste des documents triés par titre."""
+        return list(self)
+
+    def in_order_page(self, debut, taille):
+        """
+        Documents de rang `debut` à `debut + taille - 1` dans l'ordre in-order,
+        en descendant directement au rang de départ. Complexité : O(h + taille).
+        """
+        resultats = []
+        debut = max(0, debut)
+        if taille <= 0 or debut >= self.size:
+            return resultats
+
+        pile = []
+        node = self.root
+        rang = debut
+        while node is not None:
+            gauche = _taille(node.left)
+            if rang < gauche:
+                pile.append(node)
+                node = node.left
+            elif rang == gauche:
+                pile.append(node)
+                break
+            else:
+                rang -= gauche + 1
+                node = node.right
+
+        while pile and len(resultats) < taille:
+            node = pile.pop()
+            resultats.append(node.document)
+            node = node.right
+            while node is not None:
+                pile.append(node)
+                node = node.left
+        return resultats
+
+    def select(self, rang):
+        """Document de rang donné dans l'ordre in-order (None hors limites). Complexité : O(h)."""
+        page = self.in_order_page(rang, 1)
+        return page[0] if page and rang >= 0 else None
+
+
+class PersistentBinarySearchTree:
+    """
+    BST persistant : même interface que BinarySearchTree, plus snapshot(),
+    undo() et restore().
+
+    Les modifications sont sérialisées par `self.verrou` en écriture ; les
+    lectures ne prennent jamais de verrou et lisent la version courante.
+    """
+
+    def __init__(self, profondeur_historique: int = 32):
+        """
+        Args:
+            profondeur_historique: Nombre de versions précédentes conservées pour undo()
+                                   (0 : aucune ; chaque version coûte O(h) nœuds)
+        """
+        self._version = BSTSnapshot()
+        self._historique = deque(maxlen=profondeur_historique)
+        self.compteurs = None  # Counter renseigné par partie_1.profilage pendant un profilage
+        self.verrou = VerrouLectureEcriture()  # Sérialise les rédacteurs ; les lectures s'en passent
+
+    @property
+    def root(self):
+        return self._version.root
+
+    @property
+    def size(self):
+        return self._version.size
+
+    @property
+    def generation(self):
+        return self._version.generation
+
+    def snapshot(self) -> BSTSnapshot:
+        """Version courante, figée. Complexité : O(1)."""
+        return self._version
+
+    def _lire(self) -> BSTSnapshot:
+        version = self._version
+        if self.compteurs is None:
+            return version
+        return BSTSnapshot(version.root, version.size, version.generation, self.compteurs)
+
+    def _publier(self, root, size) -> None:
+        """Conserve la version courante dans l'historique puis publie la nouvelle."""
+        self._historique.append(self._version)
+        self._version = BSTSnapshot(root, size, self._version.generation + 1)
+
+    @property
+    def historique(self) -> int:
+        """Nombre de versions que undo() peut encore rétablir."""
+        return len(self._historique)
+
+    @en_ecriture
+    def undo(self) -> bool:
+        """
+        Rétablit la version précédant la dernière modification.
+
+        Returns:
+            False s'il n'y a plus de version à rétablir
+        """
+        if not self._historique:
+            return False
+        precedente = self._historique.pop()
+        # Génération toujours croissante : les caches indexés par génération restent justes
+        self._version = BSTSnapshot(precedente.root, precedente.size, self._version.generation + 1)
+        return True
+
+    @en_ecriture
+    def restore(self, instantane: BSTSnapshot) -> None:
+        """Fait d'un instantané antérieur la version courante (annulable par undo())."""
+        self._publier(instantane.root, instantane.size)
+
+    @en_ecriture
+    def insert(self, document):
+        """Insère un document en recopiant le chemin jusqu'à sa place. Complexité : O(h)."""
+        titre_cle = document.titre.lower()
+        chemin = []
+        node = self._version.root
+        while node is not None:
+            if self.compteurs is not None:
+                self.compteurs['visites_noeuds'] += 1
+            gauche = titre_cle < node.document.titre.lower()  # Doublons à droite
+            chemin.append((node, gauche))
+            node = node.left if gauche else node.right
+        self._publier(_recopier_chemin(chemin, PersistentNode(document)), self._version.size + 1)
+
+    @en_ecriture
+    def delete(self, titre):
+        """Supprime un document par titre. Complexité : O(h)."""
+        return self._supprimer(titre.lower())
+
+    @en_ecriture
+    def delete_document(self, document):
+        """Supprime ce document précis (comparé par identifiant), même si d'autres portent le même titre."""
+        return self._supprimer(document.titre.lower(), document)
+
+    @en_ecriture
+    def clear(self):
+        """Vide l'arbre (annulable par undo())."""
+        self._publier(None, 0)
+
+    def _supprimer(self, titre_cle, document=None):
+        chemin = []
+        node = self._version.root
+        cle = cle_document(document) if document is not None else None
+        while node is not None:
+            if self.compteurs is not None:
+                self.compteurs['visites_noeuds'] += 1
+            current_cle = node.document.titre.lower()
+            if titre_cle == current_cle and (cle is None or cle_document(node.document) == cle):
+                break
+            gauche = titre_cle < current_cle  # Doublon de titre : les titres égaux sont à droite
+            chemin.append((node, gauche))
+            node = node.left if gauche else node.right
+        if node is None:
+            return False
+
+        if node.left is None:
+            remplacant = node.right
+        elif node.right is None:
+            remplacant = node.left
+        else:
+            # Le successeur (minimum du sous-arbre droit) prend la place du nœud supprimé
+            chemin_min = []
+            minimum = node.right
+            while minimum.left is not None:
+                chemin_min.append((minimum, True))
+                minimum = minimum.left
+            remplacant = PersistentNode(minimum.document, node.left,
+                                        _recopier_chemin(chemin_min, minimum.right))
+        self._publier(_recopier_chemin(chemin, remplacant), self._version.size - 1)
+        return True
+
+    # Lectures : sans verrou, sur la version courante
+    def search(self, titre):
+        return self._lire().search(titre)
+
+    def search_all(self, titre):
+        return self._lire().search_all(titre)
+
+    def search_prefix(self, prefixe):
+        return self._lire().search_prefix(prefixe)
+
+    def search_by_author(self, auteur):
+        return self._lire().search_by_author(auteur)
+
+    def search_by_keywords(self, mot_cle):
+        return self._lire().search_by_keywords(mot_cle)
+
+    def search_advanced(self, terme):
+        return self._lire().search_advanced(terme)
+
+    def in_order_traversal(self):
+        return self._lire().in_order_traversal()
+
+    def in_order_page(self, debut, taille):
+        return self._lire().in_order_page(debut, taille)
+
+    def select(self, rang):
+        return self._lire().select(rang)
+
+    def __len__(self):
+        return self._version.size
+
+    def __iter__(self):
+        """Itère sur la version courante au moment de l'appel, même si l'arbre change ensuite."""
+        return iter(self._lire())
@@ -1,11 +1,13 @@
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 try:
     from ..partie_1.document import Document
+    from ..partie_1.profilage import profiler_structure
 except ImportError:
     from partie_1.document import Document
+    from partie_1.profilage import profiler_structure
 
 
 class BSTSearchAlgorithm(ABC):
@@ -34,6 +36,22 @@ class BSTSearchAlgorithm(ABC):
     def get_complexity(self) -> str:
         """Retourne la complexité de l'algorithme."""
         return self.complexity
+    
+    def profile(self, bst, terme: str, cprofile: bool = False, memoire: bool = False) -> Dict[str, Any]:
+        """
+        Recherche en comptant les nœuds visités, avec cProfile/tracemalloc à la demande.
+        
+        Args:
+            bst: Le BST
+            terme: Le terme à rechercher
+            cprofile: Attache une session cProfile
+            memoire: Mesure le pic mémoire et les blocs alloués avec tracemalloc
+            
+        Returns:
+            Rapport de profilage (voir partie_1.profilage)
+        """
+        return profiler_structure(bst, self.search, terme, cprofile, memoire,
+                                  algorithme=self.__class__.__name__, complexite=self.complexity)
 
 
 class SearchByTitleBST(BSTSearchAlgorithm):
@@ -178,17 +196,21 @@ class SearchMultipleCriteriaBST(BSTSearchAlgorithm):
 
 def comparer_recherche_bst_vs_liste(Document_Classe, tailles: List[int] = None):
     """
-    Compare les performances de recherche entre BST et liste.
+    Compare les performances de recherche entre BST et liste, par le banc
+    d'essai commun (partie_1.benchmark_recherche) : 100 requêtes par taille.
     
     Args:
         Document_Classe: La classe Document
         tailles: Liste des tailles à tester
         
     Returns:
-        Dictionnaire avec les résultats de comparaison
+        Liste de dictionnaires (taille, temps moyens par recherche, gain)
     """
-    import time
     import random
+    try:
+        from ..partie_1.benchmark_recherche import executer_benchmark_recherche
+    except ImportError:
+        from partie_1.benchmark_recherche import executer_benchmark_recherche
     
     if tailles is None:
         tailles = [100, 500, 1000, 5000, 10000]
@@ -203,25 +225,11 @@ def comparer_recherche_bst_vs_liste(Document_Classe, tailles: List[int] = None):
         titres = [f"Titre-{i:05d}" for i in range(taille)]
         random.shuffle(titres)
         documents = [Document_Classe(titre, "Auteur", "") for titre in titres]
-        
-        from .bst import BinarySearchTree
-        bst = BinarySearchTree()
-        for doc in documents:
-            bst.insert(doc)
-        
-        titres_test = random.sample(titres, min(100, taille))
-        
-        start = time.time()
-        for titre in titres_test:
-            for doc in documents:
-                if doc.titre.lower() == titre.lower():
-                    break
-        temps_liste = time.time() - start
-        
-        start = time.time()
-        for titre in titres_test:
-            bst.search(titre)
-        temps_bst = time.time() - start
+
+        rapport = executer_benchmark_recherche(documents, nombre_requetes=100, types=('exact',),
+                                               structures=('liste', 'bst'))
+        temps_liste = rapport['resultats']['liste']['exact']['moyenne']
+        temps_bst = rapport['resultats']['bst']['exact']['moyenne']
         
         gain = temps_liste / temps_bst if temps_bst > 0 else 0
         
@@ -234,10 +242,9 @@ def comparer_recherche_bst_vs_liste(Document_Classe, tailles: List[int] = None):
         resultats.append(resultat)
         
         print(f"\nTaille: {taille} documents")
-        print(f"  Liste (O(n)):    {temps_liste:.6f}s")
-        print(f"  BST (O(log n)):  {temps_bst:.6f}s")
-        print(f"  Gain:            {gain:.2f}x plus rapide")
+        print(f"  Liste (O(n)):     {temps_liste:.8f}s")
+        print(f"  BST (O(log n)):   {temps_bst:.8f}s")
+        print(f"  Gain:             {gain:.2f}x plus rapide")
     
     print("\n" + "=" * 80)
     return resultats
-
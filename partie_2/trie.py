@@ -0,0 +1,291 @@
+"""
+Trie de préfixes compressé pour l'autocomplétion.
+
+TriePrefixes est un arbre radix : chaque arête porte une chaîne et un nœud
+n'existe que là où deux termes divergent ou où un terme se termine, soit au
+plus deux nœuds par terme. Chaque nœud garde en cache les N termes les plus
+populaires de son sous-arbre ; compléter un préfixe coûte donc une descente
+O(longueur du préfixe) plus la lecture de ce cache.
+
+Les insertions et suppressions ne font qu'invalider le cache des nœuds de leur
+chemin (O(longueur du terme)) ; il est recalculé à la consultation suivante à
+partir de celui des enfants. Après un chargement massif, la première
+complétion d'un préfixe court parcourt son sous-arbre une fois.
+
+IndexSuggestions regroupe un trie pour les titres, un pour les auteurs et un
+pour les mots-clés ; la popularité d'un terme est le nombre de documents qui
+le portent.
+
+Exemple :
+    index = IndexSuggestions(documents)
+    index.suggest("le p")          # [Suggestion('Le Petit Prince', 'titre', 1), ...]
+    index.suggest("hu", 'auteur')
+"""
+
+import heapq
+import unicodedata
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+TAILLE_SUGGESTIONS = 10
+
+
+def normaliser(texte: str) -> str:
+    """Minuscules, sans accents, espaces réduits : 'L’Étranger ' -> "l'etranger"."""
+    texte = unicodedata.normalize('NFD', texte.replace('’', "'"))
+    texte = ''.join(c for c in texte if not unicodedata.combining(c))
+    return ' '.join(texte.lower().split())
+
+
+class _Noeud:
+    __slots__ = ('etiquette', 'enfants', 'compte', 'cle', 'terme', 'meilleurs')
+
+    def __init__(self, etiquette: str = ''):
+        self.etiquette = etiquette
+        self.enfants: Dict[str, '_Noeud'] = {}
+        self.compte = 0      # Popularité du terme qui se termine ici (0 : aucun)
+        self.cle = None      # Terme normalisé complet
+        self.terme = None    # Forme affichée du terme
+        self.meilleurs = []  # [(-compte, cle, terme)] du sous-arbre ; None : à recalculer
+
+
+class TriePrefixes:
+    """
+    Trie radix de termes pondérés, complétion des N termes les plus populaires.
+
+    Args:
+        taille_cache: Nombre de termes gardés en cache par nœud (N maximal servi sans parcours)
+    """
+
+    def __init__(self, taille_cache: int = TAILLE_SUGGESTIONS):
+        self.racine = _Noeud()
+        self.taille_cache = taille_cache
+        self.size = 0  # Nombre de termes distincts
+
+    def insert(self, terme: str, poids: int = 1) -> None:
+        """Ajoute `poids` à la popularité du terme (créé s'il est absent)."""
+        cle = normaliser(terme)
+        if not cle or poids <= 0:
+            return
+        noeud = self.racine
+        noeud.meilleurs = None
+        reste = cle
+        while reste:
+            enfant = noeud.enfants.get(reste[0])
+            if enfant is None:
+                enfant = _Noeud(reste)
+                noeud.enfants[reste[0]] = enfant
+                noeud = enfant
+                break
+            commun = _prefixe_commun(enfant.etiquette, reste)
+            if commun < len(enfant.etiquette):
+                # Le terme diverge au milieu de l'arête : on la coupe en deux
+                milieu = _Noeud(enfant.etiquette[:commun])
+                enfant.etiquette = enfant.etiquette[commun:]
+                milieu.enfants[enfant.etiquette[0]] = enfant
+                noeud.enfants[milieu.etiquette[0]] = milieu
+                enfant = milieu
+            noeud = enfant
+            noeud.meilleurs = None
+            reste = reste[commun:]
+        if noeud.compte == 0:
+            self.size += 1
+            noeud.cle = cle
+            noeud.terme = terme.strip()
+        noeud.compte += poids
+        noeud.meilleurs = None
+
+    def delete(self, terme: str, poids: int = 1) -> bool:
+        """
+        Retire `poids` à la popularité du terme ; le terme disparaît à zéro.
+
+        Returns:
+            False si le terme était absent
+        """
+        cle = normaliser(terme)
+        chemin = [self.racine]
+        reste = cle
+        while reste:
+            enfant = chemin[-1].enfants.get(reste[0])
+            if enfant is None or not reste.startswith(enfant.etiquette):
+                return False
+            reste = reste[len(enfant.etiquette):]
+            chemin.append(enfant)
+        noeud = chemin[-1]
+        if noeud.compte == 0:
+            return False
+
+        noeud.compte = max(0, noeud.compte - poids)
+        if noeud.compte == 0:
+            noeud.cle = noeud.terme = None
+            self.size -= 1
+            self._elaguer(chemin)
+        for noeud in chemin:
+            noeud.meilleurs = None
+        return True
+
+    def _elaguer(self, chemin: List[_Noeud]) -> None:
+        """Supprime les nœuds devenus inutiles et refusionne les arêtes."""
+        i = len(chemin) - 1
+        while i > 0:
+            noeud, parent = chemin[i], chemin[i - 1]
+            if noeud.compte or len(noeud.enfants) > 1:
+                return
+            if not noeud.enfants:
+                del parent.enfants[noeud.etiquette[0]]
+                chemin.pop()
+                i -= 1
+                continue
+            (enfant,) = noeud.enfants.values()
+            enfant.etiquette = noeud.etiquette + enfant.etiquette
+            parent.enfants[enfant.etiquette[0]] = enfant
+            chemin[i] = enfant
+            return
+
+    def _noeud_prefixe(self, prefixe: str) -> Optional[_Noeud]:
+        noeud = self.racine
+        reste = prefixe
+        while reste:
+            enfant = noeud.enfants.get(reste[0])
+            if enfant is None:
+                return None
+            if reste.startswith(enfant.etiquette):
+                reste = reste[len(enfant.etiquette):]
+            elif enfant.etiquette.startswith(reste):
+                reste = ''
+            else:
+                return None
+            noeud = enfant
+        return noeud
+
+    def _meilleurs(self, noeud: _Noeud) -> List[Tuple[int, str, str]]:
+        """Cache des meilleurs termes du sous-arbre, recalculé s'il a été invalidé."""
+        if noeud.meilleurs is None:
+            candidats = [entree for enfant in noeud.enfants.values() for entree in self._meilleurs(enfant)]
+            if noeud.compte:
+                candidats.append((-noeud.compte, noeud.cle, noeud.terme))
+            noeud.meilleurs = heapq.nsmallest(self.taille_cache, candidats)
+        return noeud.meilleurs
+
+    def complete(self, prefixe: str, n: int = TAILLE_SUGGESTIONS) -> List[Tuple[str, int]]:
+        """
+        Les n termes les plus populaires commençant par le préfixe (normalisé).
+
+        Returns:
+            Liste de (terme, popularité), par popularité décroissante puis ordre alphabétique
+        """
+        noeud = self._noeud_prefixe(normaliser(prefixe))
+        if noeud is None or n <= 0:
+            return []
+        if n <= self.taille_cache:
+            entrees = self._meilleurs(noeud)[:n]
+        else:
+            entrees = heapq.nsmallest(n, self._termes(noeud))
+        return [(terme, -compte) for compte, _, terme in entrees]
+
+    def _termes(self, noeud: _Noeud) -> Iterable[Tuple[int, str, str]]:
+        pile = [noeud]
+        while pile:
+            noeud = pile.pop()
+            if noeud.compte:
+                yield (-noeud.compte, noeud.cle, noeud.terme)
+            pile.extend(noeud.enfants.values())
+
+    def popularity(self, terme: str) -> int:
+        """Popularité d'un terme (0 s'il est absent)."""
+        cle = normaliser(terme)
+        noeud = self._noeud_prefixe(cle)
+        return noeud.compte if noeud is not None and noeud.cle == cle else 0
+
+    def clear(self) -> None:
+        self.racine = _Noeud()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, terme: str) -> bool:
+        return self.popularity(terme) > 0
+
+
+def _prefixe_commun(a: str, b: str) -> int:
+    limite = min(len(a), len(b))
+    i = 0
+    while i < limite and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class Suggestion(NamedTuple):
+    texte: str
+    champ: str
+    popularite: int
+
+
+class IndexSuggestions:
+    """
+    Tries des titres, auteurs et mots-clés, maintenus document par document.
+    """
+
+    CHAMPS = ('titre', 'auteur', 'mot_cle')
+
+    def __init__(self, documents: Iterable = (), taille_cache: int = TAILLE_SUGGESTIONS):
+        self.tries = {champ: TriePrefixes(taille_cache) for champ in self.CHAMPS}
+        self.size = 0
+        self.generation = 0
+        for document in documents:
+            self.insert(document)
+
+    @staticmethod
+    def _termes(document) -> Iterable[Tuple[str, str]]:
+        yield 'titre', document.titre
+        yield 'auteur', document.auteur
+        vus = set()
+        for mot in document.mots_cles:
+            if normaliser(mot) not in vus:
+                vus.add(normaliser(mot))
+                yield 'mot_cle', mot
+
+    def insert(self, document) -> None:
+        for champ, terme in self._termes(document):
+            self.tries[champ].insert(terme)
+        self.size += 1
+        self.generation += 1
+
+    def delete(self, document) -> bool:
+        """Retire les termes du document ; False si son titre n'était pas indexé."""
+        if normaliser(document.titre) and not self.tries['titre'].popularity(document.titre):
+            return False
+        for champ, terme in self._termes(document):
+            self.tries[champ].delete(terme)
+        self.size -= 1
+        self.generation += 1
+        return True
+
+    def clear(self) -> None:
+        for trie in self.tries.values():
+            trie.clear()
+        self.size = 0
+        self.generation += 1
+
+    def suggest(self, prefixe: str, champ: Optional[str] = None,
+                n: int = TAILLE_SUGGESTIONS) -> List[Suggestion]:
+        """
+        Complétions du préfixe, les plus populaires d'abord.
+
+        Args:
+            prefixe: Début saisi par l'utilisateur
+            champ: 'titre', 'auteur', 'mot_cle' ou None pour les trois
+            n: Nombre maximal de suggestions
+        """
+        if champ is not None and champ not in self.tries:
+            raise ValueError(f"Champ '{champ}' inconnu (disponibles : {', '.join(self.CHAMPS)})")
+        champs = (champ,) if champ else self.CHAMPS
+        suggestions = [Suggestion(terme, nom, popularite)
+                       for nom in champs
+                       for terme, popularite in self.tries[nom].complete(prefixe, n)]
+        suggestions.sort(key=lambda s: (-s.popularite, normaliser(s.texte)))
+        return suggestions[:n]
+
+    def __len__(self) -> int:
+        return self.size
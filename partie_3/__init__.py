@@ -1,60 +1,26 @@
 
-from .hashing import (
-    Bucket,
-    HashTable,
-    comparer_recherche_hachage
-)
+# Exports différés (PEP 562, voir partie_1/exports_differes.py)
+try:
+    from ..partie_1.exports_differes import exports_differes
+except ImportError:
+    from partie_1.exports_differes import exports_differes
 
-from .hash_manager import HashTableManager
+_SOUS_MODULES = {
+    'hashing': ('Bucket', 'HashTable', 'comparer_recherche_hachage'),
+    'hash_manager': ('HashTableManager',),
+    'index_inverse': ('IndexMotsCles',),
+    'planificateur': ('Predicat', 'Plan', 'PlanificateurRequetes'),
+    'search_algorithms_hash': (
+        'HashSearchAlgorithm', 'SearchByAuthorHash', 'SearchByTitleHash', 'SearchByKeywordsHash',
+        'SearchAdvancedHash', 'SearchMultipleCriteriaHash', 'comparer_recherche_hash_vs_liste',
+        'analyser_distribution_hash'
+    ),
+    'compat': (
+        'rechercher_par_auteur_hash', 'rechercher_par_titre_hash', 'rechercher_par_mots_cles_hash',
+        'recherche_avancee_hash', 'ajouter_document_hash', 'afficher_hash_table',
+        'afficher_distribution_hash', 'obtenir_tous_documents_hash', 'get_statistiques_hash',
+        'charger_depuis_bst_hash'
+    ),
+}
 
-from .search_algorithms_hash import (
-    HashSearchAlgorithm,
-    SearchByAuthorHash,
-    SearchByTitleHash,
-    SearchByKeywordsHash,
-    SearchAdvancedHash,
-    SearchMultipleCriteriaHash,
-    comparer_recherche_hash_vs_liste,
-    analyser_distribution_hash
-)
-
-from .compat import (
-    rechercher_par_auteur_hash,
-    rechercher_par_titre_hash,
-    rechercher_par_mots_cles_hash,
-    recherche_avancee_hash,
-    ajouter_document_hash,
-    afficher_hash_table,
-    afficher_distribution_hash,
-    obtenir_tous_documents_hash,
-    get_statistiques_hash,
-    charger_depuis_bst_hash
-)
-
-__all__ = [
-    'Bucket',
-    'HashTable',
-    'HashTableManager',
-    
-    'HashSearchAlgorithm',
-    'SearchByAuthorHash',
-    'SearchByTitleHash',
-    'SearchByKeywordsHash',
-    'SearchAdvancedHash',
-    'SearchMultipleCriteriaHash',
-    
-    'comparer_recherche_hachage',
-    'comparer_recherche_hash_vs_liste',
-    'analyser_distribution_hash',
-    
-    'rechercher_par_auteur_hash',
-    'rechercher_par_titre_hash',
-    'rechercher_par_mots_cles_hash',
-    'recherche_avancee_hash',
-    'ajouter_document_hash',
-    'afficher_hash_table',
-    'afficher_distribution_hash',
-    'obtenir_tous_documents_hash',
-    'get_statistiques_hash',
-    'charger_depuis_bst_hash',
-]
+__all__, __getattr__, __dir__ = exports_differes(__name__, _SOUS_MODULES, globals())
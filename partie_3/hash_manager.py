@@ -5,8 +5,12 @@ import time
 
 try:
     from ..partie_1.document import Document
+    from ..partie_1.cache import CacheResultats
+    from ..partie_1.metriques import mesure
 except ImportError:
     from partie_1.document import Document
+    from partie_1.cache import CacheResultats
+    from partie_1.metriques import mesure
 
 
 class HashTableManager:
@@ -15,15 +19,29 @@ class HashTableManager:
     Simplifie l'utilisation de la HashTable et fournit une interface cohérente.
     """
     
-    def __init__(self, size: int = 50, hash_table: Optional[HashTable] = None):
+    def __init__(self, size: int = 50, hash_table: Optional[HashTable] = None,
+                 cache: Optional[CacheResultats] = None, moteur=None):
         """
         Initialise le gestionnaire avec une HashTable existante ou en crée une nouvelle.
         
         Args:
             size: La taille de la table de hachage
             hash_table: Une HashTable existante (optionnel)
+            cache: Cache des résultats de recherche (par défaut, un cache dédié)
+            moteur: MoteurStockage dont la table est un index ; les modifications passent alors par lui
         """
         self.hash_table = hash_table if hash_table is not None else HashTable(size)
+        self.moteur = moteur
+        self.cache = cache if cache is not None else CacheResultats()
+    
+    def _rechercher(self, algorithme: str, terme: str, recherche):
+        """Sert la recherche depuis le cache tant que la table n'a pas été modifiée."""
+        return self.cache.obtenir_ou_calculer('hachage', algorithme, terme, self.hash_table.generation,
+                                              lambda: recherche(terme))
+    
+    def statistiques_cache(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache de recherche (succès, échecs, taux...)."""
+        return self.cache.statistiques()
     
     
     def ajouter_document(self, titre: str, auteur: str, mots_cles: str) -> bool:
@@ -40,12 +58,16 @@ class HashTableManager:
         """
         try:
             document = Document(titre, auteur, mots_cles)
-            self.hash_table.insert(document)
+            if self.moteur is not None:
+                self.moteur.ajouter(document)
+            else:
+                self.hash_table.insert(document)
             return True
         except Exception as e:
             print(f"❌ Erreur lors de l'ajout : {e}")
             return False
     
+    @mesure('hachage.rechercher_par_auteur')
     def rechercher_par_auteur(self, auteur: str) -> List[Document]:
         """
         Recherche tous les documents d'un auteur.
@@ -57,8 +79,9 @@ class HashTableManager:
         Returns:
             Liste des documents trouvés
         """
-        return self.hash_table.search_by_author(auteur)
+        return self._rechercher('auteur', auteur, self.hash_table.search_by_author)
     
+    @mesure('hachage.rechercher_par_titre')
     def rechercher_par_titre(self, titre: str) -> List[Document]:
         """
         Recherche des documents par titre.
@@ -70,8 +93,9 @@ class HashTableManager:
         Returns:
             Liste des documents trouvés
         """
-        return self.hash_table.search_by_title(titre)
+        return self._rechercher('titre', titre, self.hash_table.search_by_title)
     
+    @mesure('hachage.rechercher_par_mots_cles')
     def rechercher_par_mots_cles(self, mot_cle: str) -> List[Document]:
         """
         Recherche tous les documents contenant un mot-clé.
@@ -82,8 +106,9 @@ class HashTableManager:
         Returns:
             Liste des documents trouvés
         """
-        return self.hash_table.search_by_keywords(mot_cle)
+        return self._rechercher('mots_cles', mot_cle, self.hash_table.search_by_keywords)
     
+    @mesure('hachage.rechercher_avancee')
     def rechercher_avancee(self, terme: str) -> List[Document]:
         """
         Recherche avancée dans tous les champs.
@@ -94,7 +119,7 @@ class HashTableManager:
         Returns:
             Liste des documents trouvés
         """
-        return self.hash_table.search_advanced(terme)
+        return self._rechercher('avancee', terme, self.hash_table.search_advanced)
     
     
     def obtenir_tous_documents(self) -> List[Document]:
@@ -188,8 +213,10 @@ class HashTableManager:
     
     def vider(self) -> None:
         """Vide complètement la table de hachage."""
-        for bucket in self.hash_table.table:
-            bucket.items.clear()
+        if self.moteur is not None:
+            self.moteur.vider()
+        else:
+            self.hash_table.clear()
     
     def est_vide(self) -> bool:
         """
@@ -220,7 +247,12 @@ class HashTableManager:
             Le nombre de documents chargés
         """
         try:
-            self.hash_table.populate_from_bst(bst)
+            if self.moteur is not None:
+                for document in bst.in_order_traversal():
+                    if document not in self.moteur:
+                        self.moteur.ajouter(document)
+            else:
+                self.hash_table.populate_from_bst(bst)
             return self.taille()
         except Exception as e:
             print(f"❌ Erreur lors du chargement : {e}")
@@ -1,5 +1,4 @@
 
-import time
 import random
 from copy import deepcopy
 
@@ -15,6 +14,14 @@ except ImportError:
             return f"Titre: '{self.titre}' | Auteur: {self.auteur}"
 
 
+try:
+    from ..partie_1.identifiants import cle_document
+    from ..partie_1.concurrence import VerrouLectureEcriture, en_ecriture, en_lecture
+except ImportError:
+    from partie_1.identifiants import cle_document
+    from partie_1.concurrence import VerrouLectureEcriture, en_ecriture, en_lecture
+
+
 class Bucket:
     """Représente un seau (bucket) dans la table de hachage (gestion par chaînage)."""
     def __init__(self):
@@ -25,18 +32,66 @@ class HashTable:
     def __init__(self, size=10):
         self.size = size
         self.table = [Bucket() for _ in range(self.size)]
+        self.compteurs = None  # Counter renseigné par partie_1.profilage pendant un profilage
+        self.generation = 0  # Incrémentée à chaque modification (invalidation du cache de recherche)
+        self.verrou = VerrouLectureEcriture()  # Recherches en parallèle, une seule modification à la fois
 
     def _hash(self, key):
         """Fonction de hachage simple (modulo)."""
         return hash(key) % self.size
 
+    def _sonder(self, bucket):
+        """Comptabilise l'examen d'un bucket lorsqu'un profilage est actif."""
+        if self.compteurs is not None:
+            self.compteurs['sondages_buckets'] += 1
+            self.compteurs['documents_examines'] += len(bucket.items)
+        return bucket.items
+
+    @en_ecriture
     def insert(self, document):
         """Insère un document en utilisant l'auteur comme clé."""
         key = document.auteur.lower()
         hash_index = self._hash(key)
         bucket = self.table[hash_index]
         bucket.items.append(document)
+        self.generation += 1
+
+    @en_ecriture
+    def delete(self, titre):
+        """
+        Supprime tous les documents portant exactement ce titre (insensible à la casse).
+        Complexité: O(n) car la table est indexée par auteur.
+        """
+        titre_cle = titre.lower()
+        supprimes = 0
+        for bucket in self.table:
+            restants = [doc for doc in bucket.items if doc.titre.lower() != titre_cle]
+            supprimes += len(bucket.items) - len(restants)
+            bucket.items[:] = restants
+        if supprimes:
+            self.generation += 1
+        return supprimes > 0
+
+    @en_ecriture
+    def delete_document(self, document):
+        """Supprime ce document précis (comparé par identifiant) de son bucket. Complexité: O(1) en moyenne."""
+        bucket = self.get_bucket(document.auteur)
+        cle = cle_document(document)
+        for i, doc in enumerate(bucket.items):
+            if cle_document(doc) == cle:
+                bucket.items.pop(i)
+                self.generation += 1
+                return True
+        return False
+
+    @en_ecriture
+    def clear(self):
+        """Vide tous les buckets (la taille de la table est conservée)."""
+        for bucket in self.table:
+            bucket.items.clear()
+        self.generation += 1
 
+    @en_lecture
     def search_by_author(self, author_name):
         """
         Recherche tous les documents d'un auteur.
@@ -47,18 +102,32 @@ class HashTable:
         bucket = self.table[hash_index]
         
         resultats = []
-        for doc in bucket.items:
+        for doc in self._sonder(bucket):
             if key in doc.auteur.lower():
                 resultats.append(doc)
         
         if not resultats:
             for bucket in self.table:
-                for doc in bucket.items:
+                for doc in self._sonder(bucket):
                     if key in doc.auteur.lower():
                         resultats.append(doc)
                 
         return resultats
 
+    def get_bucket(self, author_name):
+        """Retourne le bucket associé à un auteur (sa taille majore le nombre de ses documents)."""
+        return self.table[self._hash(author_name.lower())]
+
+    @en_lecture
+    def search_by_author_exact(self, author_name):
+        """
+        Recherche les documents dont l'auteur est exactement celui donné (insensible à la casse).
+        Complexité: O(1) en moyenne, sans repli sur un parcours complet.
+        """
+        key = author_name.lower()
+        return [doc for doc in self._sonder(self.get_bucket(key)) if doc.auteur.lower() == key]
+
+    @en_lecture
     def search_by_title(self, titre):
         """
         Recherche tous les documents par titre.
@@ -66,11 +135,12 @@ class HashTable:
         """
         resultats = []
         for bucket in self.table:
-            for doc in bucket.items:
+            for doc in self._sonder(bucket):
                 if titre.lower() in doc.titre.lower():
                     resultats.append(doc)
         return resultats
 
+    @en_lecture
     def search_by_keywords(self, mot_cle):
         """
         Recherche tous les documents par mots-clés.
@@ -78,13 +148,14 @@ class HashTable:
         """
         resultats = []
         for bucket in self.table:
-            for doc in bucket.items:
+            for doc in self._sonder(bucket):
                 for mot in doc.mots_cles:
                     if mot_cle.lower() in mot.lower():
                         resultats.append(doc)
                         break
         return resultats
 
+    @en_lecture
     def search_advanced(self, terme):
         """
         Recherche avancée dans tous les champs (titre, auteur, mots-clés).
@@ -92,7 +163,7 @@ class HashTable:
         """
         resultats = []
         for bucket in self.table:
-            for doc in bucket.items:
+            for doc in self._sonder(bucket):
                 if terme.lower() in doc.titre.lower():
                     resultats.append(doc)
                 elif terme.lower() in doc.auteur.lower():
@@ -104,6 +175,7 @@ class HashTable:
                             break
         return resultats
         
+    @en_ecriture
     def populate_from_bst(self, bst):
         """Remplit la table de hachage à partir du BST (ou de la liste)."""
         if not bst.root:
@@ -116,8 +188,14 @@ class HashTable:
 
 def comparer_recherche_hachage(Document_Classe, list_size=10000, table_size=1000):
     """
-    Compare le temps de recherche séquentielle (O(n)) vs. Hachage (O(1)).
+    Compare le temps de recherche séquentielle (O(n)) vs. Hachage (O(1)),
+    mesuré par le banc d'essai commun (partie_1.benchmark_recherche) sur 100 auteurs.
     """
+    try:
+        from ..partie_1.benchmark_recherche import executer_benchmark_recherche
+    except ImportError:
+        from partie_1.benchmark_recherche import executer_benchmark_recherche
+
     print("\n" + "="*70)
     print("      COMPARAISON DES PERFORMANCES DE RECHERCHE O(n) vs O(1)")
     print(f"      Taille de l'échantillon : {list_size} documents")
@@ -126,24 +204,14 @@ def comparer_recherche_hachage(Document_Classe, list_size=10000, table_size=1000
     auteurs_uniques = [f"Auteur {i}" for i in range(100)]
     donnees = [Document_Classe(f"Titre-{i}", random.choice(auteurs_uniques), "") for i in range(list_size)]
     
-    bibliotheque_list = donnees
     ht = HashTable(size=table_size)
     for doc in donnees:
         ht.insert(doc)
 
-    auteurs_a_chercher = random.sample(auteurs_uniques, 10)
-    
-    start_time_seq = time.time()
-    for auteur in auteurs_a_chercher:
-        [doc for doc in donnees if doc.auteur.lower() == auteur.lower()]
-    end_time_seq = time.time()
-    temps_sequentiel = (end_time_seq - start_time_seq) / len(auteurs_a_chercher)
-    
-    start_time_hash = time.time()
-    for auteur in auteurs_a_chercher:
-        ht.search_by_author(auteur)
-    end_time_hash = time.time()
-    temps_hash = (end_time_hash - start_time_hash) / len(auteurs_a_chercher)
+    rapport = executer_benchmark_recherche(donnees, nombre_requetes=100, types=('auteur_zipf',),
+                                           hash_table=ht, structures=('liste', 'hachage'))
+    temps_sequentiel = rapport['resultats']['liste']['auteur_zipf']['moyenne']
+    temps_hash = rapport['resultats']['hachage']['auteur_zipf']['moyenne']
     
     print(f"| {'Algorithme':<30} | {'Complexité (Moyenne)':<25} | {'Temps Moyen par Recherche (s)':<15} |")
     print("-" * 70)
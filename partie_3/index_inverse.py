@@ -0,0 +1,116 @@
+
+from array import array
+from typing import Dict, Iterable, List
+
+try:
+    from ..partie_1.identifiants import cle_document, inserer_trie, retirer_trie, union_triee
+except ImportError:
+    from partie_1.identifiants import cle_document, inserer_trie, retirer_trie, union_triee
+
+
+class IndexMotsCles:
+    """
+    Index inversé des mots-clés : chaque mot-clé (en minuscules) est associé
+    au tableau trié des identifiants des documents qui le portent.
+
+    La recherche exacte d'un mot-clé coûte O(1) + O(k). La recherche par
+    sous-chaîne parcourt le vocabulaire (V mots distincts, bien moins que n
+    documents) et fusionne les tableaux des mots correspondants. Les méthodes
+    `ids` et `ids_contains` renvoient les identifiants sans résoudre les
+    documents, pour les intersections et unions du planificateur.
+    """
+
+    def __init__(self, documents: Iterable = ()):
+        self.postings: Dict[str, array] = {}
+        self.documents: Dict[int, object] = {}  # identifiant -> document
+        self.generation = 0  # Incrémentée à chaque modification (invalidation du cache de recherche)
+        for document in documents:
+            self.insert(document)
+
+    @property
+    def size(self) -> int:
+        return len(self.documents)
+
+    def insert(self, document) -> None:
+        """
+        Ajoute un document sous chacun de ses mots-clés (sans effet si ce même
+        document est déjà indexé).
+
+        Raises:
+            ValueError: Un autre document est déjà indexé sous le même identifiant
+        """
+        cle = cle_document(document)
+        existant = self.documents.get(cle)
+        if existant is document:
+            return
+        if existant is not None:
+            raise ValueError(f"L'identifiant {cle} de '{document.titre}' est déjà attribué "
+                             f"à '{existant.titre}'")
+        self.documents[cle] = document
+        for mot in set(mot.lower() for mot in document.mots_cles):
+            if mot not in self.postings:
+                self.postings[mot] = array('q')
+            inserer_trie(self.postings[mot], cle)
+        self.generation += 1
+
+    def delete(self, document) -> bool:
+        """
+        Retire un document (comparé par identifiant) de tous ses tableaux.
+
+        Returns:
+            True si le document était indexé
+        """
+        cle = cle_document(document)
+        document = self.documents.pop(cle, None)
+        if document is None:
+            return False
+        for mot in set(mot.lower() for mot in document.mots_cles):
+            identifiants = self.postings.get(mot)
+            if identifiants is not None and retirer_trie(identifiants, cle) and not identifiants:
+                del self.postings[mot]
+        self.generation += 1
+        return True
+
+    def clear(self) -> None:
+        """Vide l'index."""
+        self.postings.clear()
+        self.documents.clear()
+        self.generation += 1
+
+    def ids(self, mot_cle: str) -> array:
+        """Identifiants triés des documents portant exactement ce mot-clé."""
+        return array('q', self.postings.get(mot_cle.lower(), ()))
+
+    def ids_contains(self, terme: str) -> array:
+        """Identifiants triés, sans doublon, des documents dont un mot-clé contient le terme."""
+        terme = terme.lower()
+        tableaux = [identifiants for mot, identifiants in self.postings.items() if terme in mot]
+        return union_triee(*tableaux) if tableaux else array('q')
+
+    def resolve(self, identifiants: Iterable[int]) -> List:
+        """Documents correspondant aux identifiants, dans le même ordre."""
+        return [self.documents[cle] for cle in identifiants]
+
+    def search(self, mot_cle: str) -> List:
+        """Documents portant exactement ce mot-clé (insensible à la casse)."""
+        return self.resolve(self.postings.get(mot_cle.lower(), ()))
+
+    def search_contains(self, terme: str) -> List:
+        """Documents dont un mot-clé contient le terme, chacun une seule fois."""
+        return self.resolve(self.ids_contains(terme))
+
+    def cardinality(self, mot_cle: str) -> int:
+        """Nombre exact de documents portant ce mot-clé, sans les parcourir."""
+        return len(self.postings.get(mot_cle.lower(), ()))
+
+    def cardinality_contains(self, terme: str) -> int:
+        """Majorant du nombre de documents dont un mot-clé contient le terme."""
+        terme = terme.lower()
+        return sum(len(identifiants) for mot, identifiants in self.postings.items() if terme in mot)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, mot_cle: str) -> bool:
+        return mot_cle.lower() in self.postings
+
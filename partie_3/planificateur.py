@@ -0,0 +1,319 @@
+
+from typing import Callable, Iterable, List, Optional
+
+from .hashing import HashTable
+from .index_inverse import IndexMotsCles
+
+try:
+    from ..partie_1.identifiants import cle_document, contient_trie, intersection_triee
+except ImportError:
+    from partie_1.identifiants import cle_document, contient_trie, intersection_triee
+
+
+SEUIL_VERIFICATION = 32
+
+
+class Predicat:
+    """
+    Condition sur un champ d'un document, insensible à la casse.
+
+    Args:
+        champ: 'titre', 'auteur' ou 'mot_cle'
+        valeur: Valeur recherchée
+        operateur: 'egal' (valeur exacte) ou 'contient' (sous-chaîne)
+    """
+
+    CHAMPS = ('titre', 'auteur', 'mot_cle')
+    OPERATEURS = ('egal', 'contient')
+
+    def __init__(self, champ: str, valeur: str, operateur: str = 'egal'):
+        if champ not in self.CHAMPS:
+            raise ValueError(f"Champ '{champ}' inconnu (disponibles : {', '.join(self.CHAMPS)})")
+        if operateur not in self.OPERATEURS:
+            raise ValueError(f"Opérateur '{operateur}' inconnu (disponibles : {', '.join(self.OPERATEURS)})")
+        self.champ = champ
+        self.valeur = valeur.lower()
+        self.operateur = operateur
+
+    def verifier(self, document) -> bool:
+        """Indique si le document satisfait la condition."""
+        if self.champ == 'mot_cle':
+            textes = document.mots_cles
+        else:
+            textes = (document.titre if self.champ == 'titre' else document.auteur,)
+        if self.operateur == 'egal':
+            return any(texte.lower() == self.valeur for texte in textes)
+        return any(self.valeur in texte.lower() for texte in textes)
+
+    def __str__(self) -> str:
+        symbole = '=' if self.operateur == 'egal' else '~'
+        return f"{self.champ} {symbole} '{self.valeur}'"
+
+
+class EtapePlan:
+    """
+    Accès par index : fournit les candidats satisfaisant un prédicat.
+
+    `identifiants`, s'il est fourni, renvoie le tableau trié des identifiants
+    des candidats sans résoudre les documents (index inversé).
+    """
+
+    def __init__(self, predicat: Predicat, acces: str, estimation: int, executer: Callable[[], List],
+                 identifiants: Optional[Callable] = None):
+        self.predicat = predicat
+        self.acces = acces
+        self.estimation = estimation
+        self.executer = executer
+        self.identifiants = identifiants
+        self.reel = None
+
+
+class Plan:
+    """
+    Plan d'exécution d'une recherche multi-critères.
+
+    Attributes:
+        acces: Étapes par index, la première fournit les candidats, les
+            suivantes les intersectent (par ordre d'estimation croissante)
+        verifications: Prédicats vérifiés un à un sur les candidats restants
+        balayage: Description du parcours complet si aucun index n'est utilisable
+        taille: Nombre de documents de la collection
+    """
+
+    def __init__(self, acces: List[EtapePlan], verifications: List[Predicat],
+                 balayage: Optional[str], taille: int):
+        self.acces = acces
+        self.verifications = verifications
+        self.balayage = balayage
+        self.taille = taille
+        self.resultats_reels = None
+
+    @property
+    def estimation(self) -> int:
+        """Majorant estimé du nombre de résultats."""
+        return min((etape.estimation for etape in self.acces), default=self.taille)
+
+    def explain(self) -> str:
+        """
+        Retourne le plan choisi avec les cardinalités estimées (et réelles
+        une fois le plan exécuté).
+        """
+        def reel(valeur):
+            return f"  réel {valeur}" if valeur is not None else ""
+
+        def ligne(numero, description, cardinalite):
+            return f"  {numero}. {description:<52}  {cardinalite}"
+
+        lignes = [f"Plan d'exécution (n = {self.taille} documents)"]
+        numero = 1
+        if self.balayage:
+            lignes.append(ligne(numero, f"Balayage complet ({self.balayage})", f"estimé {self.taille}"))
+            numero += 1
+        for i, etape in enumerate(self.acces):
+            action = "Accès" if i == 0 else "Intersection"
+            lignes.append(ligne(numero, f"{action} {etape.acces} : {etape.predicat}",
+                                f"estimé {etape.estimation}{reel(etape.reel)}"))
+            numero += 1
+        for predicat in self.verifications:
+            lignes.append(ligne(numero, f"Vérification : {predicat}", f"sur ≤ {self.estimation} candidat(s)"))
+            numero += 1
+        lignes.append(f"Résultats estimés : ≤ {self.estimation}{reel(self.resultats_reels)}")
+        return "\n".join(lignes)
+
+
+class PlanificateurRequetes:
+    """
+    Planificateur des recherches multi-critères (conjonction de prédicats).
+
+    Les prédicats exacts sont résolus par l'index le plus sélectif disponible
+    (titre exact par le BST, auteur exact par le bucket de la table de hachage,
+    mot-clé par l'index inversé) ; les autres accès indexés intersectent les
+    candidats lorsque c'est moins coûteux que de les vérifier, et les prédicats
+    restants ne sont vérifiés que sur les survivants.
+
+    Les structures doivent contenir les mêmes documents : les intersections
+    portent sur leurs identifiants (tableaux triés d'entiers).
+
+    Args:
+        documents: Collection complète, utilisée pour un balayage (optionnel)
+        bst: BinarySearchTree indexé par titre (optionnel)
+        hash_table: HashTable indexée par auteur (optionnel)
+        index_mots_cles: IndexMotsCles (construit à partir des documents s'il est absent)
+        seuil_verification: En dessous de ce nombre de candidats, aucune intersection n'est tentée
+    """
+
+    def __init__(self, documents: Optional[Iterable] = None, bst=None,
+                 hash_table: Optional[HashTable] = None,
+                 index_mots_cles: Optional[IndexMotsCles] = None,
+                 seuil_verification: int = SEUIL_VERIFICATION):
+        self.documents = documents
+        self.bst = bst
+        self.hash_table = hash_table
+        if index_mots_cles is None:
+            index_mots_cles = IndexMotsCles(self._tous_documents())
+        self.index_mots_cles = index_mots_cles
+        self.seuil_verification = seuil_verification
+
+    def _tous_documents(self) -> List:
+        if self.documents is not None:
+            return list(self.documents)
+        if self.bst is not None:
+            return self.bst.in_order_traversal()
+        if self.hash_table is not None:
+            return [doc for bucket in self.hash_table.table for doc in bucket.items]
+        return []
+
+    def _source_balayage(self) -> str:
+        if self.documents is not None:
+            return "liste"
+        if self.bst is not None:
+            return "parcours in-order du BST"
+        return "buckets de la table de hachage"
+
+    def _taille(self) -> int:
+        if self.documents is not None:
+            return len(self.documents)
+        if self.bst is not None:
+            return self.bst.size
+        if self.hash_table is not None:
+            return sum(len(bucket.items) for bucket in self.hash_table.table)
+        return len(self.index_mots_cles)
+
+    def _acces_index(self, predicat: Predicat) -> Optional[EtapePlan]:
+        """Chemin d'accès indexé pour un prédicat, ou None s'il faut le vérifier."""
+        valeur = predicat.valeur
+        if predicat.champ == 'titre' and predicat.operateur == 'egal' and self.bst is not None:
+            # Les titres sont quasi uniques : la descente coûte O(h)
+            return EtapePlan(predicat, "index BST", 1, lambda: self.bst.search_all(valeur))
+        if predicat.champ == 'auteur' and predicat.operateur == 'egal' and self.hash_table is not None:
+            # La taille du bucket majore le nombre de documents de l'auteur
+            estimation = len(self.hash_table.get_bucket(valeur).items)
+            return EtapePlan(predicat, "bucket de hachage", estimation,
+                             lambda: self.hash_table.search_by_author_exact(valeur))
+        if predicat.champ == 'mot_cle':
+            index = self.index_mots_cles
+            if predicat.operateur == 'egal':
+                return EtapePlan(predicat, "index inversé", index.cardinality(valeur),
+                                 lambda: index.search(valeur), lambda: index.ids(valeur))
+            return EtapePlan(predicat, "vocabulaire de l'index inversé", index.cardinality_contains(valeur),
+                             lambda: index.search_contains(valeur), lambda: index.ids_contains(valeur))
+        return None
+
+    def _cout_verification(self, predicat: Predicat, candidats: int) -> float:
+        """Nombre de comparaisons pour vérifier un prédicat sur les candidats."""
+        if predicat.champ != 'mot_cle':
+            return candidats
+        index = self.index_mots_cles
+        mots_par_document = sum(len(docs) for docs in index.postings.values()) / len(index) if len(index) else 1
+        return candidats * max(1.0, mots_par_document)
+
+    def planifier(self, predicats: List[Predicat]) -> Plan:
+        """
+        Choisit l'ordre d'évaluation des prédicats.
+
+        Args:
+            predicats: Conditions à satisfaire toutes
+
+        Returns:
+            Le plan (voir Plan.explain)
+        """
+        acces = []
+        verifications = []
+        for predicat in predicats:
+            etape = self._acces_index(predicat)
+            if etape is None:
+                verifications.append(predicat)
+            else:
+                acces.append(etape)
+        acces.sort(key=lambda etape: etape.estimation)
+
+        if not acces:
+            return Plan([], verifications, self._source_balayage(), self._taille())
+
+        retenues = [acces[0]]
+        verifications_indexables = []
+        candidats = acces[0].estimation
+        for etape in acces[1:]:
+            # Intersecter coûte la lecture de l'index plus un test par candidat
+            if (candidats > self.seuil_verification
+                    and etape.estimation + candidats < self._cout_verification(etape.predicat, candidats)):
+                retenues.append(etape)
+            else:
+                verifications_indexables.append(etape.predicat)
+
+        return Plan(retenues, verifications_indexables + verifications, None, self._taille())
+
+    def executer(self, plan: Plan) -> List:
+        """
+        Exécute un plan et renseigne les cardinalités réelles de chaque étape.
+
+        Returns:
+            Les documents satisfaisant tous les prédicats
+        """
+        if plan.acces:
+            candidats = self._executer_acces(plan.acces)
+        else:
+            candidats = self._tous_documents()
+
+        resultats = [doc for doc in candidats
+                     if all(predicat.verifier(doc) for predicat in plan.verifications)]
+        plan.resultats_reels = len(resultats)
+        return resultats
+
+    def _executer_acces(self, acces: List[EtapePlan]) -> List:
+        """
+        Enchaîne les accès par index. Tant que les étapes fournissent des
+        identifiants, les candidats restent un tableau trié intersecté par
+        dichotomie ; les documents ne sont résolus qu'ensuite.
+        """
+        identifiants = None
+        candidats = None
+        for etape in acces:
+            if candidats is None and etape.identifiants is not None:
+                cles = etape.identifiants()
+                identifiants = cles if identifiants is None else intersection_triee(identifiants, cles)
+                etape.reel = len(identifiants)
+                continue
+            if candidats is None:
+                if identifiants is None:
+                    candidats = etape.executer()
+                    etape.reel = len(candidats)
+                    continue
+                candidats = self.index_mots_cles.resolve(identifiants)
+            if etape.identifiants is not None:
+                cles = etape.identifiants()
+                candidats = [doc for doc in candidats if contient_trie(cles, cle_document(doc))]
+            else:
+                cles = {cle_document(doc) for doc in etape.executer()}
+                candidats = [doc for doc in candidats if cle_document(doc) in cles]
+            etape.reel = len(candidats)
+        if candidats is None:
+            candidats = self.index_mots_cles.resolve(identifiants)
+        return candidats
+
+    def rechercher(self, titre: str = "", auteur: str = "", mot_cle: str = "",
+                   exact: bool = True) -> List:
+        """
+        Recherche les documents satisfaisant tous les critères renseignés.
+
+        Args:
+            titre: Titre (optionnel)
+            auteur: Auteur (optionnel)
+            mot_cle: Mot-clé (optionnel)
+            exact: Valeurs exactes (indexables) ou sous-chaînes, comme SearchMultipleCriteriaBST
+
+        Returns:
+            Liste des documents trouvés
+        """
+        return self.executer(self.planifier(self.predicats(titre, auteur, mot_cle, exact)))
+
+    def explain(self, titre: str = "", auteur: str = "", mot_cle: str = "", exact: bool = True) -> str:
+        """Retourne le plan qui serait choisi pour ces critères, sans l'exécuter."""
+        return self.planifier(self.predicats(titre, auteur, mot_cle, exact)).explain()
+
+    @staticmethod
+    def predicats(titre: str = "", auteur: str = "", mot_cle: str = "", exact: bool = True) -> List[Predicat]:
+        """Convertit des critères nommés en prédicats (les critères vides sont ignorés)."""
+        operateur = 'egal' if exact else 'contient'
+        criteres = (('titre', titre), ('auteur', auteur), ('mot_cle', mot_cle))
+        return [Predicat(champ, valeur, operateur) for champ, valeur in criteres if valeur]
@@ -1,11 +1,13 @@
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List
 
 try:
     from ..partie_1.document import Document
+    from ..partie_1.profilage import profiler_structure
 except ImportError:
     from partie_1.document import Document
+    from partie_1.profilage import profiler_structure
 
 
 class HashSearchAlgorithm(ABC):
@@ -34,6 +36,22 @@ class HashSearchAlgorithm(ABC):
     def get_complexity(self) -> str:
         """Retourne la complexité de l'algorithme."""
         return self.complexity
+    
+    def profile(self, hash_table, terme: str, cprofile: bool = False, memoire: bool = False) -> Dict[str, Any]:
+        """
+        Recherche en comptant les buckets sondés, avec cProfile/tracemalloc à la demande.
+        
+        Args:
+            hash_table: La table de hachage
+            terme: Le terme à rechercher
+            cprofile: Attache une session cProfile
+            memoire: Mesure le pic mémoire et les blocs alloués avec tracemalloc
+            
+        Returns:
+            Rapport de profilage (voir partie_1.profilage)
+        """
+        return profiler_structure(hash_table, self.search, terme, cprofile, memoire,
+                                  algorithme=self.__class__.__name__, complexite=self.complexity)
 
 
 class SearchByAuthorHash(HashSearchAlgorithm):
@@ -171,17 +189,21 @@ class SearchMultipleCriteriaHash(HashSearchAlgorithm):
 
 def comparer_recherche_hash_vs_liste(Document_Classe, tailles: List[int] = None):
     """
-    Compare les performances de recherche entre HashTable et liste.
+    Compare les performances de recherche entre HashTable et liste, par le banc
+    d'essai commun (partie_1.benchmark_recherche) : 100 requêtes par taille.
     
     Args:
         Document_Classe: La classe Document
         tailles: Liste des tailles à tester
         
     Returns:
-        Dictionnaire avec les résultats de comparaison
+        Liste de dictionnaires (taille, temps moyens par recherche, gain)
     """
-    import time
     import random
+    try:
+        from ..partie_1.benchmark_recherche import executer_benchmark_recherche
+    except ImportError:
+        from partie_1.benchmark_recherche import executer_benchmark_recherche
     
     if tailles is None:
         tailles = [100, 500, 1000, 5000, 10000]
@@ -193,26 +215,14 @@ def comparer_recherche_hash_vs_liste(Document_Classe, tailles: List[int] = None)
     print("=" * 80)
     
     for taille in tailles:
-        auteurs = [f"Auteur-{i:03d}" for i in range(min(100, taille // 10))]
+        auteurs = [f"Auteur-{i:03d}" for i in range(max(1, min(100, taille // 10)))]
         documents = [Document_Classe(f"Titre-{i}", random.choice(auteurs), "") 
                      for i in range(taille)]
-        
-        from .hashing import HashTable
-        ht = HashTable(size=max(50, taille // 20))
-        for doc in documents:
-            ht.insert(doc)
-        
-        auteurs_test = random.sample(auteurs, min(10, len(auteurs)))
-        
-        start = time.time()
-        for auteur in auteurs_test:
-            [doc for doc in documents if auteur.lower() in doc.auteur.lower()]
-        temps_liste = time.time() - start
-        
-        start = time.time()
-        for auteur in auteurs_test:
-            ht.search_by_author(auteur)
-        temps_hash = time.time() - start
+
+        rapport = executer_benchmark_recherche(documents, nombre_requetes=100, types=('auteur_zipf',),
+                                               structures=('liste', 'hachage'))
+        temps_liste = rapport['resultats']['liste']['auteur_zipf']['moyenne']
+        temps_hash = rapport['resultats']['hachage']['auteur_zipf']['moyenne']
         
         gain = temps_liste / temps_hash if temps_hash > 0 else 0
         
@@ -225,9 +235,9 @@ def comparer_recherche_hash_vs_liste(Document_Classe, tailles: List[int] = None)
         resultats.append(resultat)
         
         print(f"\nTaille: {taille} documents")
-        print(f"  Liste (O(n)):       {temps_liste:.6f}s")
-        print(f"  HashTable (O(1)):   {temps_hash:.6f}s")
-        print(f"  Gain:               {gain:.2f}x plus rapide")
+        print(f"  Liste (O(n)):     {temps_liste:.8f}s")
+        print(f"  HashTable (O(1)): {temps_hash:.8f}s")
+        print(f"  Gain:             {gain:.2f}x plus rapide")
     
     print("\n" + "=" * 80)
     return resultats
@@ -0,0 +1,353 @@
+"""
+Service HTTP/JSON local de recherche dans la bibliothèque (asyncio, bibliothèque standard)
+
+Routes :
+    GET    /search?q=...&mode=partout&limite=20   recherche (modes de cli.MODES_RECHERCHE)
+    POST   /documents                              ajout : {"titre", "auteur", "mots_cles"}
+    DELETE /documents/<id>                         suppression par identifiant
+    DELETE /documents?titre=...&tous=1             suppression par titre exact
+    GET    /stats?metriques=1                      statistiques de la collection
+
+Modèle de concurrence : un seul fil, une boucle asyncio.
+    - Les lectures s'exécutent directement dans la boucle, sans point de
+      suspension : chacune voit un état cohérent du moteur et elles ne
+      s'attendent jamais entre elles ni n'attendent les écritures.
+    - Les écritures passent par une file traitée par une unique tâche
+      d'écriture, dans l'ordre d'arrivée ; la sauvegarde du fichier est
+      regroupée (DELAI_SAUVEGARDE_S) et écrite dans un fil à partir d'une
+      copie de la liste des documents.
+
+Les connexions restent ouvertes (HTTP/1.1 keep-alive) et les requêtes
+pipelinées sont servies dans leur ordre d'arrivée.
+
+Usage :
+    python serveur_http.py --donnees bibliotheque_data_1000.json --port 8765
+    python charge_http.py --port 8765 --connexions 8 --profondeur 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+sys.path.append(os.path.dirname(__file__))
+
+from cli import ajouter, charger_moteur, informer, rechercher, statistiques, supprimer
+from partie_1.metriques import REGISTRE
+from partie_1.persistance import FICHIER_DONNEES, ecrire_documents
+
+
+HOTE_DEFAUT = '127.0.0.1'
+PORT_DEFAUT = 8765
+DELAI_INACTIVITE_S = 30        # Fermeture d'une connexion keep-alive inactive
+DELAI_SAUVEGARDE_S = 1.0       # Regroupement des sauvegardes après des écritures
+LOT_ECRITURES_MAX = 256        # Écritures appliquées d'affilée par la tâche d'écriture
+TAILLE_ENTETES_MAX = 64 * 1024
+TAILLE_CORPS_MAX = 1024 * 1024
+LIMITE_RECHERCHE_DEFAUT = 20
+
+
+class ErreurHTTP(Exception):
+    """Réponse d'erreur à renvoyer au client."""
+
+    def __init__(self, statut: HTTPStatus, message: str = ""):
+        super().__init__(message or statut.phrase)
+        self.statut = statut
+
+
+class Requete:
+    __slots__ = ('methode', 'chemin', 'parametres', 'version', 'entetes', 'corps')
+
+    def __init__(self, methode, cible, version, entetes, corps):
+        url = urlsplit(cible)
+        self.methode = methode
+        self.chemin = unquote(url.path)
+        self.parametres = {cle: valeurs[-1] for cle, valeurs in parse_qs(url.query).items()}
+        self.version = version
+        self.entetes = entetes
+        self.corps = corps
+
+    @property
+    def garder_connexion(self) -> bool:
+        connexion = self.entetes.get('connection', '').lower()
+        if self.version == 'HTTP/1.0':
+            return connexion == 'keep-alive'
+        return connexion != 'close'
+
+    def json(self):
+        try:
+            return json.loads(self.corps.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, f"JSON invalide : {e}")
+
+
+async def lire_requete(reader: asyncio.StreamReader) -> Optional[Requete]:
+    """
+    Lit une requête (ligne de requête, en-têtes, corps de Content-Length octets).
+
+    Returns:
+        None si le client a fermé la connexion entre deux requêtes
+    """
+    try:
+        brut = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Requête incomplète")
+    except asyncio.LimitOverrunError:
+        raise ErreurHTTP(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+
+    lignes = brut.decode('latin-1').split('\r\n')
+    try:
+        methode, cible, version = lignes[0].split(' ')
+    except ValueError:
+        raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Ligne de requête invalide")
+    if version not in ('HTTP/1.0', 'HTTP/1.1'):
+        raise ErreurHTTP(HTTPStatus.HTTP_VERSION_NOT_SUPPORTED)
+
+    entetes = {}
+    for ligne in lignes[1:]:
+        if ligne:
+            nom, _, valeur = ligne.partition(':')
+            entetes[nom.strip().lower()] = valeur.strip()
+    if 'transfer-encoding' in entetes:
+        raise ErreurHTTP(HTTPStatus.NOT_IMPLEMENTED, "Transfer-Encoding non pris en charge")
+
+    try:
+        longueur = int(entetes.get('content-length', 0))
+    except ValueError:
+        raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Content-Length invalide")
+    if longueur > TAILLE_CORPS_MAX:
+        raise ErreurHTTP(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    corps = await reader.readexactly(longueur) if longueur else b''
+    return Requete(methode, cible, version, entetes, corps)
+
+
+def formater_reponse(statut: HTTPStatus, contenu: Any, garder_connexion: bool) -> bytes:
+    corps = json.dumps(contenu, ensure_ascii=False).encode('utf-8')
+    entetes = (f"HTTP/1.1 {statut.value} {statut.phrase}\r\n"
+               f"Content-Type: application/json; charset=utf-8\r\n"
+               f"Content-Length: {len(corps)}\r\n"
+               f"Connection: {'keep-alive' if garder_connexion else 'close'}\r\n\r\n")
+    return entetes.encode('latin-1') + corps
+
+
+class ServeurBibliotheque:
+    """
+    Serveur HTTP/JSON au-dessus d'un MoteurStockage.
+
+    Args:
+        moteur: Moteur de stockage servi
+        fichier: Fichier de données où enregistrer les modifications (None : jamais)
+    """
+
+    def __init__(self, moteur, fichier: Optional[str] = None):
+        self.moteur = moteur
+        self.fichier = fichier
+        self.ecritures: Optional[asyncio.Queue] = None
+        self._serveur = None
+        self._taches = []
+        self._a_sauvegarder = None
+        self.connexions = 0
+
+    async def demarrer(self, hote: str = HOTE_DEFAUT, port: int = PORT_DEFAUT):
+        """Ouvre le port d'écoute et lance la tâche d'écriture ; retourne le serveur asyncio."""
+        self.ecritures = asyncio.Queue()
+        self._a_sauvegarder = asyncio.Event()
+        self._taches = [asyncio.create_task(self._ecrivain()), asyncio.create_task(self._sauvegardeur())]
+        self._serveur = await asyncio.start_server(self._servir_connexion, hote, port,
+                                                   limit=TAILLE_ENTETES_MAX)
+        return self._serveur
+
+    @property
+    def adresse(self) -> Tuple[str, int]:
+        return self._serveur.sockets[0].getsockname()[:2]
+
+    async def arreter(self) -> None:
+        """Ferme le port, applique les écritures en attente et enregistre une dernière fois."""
+        self._serveur.close()
+        await self._serveur.wait_closed()
+        await self.ecritures.join()
+        for tache in self._taches:
+            tache.cancel()
+        await asyncio.gather(*self._taches, return_exceptions=True)
+        if self._a_sauvegarder.is_set():
+            await self._sauvegarder()
+
+    # ------------------------------------------------------------------
+    # Connexions
+    # ------------------------------------------------------------------
+
+    async def _servir_connexion(self, reader, writer) -> None:
+        self.connexions += 1
+        try:
+            while True:
+                try:
+                    requete = await asyncio.wait_for(lire_requete(reader), DELAI_INACTIVITE_S)
+                except asyncio.TimeoutError:
+                    break
+                except ErreurHTTP as e:
+                    writer.write(formater_reponse(e.statut, {'erreur': str(e)}, False))
+                    break
+                if requete is None:
+                    break
+                statut, contenu = await self._traiter(requete)
+                garder = requete.garder_connexion
+                writer.write(formater_reponse(statut, contenu, garder))
+                # drain() ne suspend que si le tampon d'envoi est plein : les réponses
+                # aux requêtes pipelinées partent ensemble
+                await writer.drain()
+                if not garder:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connexions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _traiter(self, requete: Requete) -> Tuple[HTTPStatus, Any]:
+        route = self._route(requete)
+        REGISTRE.compteur('http.requetes').incrementer()
+        try:
+            with REGISTRE.chronometrer(f"http.{route}"):
+                if route == 'search':
+                    return HTTPStatus.OK, self._rechercher(requete)
+                if route == 'stats':
+                    return HTTPStatus.OK, statistiques(self.moteur, requete.parametres.get('metriques') == '1')
+                if route == 'add':
+                    return HTTPStatus.CREATED, await self._ecrire(ajouter, requete.json())
+                if route == 'delete':
+                    return HTTPStatus.OK, await self._ecrire(*self._suppression(requete))
+        except ErreurHTTP as e:
+            return e.statut, {'erreur': str(e)}
+        except (ValueError, KeyError, TypeError) as e:
+            return HTTPStatus.BAD_REQUEST, {'erreur': str(e)}
+        except Exception as e:
+            informer(f"[ERREUR] {requete.methode} {requete.chemin} : {e}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'erreur': str(e)}
+        if route == 'methode':
+            return HTTPStatus.METHOD_NOT_ALLOWED, {'erreur': f"Méthode {requete.methode} non autorisée"}
+        return HTTPStatus.NOT_FOUND, {'erreur': f"Route {requete.chemin} inconnue"}
+
+    @staticmethod
+    def _route(requete: Requete) -> str:
+        chemin = requete.chemin.rstrip('/') or '/'
+        routes = {
+            ('GET', '/search'): 'search', ('GET', '/stats'): 'stats',
+            ('POST', '/documents'): 'add', ('DELETE', '/documents'): 'delete',
+        }
+        if chemin.startswith('/documents/'):
+            chemin = '/documents'
+        route = routes.get((requete.methode, chemin))
+        if route is None and any(chemin == connu for _, connu in routes):
+            return 'methode'
+        return route or 'inconnue'
+
+    # ------------------------------------------------------------------
+    # Lectures (dans la boucle, sans suspension)
+    # ------------------------------------------------------------------
+
+    def _rechercher(self, requete: Requete) -> Dict[str, Any]:
+        parametres = requete.parametres
+        if 'q' not in parametres:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Paramètre q manquant")
+        try:
+            limite = int(parametres.get('limite', LIMITE_RECHERCHE_DEFAUT))
+        except ValueError:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "limite doit être un entier")
+        return rechercher(self.moteur, parametres['q'], parametres.get('mode', 'partout'), limite)
+
+    # ------------------------------------------------------------------
+    # Écritures (une seule tâche d'écriture)
+    # ------------------------------------------------------------------
+
+    def _suppression(self, requete: Requete):
+        identifiant = requete.chemin.rstrip('/')[len('/documents/'):] if requete.chemin.startswith('/documents/') else ''
+        if identifiant:
+            return supprimer, identifiant, True
+        if 'titre' not in requete.parametres:
+            raise ErreurHTTP(HTTPStatus.BAD_REQUEST, "Identifiant ou paramètre titre attendu")
+        return supprimer, requete.parametres['titre'], False, requete.parametres.get('tous') == '1'
+
+    async def _ecrire(self, operation, *args) -> Dict[str, Any]:
+        """Confie l'opération à la tâche d'écriture et attend son résultat."""
+        futur = asyncio.get_running_loop().create_future()
+        await self.ecritures.put((operation, args, futur))
+        return await futur
+
+    async def _ecrivain(self) -> None:
+        while True:
+            lot = [await self.ecritures.get()]
+            while len(lot) < LOT_ECRITURES_MAX and not self.ecritures.empty():
+                lot.append(self.ecritures.get_nowait())
+            for operation, args, futur in lot:
+                try:
+                    resultat = operation(self.moteur, *args)
+                except Exception as e:
+                    if not futur.done():
+                        futur.set_exception(e)
+                else:
+                    if not futur.done():
+                        futur.set_result(resultat)
+                finally:
+                    self.ecritures.task_done()
+            if self.fichier is not None:
+                self._a_sauvegarder.set()
+
+    async def _sauvegardeur(self) -> None:
+        while True:
+            await self._a_sauvegarder.wait()
+            await asyncio.sleep(DELAI_SAUVEGARDE_S)
+            await self._sauvegarder()
+
+    async def _sauvegarder(self) -> None:
+        self._a_sauvegarder.clear()
+        documents = self.moteur.documents()  # Copie prise dans la boucle : cohérente
+        try:
+            nombre = await asyncio.get_running_loop().run_in_executor(
+                None, ecrire_documents, documents, self.fichier)
+            informer(f"[OK] {nombre} documents enregistrés dans {self.fichier}")
+        except OSError as e:
+            informer(f"[ERREUR] Sauvegarde impossible : {e}")
+
+
+async def servir(fichier: str, hote: str, port: int, sauvegarder: bool = True) -> None:
+    serveur = ServeurBibliotheque(charger_moteur(fichier), fichier if sauvegarder else None)
+    await serveur.demarrer(hote, port)
+    hote, port = serveur.adresse
+    informer(f"[OK] Serveur à l'écoute sur http://{hote}:{port} (Ctrl+C pour arrêter)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await serveur.arreter()
+
+
+def main(arguments=None) -> int:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Service HTTP/JSON local de la bibliothèque")
+    parser.add_argument('--donnees', default=FICHIER_DONNEES, help="Fichier de documents .json ou .jsonl")
+    parser.add_argument('--hote', default=HOTE_DEFAUT)
+    parser.add_argument('--port', type=int, default=PORT_DEFAUT)
+    parser.add_argument('--sans-sauvegarde', action='store_true',
+                        help="N'enregistre pas les modifications dans le fichier de données")
+    args = parser.parse_args(arguments)
+    try:
+        asyncio.run(servir(args.donnees, args.hote, args.port, not args.sans_sauvegarde))
+    except KeyboardInterrupt:
+        informer("[OK] Serveur arrêté")
+    except (OSError, ValueError) as e:
+        informer(f"[ERREUR] {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,13 @@
+
+# Exports différés (PEP 562, voir partie_1/exports_differes.py)
+from partie_1.exports_differes import exports_differes
+
+_SOUS_MODULES = {
+    'index': (
+        'IndexSecondaire', 'IndexListe', 'IndexBST', 'IndexHachage', 'IndexMotsClesSecondaire',
+        'IndexBooleenSecondaire', 'IndexSuggestionsSecondaire'
+    ),
+    'moteur': ('MoteurStockage',),
+}
+
+__all__, __getattr__, __dir__ = exports_differes(__name__, _SOUS_MODULES, globals())
@@ -0,0 +1,222 @@
+"""
+Index secondaires du moteur de stockage.
+
+Chaque index enveloppe une structure existante (Bibliotheque, BinarySearchTree,
+HashTable, IndexMotsCles) et expose les trois opérations dont le moteur a
+besoin pour la maintenir : ajouter, retirer (par identité) et vider. Un nouvel
+index se branche en héritant d'IndexSecondaire.
+"""
+
+from abc import ABC, abstractmethod
+
+from partie_1.bibliotheque import Bibliotheque
+from partie_1.recherche_booleenne import IndexBooleen
+from partie_2.bst import BinarySearchTree
+from partie_2.trie import IndexSuggestions
+from partie_3.hashing import HashTable
+from partie_3.index_inverse import IndexMotsCles
+
+
+class IndexSecondaire(ABC):
+    """
+    Classe abstraite d'un index maintenu par le moteur.
+
+    Attributes:
+        nom: Nom unique de l'index dans le moteur
+        structure: La structure de données sous-jacente
+    """
+
+    nom = ""
+    chargement_groupe = False  # True : rempli d'un bloc par reconstruire() lors d'un chargement du moteur
+
+    def __init__(self, structure):
+        self.structure = structure
+
+    @abstractmethod
+    def ajouter(self, document) -> None:
+        """Indexe un document."""
+
+    @abstractmethod
+    def retirer(self, document) -> bool:
+        """Retire ce document précis ; retourne False s'il n'était pas indexé."""
+
+    @abstractmethod
+    def vider(self) -> None:
+        """Retire tous les documents."""
+
+    @abstractmethod
+    def taille(self) -> int:
+        """Nombre de documents indexés."""
+
+    def reconstruire(self, documents) -> None:
+        """Vide l'index puis indexe tous les documents."""
+        self.vider()
+        for document in documents:
+            self.ajouter(document)
+
+
+class IndexListe(IndexSecondaire):
+    """
+    Liste ordonnée (Bibliotheque) : ordre d'affichage, tri et persistance.
+    La liste Python sous-jacente est exposée dans `documents`.
+    """
+
+    nom = "liste"
+
+    def __init__(self):
+        self.documents = []
+        super().__init__(Bibliotheque(self.documents))
+
+    def ajouter(self, document) -> None:
+        self.structure.add_document(document)
+
+    def retirer(self, document) -> bool:
+        return self.structure.remove(document)
+
+    def position(self, document) -> int:
+        """Rang du document dans la liste (comparé par identité), -1 s'il est absent."""
+        for i, doc in enumerate(self.documents):
+            if doc is document:
+                return i
+        return -1
+
+    def replacer(self, document, position: int) -> None:
+        """Remet à son ancien rang un document qui vient d'être ajouté en fin de liste."""
+        if self.structure.keep_sorted or not self.documents or self.documents[-1] is not document:
+            return
+        self.documents.insert(position, self.documents.pop())
+
+    def vider(self) -> None:
+        self.structure.clear()
+
+    def taille(self) -> int:
+        return len(self.structure)
+
+
+class IndexBST(IndexSecondaire):
+    """
+    Arbre binaire de recherche indexé par titre.
+
+    Inséré document par document dans l'ordre d'un fichier trié (sauvegardé
+    après un tri), l'arbre dégénérerait en liste de hauteur n ; le moteur le
+    remplit donc d'un bloc, par reconstruire(), dans un ordre qui l'équilibre.
+    """
+
+    nom = "bst"
+    chargement_groupe = True
+
+    def __init__(self, bst: BinarySearchTree = None):
+        super().__init__(bst if bst is not None else BinarySearchTree())
+
+    def ajouter(self, document) -> None:
+        self.structure.insert(document)
+
+    def retirer(self, document) -> bool:
+        return self.structure.delete_document(document)
+
+    def vider(self) -> None:
+        self.structure.clear()
+
+    def taille(self) -> int:
+        return self.structure.size
+
+    def reconstruire(self, documents) -> None:
+        """
+        Insère d'abord le document médian (par titre), puis les médians de
+        chaque moitié, et ainsi de suite : l'arbre obtenu a une hauteur en
+        O(log n) quel que soit l'ordre des documents.
+        """
+        self.vider()
+        tries = sorted(documents, key=lambda doc: doc.titre.lower())
+        intervalles = [(0, len(tries))]
+        while intervalles:
+            debut, fin = intervalles.pop()
+            if debut < fin:
+                milieu = (debut + fin) // 2
+                self.ajouter(tries[milieu])
+                intervalles.append((milieu + 1, fin))
+                intervalles.append((debut, milieu))
+
+
+class IndexHachage(IndexSecondaire):
+    """Table de hachage indexée par auteur."""
+
+    nom = "hachage"
+
+    def __init__(self, hash_table: HashTable = None, taille: int = 50):
+        super().__init__(hash_table if hash_table is not None else HashTable(size=taille))
+
+    def ajouter(self, document) -> None:
+        self.structure.insert(document)
+
+    def retirer(self, document) -> bool:
+        return self.structure.delete_document(document)
+
+    def vider(self) -> None:
+        self.structure.clear()
+
+    def taille(self) -> int:
+        return sum(len(bucket.items) for bucket in self.structure.table)
+
+
+class IndexMotsClesSecondaire(IndexSecondaire):
+    """Index inversé des mots-clés."""
+
+    nom = "mots_cles"
+
+    def __init__(self, index: IndexMotsCles = None):
+        super().__init__(index if index is not None else IndexMotsCles())
+
+    def ajouter(self, document) -> None:
+        self.structure.insert(document)
+
+    def retirer(self, document) -> bool:
+        return self.structure.delete(document)
+
+    def vider(self) -> None:
+        self.structure.clear()
+
+    def taille(self) -> int:
+        return len(self.structure)
+
+
+class IndexBooleenSecondaire(IndexSecondaire):
+    """Bitmaps des mots-clés, mots d'auteurs et trigrammes de titres (requêtes booléennes)."""
+
+    nom = "booleen"
+
+    def __init__(self, index: IndexBooleen = None):
+        super().__init__(index if index is not None else IndexBooleen())
+
+    def ajouter(self, document) -> None:
+        self.structure.insert(document)
+
+    def retirer(self, document) -> bool:
+        return self.structure.delete(document)
+
+    def vider(self) -> None:
+        self.structure.clear()
+
+    def taille(self) -> int:
+        return len(self.structure)
+
+
+class IndexSuggestionsSecondaire(IndexSecondaire):
+    """Tries de préfixes des titres, auteurs et mots-clés (autocomplétion)."""
+
+    nom = "suggestions"
+
+    def __init__(self, index: IndexSuggestions = None):
+        super().__init__(index if index is not None else IndexSuggestions())
+
+    def ajouter(self, document) -> None:
+        self.structure.insert(document)
+
+    def retirer(self, document) -> bool:
+        return self.structure.delete(document)
+
+    def vider(self) -> None:
+        self.structure.clear()
+
+    def taille(self) -> int:
+        return len(self.structure)
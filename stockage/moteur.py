@@ -0,0 +1,518 @@
+"""
+Moteur de stockage : source unique des documents de la bibliothèque.
+
+Le moteur possède les documents dans une table primaire indexée par
+identifiant : un entier stable attribué à l'ajout (`document.id`) et
+sauvegardé avec le document. La liste, le BST, la table de hachage et l'index des mots-clés
+sont des index secondaires qu'il met à jour à chaque modification : une
+modification qui échoue sur un index est annulée sur ceux déjà mis à jour, et
+`transaction()` annule un groupe de modifications en cas d'exception.
+
+Les gestionnaires (BibliothequeManager, BSTManager, HashTableManager) obtenus
+par le moteur sont des vues : leurs recherches lisent l'index correspondant et
+leurs modifications passent par le moteur.
+
+Le moteur peut être partagé entre fils : ses lectures prennent son verrou
+lecteurs / rédacteur en lecture et ses modifications en écriture (voir
+partie_1/concurrence.py) ; `lecture()` groupe plusieurs recherches sur un
+même état.
+
+Exemple :
+    moteur = MoteurStockage()
+    moteur.charger(load_data(Document))
+    moteur.ajouter(Document("Dune", "Frank Herbert", "science-fiction"))
+    moteur.manager_hash.rechercher_par_auteur("herbert")
+    moteur.sauvegarder()
+"""
+
+from contextlib import contextmanager
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from partie_1.concurrence import VerrouLectureEcriture, en_ecriture, en_lecture
+from partie_1.document import Document
+from partie_1.gestionnaire_poo import BibliothequeManager
+from partie_1.metriques import mesure
+from partie_1.persistance import save_all_structures
+from partie_2.bst_manager import BSTManager
+from partie_2.trie import TAILLE_SUGGESTIONS, Suggestion
+from partie_3.hash_manager import HashTableManager
+from partie_3.planificateur import PlanificateurRequetes
+
+from .index import (IndexBooleenSecondaire, IndexBST, IndexHachage, IndexListe,
+                    IndexMotsClesSecondaire, IndexSecondaire, IndexSuggestionsSecondaire)
+
+
+PAS_PROGRESSION = 1000  # Documents chargés entre deux appels de la fonction de progression
+
+
+class MoteurStockage:
+    """
+    Table primaire des documents et index secondaires synchronisés.
+
+    Args:
+        taille_hachage: Nombre de buckets de la table de hachage par défaut
+        index_par_defaut: Crée les index liste, bst, hachage, mots_cles, booleen et suggestions
+    """
+
+    def __init__(self, taille_hachage: int = 50, index_par_defaut: bool = True):
+        self._documents: Dict[int, Document] = {}
+        self._prochain_identifiant = 1
+        self._journal = None
+        self.index: Dict[str, IndexSecondaire] = {}
+        self.generation = 0
+        self._managers = {}
+        self.verrou = VerrouLectureEcriture()
+
+        if index_par_defaut:
+            for index in (IndexListe(), IndexBST(), IndexHachage(taille=taille_hachage),
+                          IndexMotsClesSecondaire(), IndexBooleenSecondaire(),
+                          IndexSuggestionsSecondaire()):
+                self.ajouter_index(index)
+
+    # ------------------------------------------------------------------
+    # Index secondaires
+    # ------------------------------------------------------------------
+
+    @en_ecriture
+    def ajouter_index(self, index: IndexSecondaire) -> None:
+        """Branche un index secondaire et y indexe les documents existants."""
+        if index.nom in self.index:
+            raise ValueError(f"Un index nommé '{index.nom}' existe déjà")
+        index.reconstruire(self.documents())
+        self.index[index.nom] = index
+
+    @en_ecriture
+    def retirer_index(self, nom: str) -> IndexSecondaire:
+        """Débranche un index secondaire (il n'est plus mis à jour)."""
+        self._managers.clear()
+        return self.index.pop(nom)
+
+    def structure(self, nom: str):
+        """Retourne la structure de l'index `nom` (None s'il n'est pas branché)."""
+        index = self.index.get(nom)
+        return index.structure if index is not None else None
+
+    @property
+    def bibliotheque(self):
+        return self.structure('liste')
+
+    @property
+    def bst(self):
+        return self.structure('bst')
+
+    @property
+    def hash_table(self):
+        return self.structure('hachage')
+
+    @property
+    def index_mots_cles(self):
+        return self.structure('mots_cles')
+
+    @property
+    def index_booleen(self):
+        return self.structure('booleen')
+
+    @property
+    def suggestions(self):
+        return self.structure('suggestions')
+
+    @property
+    def liste(self) -> list:
+        """Liste Python de l'index liste, modifiable sur place pour la réordonner (tri)."""
+        return self.index['liste'].documents
+
+    # ------------------------------------------------------------------
+    # Vues
+    # ------------------------------------------------------------------
+
+    def _manager(self, nom: str, fabrique):
+        if nom not in self._managers:
+            self._managers[nom] = fabrique()
+        return self._managers[nom]
+
+    @property
+    def manager_liste(self) -> BibliothequeManager:
+        return self._manager('liste', lambda: BibliothequeManager(self.bibliotheque, moteur=self))
+
+    @property
+    def manager_bst(self) -> BSTManager:
+        return self._manager('bst', lambda: BSTManager(self.bst, moteur=self))
+
+    @property
+    def manager_hash(self) -> HashTableManager:
+        return self._manager('hachage', lambda: HashTableManager(hash_table=self.hash_table, moteur=self))
+
+    @en_lecture
+    def planificateur(self) -> PlanificateurRequetes:
+        """Planificateur multi-critères sur les index du moteur."""
+        return PlanificateurRequetes(self.documents(), self.bst, self.hash_table, self.index_mots_cles)
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    @en_lecture
+    def documents(self) -> List[Document]:
+        """Tous les documents, dans l'ordre de la liste si elle est indexée."""
+        if 'liste' in self.index:
+            return list(self.index['liste'].documents)
+        return list(self._documents.values())
+
+    @en_lecture
+    def page(self, debut: int, taille: int, par_titre: bool = False) -> List[Document]:
+        """
+        Documents de rang `debut` à `debut + taille - 1`, sans copier la collection.
+
+        Args:
+            debut: Rang du premier document
+            taille: Nombre de documents
+            par_titre: Ordre alphabétique des titres (parcours in-order du BST) au lieu de l'ordre de la liste
+        """
+        debut = max(0, debut)
+        if par_titre and self.bst is not None:
+            return self.bst.in_order_page(debut, taille)
+        if par_titre:
+            return sorted(self._documents.values(), key=lambda doc: doc.titre.lower())[debut:debut + taille]
+        if 'liste' in self.index:
+            return self.index['liste'].documents[debut:debut + taille]
+        return list(islice(self._documents.values(), debut, debut + taille))
+
+    @en_lecture
+    def obtenir(self, identifiant: int) -> Optional[Document]:
+        return self._documents.get(identifiant)
+
+    def identifiant(self, document: Document) -> Optional[int]:
+        return document.id if document in self else None
+
+    @en_lecture
+    def rechercher_par_titre(self, titre: str) -> List[Document]:
+        """Documents portant exactement ce titre (insensible à la casse)."""
+        if self.bst is not None:
+            return self.bst.search_all(titre)
+        titre = titre.lower()
+        return [doc for doc in self._documents.values() if doc.titre.lower() == titre]
+
+    @mesure('stockage.rechercher_partout')
+    @en_lecture
+    def rechercher_partout(self, terme: str) -> List[Document]:
+        """
+        Documents dont le titre, l'auteur ou un mot-clé contient le terme
+        (insensible à la casse), via l'index booléen s'il est branché.
+        """
+        if self.index_booleen is not None:
+            return self.index_booleen.search_contains(terme)
+        terme = terme.strip().lower()
+        return [doc for doc in self._documents.values()
+                if terme in doc.titre.lower() or terme in doc.auteur.lower()
+                or any(terme in mot.lower() for mot in doc.mots_cles)]
+
+    @mesure('stockage.apercu_recherche')
+    @en_lecture
+    def apercu_recherche(self, terme: str, taille: int) -> Tuple[int, List[Document]]:
+        """
+        Nombre de documents contenant le terme (comme `rechercher_partout`) et
+        les `taille` premiers d'entre eux : seuls ceux-ci sont résolus, ce qui
+        garde la recherche pendant la saisie rapide même pour un terme fréquent.
+        """
+        if self.index_booleen is None:
+            resultats = self.rechercher_partout(terme)
+            return len(resultats), resultats[:taille]
+        bitmap = self.index_booleen.bitmap_contient(terme.strip())
+        documents = self.index_booleen.documents
+        return len(bitmap), [documents[cle] for cle in islice(bitmap, taille)]
+
+    @mesure('stockage.suggerer')
+    @en_lecture
+    def suggerer(self, prefixe: str, champ: Optional[str] = None,
+                 n: int = TAILLE_SUGGESTIONS) -> List[Suggestion]:
+        """
+        Autocomplétion : titres, auteurs ou mots-clés commençant par le préfixe,
+        les plus fréquents d'abord (vide si l'index des suggestions est débranché).
+
+        Args:
+            prefixe: Début saisi
+            champ: 'titre', 'auteur', 'mot_cle' ou None pour les trois
+            n: Nombre maximal de suggestions
+        """
+        if self.suggestions is None:
+            return []
+        return self.suggestions.suggest(prefixe, champ, n)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __iter__(self) -> Iterator[Document]:
+        return iter(self.documents())
+
+    def __contains__(self, document) -> bool:
+        identifiant = getattr(document, 'id', None)
+        return identifiant is not None and self._documents.get(identifiant) is document
+
+    # ------------------------------------------------------------------
+    # Modifications
+    # ------------------------------------------------------------------
+
+    def _journaliser(self, *operation) -> None:
+        if self._journal is not None:
+            self._journal.append(operation)
+
+    def _index_groupes(self) -> List[IndexSecondaire]:
+        return [index for index in self.index.values() if index.chargement_groupe]
+
+    def _inserer(self, document: Document, identifiant: int, sauf=()) -> None:
+        """
+        Insère dans la table primaire puis dans chaque index, tout ou rien.
+
+        Args:
+            sauf: Index laissés de côté (remplis ensuite d'un bloc par reconstruire)
+        """
+        self._documents[identifiant] = document
+        indexes = []
+        try:
+            for index in self.index.values():
+                if index in sauf:
+                    continue
+                index.ajouter(document)
+                indexes.append(index)
+        except Exception:
+            for index in reversed(indexes):
+                index.retirer(document)
+            del self._documents[identifiant]
+            raise
+        self._prochain_identifiant = max(self._prochain_identifiant, identifiant + 1)
+        self.generation += 1
+
+    def _retirer(self, identifiant: int) -> Document:
+        """Retire de chaque index puis de la table primaire, tout ou rien."""
+        document = self._documents[identifiant]
+        indexes = []
+        try:
+            for index in self.index.values():
+                index.retirer(document)
+                indexes.append(index)
+        except Exception:
+            # Un document réinséré dans la liste y reprend place en fin de liste
+            for index in reversed(indexes):
+                index.ajouter(document)
+            raise
+        del self._documents[identifiant]
+        self.generation += 1
+        return document
+
+    @mesure('stockage.ajouter')
+    @en_ecriture
+    def ajouter(self, document: Document) -> int:
+        """
+        Ajoute un document à la table primaire et à tous les index.
+
+        Un document sans identifiant en reçoit un nouveau ; un document
+        rechargé depuis le fichier de données conserve le sien.
+
+        Returns:
+            L'identifiant du document
+        """
+        return self._ajouter(document)
+
+    def _ajouter(self, document: Document, sauf=()) -> int:
+        if document in self:
+            raise ValueError(f"Le document '{document.titre}' est déjà stocké")
+        identifiant = document.id
+        if identifiant is None:
+            identifiant = self._prochain_identifiant
+        elif identifiant in self._documents:
+            raise ValueError(f"L'identifiant {identifiant} de '{document.titre}' est déjà attribué "
+                             f"à '{self._documents[identifiant].titre}'")
+        ancien, document.id = document.id, identifiant
+        try:
+            self._inserer(document, identifiant, sauf)
+        except Exception:
+            document.id = ancien
+            raise
+        self._journaliser('ajout', identifiant, ancien)
+        return identifiant
+
+    def ajouter_document(self, titre: str, auteur: str, mots_cles: str = "") -> Document:
+        """Crée un document et l'ajoute ; retourne le document créé."""
+        document = Document(titre, auteur, mots_cles)
+        self.ajouter(document)
+        return document
+
+    @mesure('stockage.supprimer')
+    @en_ecriture
+    def supprimer(self, identifiant: int) -> bool:
+        """
+        Supprime un document de la table primaire et de tous les index.
+
+        Returns:
+            True si le document existait
+        """
+        if identifiant not in self._documents:
+            return False
+        position = -1
+        if self._journal is not None and 'liste' in self.index:
+            position = self.index['liste'].position(self._documents[identifiant])
+        document = self._retirer(identifiant)
+        self._journaliser('suppression', identifiant, document, position)
+        return True
+
+    def supprimer_document(self, document: Document) -> bool:
+        """Supprime ce document précis."""
+        identifiant = self.identifiant(document)
+        return identifiant is not None and self.supprimer(identifiant)
+
+    @en_ecriture
+    def supprimer_par_titre(self, titre: str, tous: bool = True) -> List[Document]:
+        """
+        Supprime les documents portant exactement ce titre (insensible à la casse).
+
+        Args:
+            titre: Le titre
+            tous: False pour ne supprimer que le premier trouvé
+
+        Returns:
+            Les documents supprimés
+        """
+        documents = self.rechercher_par_titre(titre)
+        if not tous:
+            documents = documents[:1]
+        with self.transaction():
+            for document in documents:
+                self.supprimer_document(document)
+        return documents
+
+    @mesure('stockage.vider')
+    @en_ecriture
+    def vider(self) -> None:
+        """Supprime tous les documents."""
+        contenu = [(doc.id, doc) for doc in self.documents()]
+        for index in self.index.values():
+            index.vider()
+        self._documents.clear()
+        self.generation += 1
+        self._journaliser('vidage', contenu)
+
+    @mesure('stockage.charger')
+    @en_ecriture
+    def charger(self, documents: Iterable[Document], progression=None) -> int:
+        """
+        Remplace le contenu du moteur par ces documents (en une transaction).
+        Les documents sans identifiant sont numérotés à la suite des autres.
+
+        Args:
+            documents: Documents à charger
+            progression: Fonction (fait, total, message) appelée tous les
+                PAS_PROGRESSION documents ; une exception qu'elle lève annule le chargement
+
+        Returns:
+            Le nombre de documents chargés
+        """
+        documents = list(documents)
+        with self.transaction():
+            self.vider()
+            self._prochain_identifiant = 1 + max((doc.id for doc in documents if doc.id is not None), default=0)
+            groupes = self._index_groupes()
+            for i, document in enumerate(documents, 1):
+                self._ajouter(document, sauf=groupes)
+                if progression is not None and (i % PAS_PROGRESSION == 0 or i == len(documents)):
+                    progression(i, len(documents), "Construction des index")
+            for index in groupes:
+                index.reconstruire(documents)
+        return len(self)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Regroupe des modifications : si une exception survient, toutes sont
+        annulées dans l'ordre inverse et le compteur d'identifiants est
+        restauré. Une transaction imbriquée est fusionnée avec la transaction
+        englobante.
+        """
+        with self.verrou.ecriture():
+            if self._journal is not None:
+                yield self
+                return
+
+            self._journal = []
+            prochain_identifiant = self._prochain_identifiant
+            try:
+                yield self
+            except BaseException:
+                journal, self._journal = self._journal, None
+                self._annuler(journal)
+                self._prochain_identifiant = prochain_identifiant
+                raise
+            self._journal = None
+
+    def lecture(self):
+        """
+        Contexte de lecture : les modifications des autres fils attendent sa
+        fin, plusieurs recherches y voient donc le même état.
+        """
+        return self.verrou.lecture()
+
+    def ecriture(self):
+        """Contexte d'écriture exclusive (modifications groupées hors transaction)."""
+        return self.verrou.ecriture()
+
+    @en_ecriture
+    def reordonner(self, documents: List[Document]) -> None:
+        """
+        Remplace l'ordre de la liste par celui de `documents` (résultat d'un tri
+        fait sur une copie, par exemple dans un fil de travail).
+
+        Raises:
+            ValueError: `documents` ne contient pas exactement les documents stockés
+        """
+        liste = self.index['liste']
+        with liste.structure.verrou.ecriture():
+            if sorted(map(id, documents)) != sorted(map(id, liste.documents)):
+                raise ValueError("La liste a été modifiée pendant le tri")
+            if liste.structure.keep_sorted:
+                return  # Déjà triée par titre, et son tableau de clés doit rester aligné
+            liste.documents[:] = documents
+            liste.structure.generation += 1
+
+    def _annuler(self, journal: List[tuple]) -> None:
+        for operation in reversed(journal):
+            if operation[0] == 'ajout':
+                identifiant, ancien = operation[1:]
+                self._retirer(identifiant).id = ancien
+            elif operation[0] == 'suppression':
+                identifiant, document, position = operation[1:]
+                self._inserer(document, identifiant)
+                if position >= 0:
+                    self.index['liste'].replacer(document, position)
+            elif operation[0] == 'vidage':
+                groupes = self._index_groupes()
+                for identifiant, document in operation[1]:
+                    self._inserer(document, identifiant, sauf=groupes)
+                for index in groupes:
+                    index.reconstruire([document for _, document in operation[1]])
+
+    # ------------------------------------------------------------------
+    # Persistance et contrôle
+    # ------------------------------------------------------------------
+
+    @mesure('stockage.sauvegarder')
+    @en_lecture
+    def sauvegarder(self) -> bool:
+        """Sauvegarde les documents (dans l'ordre de la liste) dans le fichier de données."""
+        return save_all_structures(self.documents())
+
+    @en_lecture
+    def verifier_coherence(self) -> List[str]:
+        """
+        Vérifie que chaque index contient autant de documents que la table primaire.
+
+        Returns:
+            La liste des anomalies (vide si tout est cohérent)
+        """
+        anomalies = []
+        for nom, index in self.index.items():
+            if index.taille() != len(self._documents):
+                anomalies.append(f"Index '{nom}' : {index.taille()} document(s) au lieu de {len(self._documents)}")
+        return anomalies
+
+    def __repr__(self) -> str:
+        return f"MoteurStockage(documents={len(self)}, index={list(self.index)})"
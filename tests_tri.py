@@ -1,16 +1,53 @@
 """
 Tests unitaires pour les algorithmes de tri
-Vérifie la validité et la cohérence de chaque algorithme
+Vérifie la validité et la cohérence de chaque algorithme, ainsi que les
+bitmaps, l'analyseur de requêtes booléennes, le trie d'autocomplétion, les
+transactions du moteur et le cache des résultats de recherche
+
+Mode performance (python tests_tri.py --perf) : compare les temps, le pic
+mémoire et la classe de complexité mesurés à une référence enregistrée, puis
+vérifie le budget de démarrage à froid de main.py et mode_terminal.py.
+
+Mode concurrence (python tests_tri.py --concurrence) : un rédacteur et
+plusieurs lecteurs sollicitent en même temps le BST, la table de hachage et la
+liste du moteur de stockage, puis des lecteurs sans verrou parcourent les
+instantanés d'un BST persistant ; toute incohérence observée fait échouer le test.
 """
 
 from partie_1.document import Document
 from partie_1.compat import (
     trier_par_titre, tri_selection, tri_bulles, 
-    tri_rapide, tri_fusion, tri_tas, tri_comptage
+    tri_rapide, tri_fusion, tri_tas, tri_comptage, tri_vectorise
 )
+from partie_1.bibliotheque import Bibliotheque
+from partie_1.cache import CacheResultats
+from partie_1.gestionnaire_poo import BibliothequeManager
+from partie_1.persistance import iterer_enregistrements, tri_externe
+from partie_1.tri_algorithms import top_k
+from partie_1.bitmap import Bitmap, SEUIL_TABLEAU, TAILLE_CONTENEUR
+from partie_1.recherche_booleenne import IndexBooleen, analyser_requete
+from partie_2.trie import TriePrefixes
+from partie_1.benchmark_tri import (
+    GRAINE_DEFAUT, algorithmes_par_defaut, generer_documents, mesurer_tri,
+    ajuster_exposant, sauvegarder_rapport, charger_rapport
+)
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
 import time
 
 
+FICHIER_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_performance_tri.json")
+
+
 class TestsTriAlgorithmes:
     """Classe de tests pour tous les algorithmes de tri"""
     
@@ -135,10 +172,82 @@ class TestsTriAlgorithmes:
                 'erreur': str(e)
             }
     
-    def executer_tous_les_tests(self):
+    def creer_liste_aleatoire(self, taille=200):
+        """Liste aléatoire avec de nombreux doublons de titres (casse variable)"""
+        rng = random.Random(GRAINE_DEFAUT)
+        titres = ["Dune", "dune", "1984", "Alice", "Zazie", "Le Petit Prince", "fondation", "Ubik"]
+        return [Document(f"{rng.choice(titres)} {rng.randrange(20)}", f"Auteur {i}", "test")
+                for i in range(taille)]
+
+    def trier_comme_sorted(self, liste):
+        """Ordre de référence : sorted() (stable) sur le titre en minuscules"""
+        return sorted(liste, key=lambda doc: doc.titre.lower())
+
+    def verifier_tri_externe(self, liste, taille_run):
+        """Tri externe par runs de `taille_run` documents, comparé à sorted()"""
+        with tempfile.TemporaryDirectory(prefix='tests_tri_') as dossier:
+            entree = os.path.join(dossier, "entree.json")
+            sortie = os.path.join(dossier, "sortie.jsonl")
+            with open(entree, 'w', encoding='utf-8') as f:
+                json.dump([doc.to_dict() for doc in liste], f, ensure_ascii=False)
+            with contextlib.redirect_stdout(io.StringIO()):
+                nombre = tri_externe(entree, sortie, taille_run=taille_run)
+            obtenu = [(e['titre'], e['auteur']) for e in iterer_enregistrements(sortie)]
+        attendu = [(doc.titre, doc.auteur) for doc in self.trier_comme_sorted(liste)]
+        if nombre != len(liste) or obtenu != attendu:
+            return f"{nombre} documents écrits, ordre différent de sorted()"
+        return None
+
+    def verifier_tri_externe_interrompu(self):
+        """Une fusion qui échoue ne laisse pas de fichier temporaire partiel"""
+        with tempfile.TemporaryDirectory(prefix='tests_tri_') as dossier:
+            entree = os.path.join(dossier, "entree.json")
+            sortie = os.path.join(dossier, "sortie")
+            os.mkdir(sortie)  # os.replace échoue après l'écriture du fichier temporaire
+            with open(entree, 'w', encoding='utf-8') as f:
+                json.dump([doc.to_dict() for doc in self.creer_liste_test_2()], f, ensure_ascii=False)
+            with contextlib.redirect_stdout(io.StringIO()):
+                nombre = tri_externe(entree, sortie, taille_run=2)
+            if nombre != 0:
+                return f"{nombre} documents annoncés malgré l'échec"
+            if os.path.exists(sortie + '.tmp'):
+                return "Fichier temporaire partiel laissé à côté de la sortie"
+        return None
+
+    def verifier_top_k(self, liste):
+        """top_k comparé à sorted()[:k], y compris k = 0, k < 0 et k > n"""
+        attendu = self.trier_comme_sorted(liste)
+        for k in sorted({-1, 0, 1, 3, len(liste) // 2, len(liste), len(liste) + 5}):
+            if top_k(liste, k) != attendu[:max(k, 0)]:
+                return f"k = {k} : résultat différent de sorted()[:k]"
+        return None
+
+    def verifier_tri_continu(self, liste):
+        """Ajouts en mode trié, activation sur une liste existante et top_k du gestionnaire"""
+        attendu = self.trier_comme_sorted(liste)
+        bibliotheque = Bibliotheque(keep_sorted=True)
+        for document in liste:
+            bibliotheque.add_document(document)
+        if bibliotheque.documents != attendu:
+            return "Ajouts en mode trié : ordre différent de sorted()"
+        gestionnaire = BibliothequeManager(Bibliotheque(list(liste)))
+        gestionnaire.activer_tri_continu()
+        gestionnaire.trier('bulles')
+        if gestionnaire.bibliotheque.documents != attendu:
+            return "Activation sur une liste existante : ordre différent de sorted()"
+        for k in (0, 3, len(liste) + 5):
+            if gestionnaire.top_k(k) != attendu[:k]:
+                return f"top_k({k}) en mode trié différent de sorted()[:k]"
+        return None
+
+    def executer_tous_les_tests(self, progression=None):
         """
         Exécute tous les tests sur tous les algorithmes
         
+        Paramètres:
+            progression: fonction (fait, total, message) appelée après chaque
+                algorithme (interface graphique)
+        
         Retourne:
             dict: {
                 'algorithme': {
@@ -155,7 +264,8 @@ class TestsTriAlgorithmes:
             "Tri Rapide": tri_rapide,
             "Tri Fusion": tri_fusion,
             "Tri Tas": tri_tas,
-            "Tri Comptage": tri_comptage
+            "Tri Comptage": tri_comptage,
+            "Tri Vectorisé": tri_vectorise
         }
         
         listes_test = {
@@ -169,11 +279,28 @@ class TestsTriAlgorithmes:
         
         resultats = {}
         
-        for nom_algo, fonction in algorithmes.items():
+        for i, (nom_algo, fonction) in enumerate(algorithmes.items(), 1):
             resultats[nom_algo] = {}
             for nom_test, liste in listes_test.items():
                 resultat = self.tester_algorithme(nom_algo, fonction, liste)
                 resultats[nom_algo][nom_test] = resultat
+            if progression is not None:
+                progression(i, len(algorithmes), nom_algo)
+        
+        listes_test["Test 7 - Liste aléatoire avec doublons (200 éléments)"] = self.creer_liste_aleatoire()
+        resultats["Tri Externe"] = {}
+        resultats["Top-k"] = {}
+        resultats["Tri Continu"] = {}
+        for nom_test, liste in listes_test.items():
+            taille_run = 2 if len(liste) < 50 else 16  # Plusieurs runs temporaires dès 3 éléments
+            resultats["Tri Externe"][nom_test] = executer_verification(
+                "Tri Externe", lambda liste=liste, taille_run=taille_run: self.verifier_tri_externe(liste, taille_run), len(liste))
+            resultats["Top-k"][nom_test] = executer_verification(
+                "Top-k", lambda liste=liste: self.verifier_top_k(liste), len(liste))
+            resultats["Tri Continu"][nom_test] = executer_verification(
+                "Tri Continu", lambda liste=liste: self.verifier_tri_continu(liste), len(liste))
+        resultats["Tri Externe"]["Fusion interrompue"] = executer_verification(
+            "Tri Externe", self.verifier_tri_externe_interrompu, 10)
         
         return resultats
     
@@ -219,12 +346,950 @@ class TestsTriAlgorithmes:
         return "\n".join(rapport)
 
 
+def executer_verification(nom, verification, taille=0):
+    """
+    Exécute une vérification qui retourne None si elle réussit, un message
+    d'erreur sinon ; résultat au format de TestsTriAlgorithmes.tester_algorithme
+    """
+    start = time.perf_counter()
+    try:
+        erreur = verification()
+    except Exception as e:
+        erreur = f"{type(e).__name__} : {e}"
+    return {
+        'nom': nom,
+        'valide': erreur is None,
+        'temps': time.perf_counter() - start,
+        'taille': taille,
+        'erreur': erreur
+    }
+
+
+class TestsRechercheBooleenne:
+    """
+    Tests des bitmaps compressés et de l'analyseur de requêtes booléennes
+
+    Les opérations ET / OU / SAUF sont comparées aux ensembles Python sur des
+    conteneurs de part et d'autre du seuil tableau / carte de bits (4096
+    valeurs) et des frontières de conteneurs (multiples de 65536).
+    """
+
+    def __init__(self, graine=GRAINE_DEFAUT):
+        self.graine = graine
+
+    def creer_ensembles(self):
+        """Paires d'ensembles couvrant tableaux, cartes de bits et frontières de conteneurs"""
+        rng = random.Random(self.graine)
+        autour = [TAILLE_CONTENEUR * k + d for k in range(1, 4) for d in (-2, -1, 0, 1)]
+        dense = set(rng.sample(range(TAILLE_CONTENEUR), 6000))             # Carte de bits
+        seuil = set(rng.sample(range(TAILLE_CONTENEUR, 2 * TAILLE_CONTENEUR), SEUIL_TABLEAU))
+        creux = set(rng.sample(range(2 * TAILLE_CONTENEUR, 3 * TAILLE_CONTENEUR), 300))
+        return {
+            "Carte de bits / tableau": (dense | set(autour), creux | set(autour[:6])),
+            "Seuil 4096 / 4097": (seuil, seuil | {min(set(range(TAILLE_CONTENEUR, 2 * TAILLE_CONTENEUR)) - seuil)}),
+            "Tableau / carte de bits du même conteneur": (set(rng.sample(range(TAILLE_CONTENEUR), 300)), dense),
+            "Cartes de bits recouvrantes": (dense, set(rng.sample(range(TAILLE_CONTENEUR), 5000))),
+            "Conteneurs disjoints": (dense, creux),
+            "Ensemble vide": (creux, set()),
+        }
+
+    def verifier_operations(self, a, b):
+        """Compare ET, OU, SAUF et l'union multiple aux ensembles Python"""
+        ba, bb = Bitmap(a), Bitmap(b)
+        attendus = {
+            'ET': (ba & bb, a & b),
+            'OU': (ba | bb, a | b),
+            'SAUF': (ba - bb, a - b),
+            'SAUF inverse': (bb - ba, b - a),
+            'union': (Bitmap.union(ba, bb, Bitmap([0, TAILLE_CONTENEUR])), a | b | {0, TAILLE_CONTENEUR}),
+        }
+        for operation, (bitmap, ensemble) in attendus.items():
+            if list(bitmap) != sorted(ensemble) or len(bitmap) != len(ensemble):
+                return f"{operation} : {len(bitmap)} valeurs au lieu de {len(ensemble)}"
+        if len(ba) != len(a) or any(valeur not in ba for valeur in a) or TAILLE_CONTENEUR * 5 in ba:
+            return "Appartenance ou cardinal incorrect"
+        return None
+
+    def verifier_conversions(self):
+        """Ajouts puis retraits de part et d'autre du seuil tableau / carte de bits"""
+        rng = random.Random(self.graine)
+        valeurs = rng.sample(range(TAILLE_CONTENEUR - 100, 2 * TAILLE_CONTENEUR + 100), SEUIL_TABLEAU + 50)
+        bitmap, ensemble = Bitmap(), set()
+        for valeur in valeurs:
+            bitmap.add(valeur)
+            ensemble.add(valeur)
+        if list(bitmap) != sorted(ensemble):
+            return "Ajouts : contenu différent de l'ensemble"
+        for valeur in valeurs[:SEUIL_TABLEAU]:
+            bitmap.discard(valeur)
+            ensemble.discard(valeur)
+        if list(bitmap) != sorted(ensemble) or bitmap != Bitmap.depuis_tries(sorted(ensemble)):
+            return "Retraits : contenu différent de l'ensemble"
+        return None
+
+    def verifier_precedence(self):
+        """OR < AND (implicite) < NOT, parenthèses et champs"""
+        a, b, c = ('terme', None, 'a'), ('terme', None, 'b'), ('terme', None, 'c')
+        attendus = {
+            "a OR b c": ('OR', a, ('AND', b, c)),
+            "a AND b OR c": ('OR', ('AND', a, b), c),
+            "NOT a b": ('AND', ('NOT', a), b),
+            "NOT (a OR b)": ('NOT', ('OR', a, b)),
+            "(a OR b) c": ('AND', ('OR', a, b), c),
+            "auteur:a OR b": ('OR', ('terme', 'auteur', 'a'), b),
+        }
+        for requete, arbre in attendus.items():
+            obtenu = analyser_requete(requete)
+            if obtenu != arbre:
+                return f"{requete!r} analysée en {obtenu}"
+        return None
+
+    def verifier_erreurs(self):
+        """Les requêtes mal formées lèvent ValueError"""
+        for requete in ("a AND", "(a", "inconnu:x", "", "a )"):
+            try:
+                analyser_requete(requete)
+            except ValueError:
+                continue
+            return f"{requete!r} acceptée"
+        return None
+
+    def verifier_recherche(self):
+        """Requêtes sur les mots-clés comparées aux ensembles Python"""
+        rng = random.Random(self.graine)
+        documents = [Document(f"Titre {i}", "Auteur", rng.sample(["a", "b", "c", "d"], rng.randint(0, 3)), id=i)
+                     for i in range(1, 301)]
+        index = IndexBooleen(documents)
+        par_mot = {mot: {doc.id for doc in documents if mot in doc.mots_cles} for mot in "abcd"}
+        tous = {doc.id for doc in documents}
+        attendus = {
+            "keyword:a OR keyword:b keyword:c": par_mot["a"] | (par_mot["b"] & par_mot["c"]),
+            "keyword:a NOT keyword:b": par_mot["a"] - par_mot["b"],
+            "NOT keyword:a keyword:d": par_mot["d"] - par_mot["a"],
+            "NOT (keyword:a OR keyword:c)": tous - par_mot["a"] - par_mot["c"],
+        }
+        for requete, ensemble in attendus.items():
+            obtenus = [doc.id for doc in index.search(requete)]
+            if obtenus != sorted(ensemble):
+                return f"{requete!r} : {len(obtenus)} documents au lieu de {len(ensemble)}"
+        return None
+
+    def verifier_identifiant_duplique(self):
+        """Un autre document sous un identifiant déjà indexé est refusé, le même est ignoré"""
+        from partie_3.index_inverse import IndexMotsCles
+
+        premier = Document("Premier", "Auteur", "roman", id=1)
+        second = Document("Second", "Auteur", "roman", id=1)
+        for classe in (IndexBooleen, IndexMotsCles):
+            index = classe([premier])
+            index.insert(premier)
+            try:
+                index.insert(second)
+            except ValueError:
+                pass
+            else:
+                return f"{classe.__name__} : second document de même identifiant ignoré sans erreur"
+            if len(index) != 1 or index.documents[1] is not premier:
+                return f"{classe.__name__} : index modifié par l'insertion refusée"
+        return None
+
+    def verifier_cache_gestionnaire(self):
+        """Sans moteur, une suppression suivie d'un ajout invalide le cache des requêtes"""
+        gestionnaire = BibliothequeManager()
+        gestionnaire.ajouter_document("Alpha", "Auteur A", "roman")
+        gestionnaire.ajouter_document("Beta", "Auteur B", "")
+        if [doc.titre for doc in gestionnaire.rechercher_booleen("keyword:roman")] != ["Alpha"]:
+            return "Première requête incorrecte"
+        gestionnaire.supprimer_document("Alpha")
+        gestionnaire.ajouter_document("Gamma", "Auteur G", "")
+        obtenus = [doc.titre for doc in gestionnaire.rechercher_booleen("keyword:roman")]
+        if obtenus:
+            return f"Document supprimé servi par le cache : {obtenus}"
+        return None
+
+    def executer_tous_les_tests(self):
+        """
+        Exécute les vérifications, au format de TestsTriAlgorithmes.executer_tous_les_tests
+
+        Retourne:
+            dict: {'Bitmaps': {...}, 'Requêtes booléennes': {...}}
+        """
+        bitmaps = {}
+        for nom, (a, b) in self.creer_ensembles().items():
+            bitmaps[f"ET / OU / SAUF - {nom}"] = executer_verification(
+                nom, lambda a=a, b=b: self.verifier_operations(a, b), len(a) + len(b))
+        bitmaps["Conversions tableau / carte de bits"] = executer_verification(
+            "Conversions", self.verifier_conversions, SEUIL_TABLEAU + 50)
+        return {
+            "Bitmaps": bitmaps,
+            "Requêtes booléennes": {
+                "Précédence des opérateurs": executer_verification("Précédence", self.verifier_precedence),
+                "Requêtes mal formées": executer_verification("Erreurs", self.verifier_erreurs),
+                "Recherche par mots-clés": executer_verification("Recherche", self.verifier_recherche, 300),
+                "Identifiant déjà indexé": executer_verification(
+                    "Identifiant", self.verifier_identifiant_duplique, 2),
+                "Cache après suppression puis ajout": executer_verification(
+                    "Cache", self.verifier_cache_gestionnaire, 3),
+            },
+        }
+
+
+class TestsTriePrefixes:
+    """
+    Tests du trie radix d'autocomplétion
+
+    Des insertions et suppressions aléatoires sur un petit alphabet (beaucoup
+    de préfixes communs, donc de coupures et de fusions d'arêtes) sont
+    rejouées sur un dictionnaire de référence ; chaque complétion est comparée
+    au classement attendu, égalités et n supérieur à taille_cache compris.
+    """
+
+    TAILLE_CACHE = 3
+    OPERATIONS = 3000
+
+    def __init__(self, graine=GRAINE_DEFAUT):
+        self.graine = graine
+
+    def attendu(self, reference, prefixe, n):
+        """Complétion de référence : popularité décroissante puis ordre alphabétique"""
+        termes = sorted((-compte, cle) for cle, compte in reference.items() if cle.startswith(prefixe))
+        return [(cle, -compte) for compte, cle in termes[:max(n, 0)]]
+
+    def verifier_structure(self, trie):
+        """Aucun nœud sans terme n'est une feuille ou n'a un seul enfant (arêtes refusionnées)"""
+        pile = list(trie.racine.enfants.values())
+        while pile:
+            noeud = pile.pop()
+            if not noeud.compte and len(noeud.enfants) < 2:
+                return f"Nœud '{noeud.etiquette}' inutile laissé dans le trie"
+            pile.extend(noeud.enfants.values())
+        return None
+
+    def verifier_aleatoire(self):
+        """Insertions, suppressions et complétions aléatoires comparées à un dictionnaire"""
+        rng = random.Random(self.graine)
+        trie = TriePrefixes(taille_cache=self.TAILLE_CACHE)
+        reference = {}
+        for i in range(self.OPERATIONS):
+            terme = ''.join(rng.choice("ab") for _ in range(rng.randint(1, 6)))
+            poids = rng.randint(1, 3)
+            if rng.random() < 0.6:
+                trie.insert(terme, poids)
+                reference[terme] = reference.get(terme, 0) + poids
+            else:
+                present = trie.delete(terme, poids)
+                if present != (terme in reference):
+                    return f"delete({terme!r}) a retourné {present}"
+                if present:
+                    reference[terme] -= poids
+                    if reference[terme] <= 0:
+                        del reference[terme]
+            if len(trie) != len(reference):
+                return f"Opération {i} : {len(trie)} termes au lieu de {len(reference)}"
+            prefixe = terme[:rng.randint(0, len(terme))]
+            for n in (0, 1, self.TAILLE_CACHE, self.TAILLE_CACHE + 4):
+                if trie.complete(prefixe, n) != self.attendu(reference, prefixe, n):
+                    return f"Opération {i} : complete({prefixe!r}, {n}) différent de la référence"
+            if trie.popularity(terme) != reference.get(terme, 0):
+                return f"Opération {i} : popularité de {terme!r} incorrecte"
+            if i % 100 == 0:
+                erreur = self.verifier_structure(trie)
+                if erreur:
+                    return erreur
+        return self.verifier_structure(trie)
+
+    def executer_tous_les_tests(self):
+        """
+        Exécute les vérifications, au format de TestsTriAlgorithmes.executer_tous_les_tests
+
+        Retourne:
+            dict: {'Trie de préfixes': {...}}
+        """
+        return {
+            "Trie de préfixes": {
+                "Insertions / suppressions / complétions aléatoires": executer_verification(
+                    "Trie", self.verifier_aleatoire, self.OPERATIONS),
+            },
+        }
+
+
+class TestsTransactions:
+    """
+    Tests d'annulation des transactions du moteur de stockage
+
+    Un index qui refuse un document, une exception levée dans le bloc
+    `transaction()` ou un chargement interrompu doivent laisser chaque index,
+    les identifiants des documents et la numérotation des suivants exactement
+    dans leur état initial.
+    """
+
+    TITRE_REFUSE = "Document refusé"
+
+    def creer_moteur(self):
+        """Moteur de 50 documents, avec un index qui refuse TITRE_REFUSE"""
+        from stockage import IndexSecondaire, MoteurStockage
+
+        titre_refuse = self.TITRE_REFUSE
+
+        class IndexRefus(IndexSecondaire):
+            nom = "refus"
+
+            def __init__(self):
+                super().__init__(set())
+
+            def ajouter(self, document):
+                if document.titre == titre_refuse:
+                    raise ValueError(f"'{titre_refuse}' refusé par l'index")
+                self.structure.add(id(document))
+
+            def retirer(self, document):
+                if id(document) not in self.structure:
+                    return False
+                self.structure.discard(id(document))
+                return True
+
+            def vider(self):
+                self.structure.clear()
+
+            def taille(self):
+                return len(self.structure)
+
+        rng = random.Random(GRAINE_DEFAUT)
+        moteur = MoteurStockage()
+        for i in range(50):
+            moteur.ajouter(Document(f"Titre {rng.randrange(1000):03d} {i}", f"Auteur {i % 7}",
+                                    rng.sample(["roman", "conte", "poésie", "essai"], 2)))
+        moteur.ajouter_index(IndexRefus())
+        return moteur
+
+    def etat(self, moteur):
+        """Contenu observable de la table primaire et de chaque index"""
+        return {
+            'documents': sorted((doc.id, id(doc)) for doc in moteur.documents()),
+            'liste': [id(doc) for doc in moteur.liste],
+            'bst': [id(doc) for doc in moteur.bst.in_order_traversal()],
+            'hachage': sorted(id(doc) for doc in moteur.hash_table.search_by_title("")),
+            'mots_cles': {mot: [id(doc) for doc in moteur.index_mots_cles.search(mot)]
+                          for mot in ("roman", "conte", "poésie", "essai")},
+            'booleen': [id(doc) for doc in moteur.index_booleen.search("keyword:roman OR auteur:3")],
+            'suggestions': moteur.suggestions.suggest("titre"),
+            'tailles': {nom: index.taille() for nom, index in moteur.index.items()},
+        }
+
+    def verifier_annulation(self, operation):
+        """Applique une opération qui doit échouer, puis compare l'état et la numérotation"""
+        moteur = self.creer_moteur()
+        avant = self.etat(moteur)
+        prochain = max(doc.id for doc in moteur.documents()) + 1
+        try:
+            operation(moteur)
+        except (ValueError, RuntimeError):
+            pass
+        else:
+            return "L'opération n'a pas échoué"
+        if self.etat(moteur) != avant:
+            differences = [cle for cle, valeur in self.etat(moteur).items() if valeur != avant[cle]]
+            return f"État modifié après annulation : {', '.join(differences)}"
+        if moteur.verifier_coherence():
+            return "; ".join(moteur.verifier_coherence())
+        identifiant = moteur.ajouter(Document("Après annulation", "Auteur", "test"))
+        if identifiant != prochain:
+            return f"Identifiant {identifiant} attribué au lieu de {prochain}"
+        return None
+
+    def executer_tous_les_tests(self):
+        """
+        Exécute les vérifications, au format de TestsTriAlgorithmes.executer_tous_les_tests
+
+        Retourne:
+            dict: {'Transactions': {...}}
+        """
+        refuse = self.TITRE_REFUSE
+
+        def modifications_puis_refus(moteur):
+            with moteur.transaction():
+                moteur.ajouter(Document("Ajout annulé", "Auteur", "test"))
+                moteur.supprimer(moteur.documents()[3].id)
+                moteur.ajouter(Document(refuse, "Auteur", "test"))
+
+        def exception_dans_le_bloc(moteur):
+            with moteur.transaction():
+                moteur.supprimer_par_titre(moteur.documents()[0].titre)
+                moteur.ajouter(Document("Ajout annulé", "Auteur", "test"))
+                moteur.vider()
+                moteur.ajouter(Document("Après vidage", "Auteur", "test"))
+                raise RuntimeError("Interruption du bloc")
+
+        def chargement_refuse(moteur):
+            documents = [Document(f"Chargé {i}", "Auteur", "test") for i in range(300)]
+            documents.insert(200, Document(refuse, "Auteur", "test"))
+            documents.append(Document("Identifiant élevé", "Auteur", "test", id=10**6))
+            try:
+                moteur.charger(documents)
+            finally:
+                if any(doc.id is not None for doc in documents[:-1]):
+                    raise AssertionError("Identifiants des documents non chargés conservés")
+
+        def chargement_interrompu(moteur):
+            def progression(fait, total, message):
+                raise RuntimeError("Chargement interrompu")
+            moteur.charger((Document(f"Chargé {i}", "Auteur", "test") for i in range(300)), progression)
+
+        verifications = {
+            "Index qui refuse un ajout": modifications_puis_refus,
+            "Exception dans le bloc transaction()": exception_dans_le_bloc,
+            "Chargement refusé par un index": chargement_refuse,
+            "Chargement interrompu par la progression": chargement_interrompu,
+        }
+        return {
+            "Transactions": {
+                nom: executer_verification(nom, lambda operation=operation: self.verifier_annulation(operation), 50)
+                for nom, operation in verifications.items()
+            },
+        }
+
+
+class TestsCache:
+    """
+    Tests du cache des résultats de recherche
+
+    Une entrée n'est servie que si la génération de sa structure n'a pas
+    changé : chaque gestionnaire (liste, BST, hachage, requêtes booléennes)
+    doit recalculer après une modification. Durée de vie, éviction LRU et
+    copie des listes retournées sont vérifiées sur un cache isolé.
+    """
+
+    def verifier_invalidation(self, gestionnaire, ajouter, rechercher):
+        """Deuxième appel servi par le cache, appel après un ajout recalculé"""
+        cache = gestionnaire.cache
+        premiers = rechercher()
+        succes = cache.succes
+        if rechercher() != premiers or cache.succes != succes + 1:
+            return "Deuxième recherche non servie par le cache"
+        perimes = cache.perimes
+        ajouter()
+        apres = rechercher()
+        if len(apres) != len(premiers) + 1:
+            return f"Résultat périmé servi : {len(apres)} document(s) au lieu de {len(premiers) + 1}"
+        if cache.perimes != perimes + 1:
+            return "Entrée périmée non comptée"
+        return None
+
+    def verifier_liste(self):
+        """Recherche par titre partiel, après un ajout puis une suppression"""
+        gestionnaire = BibliothequeManager()
+        gestionnaire.ajouter_document("Alpha", "Victor Hugo", "roman")
+        erreur = self.verifier_invalidation(
+            gestionnaire, lambda: gestionnaire.ajouter_document("Alphabet", "Auteur", "essai"),
+            lambda: gestionnaire.rechercher("alpha", 'titre_partiel'))
+        if erreur:
+            return erreur
+        gestionnaire.supprimer_document("Alpha")
+        if len(gestionnaire.rechercher("alpha", 'titre_partiel')) != 1:
+            return "Résultat périmé servi après une suppression"
+        return None
+
+    def verifier_bst(self):
+        """Recherche par préfixe du BSTManager"""
+        from partie_2 import BSTManager
+
+        gestionnaire = BSTManager()
+        gestionnaire.ajouter_document("Alpha", "Victor Hugo", "roman")
+        return self.verifier_invalidation(
+            gestionnaire, lambda: gestionnaire.ajouter_document("Alphabet", "Auteur", "essai"),
+            lambda: gestionnaire.rechercher_par_prefixe("alp"))
+
+    def verifier_hachage(self):
+        """Recherche par auteur du HashTableManager"""
+        from partie_3 import HashTableManager
+
+        gestionnaire = HashTableManager()
+        gestionnaire.ajouter_document("Alpha", "Victor Hugo", "roman")
+        return self.verifier_invalidation(
+            gestionnaire, lambda: gestionnaire.ajouter_document("Beta", "Victor Hugo", "essai"),
+            lambda: gestionnaire.rechercher_par_auteur("victor hugo"))
+
+    def verifier_booleen(self):
+        """Requête booléenne du gestionnaire sans moteur"""
+        gestionnaire = BibliothequeManager()
+        gestionnaire.ajouter_document("Alpha", "Victor Hugo", "roman")
+        return self.verifier_invalidation(
+            gestionnaire, lambda: gestionnaire.ajouter_document("Beta", "Auteur", "roman"),
+            lambda: gestionnaire.rechercher_booleen("keyword:roman"))
+
+    def verifier_duree_vie(self):
+        cache = CacheResultats(duree_vie=0.01)
+        calculs = []
+        for _ in range(2):
+            cache.obtenir_ou_calculer('liste', 'titre', "terme", 0, lambda: calculs.append(1))
+        time.sleep(0.02)
+        cache.obtenir_ou_calculer('liste', 'titre', "terme", 0, lambda: calculs.append(1))
+        if len(calculs) != 2 or cache.expirations != 1:
+            return f"{len(calculs)} calcul(s) et {cache.expirations} expiration(s) au lieu de 2 et 1"
+        return None
+
+    def verifier_lru(self):
+        cache = CacheResultats(capacite=2)
+        calculs = []
+
+        def obtenir(terme):
+            return cache.obtenir_ou_calculer('liste', 'titre', terme, 0, lambda: calculs.append(terme))
+
+        for terme in ("a", "b", "a", "c"):  # "a" redevient récent : "b" est évincé par "c"
+            obtenir(terme)
+        obtenir("a")
+        obtenir("b")
+        if calculs != ["a", "b", "c", "b"] or cache.evictions != 2 or len(cache) != 2:
+            return f"Calculs {calculs}, {cache.evictions} éviction(s) au lieu de ['a', 'b', 'c', 'b'] et 2"
+        return None
+
+    def verifier_copie(self):
+        cache = CacheResultats()
+        resultat = cache.obtenir_ou_calculer('liste', 'titre', "terme", 0, lambda: ["x", "y"])
+        resultat.append("modifié")
+        cache.obtenir_ou_calculer('liste', 'titre', "terme", 0, lambda: []).clear()
+        if cache.obtenir_ou_calculer('liste', 'titre', "terme", 0, lambda: []) != ["x", "y"]:
+            return "Entrée du cache modifiée par l'appelant"
+        return None
+
+    def executer_tous_les_tests(self):
+        """
+        Exécute les vérifications, au format de TestsTriAlgorithmes.executer_tous_les_tests
+
+        Retourne:
+            dict: {'Cache de recherche': {...}}
+        """
+        verifications = {
+            "Invalidation - liste": self.verifier_liste,
+            "Invalidation - BST": self.verifier_bst,
+            "Invalidation - hachage": self.verifier_hachage,
+            "Invalidation - requêtes booléennes": self.verifier_booleen,
+            "Durée de vie": self.verifier_duree_vie,
+            "Éviction LRU": self.verifier_lru,
+            "Liste retournée modifiable": self.verifier_copie,
+        }
+        return {
+            "Cache de recherche": {nom: executer_verification(nom, verification)
+                                   for nom, verification in verifications.items()},
+        }
+
+
+class TestsPerformanceTri:
+    """
+    Tests de non-régression des performances des algorithmes de tri
+
+    Les temps sont normalisés par celui du tri natif de Python sur la même machine,
+    ce qui rend la référence comparable d'un poste à l'autre. La classe de complexité
+    est déduite de l'exposant ajusté sur les temps minimaux (plus stables que la médiane).
+    """
+
+    TAILLES = (200, 400, 800)  # Au-delà, les tris quadratiques allongent trop la série
+    SCENARIOS = ('aleatoire', 'trie', 'inverse')
+    REPETITIONS = 7
+    TOLERANCE_TEMPS = 2.0       # Ratio maximal du temps normalisé par rapport à la référence
+    TOLERANCE_MEMOIRE = 1.25    # Ratio maximal du pic mémoire
+    MARGE_MEMOIRE = 1024        # Octets tolérés en plus du ratio (petits pics)
+    MARGE_BLOCS = 32            # Blocs encore alloués après le tri tolérés en plus de la référence
+    SEUIL_QUADRATIQUE = 1.5     # Exposant séparant O(n log n) de O(n²)
+    QUASI_LINEAIRES = ('rapide', 'fusion', 'tas', 'comptage', 'vectorise')  # Sur tous les scénarios
+
+    def __init__(self, fichier_baseline=FICHIER_BASELINE, graine=GRAINE_DEFAUT):
+        self.fichier_baseline = fichier_baseline
+        self.graine = graine
+
+    def classe_complexite(self, exposant):
+        """Retourne 'quadratique' ou 'quasi-lineaire' selon l'exposant mesuré"""
+        if exposant is None:
+            return None
+        return 'quadratique' if exposant >= self.SEUIL_QUADRATIQUE else 'quasi-lineaire'
+
+    def mesurer_calibration(self):
+        """Temps minimal du tri natif sur le plus grand jeu aléatoire (unité de normalisation)"""
+        documents = generer_documents('aleatoire', self.TAILLES[-1], self.graine)
+        echantillons = []
+        for _ in range(self.REPETITIONS):
+            copie = list(documents)
+            debut = time.perf_counter()
+            copie.sort(key=lambda doc: doc.titre.lower())
+            echantillons.append(time.perf_counter() - debut)
+        return min(echantillons)
+
+    def mesurer(self):
+        """
+        Mesure tous les algorithmes sur les scénarios et tailles fixes
+
+        Retourne:
+            dict: {'environnement': {...}, 'calibration': float,
+                   'resultats': {algo: {scenario: {'temps_normalise', 'memoire_pic',
+                                                   'blocs_alloues', 'exposant', 'classe'}}}}
+        """
+        calibration = self.mesurer_calibration()
+        jeux = {(scenario, taille): generer_documents(scenario, taille, self.graine)
+                for scenario in self.SCENARIOS for taille in self.TAILLES}
+
+        resultats = {}
+        for nom, algorithme in algorithmes_par_defaut().items():
+            resultats[nom] = {}
+            for scenario in self.SCENARIOS:
+                temps = [mesurer_tri(algorithme, jeux[(scenario, taille)], self.REPETITIONS,
+                                     mesurer_memoire=False)['min']
+                         for taille in self.TAILLES]
+                # tracemalloc ralentit fortement les tris : une seule exécution, à la plus grande taille
+                memoire = mesurer_tri(algorithme, jeux[(scenario, self.TAILLES[-1])], 1,
+                                      echauffement=0)
+                exposant = ajuster_exposant(self.TAILLES, temps)
+                resultats[nom][scenario] = {
+                    'temps_normalise': temps[-1] / calibration,
+                    'memoire_pic': memoire['memoire_pic'],
+                    'blocs_alloues': memoire['blocs_alloues'],
+                    'exposant': exposant,
+                    'classe': self.classe_complexite(exposant)
+                }
+
+        return {
+            'environnement': {
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'numpy': algorithmes_par_defaut()['vectorise'].numpy_disponible
+            },
+            'parametres': {
+                'graine': self.graine,
+                'tailles': list(self.TAILLES),
+                'scenarios': list(self.SCENARIOS)
+            },
+            'calibration': calibration,
+            'resultats': resultats
+        }
+
+    def comparer(self, reference, actuel):
+        """
+        Compare une mesure à la référence
+
+        Le pic mémoire et les blocs alloués ne sont comparés que si la version
+        de Python et la présence de NumPy sont identiques (la taille des objets
+        en dépend). Les algorithmes QUASI_LINEAIRES doivent l'être sur chaque
+        scénario, quelle que soit la référence.
+
+        Retourne:
+            list: Messages décrivant chaque régression (vide si aucune)
+        """
+        env_ref = reference['environnement']
+        env_act = actuel['environnement']
+        comparer_memoire = (env_ref['python'].rsplit('.', 1)[0] == env_act['python'].rsplit('.', 1)[0]
+                            and env_ref['implementation'] == env_act['implementation']
+                            and env_ref['numpy'] == env_act['numpy'])
+
+        regressions = []
+        for nom, scenarios in actuel['resultats'].items():
+            for scenario, mesure in scenarios.items():
+                libelle = f"{nom} / {scenario}"
+                if nom in self.QUASI_LINEAIRES and mesure['classe'] == 'quadratique':
+                    regressions.append(f"{libelle} : complexité quadratique au lieu de quasi-linéaire "
+                                       f"(exposant {mesure['exposant']:.2f})")
+
+                ref = reference['resultats'].get(nom, {}).get(scenario)
+                if ref is None:
+                    continue
+
+                limite = ref['temps_normalise'] * self.TOLERANCE_TEMPS
+                if mesure['temps_normalise'] > limite:
+                    regressions.append(f"{libelle} : temps x{mesure['temps_normalise'] / ref['temps_normalise']:.2f} "
+                                       f"(tolérance x{self.TOLERANCE_TEMPS})")
+
+                if comparer_memoire and ref['memoire_pic'] is not None:
+                    limite = ref['memoire_pic'] * self.TOLERANCE_MEMOIRE + self.MARGE_MEMOIRE
+                    if mesure['memoire_pic'] > limite:
+                        regressions.append(f"{libelle} : pic mémoire {mesure['memoire_pic']} octets "
+                                           f"(référence {ref['memoire_pic']})")
+
+                if comparer_memoire and ref.get('blocs_alloues') is not None:
+                    if mesure['blocs_alloues'] > ref['blocs_alloues'] + self.MARGE_BLOCS:
+                        regressions.append(f"{libelle} : {mesure['blocs_alloues']} blocs encore alloués "
+                                           f"après le tri (référence {ref['blocs_alloues']})")
+
+                if ref['classe'] and mesure['classe'] and ref['classe'] != mesure['classe']:
+                    regressions.append(f"{libelle} : complexité {ref['classe']} → {mesure['classe']} "
+                                       f"(exposant {ref['exposant']:.2f} → {mesure['exposant']:.2f})")
+
+        return regressions
+
+    def executer(self, maj_baseline=False):
+        """
+        Mesure puis compare à la référence (ou l'enregistre)
+
+        Retourne:
+            bool: True si aucune régression n'est détectée
+        """
+        actuel = self.mesurer()
+
+        if maj_baseline or not os.path.exists(self.fichier_baseline):
+            sauvegarder_rapport(actuel, self.fichier_baseline)
+            print(f"[OK] Référence de performance enregistrée dans {self.fichier_baseline}")
+            return True
+
+        reference = charger_rapport(self.fichier_baseline)
+        regressions = self.comparer(reference, actuel)
+        if regressions:
+            # Une mesure bruitée isolée ne doit pas faire échouer : on confirme par une seconde série
+            print("⚠️ Écart détecté, nouvelle série de mesures pour confirmer...")
+            premieres = {message.split(' : ')[0] for message in regressions}
+            regressions = [message for message in self.comparer(reference, self.mesurer())
+                           if message.split(' : ')[0] in premieres]
+        if regressions:
+            print(f"❌ {len(regressions)} régression(s) de performance :")
+            for message in regressions:
+                print(f"  - {message}")
+            return False
+
+        print("✅ Aucune régression de performance détectée")
+        return True
+
+
+class TestsDemarrage:
+    """
+    Budget de démarrage à froid des points d'entrée
+
+    Chaque module est importé dans un interpréteur neuf avec `-X importtime` ;
+    on retient le meilleur temps cumulé sur plusieurs essais et on vérifie que
+    les dépendances lourdes (Tkinter, NumPy) ne sont pas chargées à l'import.
+    """
+
+    BUDGETS_MS = {'main': 20, 'mode_terminal': 90}
+    IMPORTS_INTERDITS = ('tkinter', 'numpy')
+    ESSAIS = 3
+
+    def mesurer(self, module):
+        """
+        Importe le module dans un sous-processus
+
+        Retourne:
+            tuple: (temps cumulé en ms, ensemble des modules importés)
+        """
+        sortie = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True).stderr
+        temps, modules = None, set()
+        for ligne in sortie.splitlines():
+            if not ligne.startswith('import time:') or 'cumulative' in ligne:
+                continue
+            _, cumule, nom = ligne[len('import time:'):].split('|')
+            modules.add(nom.strip())
+            if nom.strip() == module:
+                temps = int(cumule) / 1000
+        return temps, modules
+
+    def executer(self):
+        """
+        Retourne:
+            bool: True si chaque point d'entrée respecte son budget
+        """
+        valide = True
+        for module, budget in self.BUDGETS_MS.items():
+            mesures = [self.mesurer(module) for _ in range(self.ESSAIS)]
+            temps = min(t for t, _ in mesures)
+            lourds = sorted(nom for nom in mesures[0][1]
+                            if nom.split('.')[0] in self.IMPORTS_INTERDITS)
+            if temps > budget:
+                print(f"❌ import {module} : {temps:.1f} ms (budget {budget} ms)")
+                valide = False
+            elif lourds:
+                print(f"❌ import {module} charge {', '.join(lourds)}")
+                valide = False
+            else:
+                print(f"✅ import {module} : {temps:.1f} ms (budget {budget} ms)")
+        return valide
+
+
+class TestsConcurrence:
+    """
+    Test de charge concurrente des structures partagées
+
+    Un fil rédacteur ajoute, supprime et trie pendant que plusieurs fils
+    lecteurs parcourent le BST, les buckets de la table de hachage et la
+    liste. Chaque lecture vérifie un invariant (parcours trié, aucun document
+    vu deux fois, index de même taille sous `moteur.lecture()`) ; la moindre
+    exception ou incohérence fait échouer le test.
+    """
+
+    TAILLE = 2000
+    LECTEURS = 6
+    DUREE = 2.0                 # Secondes de charge
+    INTERVALLE_BASCULE = 1e-5   # Bascule fréquente entre fils pour multiplier les entrelacements
+
+    def __init__(self, graine=GRAINE_DEFAUT):
+        self.graine = graine
+
+    def _lecteur(self, moteur, fin, anomalies, compte):
+        rng = random.Random()
+        while time.perf_counter() < fin and not anomalies:
+            try:
+                choix = rng.randrange(4)
+                if choix == 0:
+                    parcours = moteur.bst.in_order_traversal()
+                    titres = [doc.titre.lower() for doc in parcours]
+                    if titres != sorted(titres) or len({id(doc) for doc in parcours}) != len(parcours):
+                        anomalies.append("Parcours du BST non trié ou avec doublons")
+                elif choix == 1:
+                    documents = moteur.hash_table.search_by_title("")
+                    if len({id(doc) for doc in documents}) != len(documents):
+                        anomalies.append("Parcours des buckets avec doublons")
+                elif choix == 2:
+                    with moteur.lecture():
+                        tailles = {len(moteur), moteur.bst.size, len(moteur.bibliotheque),
+                                   sum(len(bucket.items) for bucket in moteur.hash_table.table)}
+                    if len(tailles) != 1:
+                        anomalies.append(f"Index de tailles différentes sous verrou : {sorted(tailles)}")
+                else:
+                    moteur.manager_liste.rechercher(rng.choice("aeiou"), 'titre_partiel')
+                    moteur.manager_bst.rechercher_par_prefixe(rng.choice("lmp"))
+                    moteur.rechercher_partout(rng.choice(("la", "mer", "roman")))
+                compte[0] += 1
+            except Exception as e:
+                anomalies.append(f"{type(e).__name__} pendant une lecture : {e}")
+
+    def _redacteur(self, moteur, fin, anomalies, compte):
+        rng = random.Random(self.graine)
+        ajoutes = []
+        try:
+            while time.perf_counter() < fin and not anomalies:
+                if ajoutes and rng.random() < 0.45:
+                    moteur.supprimer(ajoutes.pop(rng.randrange(len(ajoutes))))
+                elif rng.random() < 0.02:
+                    moteur.manager_liste.trier('fusion')
+                else:
+                    ajoutes.append(moteur.ajouter(Document(f"Concurrence {rng.random():.6f}", "Fil Rédacteur", "test")))
+                compte[0] += 1
+        except Exception as e:
+            anomalies.append(f"{type(e).__name__} pendant une écriture : {e}")
+
+    def executer(self):
+        """
+        Retourne:
+            bool: True si aucune anomalie n'a été détectée
+        """
+        from partie_1.generateur import generer_documents_realistes
+        from stockage import MoteurStockage
+
+        moteur = MoteurStockage()
+        moteur.charger(generer_documents_realistes(self.TAILLE, self.graine))
+        anomalies, lectures, ecritures = [], [0], [0]
+        intervalle = sys.getswitchinterval()
+        sys.setswitchinterval(self.INTERVALLE_BASCULE)
+        try:
+            fin = time.perf_counter() + self.DUREE
+            fils = [threading.Thread(target=self._redacteur, args=(moteur, fin, anomalies, ecritures))]
+            fils += [threading.Thread(target=self._lecteur, args=(moteur, fin, anomalies, lectures))
+                     for _ in range(self.LECTEURS)]
+            for fil in fils:
+                fil.start()
+            for fil in fils:
+                fil.join()
+        finally:
+            sys.setswitchinterval(intervalle)
+
+        anomalies += moteur.verifier_coherence()
+        if anomalies:
+            print(f"❌ {len(anomalies)} anomalie(s) de concurrence :")
+            for message in anomalies[:10]:
+                print(f"  - {message}")
+            return False
+        print(f"✅ {lectures[0]} lectures ({self.LECTEURS} fils) et {ecritures[0]} écritures concurrentes "
+              f"en {self.DUREE:.0f} s, aucune anomalie")
+        return True
+
+    def executer_persistant(self):
+        """
+        Même charge sur un PersistentBinarySearchTree, lecteurs sans verrou :
+        chaque instantané doit rester trié, de la taille annoncée et identique
+        d'un parcours à l'autre pendant que le rédacteur modifie l'arbre ;
+        undo() doit ensuite rétablir exactement la version précédente, et un
+        arbre dégénéré (titres insérés dans l'ordre) ne doit pas dépasser la
+        limite de récursion.
+
+        Retourne:
+            bool: True si aucune anomalie n'a été détectée
+        """
+        from partie_1.generateur import generer_documents_realistes
+        from partie_2.bst_persistant import PersistentBinarySearchTree
+
+        arbre = PersistentBinarySearchTree()
+        for document in generer_documents_realistes(self.TAILLE, self.graine):
+            arbre.insert(document)
+        anomalies, lectures, ecritures = [], [0], [0]
+
+        def lecteur(fin):
+            while time.perf_counter() < fin and not anomalies:
+                instantane = arbre.snapshot()
+                parcours = list(instantane)
+                titres = [doc.titre.lower() for doc in parcours]
+                if titres != sorted(titres) or len(parcours) != instantane.size:
+                    anomalies.append("Instantané non trié ou de taille incohérente")
+                elif list(instantane) != parcours:
+                    anomalies.append("Instantané modifié entre deux parcours")
+                lectures[0] += 1
+
+        def redacteur(fin):
+            rng = random.Random(self.graine)
+            ajoutes = []
+            while time.perf_counter() < fin and not anomalies:
+                if ajoutes and rng.random() < 0.45:
+                    arbre.delete_document(ajoutes.pop(rng.randrange(len(ajoutes))))
+                else:
+                    ajoutes.append(Document(f"Concurrence {rng.random():.6f}", "Fil Rédacteur", "test"))
+                    arbre.insert(ajoutes[-1])
+                ecritures[0] += 1
+
+        intervalle = sys.getswitchinterval()
+        sys.setswitchinterval(self.INTERVALLE_BASCULE)
+        try:
+            fin = time.perf_counter() + self.DUREE
+            fils = [threading.Thread(target=redacteur, args=(fin,))]
+            fils += [threading.Thread(target=lecteur, args=(fin,)) for _ in range(self.LECTEURS)]
+            for fil in fils:
+                fil.start()
+            for fil in fils:
+                fil.join()
+        finally:
+            sys.setswitchinterval(intervalle)
+
+        avant = list(arbre)
+        if avant:
+            arbre.delete_document(avant[len(avant) // 2])
+            if not arbre.undo() or list(arbre) != avant:
+                anomalies.append("undo() n'a pas rétabli la suppression")
+
+        # Titres insérés dans l'ordre : arbre dégénéré plus haut que la limite de récursion
+        degenere = PersistentBinarySearchTree()
+        taille = 2 * sys.getrecursionlimit()
+        for i in range(taille):
+            degenere.insert(Document(f"Trie {i:06d}", "Auteur", "test"))
+        try:
+            if (len(degenere.search_prefix("trie")) != taille or len(degenere.search_advanced("trie")) != taille
+                    or not degenere.delete(f"Trie {taille - 1:06d}")):
+                anomalies.append("Recherche incorrecte sur un arbre dégénéré")
+        except RecursionError:
+            anomalies.append("RecursionError sur un arbre dégénéré")
+
+        if anomalies:
+            print(f"❌ {len(anomalies)} anomalie(s) sur le BST persistant :")
+            for message in anomalies[:10]:
+                print(f"  - {message}")
+            return False
+        print(f"✅ BST persistant : {lectures[0]} parcours d'instantanés sans verrou et "
+              f"{ecritures[0]} écritures concurrentes, aucune anomalie")
+        return True
+
+
 def executer_tests_console():
     """Fonction pour exécuter les tests en console"""
     print("\n🧪 Démarrage des tests unitaires...\n")
     
     tests = TestsTriAlgorithmes()
     resultats = tests.executer_tous_les_tests()
+    resultats.update(TestsRechercheBooleenne().executer_tous_les_tests())
+    resultats.update(TestsTriePrefixes().executer_tous_les_tests())
+    resultats.update(TestsTransactions().executer_tous_les_tests())
+    resultats.update(TestsCache().executer_tous_les_tests())
     rapport = tests.generer_rapport_texte(resultats)
     
     print(rapport)
@@ -232,6 +1297,34 @@ def executer_tests_console():
     return resultats
 
 
+def executer_tests_performance(maj_baseline=False, fichier_baseline=FICHIER_BASELINE):
+    """Fonction pour exécuter les tests de performance en console"""
+    print("\n⏱️ Démarrage des tests de performance...\n")
+
+    tri_valide = TestsPerformanceTri(fichier_baseline).executer(maj_baseline)
+    print("\n🚀 Temps de démarrage à froid...\n")
+    return TestsDemarrage().executer() and tri_valide
+
+
 if __name__ == "__main__":
-    executer_tests_console()
+    parser = argparse.ArgumentParser(description="Tests des algorithmes de tri")
+    parser.add_argument('--perf', action='store_true', help="Exécute les tests de non-régression des performances")
+    parser.add_argument('--maj-baseline', action='store_true', help="Enregistre les mesures comme nouvelle référence")
+    parser.add_argument('--baseline', default=FICHIER_BASELINE, help="Fichier de référence")
+    parser.add_argument('--concurrence', action='store_true',
+                        help="Exécute le test de charge concurrente (lecteurs et rédacteur sur les structures)")
+    args = parser.parse_args()
+
+    if args.concurrence:
+        print("\n🧵 Test de charge concurrente...\n")
+        tests = TestsConcurrence()
+        resultats = [tests.executer(), tests.executer_persistant()]
+        sys.exit(0 if all(resultats) else 1)
+
+    if args.perf or args.maj_baseline:
+        sys.exit(0 if executer_tests_performance(args.maj_baseline, args.baseline) else 1)
+
+    resultats = executer_tests_console()
+    if not all(test['valide'] for tests in resultats.values() for test in tests.values()):
+        sys.exit(1)
 